@@ -0,0 +1,458 @@
+using UnityEngine;
+using UnityEditor;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    // Index of the assets under Assets/: GUID, path, name, main type and labels, kept
+    // sorted by path. Built on first use with one FindAssets call and then kept up to
+    // date by MCPAssetIndexPostprocessor, so searches (unity_search_assets), scene
+    // lookup by name and {"type": "reference"} values resolve without asking the
+    // AssetDatabase to search. Main types come from GetMainAssetTypeAtPath, which
+    // reads the import metadata without loading the asset.
+    public static class MCPAssetIndex
+    {
+        public class AssetRecord
+        {
+            public string guid;
+            public string path;
+            public string name;
+            public string type;
+            public string[] labels;
+        }
+        
+        private const int DefaultPageSize = 50;
+        private const int MaxPageSize = 1000;
+        
+        // Search types that are not a main asset type name
+        private static readonly string[] ModelExtensions = { ".fbx", ".obj", ".dae", ".3ds", ".blend", ".max", ".ma", ".mb" };
+        private static readonly Dictionary<string, Func<AssetRecord, bool>> TypeAliases = new Dictionary<string, Func<AssetRecord, bool>>(StringComparer.OrdinalIgnoreCase)
+        {
+            ["Prefab"] = record => record.path.EndsWith(".prefab", StringComparison.OrdinalIgnoreCase),
+            ["Model"] = record => ModelExtensions.Any(extension => record.path.EndsWith(extension, StringComparison.OrdinalIgnoreCase)),
+            ["Scene"] = record => record.type == "SceneAsset",
+            ["Script"] = record => record.type == "MonoScript",
+            ["Texture"] = record => record.type == "Texture2D",
+        };
+        
+        private static readonly List<AssetRecord> byPath = new List<AssetRecord>();
+        private static readonly Dictionary<string, AssetRecord> byGuid = new Dictionary<string, AssetRecord>();
+        private static readonly Dictionary<string, List<AssetRecord>> byName = new Dictionary<string, List<AssetRecord>>(StringComparer.OrdinalIgnoreCase);
+        // Static state is dropped by domain reloads, so the index is rebuilt after one
+        private static bool built;
+        // Bumped by every change, so paging cursors can tell the listing moved
+        private static long version;
+        
+        private static void EnsureBuilt()
+        {
+            if (built)
+            {
+                return;
+            }
+            
+            byPath.Clear();
+            byGuid.Clear();
+            byName.Clear();
+            foreach (string guid in AssetDatabase.FindAssets("", new[] { "Assets" }))
+            {
+                string path = AssetDatabase.GUIDToAssetPath(guid);
+                AssetRecord record = Read(guid, path);
+                if (record != null)
+                {
+                    byPath.Add(record);
+                    byGuid[guid] = record;
+                    AddName(record);
+                }
+            }
+            byPath.Sort((a, b) => string.CompareOrdinal(a.path, b.path));
+            
+            built = true;
+            version++;
+        }
+        
+        // Null for folders and paths outside Assets/
+        private static AssetRecord Read(string guid, string path)
+        {
+            if (string.IsNullOrEmpty(path) || !path.StartsWith("Assets/") || AssetDatabase.IsValidFolder(path))
+            {
+                return null;
+            }
+            
+            Type type = AssetDatabase.GetMainAssetTypeAtPath(path);
+            return new AssetRecord
+            {
+                guid = guid,
+                path = path,
+                name = Path.GetFileNameWithoutExtension(path),
+                type = type != null ? type.Name : "Unknown",
+                labels = AssetDatabase.GetLabels(new GUID(guid))
+            };
+        }
+        
+        private static void AddName(AssetRecord record)
+        {
+            if (!byName.TryGetValue(record.name, out var named))
+            {
+                named = new List<AssetRecord>();
+                byName[record.name] = named;
+            }
+            named.Add(record);
+        }
+        
+        // Index of the record with this path, or the bitwise complement of where it would go
+        private static int IndexOfPath(string path)
+        {
+            int low = 0;
+            int high = byPath.Count - 1;
+            while (low <= high)
+            {
+                int middle = (low + high) / 2;
+                int order = string.CompareOrdinal(byPath[middle].path, path);
+                if (order == 0)
+                {
+                    return middle;
+                }
+                if (order < 0)
+                {
+                    low = middle + 1;
+                }
+                else
+                {
+                    high = middle - 1;
+                }
+            }
+            return ~low;
+        }
+        
+        // Where a record with this path is or would be
+        private static int LowerBound(string path)
+        {
+            int index = IndexOfPath(path);
+            return index >= 0 ? index : ~index;
+        }
+        
+        // ==================== UPDATES ====================
+        
+        // Called by MCPAssetIndexPostprocessor after every import batch
+        internal static void Apply(string[] imported, string[] deleted, string[] moved, string[] movedFrom)
+        {
+            if (!built)
+            {
+                // Nothing to update; the first search builds from scratch
+                return;
+            }
+            
+            foreach (string path in deleted.Concat(movedFrom))
+            {
+                Remove(path);
+            }
+            foreach (string path in imported.Concat(moved))
+            {
+                Remove(path);
+                AssetRecord record = Read(AssetDatabase.AssetPathToGUID(path), path);
+                if (record == null)
+                {
+                    continue;
+                }
+                if (byGuid.TryGetValue(record.guid, out var stale))
+                {
+                    Remove(stale.path);
+                }
+                byPath.Insert(LowerBound(record.path), record);
+                byGuid[record.guid] = record;
+                AddName(record);
+            }
+            version++;
+        }
+        
+        private static void Remove(string path)
+        {
+            int index = IndexOfPath(path);
+            if (index < 0)
+            {
+                return;
+            }
+            
+            AssetRecord record = byPath[index];
+            byPath.RemoveAt(index);
+            byGuid.Remove(record.guid);
+            if (byName.TryGetValue(record.name, out var named))
+            {
+                named.Remove(record);
+                if (named.Count == 0)
+                {
+                    byName.Remove(record.name);
+                }
+            }
+        }
+        
+        // ==================== RESOLUTION ====================
+        
+        // An asset path, a GUID (optionally "guid:..."), or an asset name that only one
+        // asset of a matching type has. Null with the reason in problem otherwise.
+        public static string ResolvePath(string reference, string type, out string problem)
+        {
+            problem = null;
+            if (string.IsNullOrEmpty(reference))
+            {
+                problem = "Asset reference is empty";
+                return null;
+            }
+            EnsureBuilt();
+            
+            string guid = reference.StartsWith("guid:") ? reference.Substring(5) : reference;
+            if (byGuid.TryGetValue(guid, out var byId))
+            {
+                return byId.path;
+            }
+            
+            if (reference.Contains("/"))
+            {
+                int index = IndexOfPath(reference);
+                if (index >= 0)
+                {
+                    return byPath[index].path;
+                }
+                // Packages/ and other paths outside the index are left to the AssetDatabase
+                if (!reference.StartsWith("Assets/") || AssetDatabase.LoadMainAssetAtPath(reference) != null)
+                {
+                    return reference;
+                }
+                problem = $"No asset at path '{reference}'";
+                return null;
+            }
+            
+            Func<AssetRecord, bool> matchesType = TypeFilter(type);
+            var candidates = byName.TryGetValue(reference, out var named)
+                ? named.Where(matchesType).ToList()
+                : new List<AssetRecord>();
+            if (candidates.Count == 1)
+            {
+                return candidates[0].path;
+            }
+            
+            string typed = type != null ? $" {type}" : "";
+            if (candidates.Count == 0)
+            {
+                problem = $"No{typed} asset named '{reference}'. Use unity_search_assets to find its path";
+            }
+            else
+            {
+                string listed = string.Join(", ", candidates.Take(5).Select(record => record.path));
+                problem = $"{candidates.Count}{typed} assets are named '{reference}' ({listed}); pass a path instead";
+            }
+            return null;
+        }
+        
+        // Loads what ResolvePath resolves to
+        public static UnityEngine.Object Load(string reference, out string problem)
+        {
+            string path = ResolvePath(reference, null, out problem);
+            if (path == null)
+            {
+                return null;
+            }
+            
+            UnityEngine.Object asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(path);
+            if (asset == null)
+            {
+                problem = $"Could not load asset from path: {path}";
+            }
+            return asset;
+        }
+        
+        // A scene by exact name first, then by the first name containing it, like the
+        // "name t:Scene" search LoadScene used to run
+        public static string FindScene(string sceneName)
+        {
+            EnsureBuilt();
+            if (sceneName.EndsWith(".unity") && IndexOfPath(sceneName) >= 0)
+            {
+                return sceneName;
+            }
+            
+            if (byName.TryGetValue(sceneName, out var named))
+            {
+                AssetRecord exact = named.FirstOrDefault(record => record.type == "SceneAsset");
+                if (exact != null)
+                {
+                    return exact.path;
+                }
+            }
+            return byPath.FirstOrDefault(record => record.type == "SceneAsset" &&
+                record.name.IndexOf(sceneName, StringComparison.OrdinalIgnoreCase) >= 0)?.path;
+        }
+        
+        // Indexed paths matching a glob such as "Assets/Characters/FBX/*.fbx" ("**"
+        // crosses folders), in path order. Only the folder before the first wildcard
+        // is scanned, as one contiguous range of the sorted list.
+        public static List<string> MatchPaths(string pattern)
+        {
+            EnsureBuilt();
+            var paths = new List<string>();
+            int wildcard = pattern.IndexOfAny(new[] { '*', '?' });
+            if (wildcard < 0)
+            {
+                if (IndexOfPath(pattern) >= 0)
+                {
+                    paths.Add(pattern);
+                }
+                return paths;
+            }
+            
+            string literal = pattern.Substring(0, pattern.LastIndexOf('/', wildcard) + 1);
+            Func<string, bool> matches = MCPQuery.Glob(pattern);
+            for (int i = LowerBound(literal); i < byPath.Count && byPath[i].path.StartsWith(literal, StringComparison.Ordinal); i++)
+            {
+                if (matches(byPath[i].path))
+                {
+                    paths.Add(byPath[i].path);
+                }
+            }
+            return paths;
+        }
+        
+        private static Func<AssetRecord, bool> TypeFilter(string type)
+        {
+            if (string.IsNullOrEmpty(type))
+            {
+                return record => true;
+            }
+            if (TypeAliases.TryGetValue(type, out var alias))
+            {
+                return alias;
+            }
+            return record => string.Equals(record.type, type, StringComparison.OrdinalIgnoreCase);
+        }
+        
+        // ==================== SEARCH ====================
+        
+        public static JObject Search(JObject args)
+        {
+            string type = args["type"]?.ToString();
+            string name = args["name"]?.ToString();
+            string folder = args["folder"]?.ToString()?.TrimEnd('/');
+            string label = args["label"]?.ToString();
+            bool recursive = args["recursive"]?.ToObject<bool>() ?? true;
+            int pageSize = args["pageSize"]?.Value<int>() ?? DefaultPageSize;
+            if (pageSize < 1 || pageSize > MaxPageSize)
+            {
+                return Error($"pageSize must be between 1 and {MaxPageSize}; got {pageSize}");
+            }
+            if (!string.IsNullOrEmpty(folder) && folder != "Assets" && !folder.StartsWith("Assets/"))
+            {
+                folder = "Assets/" + folder;
+            }
+            
+            EnsureBuilt();
+            
+            int offset = 0;
+            bool assetsChanged = false;
+            string cursor = args["cursor"]?.ToString();
+            if (!string.IsNullOrEmpty(cursor))
+            {
+                var parts = cursor.Split(':');
+                if (parts.Length != 2 || !int.TryParse(parts[0], out offset) || offset < 0 || !long.TryParse(parts[1], out long issued))
+                {
+                    return Error($"Invalid cursor '{cursor}'");
+                }
+                assetsChanged = issued != version;
+            }
+            
+            // Records are sorted by path, so a folder is one contiguous range
+            int start = 0;
+            int end = byPath.Count;
+            string prefix = null;
+            if (!string.IsNullOrEmpty(folder))
+            {
+                // '0' sorts right after '/'
+                prefix = folder + "/";
+                start = LowerBound(prefix);
+                end = LowerBound(folder + "0");
+            }
+            
+            Func<AssetRecord, bool> matchesType = TypeFilter(type);
+            Func<string, bool> matchesName = null;
+            if (!string.IsNullOrEmpty(name))
+            {
+                // Plain text matches anywhere in the name, like the Project window search
+                matchesName = MCPQuery.Glob(name.IndexOfAny(new[] { '*', '?' }) < 0 ? $"*{name}*" : name, true);
+            }
+            
+            var assets = new JArray();
+            int matched = 0;
+            for (int i = start; i < end; i++)
+            {
+                AssetRecord record = byPath[i];
+                if (!recursive && prefix != null && record.path.IndexOf('/', prefix.Length) >= 0)
+                {
+                    continue;
+                }
+                if (!matchesType(record) || (matchesName != null && !matchesName(record.name)))
+                {
+                    continue;
+                }
+                if (!string.IsNullOrEmpty(label) && !record.labels.Contains(label, StringComparer.OrdinalIgnoreCase))
+                {
+                    continue;
+                }
+                
+                if (matched >= offset && assets.Count < pageSize)
+                {
+                    var asset = new JObject
+                    {
+                        ["guid"] = record.guid,
+                        ["path"] = record.path,
+                        ["name"] = record.name,
+                        ["type"] = record.type
+                    };
+                    if (record.labels.Length > 0)
+                    {
+                        asset["labels"] = new JArray(record.labels);
+                    }
+                    assets.Add(asset);
+                }
+                matched++;
+            }
+            
+            var result = new JObject
+            {
+                ["success"] = true,
+                ["total"] = matched,
+                ["count"] = assets.Count,
+                ["assets"] = assets
+            };
+            if (offset + assets.Count < matched)
+            {
+                result["nextCursor"] = $"{offset + assets.Count}:{version}";
+            }
+            if (assetsChanged)
+            {
+                result["assetsChanged"] = true;
+            }
+            return result;
+        }
+        
+        private static JObject Error(string message)
+        {
+            return new JObject
+            {
+                ["success"] = false,
+                ["error"] = message
+            };
+        }
+    }
+    
+    // Keeps MCPAssetIndex in step with imports, deletions and moves
+    public class MCPAssetIndexPostprocessor : AssetPostprocessor
+    {
+        private static void OnPostprocessAllAssets(string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            MCPAssetIndex.Apply(importedAssets, deletedAssets, movedAssets, movedFromAssetPaths);
+        }
+    }
+}
@@ -0,0 +1,465 @@
+using UnityEngine;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    // Scene version counter so the MCP server can tell whether cached reads
+    // are still valid. Bumped on the main thread by editor change callbacks
+    // (including edits made by hand), read from any thread.
+    //
+    // Also keeps a hierarchy revision per object for sinceRevision deltas in
+    // unity_list_all_gameobjects. ObjectChangeEvents name the objects that
+    // were created, destroyed, re-parented or edited, so a refresh only
+    // re-reads those subtrees. The whole scene is walked on first use, after a
+    // scene change or undo, and when hierarchyChanged fires in an update that
+    // published no ObjectChangeEvents (code that bypasses Undo).
+    [InitializeOnLoad]
+    public static class MCPChangeTracker
+    {
+        // Seeded from the clock so versions never repeat across domain reloads
+        private static long sceneVersion = DateTime.UtcNow.Ticks;
+        
+        public static long SceneVersion => Interlocked.Read(ref sceneVersion);
+        
+        // Main thread, once per update in which the hierarchy changed but no ObjectChangeEvents
+        // said where, so indexes kept up to date from those events must rebuild
+        public static event Action UnpublishedHierarchyChange;
+        
+        static MCPChangeTracker()
+        {
+            EditorApplication.hierarchyChanged += OnHierarchyChanged;
+            EditorApplication.update += SettleUpdate;
+            ObjectChangeEvents.changesPublished += OnChangesPublished;
+            Undo.undoRedoPerformed += MarkChanged;
+            EditorApplication.playModeStateChanged += (state) => MarkChanged();
+            EditorSceneManager.sceneOpened += (scene, mode) => MarkChanged();
+            EditorSceneManager.sceneClosed += (scene) => MarkChanged();
+            EditorSceneManager.newSceneCreated += (scene, setup, mode) => MarkChanged();
+            EditorSceneManager.activeSceneChangedInEditMode += (previous, next) => MarkChanged();
+        }
+        
+        // A change with no object to pin it on: the next refresh walks the whole scene
+        public static void MarkChanged()
+        {
+            Interlocked.Increment(ref sceneVersion);
+            fullWalkNeeded = true;
+        }
+        
+        private static void OnHierarchyChanged()
+        {
+            Interlocked.Increment(ref sceneVersion);
+            hierarchyChangedThisUpdate = true;
+        }
+        
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            if (stream.length == 0)
+            {
+                return;
+            }
+            Interlocked.Increment(ref sceneVersion);
+            eventsThisUpdate = true;
+            
+            for (int i = 0; i < stream.length; i++)
+            {
+                switch (stream.GetEventType(i))
+                {
+                    case ObjectChangeKind.ChangeGameObjectOrComponentProperties:
+                        stream.GetChangeGameObjectOrComponentPropertiesEvent(i, out var properties);
+                        dirtyIds.Add(properties.instanceId);
+                        break;
+                    
+                    case ObjectChangeKind.CreateGameObjectHierarchy:
+                        stream.GetCreateGameObjectHierarchyEvent(i, out var created);
+                        dirtyIds.Add(created.instanceId);
+                        break;
+                    
+                    case ObjectChangeKind.DestroyGameObjectHierarchy:
+                        stream.GetDestroyGameObjectHierarchyEvent(i, out var destroyed);
+                        destroyedIds.Add(destroyed.instanceId);
+                        break;
+                    
+                    case ObjectChangeKind.ChangeGameObjectParent:
+                        stream.GetChangeGameObjectParentEvent(i, out var reparented);
+                        dirtyIds.Add(reparented.instanceId);
+                        break;
+                    
+                    case ObjectChangeKind.ChangeGameObjectStructure:
+                        stream.GetChangeGameObjectStructureEvent(i, out var structure);
+                        dirtyIds.Add(structure.instanceId);
+                        break;
+                    
+                    case ObjectChangeKind.ChangeGameObjectStructureHierarchy:
+                        stream.GetChangeGameObjectStructureHierarchyEvent(i, out var structureHierarchy);
+                        dirtyIds.Add(structureHierarchy.instanceId);
+                        break;
+                    
+                    case ObjectChangeKind.UpdatePrefabInstances:
+                        stream.GetUpdatePrefabInstancesEvent(i, out var prefabInstances);
+                        foreach (int id in prefabInstances.instanceIds)
+                        {
+                            dirtyIds.Add(id);
+                        }
+                        break;
+                    
+                    case ObjectChangeKind.ChangeScene:
+                        fullWalkNeeded = true;
+                        break;
+                }
+            }
+        }
+        
+        // EditorApplication.update: a hierarchy change with no ObjectChangeEvents in the
+        // same update came from code that bypasses Undo, and only a full walk finds it
+        private static void SettleUpdate()
+        {
+            if (hierarchyChangedThisUpdate && !eventsThisUpdate)
+            {
+                fullWalkNeeded = true;
+                UnpublishedHierarchyChange?.Invoke();
+            }
+            hierarchyChangedThisUpdate = false;
+            eventsThisUpdate = false;
+        }
+        
+        // ==================== HIERARCHY REVISIONS ====================
+        
+        // Last known state of one object in the active scene
+        private class TrackedObject
+        {
+            public string name;
+            public string path;
+            public bool active;
+            public string tag;
+            public string layer;
+            public Vector3 position;
+            public int parentId;
+            public readonly HashSet<int> children = new HashSet<int>();
+            public long addedRevision;
+            public long revision;
+        }
+        
+        // One object added, changed or removed at a revision; the log is in revision order
+        private struct HierarchyChange
+        {
+            public long revision;
+            public int instanceId;
+            public bool removed;
+            public string path;
+            public long addedRevision;
+        }
+        
+        private const int MaxChangeHistory = 10000;
+        
+        private static readonly Dictionary<int, TrackedObject> trackedObjects = new Dictionary<int, TrackedObject>();
+        private static readonly List<HierarchyChange> changeLog = new List<HierarchyChange>();
+        // Milliseconds rather than ticks so tokens stay exact as JSON numbers in any client
+        private static long hierarchyRevision = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds();
+        // Oldest sinceRevision that can still be answered with a delta
+        private static long oldestDeltaRevision = long.MaxValue;
+        private static int trackedSceneHandle;
+        
+        // Main thread only, like everything below: what changed since the last refresh
+        private static readonly HashSet<int> dirtyIds = new HashSet<int>();
+        private static readonly HashSet<int> destroyedIds = new HashSet<int>();
+        private static bool fullWalkNeeded = true;
+        private static bool hierarchyChangedThisUpdate;
+        private static bool eventsThisUpdate;
+        
+        public static long HierarchyRevision => hierarchyRevision;
+        
+        // Whether the next RefreshHierarchy has to walk the whole active scene
+        public static bool NeedsFullWalk =>
+            fullWalkNeeded || (hierarchyChangedThisUpdate && !eventsThisUpdate) ||
+            oldestDeltaRevision == long.MaxValue || EditorSceneManager.GetActiveScene().handle != trackedSceneHandle;
+        
+        // Bring per-object revisions up to date with the active scene. Main thread only.
+        // When NeedsFullWalk, visitor sees every object with its path in hierarchy order,
+        // so a caller listing the whole scene can share the walk instead of making its own.
+        public static long RefreshHierarchy(Action<GameObject, string> visitor = null)
+        {
+            var scene = EditorSceneManager.GetActiveScene();
+            if (scene.handle != trackedSceneHandle || oldestDeltaRevision == long.MaxValue)
+            {
+                // New scene (or first use): start tracking from scratch
+                trackedObjects.Clear();
+                changeLog.Clear();
+                hierarchyRevision = Math.Max(hierarchyRevision + 1, DateTimeOffset.UtcNow.ToUnixTimeMilliseconds());
+                oldestDeltaRevision = hierarchyRevision;
+                trackedSceneHandle = scene.handle;
+                fullWalkNeeded = true;
+            }
+            
+            long next = hierarchyRevision + 1;
+            int logged = changeLog.Count;
+            
+            if (NeedsFullWalk)
+            {
+                fullWalkNeeded = false;
+                hierarchyChangedThisUpdate = false;
+                dirtyIds.Clear();
+                destroyedIds.Clear();
+                
+                var seen = new HashSet<int>();
+                foreach (var root in scene.GetRootGameObjects())
+                {
+                    Visit(root, root.name, 0, next, seen, visitor);
+                }
+                
+                if (seen.Count != trackedObjects.Count)
+                {
+                    var gone = new List<int>();
+                    foreach (int id in trackedObjects.Keys)
+                    {
+                        if (!seen.Contains(id))
+                        {
+                            gone.Add(id);
+                        }
+                    }
+                    foreach (int id in gone)
+                    {
+                        Untrack(id, next);
+                    }
+                }
+            }
+            else
+            {
+                foreach (int id in destroyedIds)
+                {
+                    Untrack(id, next);
+                }
+                foreach (int id in dirtyIds)
+                {
+                    Relocate(EditorUtility.InstanceIDToObject(id), id, next);
+                }
+                destroyedIds.Clear();
+                dirtyIds.Clear();
+            }
+            
+            if (changeLog.Count > MaxChangeHistory)
+            {
+                // Forget the oldest half, whole revisions at a time; deltas older than that
+                // become full snapshots
+                int drop = changeLog.Count / 2;
+                long cutoff = changeLog[drop - 1].revision;
+                while (drop < changeLog.Count && changeLog[drop].revision == cutoff)
+                {
+                    drop++;
+                }
+                oldestDeltaRevision = cutoff;
+                changeLog.RemoveRange(0, drop);
+            }
+            
+            if (changeLog.Count > logged)
+            {
+                hierarchyRevision = next;
+            }
+            
+            return hierarchyRevision;
+        }
+        
+        // Re-read the subtree of an object named by a change event, wherever it is now
+        private static void Relocate(UnityEngine.Object target, int id, long next)
+        {
+            // Other components carry none of the tracked fields
+            var go = target as GameObject ?? (target as Transform)?.gameObject;
+            if (go == null && target is Component)
+            {
+                return;
+            }
+            
+            if (go == null || go.scene.handle != trackedSceneHandle)
+            {
+                Untrack(go != null ? go.GetInstanceID() : id, next);
+                return;
+            }
+            
+            var parent = go.transform.parent;
+            string parentPath = parent != null ? MCPObjectIndex.GetPath(parent.gameObject) : null;
+            string path = parentPath == null ? go.name : $"{parentPath}/{go.name}";
+            Visit(go, path, parent != null ? parent.gameObject.GetInstanceID() : 0, next, null, null);
+        }
+        
+        private static void Visit(GameObject go, string path, int parentId, long next, HashSet<int> seen,
+            Action<GameObject, string> visitor)
+        {
+            int id = go.GetInstanceID();
+            seen?.Add(id);
+            visitor?.Invoke(go, path);
+            
+            Vector3 position = go.transform.position;
+            bool active = go.activeInHierarchy;
+            string tag = go.tag;
+            string layer = LayerMask.LayerToName(go.layer);
+            
+            if (!trackedObjects.TryGetValue(id, out var tracked))
+            {
+                tracked = new TrackedObject { addedRevision = next };
+                trackedObjects[id] = tracked;
+            }
+            
+            if (tracked.parentId != parentId)
+            {
+                if (trackedObjects.TryGetValue(tracked.parentId, out var previous))
+                {
+                    previous.children.Remove(id);
+                }
+                tracked.parentId = parentId;
+            }
+            if (parentId != 0 && trackedObjects.TryGetValue(parentId, out var parentTracked))
+            {
+                parentTracked.children.Add(id);
+            }
+            
+            if (tracked.revision == 0 || tracked.path != path || tracked.name != go.name || tracked.active != active ||
+                tracked.tag != tag || tracked.layer != layer || tracked.position != position)
+            {
+                tracked.name = go.name;
+                tracked.path = path;
+                tracked.active = active;
+                tracked.tag = tag;
+                tracked.layer = layer;
+                tracked.position = position;
+                tracked.revision = next;
+                changeLog.Add(new HierarchyChange { revision = next, instanceId = id });
+            }
+            
+            foreach (Transform child in go.transform)
+            {
+                Visit(child.gameObject, $"{path}/{child.name}", id, next, seen, visitor);
+            }
+            
+            // Children that left without an event of their own: destroyed, or moved elsewhere
+            if (tracked.children.Count > go.transform.childCount)
+            {
+                var left = new List<int>();
+                foreach (int childId in tracked.children)
+                {
+                    var child = EditorUtility.InstanceIDToObject(childId) as GameObject;
+                    if (child == null || child.transform.parent != go.transform)
+                    {
+                        left.Add(childId);
+                    }
+                }
+                foreach (int childId in left)
+                {
+                    tracked.children.Remove(childId);
+                    if (seen == null)
+                    {
+                        Relocate(EditorUtility.InstanceIDToObject(childId), childId, next);
+                    }
+                }
+            }
+        }
+        
+        // Drop an object and its tracked descendants, logging each removal
+        private static void Untrack(int id, long next)
+        {
+            if (!trackedObjects.TryGetValue(id, out var tracked))
+            {
+                return;
+            }
+            
+            trackedObjects.Remove(id);
+            if (trackedObjects.TryGetValue(tracked.parentId, out var parent))
+            {
+                parent.children.Remove(id);
+            }
+            changeLog.Add(new HierarchyChange
+            {
+                revision = next,
+                instanceId = id,
+                removed = true,
+                path = tracked.path,
+                addedRevision = tracked.addedRevision
+            });
+            
+            foreach (int childId in tracked.children)
+            {
+                Untrack(childId, next);
+            }
+        }
+        
+        // Whether sinceRevision can be answered with a delta for the active scene
+        public static bool CanDelta(long sinceRevision)
+        {
+            return EditorSceneManager.GetActiveScene().handle == trackedSceneHandle &&
+                sinceRevision >= oldestDeltaRevision && sinceRevision <= hierarchyRevision;
+        }
+        
+        // Objects added, changed and removed after sinceRevision (call after RefreshHierarchy).
+        // Reads only the change log entries after sinceRevision, newest first, so each object
+        // is reported once with its latest state.
+        public static JObject GetHierarchyDelta(long sinceRevision)
+        {
+            var added = new JArray();
+            var changed = new JArray();
+            var removed = new JArray();
+            var reported = new HashSet<int>();
+            
+            for (int i = changeLog.Count - 1; i >= 0 && changeLog[i].revision > sinceRevision; i--)
+            {
+                var change = changeLog[i];
+                if (!reported.Add(change.instanceId))
+                {
+                    continue;
+                }
+                
+                if (trackedObjects.TryGetValue(change.instanceId, out var tracked))
+                {
+                    var obj = new JObject
+                    {
+                        ["instanceId"] = change.instanceId,
+                        ["name"] = tracked.name,
+                        ["path"] = tracked.path,
+                        ["active"] = tracked.active,
+                        ["tag"] = tracked.tag,
+                        ["layer"] = tracked.layer,
+                        ["position"] = new JArray { tracked.position.x, tracked.position.y, tracked.position.z }
+                    };
+                    
+                    if (tracked.addedRevision > sinceRevision)
+                    {
+                        added.Add(obj);
+                    }
+                    else
+                    {
+                        changed.Add(obj);
+                    }
+                }
+                // Objects that came and went after sinceRevision were never seen by the caller
+                else if (change.removed && change.addedRevision <= sinceRevision)
+                {
+                    removed.Add(new JObject
+                    {
+                        ["instanceId"] = change.instanceId,
+                        ["path"] = change.path
+                    });
+                }
+            }
+            
+            return new JObject
+            {
+                ["added"] = added,
+                ["changed"] = changed,
+                ["removed"] = removed,
+                ["totalObjects"] = trackedObjects.Count
+            };
+        }
+        
+        // Answered directly on the listener thread; never waits for the main thread
+        public static JObject GetStatus()
+        {
+            return new JObject
+            {
+                ["success"] = true,
+                ["sceneVersion"] = SceneVersion
+            };
+        }
+    }
+}
@@ -0,0 +1,493 @@
+using UnityEngine;
+using UnityEditor;
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    // Asynchronous jobs: unity_submit_job queues any tool and returns a job id
+    // straight away, so slow operations (prefab imports, scene saves, script
+    // compiles) neither hit the 30 second request timeout nor hold a listener
+    // thread. Jobs run on the main thread through MCPServer's heavy lane, so
+    // they share its per-update budget: at most one heavy request or job per
+    // update, with queued reads and writes still served first. The status,
+    // wait and result tools are answered on the listener thread, so they also
+    // work while a job is blocking the main thread.
+    //
+    // Finished jobs are kept for RetentionSeconds, at most MaxRetainedJobs of
+    // them, oldest evicted first. The table survives assembly reloads through
+    // SessionState.
+    [InitializeOnLoad]
+    public static class MCPJobs
+    {
+        // Never wait longer than this, to stay inside the 30 second request timeout
+        public const double MaxWaitSeconds = 25.0;
+        
+        private const double RetentionSeconds = 600.0;
+        private const int MaxRetainedJobs = 100;
+        private const string SessionKey = "UnityMCP.Jobs";
+        
+        private static readonly HashSet<string> JobTools = new HashSet<string>
+        {
+            "unity_submit_job",
+            "unity_get_job_status",
+            "unity_wait_for_job",
+            "unity_get_job_result"
+        };
+        
+        private class Job
+        {
+            public string id;
+            public string tool;
+            public JObject args;
+            public string status = "queued";
+            public float progress;
+            public string message;
+            public DateTime submittedAt;
+            public DateTime startedAt;
+            public DateTime finishedAt;
+            public JObject result;
+            public ManualResetEvent done = new ManualResetEvent(false);
+            
+            public bool Finished => status == "succeeded" || status == "failed";
+        }
+        
+        private static readonly object jobLock = new object();
+        private static readonly Dictionary<string, Job> jobs = new Dictionary<string, Job>();
+        private static int queuedJobs;
+        private static int nextJobId = 1;
+        
+        // Main thread only: the job MCPTools.Execute is running, for ReportProgress
+        private static Job currentJob;
+        
+        static MCPJobs()
+        {
+            Restore();
+            AssemblyReloadEvents.beforeAssemblyReload += Save;
+        }
+        
+        public static bool IsJobTool(string tool)
+        {
+            return JobTools.Contains(tool);
+        }
+        
+        // Listener thread
+        public static JObject Execute(string tool, JObject args)
+        {
+            switch (tool)
+            {
+                case "unity_submit_job":
+                    return Submit(args);
+                case "unity_get_job_status":
+                    return GetStatus(args);
+                case "unity_wait_for_job":
+                    return Wait(args);
+                case "unity_get_job_result":
+                    return GetResult(args);
+                default:
+                    return Error($"Unknown tool: {tool}");
+            }
+        }
+        
+        // Main thread, from inside a tool: progress (0-1) shown by unity_get_job_status.
+        // Does nothing when the tool is not running as a job.
+        public static void ReportProgress(float progress, string message)
+        {
+            if (currentJob == null)
+            {
+                return;
+            }
+            
+            lock (jobLock)
+            {
+                currentJob.progress = Mathf.Clamp01(progress);
+                currentJob.message = message;
+            }
+        }
+        
+        private static JObject Submit(JObject args)
+        {
+            string tool = args["tool"]?.ToString();
+            var toolArgs = args["args"] as JObject ?? new JObject();
+            
+            if (string.IsNullOrEmpty(tool))
+            {
+                return Error("tool is required");
+            }
+            if (IsJobTool(tool))
+            {
+                return Error($"{tool} cannot run as a job");
+            }
+            
+            Job job;
+            int queued;
+            lock (jobLock)
+            {
+                Evict();
+                job = new Job
+                {
+                    id = $"job-{nextJobId++}",
+                    tool = tool,
+                    args = toolArgs,
+                    submittedAt = DateTime.UtcNow
+                };
+                jobs[job.id] = job;
+                queued = ++queuedJobs;
+            }
+            
+            MCPServer.EnqueueJob(job.id);
+            Debug.Log($"[MCP] Job {job.id} queued: {tool}");
+            
+            return new JObject
+            {
+                ["success"] = true,
+                ["jobId"] = job.id,
+                ["tool"] = tool,
+                ["status"] = "queued",
+                ["queuePosition"] = queued
+            };
+        }
+        
+        private static JObject GetStatus(JObject args)
+        {
+            string jobId = args["jobId"]?.ToString();
+            
+            lock (jobLock)
+            {
+                Evict();
+                
+                if (string.IsNullOrEmpty(jobId))
+                {
+                    // Every retained job, oldest first
+                    var list = new List<Job>(jobs.Values);
+                    list.Sort((a, b) => a.submittedAt.CompareTo(b.submittedAt));
+                    var summaries = new JArray();
+                    foreach (var listed in list)
+                    {
+                        summaries.Add(Describe(listed));
+                    }
+                    return new JObject
+                    {
+                        ["success"] = true,
+                        ["count"] = summaries.Count,
+                        ["jobs"] = summaries
+                    };
+                }
+                
+                if (!jobs.TryGetValue(jobId, out var job))
+                {
+                    return UnknownJob(jobId);
+                }
+                var status = Describe(job);
+                status["success"] = true;
+                return status;
+            }
+        }
+        
+        // Block until the job finishes or waitSeconds pass; the result is included once finished
+        private static JObject Wait(JObject args)
+        {
+            string jobId = args["jobId"]?.ToString();
+            double waitSeconds = Math.Min(args["waitSeconds"]?.ToObject<double>() ?? 20.0, MaxWaitSeconds);
+            
+            if (string.IsNullOrEmpty(jobId))
+            {
+                return Error("jobId is required");
+            }
+            
+            Job job;
+            lock (jobLock)
+            {
+                Evict();
+                if (!jobs.TryGetValue(jobId, out job))
+                {
+                    return UnknownJob(jobId);
+                }
+            }
+            
+            bool finished = job.done.WaitOne(TimeSpan.FromSeconds(Math.Max(0, waitSeconds)));
+            
+            lock (jobLock)
+            {
+                var response = Describe(job);
+                response["success"] = true;
+                response["timedOut"] = !finished;
+                if (finished)
+                {
+                    response["result"] = job.result;
+                }
+                return response;
+            }
+        }
+        
+        private static JObject GetResult(JObject args)
+        {
+            string jobId = args["jobId"]?.ToString();
+            if (string.IsNullOrEmpty(jobId))
+            {
+                return Error("jobId is required");
+            }
+            
+            lock (jobLock)
+            {
+                Evict();
+                if (!jobs.TryGetValue(jobId, out var job))
+                {
+                    return UnknownJob(jobId);
+                }
+                if (!job.Finished)
+                {
+                    return Error($"Job {jobId} is still {job.status}");
+                }
+                
+                // The tool's own response, so success and error read exactly as a direct call
+                var result = (JObject)job.result.DeepClone();
+                result["jobId"] = job.id;
+                return result;
+            }
+        }
+        
+        // Main thread, from MCPServer.ProcessRequests when the job's turn in the heavy lane comes
+        public static void Run(string jobId)
+        {
+            Job job;
+            lock (jobLock)
+            {
+                if (!jobs.TryGetValue(jobId, out job) || job.status != "queued")
+                {
+                    return;
+                }
+                queuedJobs--;
+                job.status = "running";
+                job.startedAt = DateTime.UtcNow;
+            }
+            
+            Debug.Log($"[MCP] Job {job.id} running: {job.tool}");
+            
+            JObject result;
+            currentJob = job;
+            try
+            {
+                result = MCPTools.Execute(job.tool, job.args);
+            }
+            catch (Exception e)
+            {
+                Debug.LogError($"[MCP] Job {job.id} error: {e.Message}");
+                result = Error(e.Message);
+            }
+            finally
+            {
+                currentJob = null;
+            }
+            
+            if (job.tool == "unity_create_scripts" && result["waitId"] != null)
+            {
+                // Finish once the compile completes; the assembly reload waits for Release
+                SetProgress(job, 0.5f, "Compiling");
+                ThreadPool.QueueUserWorkItem(_ =>
+                {
+                    int waitId = MCPScripts.WaitForCompile(result);
+                    Complete(job, result);
+                    MCPScripts.Release(waitId);
+                });
+                return;
+            }
+            
+            Complete(job, result);
+        }
+        
+        private static void SetProgress(Job job, float progress, string message)
+        {
+            lock (jobLock)
+            {
+                job.progress = progress;
+                job.message = message;
+            }
+        }
+        
+        private static void Complete(Job job, JObject result)
+        {
+            lock (jobLock)
+            {
+                job.result = result;
+                job.status = result["success"]?.ToObject<bool>() == true ? "succeeded" : "failed";
+                job.progress = 1f;
+                job.message = null;
+                job.finishedAt = DateTime.UtcNow;
+                job.done.Set();
+                Evict();
+            }
+            
+            Debug.Log($"[MCP] Job {job.id} {job.status} in {(job.finishedAt - job.startedAt).TotalSeconds:F2}s");
+        }
+        
+        // Caller holds jobLock. Drops finished jobs past their retention time, then the oldest beyond the cap.
+        private static void Evict()
+        {
+            var now = DateTime.UtcNow;
+            var finished = new List<Job>();
+            foreach (var job in jobs.Values)
+            {
+                if (job.Finished)
+                {
+                    finished.Add(job);
+                }
+            }
+            
+            finished.Sort((a, b) => a.finishedAt.CompareTo(b.finishedAt));
+            int excess = finished.Count - MaxRetainedJobs;
+            for (int i = 0; i < finished.Count; i++)
+            {
+                if (i < excess || (now - finished[i].finishedAt).TotalSeconds > RetentionSeconds)
+                {
+                    jobs.Remove(finished[i].id);
+                }
+            }
+        }
+        
+        // Caller holds jobLock
+        private static JObject Describe(Job job)
+        {
+            var now = DateTime.UtcNow;
+            var status = new JObject
+            {
+                ["jobId"] = job.id,
+                ["tool"] = job.tool,
+                ["status"] = job.status,
+                ["progress"] = job.progress
+            };
+            
+            if (!string.IsNullOrEmpty(job.message))
+            {
+                status["message"] = job.message;
+            }
+            
+            if (job.status == "queued")
+            {
+                status["queuedSeconds"] = Math.Round((now - job.submittedAt).TotalSeconds, 3);
+            }
+            else
+            {
+                var end = job.Finished ? job.finishedAt : now;
+                status["elapsedSeconds"] = Math.Round((end - job.startedAt).TotalSeconds, 3);
+            }
+            
+            if (job.Finished)
+            {
+                status["expiresInSeconds"] = Math.Round(RetentionSeconds - (now - job.finishedAt).TotalSeconds, 3);
+                if (job.status == "failed")
+                {
+                    status["error"] = job.result["error"];
+                }
+            }
+            return status;
+        }
+        
+        // Keep the table across assembly reloads (script compiles reload the domain)
+        private static void Save()
+        {
+            var saved = new JArray();
+            lock (jobLock)
+            {
+                foreach (var job in jobs.Values)
+                {
+                    saved.Add(new JObject
+                    {
+                        ["id"] = job.id,
+                        ["tool"] = job.tool,
+                        ["args"] = job.args,
+                        ["status"] = job.status,
+                        ["submittedAt"] = job.submittedAt.Ticks,
+                        ["startedAt"] = job.startedAt.Ticks,
+                        ["finishedAt"] = job.finishedAt.Ticks,
+                        ["result"] = job.result
+                    });
+                }
+            }
+            
+            SessionState.SetString(SessionKey, new JObject
+            {
+                ["nextJobId"] = nextJobId,
+                ["jobs"] = saved
+            }.ToString(Formatting.None));
+        }
+        
+        private static void Restore()
+        {
+            string json = SessionState.GetString(SessionKey, null);
+            if (string.IsNullOrEmpty(json))
+            {
+                return;
+            }
+            SessionState.EraseString(SessionKey);
+            
+            try
+            {
+                var state = JObject.Parse(json);
+                nextJobId = state["nextJobId"]?.ToObject<int>() ?? 1;
+                
+                var restored = new List<Job>();
+                foreach (JObject saved in state["jobs"])
+                {
+                    var job = new Job
+                    {
+                        id = saved["id"].ToString(),
+                        tool = saved["tool"].ToString(),
+                        args = saved["args"] as JObject ?? new JObject(),
+                        status = saved["status"].ToString(),
+                        submittedAt = new DateTime(saved["submittedAt"].ToObject<long>(), DateTimeKind.Utc),
+                        startedAt = new DateTime(saved["startedAt"].ToObject<long>(), DateTimeKind.Utc),
+                        finishedAt = new DateTime(saved["finishedAt"].ToObject<long>(), DateTimeKind.Utc),
+                        result = saved["result"] as JObject
+                    };
+                    
+                    if (job.status == "running")
+                    {
+                        job.result = Error("Interrupted by assembly reload");
+                        job.status = "failed";
+                        job.finishedAt = DateTime.UtcNow;
+                    }
+                    if (job.Finished)
+                    {
+                        job.progress = 1f;
+                        job.done.Set();
+                    }
+                    restored.Add(job);
+                }
+                
+                // Queued jobs go back into the heavy lane in their old order
+                restored.Sort((a, b) => a.submittedAt.CompareTo(b.submittedAt));
+                foreach (var job in restored)
+                {
+                    jobs[job.id] = job;
+                    if (job.status == "queued")
+                    {
+                        queuedJobs++;
+                        MCPServer.EnqueueJob(job.id);
+                    }
+                }
+            }
+            catch (Exception e)
+            {
+                Debug.LogError($"[MCP] Could not restore jobs: {e.Message}");
+            }
+        }
+        
+        private static JObject UnknownJob(string jobId)
+        {
+            return Error($"Unknown job '{jobId}'. Finished jobs are kept for {RetentionSeconds:F0} seconds.");
+        }
+        
+        private static JObject Error(string message)
+        {
+            return new JObject
+            {
+                ["success"] = false,
+                ["error"] = message
+            };
+        }
+    }
+}
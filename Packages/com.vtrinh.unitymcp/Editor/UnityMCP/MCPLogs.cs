@@ -0,0 +1,294 @@
+using UnityEngine;
+using UnityEditor;
+using System;
+using System.Collections.Generic;
+using System.Reflection;
+using System.Text.RegularExpressions;
+using System.Threading;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    // Console log reader for unity_get_logs. Reflection handles into the
+    // internal LogEntries API are looked up once per domain load, and filters
+    // run here rather than in the client. LogSequence/WaitForNewLogs let the
+    // listener thread long-poll without holding the main thread.
+    [InitializeOnLoad]
+    public static class MCPLogs
+    {
+        // Long-polls never wait longer than this, to stay inside the 30 second request timeout
+        public const double MaxWaitSeconds = 25.0;
+        
+        // Console entries that are not raised through logMessageReceived (compiler
+        // messages, for instance) are picked up by re-checking this often
+        private const int RecheckMilliseconds = 500;
+        
+        // The bridge's per-request trace lines (MCPServer.Dispatch, ProcessRequests,
+        // SendResponse); they neither wake long-polls nor are returned. Its other
+        // lines, errors and warnings included, stay visible.
+        private static readonly string[] TracePrefixes =
+        {
+            "[MCP] Received: ",
+            "[MCP] Executing: ",
+            "[MCP] Executed successfully",
+            "[MCP] Response sent: "
+        };
+        
+        // LogEntry.mode bits (UnityEditor.LogMessageFlags)
+        private const int ErrorModeMask = 1 | 2 | 16 | 64 | 256 | 2048 | 131072 | 2097152;
+        private const int WarningModeMask = 128 | 512 | 4096;
+        
+        private static readonly string[] LogTypes = { "Log", "Warning", "Error" };
+        
+        private static readonly MethodInfo getCountMethod;
+        private static readonly MethodInfo startGettingEntriesMethod;
+        private static readonly MethodInfo getEntryInternalMethod;
+        private static readonly MethodInfo endGettingEntriesMethod;
+        private static readonly Type logEntryType;
+        private static readonly FieldInfo messageField;
+        private static readonly FieldInfo fileField;
+        private static readonly FieldInfo lineField;
+        private static readonly FieldInfo modeField;
+        
+        private static string cachedPattern;
+        private static Regex cachedRegex;
+        
+        private static long logSequence;
+        private static readonly object logSignal = new object();
+        
+        public static long LogSequence
+        {
+            get { lock (logSignal) { return logSequence; } }
+        }
+        
+        static MCPLogs()
+        {
+            var logEntriesType = Type.GetType("UnityEditor.LogEntries,UnityEditor.dll");
+            getCountMethod = logEntriesType.GetMethod("GetCount");
+            startGettingEntriesMethod = logEntriesType.GetMethod("StartGettingEntries");
+            getEntryInternalMethod = logEntriesType.GetMethod("GetEntryInternal");
+            endGettingEntriesMethod = logEntriesType.GetMethod("EndGettingEntries");
+            
+            logEntryType = Type.GetType("UnityEditor.LogEntry,UnityEditor.dll");
+            messageField = logEntryType.GetField("message");
+            fileField = logEntryType.GetField("file");
+            lineField = logEntryType.GetField("line");
+            modeField = logEntryType.GetField("mode");
+            
+            Application.logMessageReceivedThreaded += OnLogMessage;
+        }
+        
+        private static void OnLogMessage(string condition, string stackTrace, LogType type)
+        {
+            if (type == LogType.Log && IsTrace(condition))
+            {
+                return;
+            }
+            
+            lock (logSignal)
+            {
+                logSequence++;
+                Monitor.PulseAll(logSignal);
+            }
+        }
+        
+        private static bool IsTrace(string message)
+        {
+            if (message == null)
+            {
+                return false;
+            }
+            foreach (var prefix in TracePrefixes)
+            {
+                if (message.StartsWith(prefix, StringComparison.Ordinal))
+                {
+                    return true;
+                }
+            }
+            return false;
+        }
+        
+        // Block until something is logged after `seen` or the timeout passes. Any thread but the main one.
+        public static void WaitForNewLogs(long seen, TimeSpan timeout)
+        {
+            int milliseconds = (int)Math.Min(timeout.TotalMilliseconds, RecheckMilliseconds);
+            if (milliseconds <= 0)
+            {
+                return;
+            }
+            
+            lock (logSignal)
+            {
+                if (logSequence == seen)
+                {
+                    Monitor.Wait(logSignal, milliseconds);
+                }
+            }
+        }
+        
+        private static string GetLogType(int mode)
+        {
+            if ((mode & ErrorModeMask) != 0)
+                return "Error";
+            if ((mode & WarningModeMask) != 0)
+                return "Warning";
+            return "Log";
+        }
+        
+        // Main thread only
+        public static JObject GetLogs(JObject args)
+        {
+            int count = args["count"]?.ToObject<int>() ?? 50;
+            bool includeStackTrace = args["includeStackTrace"]?.ToObject<bool>() ?? false;
+            var sinceToken = args["sinceIndex"];
+            string contains = args["contains"]?.ToString();
+            string pattern = args["pattern"]?.ToString();
+            
+            HashSet<string> types = null;
+            if (args["types"] is JArray typesArray && typesArray.Count > 0)
+            {
+                types = new HashSet<string>();
+                foreach (var token in typesArray)
+                {
+                    string type = token.ToString();
+                    if (Array.IndexOf(LogTypes, type) < 0)
+                    {
+                        throw new Exception($"Unknown log type '{type}'. Valid types: {string.Join(", ", LogTypes)}");
+                    }
+                    types.Add(type);
+                }
+            }
+            
+            Regex regex = null;
+            if (!string.IsNullOrEmpty(pattern))
+            {
+                if (pattern != cachedPattern)
+                {
+                    try
+                    {
+                        cachedRegex = new Regex(pattern, RegexOptions.CultureInvariant);
+                    }
+                    catch (ArgumentException e)
+                    {
+                        throw new Exception($"Invalid pattern: {e.Message}");
+                    }
+                    cachedPattern = pattern;
+                }
+                regex = cachedRegex;
+            }
+            
+            int totalCount = (int)getCountMethod.Invoke(null, null);
+            var logs = new List<JObject>();
+            int nextIndex = totalCount;
+            bool reset = false;
+            
+            var logEntry = Activator.CreateInstance(logEntryType);
+            var entryArgs = new object[] { 0, logEntry };
+            
+            // Null when the entry does not pass the filters
+            JObject ReadEntry(int index)
+            {
+                entryArgs[0] = index;
+                getEntryInternalMethod.Invoke(null, entryArgs);
+                
+                string logType = GetLogType((int)modeField.GetValue(entryArgs[1]));
+                if (types != null && !types.Contains(logType))
+                {
+                    return null;
+                }
+                
+                var message = messageField.GetValue(entryArgs[1]) as string ?? "";
+                if (logType == "Log" && IsTrace(message))
+                {
+                    return null;
+                }
+                if (!string.IsNullOrEmpty(contains) && message.IndexOf(contains, StringComparison.OrdinalIgnoreCase) < 0)
+                {
+                    return null;
+                }
+                if (regex != null && !regex.IsMatch(message))
+                {
+                    return null;
+                }
+                
+                var logObj = new JObject
+                {
+                    ["index"] = index,
+                    ["type"] = logType,
+                    ["message"] = message
+                };
+                
+                var file = fileField.GetValue(entryArgs[1]) as string;
+                if (includeStackTrace && !string.IsNullOrEmpty(file))
+                {
+                    logObj["file"] = file;
+                    logObj["line"] = (int)lineField.GetValue(entryArgs[1]);
+                }
+                return logObj;
+            }
+            
+            startGettingEntriesMethod.Invoke(null, null);
+            
+            try
+            {
+                if (sinceToken != null && sinceToken.Type != JTokenType.Null)
+                {
+                    // Oldest first from the cursor, stopping once `count` entries match
+                    int start = sinceToken.ToObject<int>();
+                    if (start > totalCount)
+                    {
+                        // Console was cleared since the cursor was issued
+                        start = 0;
+                        reset = true;
+                    }
+                    
+                    for (int i = Math.Max(0, start); i < totalCount; i++)
+                    {
+                        var logObj = ReadEntry(i);
+                        if (logObj == null)
+                        {
+                            continue;
+                        }
+                        logs.Add(logObj);
+                        if (logs.Count >= count)
+                        {
+                            nextIndex = i + 1;
+                            break;
+                        }
+                    }
+                }
+                else
+                {
+                    // Newest `count` matching entries, returned oldest first
+                    for (int i = totalCount - 1; i >= 0 && logs.Count < count; i--)
+                    {
+                        var logObj = ReadEntry(i);
+                        if (logObj != null)
+                        {
+                            logs.Add(logObj);
+                        }
+                    }
+                    logs.Reverse();
+                }
+            }
+            finally
+            {
+                endGettingEntriesMethod.Invoke(null, null);
+            }
+            
+            var result = new JObject
+            {
+                ["success"] = true,
+                ["totalCount"] = totalCount,
+                ["returnedCount"] = logs.Count,
+                ["nextIndex"] = nextIndex,
+                ["logs"] = new JArray(logs)
+            };
+            if (reset)
+            {
+                result["reset"] = true;
+            }
+            return result;
+        }
+    }
+}
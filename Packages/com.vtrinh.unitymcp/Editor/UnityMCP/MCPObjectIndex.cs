@@ -0,0 +1,379 @@
+using UnityEngine;
+using UnityEditor;
+using UnityEngine.SceneManagement;
+using UnityEditor.SceneManagement;
+using System.Collections.Generic;
+
+namespace UnityMCP
+{
+    // Resolves the GameObject a tool targets: either a handle ("id:<instanceId>",
+    // returned by creating and finding tools) or a name/path as accepted by
+    // GameObject.Find. Names and paths go through a name -> objects and
+    // path -> object index of every loaded scene instead of a full scan per call.
+    // The active scene is indexed first, so its objects win when names repeat
+    // across scenes.
+    //
+    // The index is built when the set of loaded scenes or the active scene
+    // changes, and otherwise kept up to date from ObjectChangeEvents: created,
+    // re-parented and renamed objects have their subtree re-indexed, and
+    // destroyed ones are dropped when a lookup next meets them. Tools that
+    // create objects add them straight away, since the events only arrive
+    // after the tool returns. A hierarchy change that published no events
+    // (code that bypasses Undo) makes the next lookup rebuild. Hits are
+    // re-checked against the live object, and stale entries are fixed in
+    // place, so the index never returns the wrong object. Unlike
+    // GameObject.Find, inactive objects are found too (active ones win when
+    // names repeat).
+    [InitializeOnLoad]
+    public static class MCPObjectIndex
+    {
+        public const string HandlePrefix = "id:";
+        
+        // What an object was indexed under, so re-indexing can remove the old entries
+        private class IndexedObject
+        {
+            public string name;
+            public string path;
+        }
+        
+        private static readonly Dictionary<string, List<GameObject>> byName = new Dictionary<string, List<GameObject>>();
+        private static readonly Dictionary<string, GameObject> byPath = new Dictionary<string, GameObject>();
+        private static readonly Dictionary<int, IndexedObject> indexed = new Dictionary<int, IndexedObject>();
+        private static bool dirty = true;
+        private static readonly List<int> indexedScenes = new List<int>();
+        private static readonly List<Scene> loadedScenes = new List<Scene>();
+        
+        static MCPObjectIndex()
+        {
+            ObjectChangeEvents.changesPublished += OnChangesPublished;
+            MCPChangeTracker.UnpublishedHierarchyChange += Invalidate;
+        }
+        
+        public static void Invalidate()
+        {
+            dirty = true;
+        }
+        
+        public static string Handle(GameObject go)
+        {
+            return HandlePrefix + go.GetInstanceID();
+        }
+        
+        public static string GetPath(GameObject go)
+        {
+            string path = go.name;
+            for (var parent = go.transform.parent; parent != null; parent = parent.parent)
+            {
+                path = parent.name + "/" + path;
+            }
+            return path;
+        }
+        
+        // Root objects of every loaded scene, active scene first, in the index's order
+        public static IEnumerable<GameObject> LoadedRoots()
+        {
+            ReadLoadedScenes();
+            foreach (var scene in loadedScenes.ToArray())
+            {
+                foreach (var root in scene.GetRootGameObjects())
+                {
+                    yield return root;
+                }
+            }
+        }
+        
+        // Index an object created by a tool (and its children) before its events arrive
+        public static void Add(GameObject go)
+        {
+            if (dirty)
+            {
+                return;
+            }
+            Reindex(go);
+        }
+        
+        public static GameObject Find(string nameOrHandle)
+        {
+            if (string.IsNullOrEmpty(nameOrHandle))
+            {
+                return null;
+            }
+            
+            if (nameOrHandle.StartsWith(HandlePrefix))
+            {
+                if (!int.TryParse(nameOrHandle.Substring(HandlePrefix.Length), out int instanceId))
+                {
+                    return null;
+                }
+                var target = EditorUtility.InstanceIDToObject(instanceId) as GameObject;
+                // Scene objects only, not prefab assets
+                return target != null && target.scene.IsValid() ? target : null;
+            }
+            
+            if (ReadLoadedScenes() || dirty)
+            {
+                Rebuild();
+            }
+            return Lookup(nameOrHandle);
+        }
+        
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            if (dirty)
+            {
+                // The next lookup rebuilds anyway
+                return;
+            }
+            
+            for (int i = 0; i < stream.length; i++)
+            {
+                switch (stream.GetEventType(i))
+                {
+                    case ObjectChangeKind.CreateGameObjectHierarchy:
+                        stream.GetCreateGameObjectHierarchyEvent(i, out var created);
+                        Reindex(EditorUtility.InstanceIDToObject(created.instanceId) as GameObject);
+                        break;
+                    
+                    case ObjectChangeKind.ChangeGameObjectParent:
+                        stream.GetChangeGameObjectParentEvent(i, out var reparented);
+                        Reindex(EditorUtility.InstanceIDToObject(reparented.instanceId) as GameObject);
+                        break;
+                    
+                    case ObjectChangeKind.ChangeGameObjectStructureHierarchy:
+                        stream.GetChangeGameObjectStructureHierarchyEvent(i, out var structure);
+                        Reindex(EditorUtility.InstanceIDToObject(structure.instanceId) as GameObject);
+                        break;
+                    
+                    case ObjectChangeKind.UpdatePrefabInstances:
+                        stream.GetUpdatePrefabInstancesEvent(i, out var prefabInstances);
+                        foreach (int id in prefabInstances.instanceIds)
+                        {
+                            Reindex(EditorUtility.InstanceIDToObject(id) as GameObject);
+                        }
+                        break;
+                    
+                    case ObjectChangeKind.ChangeGameObjectOrComponentProperties:
+                    {
+                        // Only a rename moves index entries
+                        stream.GetChangeGameObjectOrComponentPropertiesEvent(i, out var properties);
+                        var go = EditorUtility.InstanceIDToObject(properties.instanceId) as GameObject;
+                        if (go != null && indexed.TryGetValue(properties.instanceId, out var entry) && entry.name != go.name)
+                        {
+                            Reindex(go);
+                        }
+                        break;
+                    }
+                    
+                    case ObjectChangeKind.DestroyGameObjectHierarchy:
+                        stream.GetDestroyGameObjectHierarchyEvent(i, out var destroyed);
+                        Unindex(destroyed.instanceId);
+                        break;
+                }
+            }
+        }
+        
+        // Fills loadedScenes, active scene first; true if they differ from the indexed ones
+        private static bool ReadLoadedScenes()
+        {
+            loadedScenes.Clear();
+            var active = EditorSceneManager.GetActiveScene();
+            loadedScenes.Add(active);
+            for (int i = 0; i < SceneManager.sceneCount; i++)
+            {
+                var scene = SceneManager.GetSceneAt(i);
+                if (scene.isLoaded && scene != active)
+                {
+                    loadedScenes.Add(scene);
+                }
+            }
+            
+            if (loadedScenes.Count != indexedScenes.Count)
+            {
+                return true;
+            }
+            for (int i = 0; i < loadedScenes.Count; i++)
+            {
+                if (loadedScenes[i].handle != indexedScenes[i])
+                {
+                    return true;
+                }
+            }
+            return false;
+        }
+        
+        private static void Rebuild()
+        {
+            byName.Clear();
+            byPath.Clear();
+            indexed.Clear();
+            indexedScenes.Clear();
+            foreach (var scene in loadedScenes)
+            {
+                indexedScenes.Add(scene.handle);
+                foreach (var root in scene.GetRootGameObjects())
+                {
+                    Index(root, null);
+                }
+            }
+            
+            dirty = false;
+        }
+        
+        // Fix a stale entry met by a lookup: destroyed objects leave the index, others move
+        // to their current name and path
+        private static void Refresh(GameObject go)
+        {
+            if (go == null)
+            {
+                // Destroyed objects still report their instance ID
+                Unindex(go.GetInstanceID());
+                return;
+            }
+            Reindex(go);
+        }
+        
+        // Re-index an object and its children under their current names and paths
+        private static void Reindex(GameObject go)
+        {
+            if (go == null)
+            {
+                return;
+            }
+            if (!indexedScenes.Contains(go.scene.handle))
+            {
+                Unindex(go.GetInstanceID());
+                return;
+            }
+            var parent = go.transform.parent;
+            Index(go, parent != null ? GetPath(parent.gameObject) : null);
+        }
+        
+        private static void Index(GameObject go, string parentPath)
+        {
+            string path = parentPath == null ? go.name : parentPath + "/" + go.name;
+            int id = go.GetInstanceID();
+            
+            // Entries that are still right keep their place, so active-scene objects stay first
+            bool current = indexed.TryGetValue(id, out var entry) && entry.name == go.name && entry.path == path;
+            if (!current)
+            {
+                Unindex(id);
+                indexed[id] = new IndexedObject { name = go.name, path = path };
+                
+                if (!byName.TryGetValue(go.name, out var named))
+                {
+                    named = new List<GameObject>();
+                    byName[go.name] = named;
+                }
+                named.Add(go);
+                
+                // The first object indexed under a path wins, except that the active scene beats others
+                if (!byPath.TryGetValue(path, out var existing) || existing == null ||
+                    (go.scene.handle == indexedScenes[0] && existing.scene.handle != indexedScenes[0]))
+                {
+                    byPath[path] = go;
+                }
+            }
+            
+            foreach (Transform child in go.transform)
+            {
+                Index(child.gameObject, path);
+            }
+        }
+        
+        // Drop one object's entries; its children keep theirs until they are re-indexed or met destroyed
+        private static void Unindex(int id)
+        {
+            if (!indexed.TryGetValue(id, out var entry))
+            {
+                return;
+            }
+            indexed.Remove(id);
+            
+            if (byName.TryGetValue(entry.name, out var named))
+            {
+                named.RemoveAll(candidate => candidate == null || candidate.GetInstanceID() == id);
+                if (named.Count == 0)
+                {
+                    byName.Remove(entry.name);
+                }
+            }
+            if (byPath.TryGetValue(entry.path, out var exact) && (exact == null || exact.GetInstanceID() == id))
+            {
+                byPath.Remove(entry.path);
+            }
+        }
+        
+        // GameObject.Find semantics: a bare name matches at any depth, "a/b" matches a
+        // path ending in a/b, and a leading '/' anchors the path at a root object
+        private static GameObject Lookup(string name)
+        {
+            bool anchored = name.StartsWith("/");
+            string path = name.Trim('/');
+            int slash = path.LastIndexOf('/');
+            
+            if (slash >= 0 && byPath.TryGetValue(path, out var exact))
+            {
+                if (exact != null && GetPath(exact) == path)
+                {
+                    return exact;
+                }
+                // Moved or renamed without an event yet, or destroyed: fix the entry and
+                // fall back to the name list, which checks live paths
+                byPath.Remove(path);
+                Refresh(exact);
+            }
+            
+            string leaf = slash >= 0 ? path.Substring(slash + 1) : path;
+            if (!byName.TryGetValue(leaf, out var candidates))
+            {
+                return null;
+            }
+            
+            string suffix = "/" + path;
+            GameObject match = null;
+            GameObject inactiveMatch = null;
+            List<GameObject> stale = null;
+            foreach (var candidate in candidates)
+            {
+                if (candidate == null || candidate.name != leaf)
+                {
+                    if (stale == null)
+                    {
+                        stale = new List<GameObject>();
+                    }
+                    stale.Add(candidate);
+                    continue;
+                }
+                if (slash >= 0 || anchored)
+                {
+                    // "/name" and "/a/b" only match from a root object
+                    string candidatePath = GetPath(candidate);
+                    if (anchored ? candidatePath != path : candidatePath != path && !candidatePath.EndsWith(suffix))
+                    {
+                        continue;
+                    }
+                }
+                
+                if (candidate.activeInHierarchy)
+                {
+                    match = candidate;
+                    break;
+                }
+                if (inactiveMatch == null)
+                {
+                    inactiveMatch = candidate;
+                }
+            }
+            
+            if (stale != null)
+            {
+                foreach (var candidate in stale)
+                {
+                    Refresh(candidate);
+                }
+            }
+            return match ?? inactiveMatch;
+        }
+    }
+}
@@ -0,0 +1,895 @@
+using UnityEngine;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using Stopwatch = System.Diagnostics.Stopwatch;
+
+namespace UnityMCP
+{
+    // unity_instantiate_prefabs: many instances of one prefab in one call. Positions
+    // are given (3 numbers per instance) or generated from a pattern: a grid on the
+    // XZ plane, a ring around a point, or a seeded random scatter inside bounds.
+    // Property overrides ("Component.property": value) are tried on the prefab asset
+    // first, without applying them, so a bad one fails the call before anything is
+    // created. Instances keep their prefab link, are created as one undo step and
+    // come back as handles.
+    //
+    // unity_create_prefabs_from_assets: a prefab for each model (or prefab) matched by
+    // a path glob or listed, optionally with components added, saved inside one
+    // StartAssetEditing/StopAssetEditing window so the new prefabs import together.
+    //
+    // unity_update_prefab: an ordered list of add_component, remove_component and
+    // set_property operations, on the root or on children by path, applied to one
+    // LoadPrefabContents copy and saved once. If any operation fails, nothing is saved.
+    public static class MCPPrefabs
+    {
+        // Keeps one call well inside the request timeout; run more as a job
+        public const int MaxInstances = 10000;
+        public const int MaxPrefabsFromAssets = 500;
+        
+        private class PropertyTarget
+        {
+            public Type componentType;
+            public string propertyPath;
+        }
+        
+        public static JObject InstantiatePrefabs(JObject args)
+        {
+            string prefabPath = NormalizePrefabPath(args["prefabPath"]?.ToString());
+            if (prefabPath == null)
+            {
+                return Error("prefabPath is required");
+            }
+            
+            GameObject prefab = AssetDatabase.LoadAssetAtPath<GameObject>(prefabPath);
+            if (prefab == null)
+            {
+                return Error($"Prefab not found at '{prefabPath}'");
+            }
+            
+            // Where the instances go: explicit positions, a pattern, or the prefab's own position
+            JArray positionArray = args["positions"] as JArray;
+            JObject pattern = args["pattern"] as JObject;
+            int count;
+            Vector3[] positions = null;
+            if (positionArray != null)
+            {
+                if (pattern != null)
+                {
+                    return Error("Pass either positions or pattern, not both");
+                }
+                if (positionArray.Count == 0 || positionArray.Count % 3 != 0)
+                {
+                    return Error($"positions must hold 3 numbers per instance; got {positionArray.Count}");
+                }
+                count = positionArray.Count / 3;
+                int requested = args["count"]?.ToObject<int>() ?? count;
+                if (requested != count)
+                {
+                    return Error($"count is {requested} but positions hold {count} instances");
+                }
+            }
+            else
+            {
+                count = args["count"]?.ToObject<int>() ?? 0;
+                if (count < 1)
+                {
+                    return Error("count (at least 1) is required unless positions are given");
+                }
+            }
+            
+            if (count > MaxInstances)
+            {
+                return Error($"At most {MaxInstances} instances per call; got {count}. Split the call or run it with unity_submit_job");
+            }
+            
+            if (positionArray != null)
+            {
+                positions = new Vector3[count];
+                for (int i = 0; i < count; i++)
+                {
+                    positions[i] = new Vector3((float)positionArray[i * 3], (float)positionArray[i * 3 + 1], (float)positionArray[i * 3 + 2]);
+                }
+            }
+            else if (pattern != null)
+            {
+                string patternProblem = PatternPositions(pattern, count, out positions);
+                if (patternProblem != null)
+                {
+                    return Error(patternProblem);
+                }
+            }
+            
+            string problem = MCPTransforms.ReadChannel(args, "rotations", count, "instance", out float[] rotations);
+            if (problem != null)
+            {
+                return Error(problem);
+            }
+            problem = MCPTransforms.ReadChannel(args, "scales", count, "instance", out float[] scales);
+            if (problem != null)
+            {
+                return Error(problem);
+            }
+            
+            Transform parent = null;
+            string parentName = args["parent"]?.ToString();
+            if (!string.IsNullOrEmpty(parentName))
+            {
+                GameObject parentObj = MCPObjectIndex.Find(parentName);
+                if (parentObj == null)
+                {
+                    return Error($"Parent GameObject '{parentName}' not found");
+                }
+                parent = parentObj.transform;
+            }
+            
+            string nameFormat = args["name"]?.ToString() ?? "{prefab}_{i}";
+            int startIndex = args["startIndex"]?.ToObject<int>() ?? 0;
+            
+            // Overrides: "properties" for every instance, "overrides"[i] for instance i
+            JObject shared = args["properties"] as JObject;
+            JArray perInstance = args["overrides"] as JArray;
+            if (perInstance != null && perInstance.Count > count)
+            {
+                return Error($"overrides has {perInstance.Count} entries for {count} instances");
+            }
+            
+            var targets = new Dictionary<string, PropertyTarget>();
+            var trial = new Dictionary<Type, SerializedObject>();
+            problem = CheckOverrides(prefab, shared, "properties", targets, trial);
+            for (int i = 0; problem == null && perInstance != null && i < perInstance.Count; i++)
+            {
+                JToken entry = perInstance[i];
+                if (entry.Type == JTokenType.Null)
+                {
+                    continue;
+                }
+                if (!(entry is JObject values))
+                {
+                    return Error($"overrides[{i}] must be an object of \"Component.property\": value");
+                }
+                problem = CheckOverrides(prefab, values, $"overrides[{i}]", targets, trial);
+            }
+            if (problem != null)
+            {
+                return Error(problem);
+            }
+            
+            Undo.IncrementCurrentGroup();
+            int undoGroup = Undo.GetCurrentGroup();
+            Undo.SetCurrentGroupName($"MCP Instantiate {prefab.name} x{count}");
+            
+            var handles = new JArray();
+            for (int i = 0; i < count; i++)
+            {
+                var instance = (GameObject)PrefabUtility.InstantiatePrefab(prefab, parent);
+                instance.name = nameFormat.Replace("{prefab}", prefab.name).Replace("{i}", (startIndex + i).ToString());
+                
+                Transform transform = instance.transform;
+                if (positions != null)
+                {
+                    transform.localPosition = positions[i];
+                }
+                if (rotations != null)
+                {
+                    transform.localEulerAngles = MCPTransforms.Read(rotations, i);
+                }
+                if (scales != null)
+                {
+                    transform.localScale = MCPTransforms.Read(scales, i);
+                }
+                
+                JObject own = perInstance != null && i < perInstance.Count ? perInstance[i] as JObject : null;
+                if (shared != null || own != null)
+                {
+                    ApplyOverrides(instance, shared, own, targets);
+                }
+                
+                Undo.RegisterCreatedObjectUndo(instance, $"Instantiate {instance.name}");
+                MCPObjectIndex.Add(instance);
+                handles.Add(MCPObjectIndex.Handle(instance));
+                MCPJobs.ReportProgress((float)(i + 1) / count, $"{i + 1}/{count} instances");
+            }
+            
+            Undo.CollapseUndoOperations(undoGroup);
+            EditorSceneManager.MarkSceneDirty(EditorSceneManager.GetActiveScene());
+            
+            Debug.Log($"[MCP] Instantiated {count} x '{prefabPath}'" + (parent != null ? $" under '{parent.name}'" : ""));
+            
+            return new JObject
+            {
+                ["success"] = true,
+                ["prefabPath"] = prefabPath,
+                ["count"] = count,
+                ["handles"] = handles
+            };
+        }
+        
+        // Same rules as unity_save_prefab: "Prefabs/Enemy" is Assets/Prefabs/Enemy.prefab
+        private static string NormalizePrefabPath(string path)
+        {
+            if (string.IsNullOrEmpty(path))
+            {
+                return null;
+            }
+            if (!path.StartsWith("Assets/"))
+            {
+                path = "Assets/" + path;
+            }
+            if (!path.EndsWith(".prefab"))
+            {
+                path += ".prefab";
+            }
+            return path;
+        }
+        
+        // ==================== PREFABS FROM ASSETS ====================
+        
+        public static JObject CreatePrefabsFromAssets(JObject args)
+        {
+            long callStart = Stopwatch.GetTimestamp();
+            
+            // Sources: an explicit list (paths, GUIDs or unique names) and/or a path glob
+            var sources = new List<string>();
+            var failures = new JArray();
+            JArray assetList = args["assets"] as JArray;
+            string assetGlob = args["assetGlob"]?.ToString();
+            if ((assetList == null || assetList.Count == 0) && string.IsNullOrEmpty(assetGlob))
+            {
+                return Error("Pass assets (paths, GUIDs or names) or assetGlob (e.g. 'Assets/Characters/FBX/*.fbx')");
+            }
+            if (assetList != null)
+            {
+                foreach (JToken reference in assetList)
+                {
+                    string path = MCPAssetIndex.ResolvePath(reference.ToString(), null, out string problem);
+                    if (path == null)
+                    {
+                        failures.Add(new JObject { ["asset"] = reference.ToString(), ["error"] = problem });
+                    }
+                    else if (!sources.Contains(path))
+                    {
+                        sources.Add(path);
+                    }
+                }
+            }
+            if (!string.IsNullOrEmpty(assetGlob))
+            {
+                List<string> matched = MCPAssetIndex.MatchPaths(assetGlob);
+                if (matched.Count == 0)
+                {
+                    return Error($"No assets match '{assetGlob}'. Use unity_search_assets to find their paths");
+                }
+                sources.AddRange(matched.Where(path => !sources.Contains(path)));
+            }
+            if (sources.Count > MaxPrefabsFromAssets)
+            {
+                return Error($"At most {MaxPrefabsFromAssets} assets per call; got {sources.Count}. Split the call or run it with unity_submit_job");
+            }
+            
+            string outputFolder = args["outputFolder"]?.ToString()?.TrimEnd('/');
+            if (string.IsNullOrEmpty(outputFolder))
+            {
+                return Error("outputFolder is required");
+            }
+            if (outputFolder != "Assets" && !outputFolder.StartsWith("Assets/"))
+            {
+                outputFolder = "Assets/" + outputFolder;
+            }
+            
+            // Components are resolved before anything is written
+            var componentTypes = new List<Type>();
+            if (args["components"] is JArray componentNames)
+            {
+                foreach (JToken componentName in componentNames)
+                {
+                    Type type = MCPTools.FindComponentType(componentName.ToString());
+                    if (type == null)
+                    {
+                        return Error($"Component type '{componentName}' not found");
+                    }
+                    componentTypes.Add(type);
+                }
+            }
+            
+            // Output paths: "{name}" is the source asset's file name, "{i}" its position
+            string nameFormat = args["name"]?.ToString() ?? "{name}";
+            bool overwrite = args["overwrite"]?.ToObject<bool>() ?? true;
+            var outputs = new string[sources.Count];
+            var sourceOf = new Dictionary<string, string>();
+            for (int i = 0; i < sources.Count; i++)
+            {
+                string name = nameFormat
+                    .Replace("{name}", Path.GetFileNameWithoutExtension(sources[i]))
+                    .Replace("{i}", i.ToString());
+                outputs[i] = $"{outputFolder}/{name}.prefab";
+                if (sourceOf.TryGetValue(outputs[i], out string other))
+                {
+                    return Error($"'{other}' and '{sources[i]}' would both be saved as '{outputs[i]}'; add {{i}} to name");
+                }
+                sourceOf[outputs[i]] = sources[i];
+            }
+            
+            EnsureFolder(outputFolder);
+            
+            // Instances are built in a preview scene, so the open scene, its change
+            // tracking and the object and bounds indexes never see them. Saves inside
+            // the asset-editing window are imported together by StopAssetEditing.
+            var results = new JArray();
+            int created = 0;
+            UnityEngine.SceneManagement.Scene preview = EditorSceneManager.NewPreviewScene();
+            AssetDatabase.StartAssetEditing();
+            double importMs;
+            try
+            {
+                for (int i = 0; i < sources.Count; i++)
+                {
+                    long assetStart = Stopwatch.GetTimestamp();
+                    var result = new JObject { ["asset"] = sources[i], ["prefabPath"] = outputs[i] };
+                    string problem = CreatePrefabFromAsset(sources[i], outputs[i], overwrite, componentTypes, preview);
+                    result["ms"] = Math.Round(MillisecondsSince(assetStart), 2);
+                    if (problem != null)
+                    {
+                        result["error"] = problem;
+                        failures.Add(result);
+                    }
+                    else
+                    {
+                        results.Add(result);
+                        created++;
+                    }
+                    MCPJobs.ReportProgress((float)(i + 1) / sources.Count, $"{i + 1}/{sources.Count} prefabs");
+                }
+            }
+            finally
+            {
+                long importStart = Stopwatch.GetTimestamp();
+                AssetDatabase.StopAssetEditing();
+                importMs = MillisecondsSince(importStart);
+                EditorSceneManager.ClosePreviewScene(preview);
+            }
+            
+            Debug.Log($"[MCP] Created {created} prefabs in '{outputFolder}'" + (failures.Count > 0 ? $", {failures.Count} failed" : ""));
+            
+            var response = new JObject
+            {
+                ["success"] = true,
+                ["outputFolder"] = outputFolder,
+                ["created"] = created,
+                ["failed"] = failures.Count,
+                ["prefabs"] = results,
+                ["importMs"] = Math.Round(importMs, 2),
+                ["totalMs"] = Math.Round(MillisecondsSince(callStart), 2)
+            };
+            if (failures.Count > 0)
+            {
+                response["failures"] = failures;
+            }
+            return response;
+        }
+        
+        // Null on success, otherwise why this asset was skipped
+        private static string CreatePrefabFromAsset(string assetPath, string prefabPath, bool overwrite,
+            List<Type> componentTypes, UnityEngine.SceneManagement.Scene scene)
+        {
+            if (!overwrite && File.Exists(prefabPath))
+            {
+                return "Prefab already exists; pass overwrite to replace it";
+            }
+            GameObject asset = AssetDatabase.LoadAssetAtPath<GameObject>(assetPath);
+            if (asset == null)
+            {
+                return "Not a model or prefab asset";
+            }
+            
+            var instance = PrefabUtility.InstantiatePrefab(asset, scene) as GameObject;
+            if (instance == null)
+            {
+                return "Could not instantiate asset";
+            }
+            try
+            {
+                instance.transform.position = Vector3.zero;
+                instance.transform.rotation = Quaternion.identity;
+                instance.transform.localScale = Vector3.one;
+                foreach (Type type in componentTypes)
+                {
+                    if (instance.GetComponent(type) == null && instance.AddComponent(type) == null)
+                    {
+                        return $"Could not add {type.Name}";
+                    }
+                }
+                PrefabUtility.SaveAsPrefabAsset(instance, prefabPath, out bool saved);
+                return saved ? null : "Failed to save prefab";
+            }
+            finally
+            {
+                UnityEngine.Object.DestroyImmediate(instance);
+            }
+        }
+        
+        // Creates any missing folders along the path, like unity_create_prefab_from_asset
+        private static void EnsureFolder(string folder)
+        {
+            string currentPath = "Assets";
+            string[] folders = folder.Split('/');
+            for (int i = 1; i < folders.Length; i++)
+            {
+                string newPath = currentPath + "/" + folders[i];
+                if (!AssetDatabase.IsValidFolder(newPath))
+                {
+                    AssetDatabase.CreateFolder(currentPath, folders[i]);
+                }
+                currentPath = newPath;
+            }
+        }
+        
+        private static double MillisecondsSince(long start)
+        {
+            return (Stopwatch.GetTimestamp() - start) * 1000.0 / Stopwatch.Frequency;
+        }
+        
+        // ==================== UPDATE PREFAB ====================
+        
+        public static JObject UpdatePrefab(JObject args)
+        {
+            string prefabPath = NormalizePrefabPath(args["prefabPath"]?.ToString());
+            if (prefabPath == null)
+            {
+                return Error("Prefab path is required");
+            }
+            if (!File.Exists(prefabPath))
+            {
+                return Error($"Prefab not found: {prefabPath}");
+            }
+            
+            // A single action (the original form of the tool) is a list of one
+            JArray operations = args["operations"] as JArray;
+            bool single = operations == null;
+            if (single)
+            {
+                if (args["action"] == null)
+                {
+                    return Error("Pass operations, or a single action");
+                }
+                operations = new JArray { args.DeepClone() };
+            }
+            else if (args["action"] != null)
+            {
+                return Error("Pass either operations or action, not both");
+            }
+            if (operations.Count == 0)
+            {
+                return Error("operations must not be empty");
+            }
+            
+            GameObject root = PrefabUtility.LoadPrefabContents(prefabPath);
+            if (root == null)
+            {
+                return Error("Failed to load prefab");
+            }
+            
+            var results = new JArray();
+            try
+            {
+                for (int i = 0; i < operations.Count; i++)
+                {
+                    if (!(operations[i] is JObject operation))
+                    {
+                        return Error($"operations[{i}] must be an object");
+                    }
+                    string problem = ApplyOperation(root, operation, out string done);
+                    if (problem != null)
+                    {
+                        string where = single ? "" : $"operations[{i}] ({operation["action"]}): ";
+                        return Error($"{where}{problem}. Nothing was saved");
+                    }
+                    results.Add(done);
+                }
+                
+                PrefabUtility.SaveAsPrefabAsset(root, prefabPath, out bool saved);
+                if (!saved)
+                {
+                    return Error("Failed to save prefab");
+                }
+            }
+            finally
+            {
+                PrefabUtility.UnloadPrefabContents(root);
+            }
+            
+            Debug.Log($"[MCP] Updated prefab: {prefabPath} - {string.Join("; ", results)}");
+            
+            var response = new JObject
+            {
+                ["success"] = true,
+                ["prefabPath"] = prefabPath,
+                ["modified"] = true,
+                ["operations"] = operations.Count,
+                ["results"] = results
+            };
+            if (single)
+            {
+                response["action"] = results[0];
+            }
+            return response;
+        }
+        
+        // Null on success, otherwise why the operation cannot be applied
+        private static string ApplyOperation(GameObject root, JObject operation, out string done)
+        {
+            done = null;
+            string action = operation["action"]?.ToString();
+            
+            // Nested objects by path from the prefab root, e.g. "Body/Weapon"
+            GameObject target = root;
+            string targetPath = operation["target"]?.ToString();
+            if (!string.IsNullOrEmpty(targetPath))
+            {
+                Transform child = root.transform.Find(targetPath);
+                if (child == null)
+                {
+                    return $"No child '{targetPath}' in prefab '{root.name}'";
+                }
+                target = child.gameObject;
+            }
+            string on = target == root ? "" : $" on '{targetPath}'";
+            
+            string componentName = operation["componentType"]?.ToString();
+            if (string.IsNullOrEmpty(componentName))
+            {
+                return "componentType is required";
+            }
+            Type type = MCPTools.FindComponentType(componentName);
+            if (type == null)
+            {
+                return $"Component type not found: {componentName}";
+            }
+            
+            switch (action)
+            {
+                case "add_component":
+                    if (target.AddComponent(type) == null)
+                    {
+                        return $"Could not add {componentName}{on}";
+                    }
+                    done = $"Added component: {componentName}{on}";
+                    return null;
+                
+                case "remove_component":
+                {
+                    Component component = target.GetComponent(type);
+                    if (component == null)
+                    {
+                        return $"Component not found: {componentName}{on}";
+                    }
+                    UnityEngine.Object.DestroyImmediate(component);
+                    done = $"Removed component: {componentName}{on}";
+                    return null;
+                }
+                
+                case "set_property":
+                {
+                    Component component = target.GetComponent(type);
+                    if (component == null)
+                    {
+                        return $"Component not found: {componentName}{on}";
+                    }
+                    string propertyName = operation["propertyName"]?.ToString();
+                    if (string.IsNullOrEmpty(propertyName))
+                    {
+                        return "propertyName is required";
+                    }
+                    var so = new SerializedObject(component);
+                    SerializedProperty property = so.FindProperty(propertyName);
+                    if (property == null)
+                    {
+                        return $"Property '{propertyName}' not found on {componentName}{on}";
+                    }
+                    JToken value = operation["value"] ?? JValue.CreateNull();
+                    if (!SetValue(property, value))
+                    {
+                        return $"Cannot set '{propertyName}' ({property.propertyType}) to {value.ToString(Formatting.None)}";
+                    }
+                    // Prefab contents are not part of the undo history
+                    so.ApplyModifiedPropertiesWithoutUndo();
+                    done = $"Set property '{propertyName}' on {componentName}{on}";
+                    return null;
+                }
+                
+                default:
+                    return $"Unknown action '{action}'. Use add_component, remove_component or set_property";
+            }
+        }
+        
+        // ==================== PATTERNS ====================
+        
+        private static string PatternPositions(JObject pattern, int count, out Vector3[] positions)
+        {
+            positions = new Vector3[count];
+            string type = pattern["type"]?.ToString();
+            if (!ReadVector(pattern, "origin", Vector3.zero, out Vector3 origin))
+            {
+                return "pattern.origin must be [x, y, z]";
+            }
+            
+            switch (type)
+            {
+                case "grid":
+                {
+                    // Rows along +Z, columns along +X, starting at origin
+                    int columns = pattern["columns"]?.ToObject<int>() ?? Mathf.CeilToInt(Mathf.Sqrt(count));
+                    if (columns < 1)
+                    {
+                        return "pattern.columns must be at least 1";
+                    }
+                    JArray spacing = pattern["spacing"] as JArray;
+                    if (spacing != null && spacing.Count != 2)
+                    {
+                        return "pattern.spacing must be [x, z]";
+                    }
+                    float spacingX = spacing != null ? (float)spacing[0] : 2f;
+                    float spacingZ = spacing != null ? (float)spacing[1] : 2f;
+                    for (int i = 0; i < count; i++)
+                    {
+                        positions[i] = origin + new Vector3(i % columns * spacingX, 0f, i / columns * spacingZ);
+                    }
+                    return null;
+                }
+                
+                case "ring":
+                {
+                    // Evenly spaced on a circle in the XZ plane, clockwise from +Z seen from above
+                    float radius = pattern["radius"]?.ToObject<float>() ?? 5f;
+                    float startAngle = pattern["startAngle"]?.ToObject<float>() ?? 0f;
+                    for (int i = 0; i < count; i++)
+                    {
+                        float angle = (startAngle + 360f * i / count) * Mathf.Deg2Rad;
+                        positions[i] = origin + new Vector3(Mathf.Sin(angle) * radius, 0f, Mathf.Cos(angle) * radius);
+                    }
+                    return null;
+                }
+                
+                case "scatter":
+                {
+                    // Uniform inside [boundsMin, boundsMax]; the same seed gives the same layout
+                    if (!ReadVector(pattern, "boundsMin", null, out Vector3 min) || !ReadVector(pattern, "boundsMax", null, out Vector3 max))
+                    {
+                        return "pattern.boundsMin and pattern.boundsMax ([x, y, z]) are required for scatter";
+                    }
+                    var random = new System.Random(pattern["seed"]?.ToObject<int>() ?? 0);
+                    for (int i = 0; i < count; i++)
+                    {
+                        positions[i] = new Vector3(
+                            Mathf.Lerp(min.x, max.x, (float)random.NextDouble()),
+                            Mathf.Lerp(min.y, max.y, (float)random.NextDouble()),
+                            Mathf.Lerp(min.z, max.z, (float)random.NextDouble()));
+                    }
+                    return null;
+                }
+                
+                default:
+                    return $"Unknown pattern type '{type}'. Use grid, ring or scatter";
+            }
+        }
+        
+        // False if the key holds something other than [x, y, z], or is missing without a fallback
+        private static bool ReadVector(JObject source, string key, Vector3? fallback, out Vector3 vector)
+        {
+            vector = fallback ?? Vector3.zero;
+            JToken token = source[key];
+            if (token == null)
+            {
+                return fallback.HasValue;
+            }
+            if (!(token is JArray array) || array.Count != 3)
+            {
+                return false;
+            }
+            vector = new Vector3((float)array[0], (float)array[1], (float)array[2]);
+            return true;
+        }
+        
+        // ==================== PROPERTY OVERRIDES ====================
+        
+        // Resolves each "Component.property" key once and sets its value on the prefab's
+        // own SerializedObject without applying it, to catch bad keys and values up front
+        private static string CheckOverrides(GameObject prefab, JObject values, string where,
+            Dictionary<string, PropertyTarget> targets, Dictionary<Type, SerializedObject> trial)
+        {
+            if (values == null)
+            {
+                return null;
+            }
+            
+            foreach (var pair in values)
+            {
+                if (!targets.TryGetValue(pair.Key, out PropertyTarget target))
+                {
+                    int dot = pair.Key.IndexOf('.');
+                    if (dot <= 0 || dot == pair.Key.Length - 1)
+                    {
+                        return $"{where}: '{pair.Key}' must be \"Component.property\" (e.g. \"Rigidbody.m_Mass\")";
+                    }
+                    string componentName = pair.Key.Substring(0, dot);
+                    Type type = MCPTools.FindComponentType(componentName);
+                    if (type == null)
+                    {
+                        return $"{where}: component type '{componentName}' not found";
+                    }
+                    target = new PropertyTarget { componentType = type, propertyPath = pair.Key.Substring(dot + 1) };
+                    targets[pair.Key] = target;
+                }
+                
+                if (!trial.TryGetValue(target.componentType, out SerializedObject so))
+                {
+                    Component component = prefab.GetComponent(target.componentType);
+                    if (component == null)
+                    {
+                        return $"{where}: prefab '{prefab.name}' has no {target.componentType.Name} component";
+                    }
+                    so = new SerializedObject(component);
+                    trial[target.componentType] = so;
+                }
+                
+                SerializedProperty property = so.FindProperty(target.propertyPath);
+                if (property == null)
+                {
+                    return $"{where}: property '{target.propertyPath}' not found on {target.componentType.Name}";
+                }
+                if (!SetValue(property, pair.Value))
+                {
+                    return $"{where}: cannot set '{pair.Key}' ({property.propertyType}) to {pair.Value.ToString(Formatting.None)}";
+                }
+            }
+            return null;
+        }
+        
+        private static void ApplyOverrides(GameObject instance, JObject shared, JObject own, Dictionary<string, PropertyTarget> targets)
+        {
+            var objects = new Dictionary<Type, SerializedObject>();
+            foreach (JObject values in new[] { shared, own })
+            {
+                if (values == null)
+                {
+                    continue;
+                }
+                foreach (var pair in values)
+                {
+                    PropertyTarget target = targets[pair.Key];
+                    if (!objects.TryGetValue(target.componentType, out SerializedObject so))
+                    {
+                        so = new SerializedObject(instance.GetComponent(target.componentType));
+                        objects[target.componentType] = so;
+                    }
+                    SetValue(so.FindProperty(target.propertyPath), pair.Value);
+                }
+            }
+            // The instance is new and registered for undo as a whole
+            foreach (SerializedObject so in objects.Values)
+            {
+                so.ApplyModifiedPropertiesWithoutUndo();
+            }
+        }
+        
+        // False if the value does not fit the property's type
+        private static bool SetValue(SerializedProperty property, JToken value)
+        {
+            switch (property.propertyType)
+            {
+                case SerializedPropertyType.Integer:
+                case SerializedPropertyType.LayerMask:
+                    if (value.Type != JTokenType.Integer)
+                    {
+                        return false;
+                    }
+                    property.intValue = value.ToObject<int>();
+                    return true;
+                
+                case SerializedPropertyType.Float:
+                    if (value.Type != JTokenType.Float && value.Type != JTokenType.Integer)
+                    {
+                        return false;
+                    }
+                    property.floatValue = value.ToObject<float>();
+                    return true;
+                
+                case SerializedPropertyType.Boolean:
+                    if (value.Type != JTokenType.Boolean)
+                    {
+                        return false;
+                    }
+                    property.boolValue = value.ToObject<bool>();
+                    return true;
+                
+                case SerializedPropertyType.String:
+                    if (value.Type != JTokenType.String)
+                    {
+                        return false;
+                    }
+                    property.stringValue = value.ToString();
+                    return true;
+                
+                case SerializedPropertyType.Enum:
+                    if (value.Type == JTokenType.Integer)
+                    {
+                        property.enumValueIndex = value.ToObject<int>();
+                        return true;
+                    }
+                    int index = Array.IndexOf(property.enumNames, value.ToString());
+                    if (index < 0)
+                    {
+                        return false;
+                    }
+                    property.enumValueIndex = index;
+                    return true;
+                
+                case SerializedPropertyType.Vector2:
+                case SerializedPropertyType.Vector3:
+                case SerializedPropertyType.Color:
+                    return SetVector(property, value as JArray);
+                
+                case SerializedPropertyType.ObjectReference:
+                    if (value.Type == JTokenType.Null)
+                    {
+                        property.objectReferenceValue = null;
+                        return true;
+                    }
+                    UnityEngine.Object reference = null;
+                    if (value is JObject referenceObj && referenceObj["type"]?.ToString() == "reference")
+                    {
+                        reference = MCPAssetIndex.Load(referenceObj["path"]?.ToString(), out _);
+                    }
+                    else if (value.Type == JTokenType.String)
+                    {
+                        reference = MCPObjectIndex.Find(value.ToString());
+                    }
+                    if (reference == null)
+                    {
+                        return false;
+                    }
+                    property.objectReferenceValue = reference;
+                    return true;
+                
+                default:
+                    return false;
+            }
+        }
+        
+        private static bool SetVector(SerializedProperty property, JArray array)
+        {
+            if (array == null)
+            {
+                return false;
+            }
+            switch (property.propertyType)
+            {
+                case SerializedPropertyType.Vector2 when array.Count == 2:
+                    property.vector2Value = new Vector2((float)array[0], (float)array[1]);
+                    return true;
+                case SerializedPropertyType.Vector3 when array.Count == 3:
+                    property.vector3Value = new Vector3((float)array[0], (float)array[1], (float)array[2]);
+                    return true;
+                case SerializedPropertyType.Color when array.Count == 3 || array.Count == 4:
+                    property.colorValue = new Color((float)array[0], (float)array[1], (float)array[2], array.Count == 4 ? (float)array[3] : 1f);
+                    return true;
+                default:
+                    return false;
+            }
+        }
+        
+        private static JObject Error(string message)
+        {
+            return new JObject
+            {
+                ["success"] = false,
+                ["error"] = message
+            };
+        }
+    }
+}
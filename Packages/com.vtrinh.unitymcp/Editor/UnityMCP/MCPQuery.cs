@@ -0,0 +1,375 @@
+using UnityEngine;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+using System.Text.RegularExpressions;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    // unity_query_gameobjects: finds objects by a predicate evaluated in the editor, so
+    // a question like "every Enemy on the Enemies layer" returns a few handles instead
+    // of the whole hierarchy. The predicate is a JSON object whose keys must all hold:
+    //
+    //   {"component": "Enemy", "layer": "Enemies", "active": true,
+    //    "under": "Level1", "any": [{"tag": "Boss"}, {"name": "Elite*"}],
+    //    "not": {"path": "**/Pool/*"}}
+    //
+    // It is compiled once per call (globs to regexes, component names to types, layer
+    // names to indices) and then run over one walk of every loaded scene, active scene
+    // first like MCPObjectIndex, which stops as soon as limit + 1 matches are found.
+    public static class MCPQuery
+    {
+        private static readonly string[] PredicateKeys = { "name", "path", "tag", "layer", "component", "active", "under", "any", "not" };
+        private static readonly string[] QueryFields = { "instanceId", "name", "path", "active", "tag", "layer", "position", "components" };
+        
+        private const int DefaultLimit = 100;
+        private const int MaxLimit = 10000;
+        
+        private delegate bool Predicate(GameObject go, string path);
+        
+        // A predicate that cannot be compiled; the message becomes the tool's error
+        private class QueryException : Exception
+        {
+            public QueryException(string message) : base(message) { }
+        }
+        
+        public static JObject QueryGameObjects(JObject args)
+        {
+            JToken whereToken = args["where"];
+            if (whereToken != null && whereToken.Type != JTokenType.Null && !(whereToken is JObject))
+            {
+                return Error("where must be an object, e.g. {\"component\": \"Enemy\", \"active\": true}");
+            }
+            JObject where = whereToken as JObject ?? new JObject();
+            
+            int limit = args["limit"]?.Value<int>() ?? DefaultLimit;
+            if (limit < 1 || limit > MaxLimit)
+            {
+                return Error($"limit must be between 1 and {MaxLimit}; got {limit}");
+            }
+            var fields = MCPTools.ParseFields(args, QueryFields);
+            bool columnar = MCPTools.IsColumnar(args);
+            
+            Predicate predicate;
+            bool needsPath = fields != null && fields.Contains("path");
+            try
+            {
+                predicate = Compile(where, "where", ref needsPath);
+            }
+            catch (QueryException e)
+            {
+                return Error(e.Message);
+            }
+            
+            // A top-level 'under' narrows the walk to that subtree
+            IEnumerable<GameObject> starts;
+            string under = where["under"]?.ToString();
+            if (!string.IsNullOrEmpty(under))
+            {
+                GameObject root = MCPObjectIndex.Find(under);
+                starts = root.transform.Cast<Transform>().Select(child => child.gameObject);
+            }
+            else
+            {
+                starts = MCPObjectIndex.LoadedRoots();
+            }
+            
+            var matches = new List<KeyValuePair<GameObject, string>>();
+            int scanned = 0;
+            bool truncated = false;
+            
+            bool Visit(GameObject go, string path)
+            {
+                scanned++;
+                if (predicate(go, path))
+                {
+                    if (matches.Count == limit)
+                    {
+                        truncated = true;
+                        return false;
+                    }
+                    matches.Add(new KeyValuePair<GameObject, string>(go, path));
+                }
+                
+                foreach (Transform child in go.transform)
+                {
+                    if (!Visit(child.gameObject, path != null ? path + "/" + child.name : null))
+                    {
+                        return false;
+                    }
+                }
+                return true;
+            }
+            
+            foreach (GameObject start in starts)
+            {
+                if (!Visit(start, needsPath ? MCPObjectIndex.GetPath(start) : null))
+                {
+                    break;
+                }
+            }
+            
+            var result = new JObject
+            {
+                ["success"] = true,
+                ["count"] = matches.Count,
+                ["scanned"] = scanned,
+                ["truncated"] = truncated
+            };
+            
+            if (fields == null)
+            {
+                result["handles"] = new JArray(matches.Select(match => MCPObjectIndex.Handle(match.Key)));
+                return result;
+            }
+            
+            var objects = new JArray();
+            foreach (var match in matches)
+            {
+                JObject obj = MCPTools.DescribeGameObject(match.Key, match.Value, fields);
+                obj.AddFirst(new JProperty("handle", MCPObjectIndex.Handle(match.Key)));
+                if (fields.Contains("components"))
+                {
+                    obj["components"] = new JArray(match.Key.GetComponents<Component>()
+                        .Where(component => component != null)
+                        .Select(component => component.GetType().Name));
+                }
+                objects.Add(obj);
+            }
+            if (columnar)
+            {
+                result["columns"] = MCPTools.ToColumns(objects);
+            }
+            else
+            {
+                result["objects"] = objects;
+            }
+            return result;
+        }
+        
+        // Every key of the object must hold; 'at' names it in error messages
+        private static Predicate Compile(JObject where, string at, ref bool needsPath)
+        {
+            var parts = new List<Predicate>();
+            foreach (var pair in where)
+            {
+                string key = pair.Key;
+                JToken value = pair.Value;
+                string label = $"{at}.{key}";
+                switch (key)
+                {
+                    case "name":
+                    {
+                        Func<string, bool> matchName = Glob(Text(value, label));
+                        parts.Add((go, path) => matchName(go.name));
+                        break;
+                    }
+                    
+                    case "path":
+                    {
+                        Func<string, bool> matchPath = Glob(Text(value, label).TrimStart('/'));
+                        needsPath = true;
+                        parts.Add((go, path) => matchPath(path));
+                        break;
+                    }
+                    
+                    case "tag":
+                    {
+                        string tag = Text(value, label);
+                        if (!UnityEditorInternal.InternalEditorUtility.tags.Contains(tag))
+                        {
+                            throw new QueryException($"{label}: unknown tag '{tag}'");
+                        }
+                        parts.Add((go, path) => go.CompareTag(tag));
+                        break;
+                    }
+                    
+                    case "layer":
+                    {
+                        int layer = Layer(value, label);
+                        parts.Add((go, path) => go.layer == layer);
+                        break;
+                    }
+                    
+                    case "component":
+                    {
+                        // One name or a list; objects need all of them
+                        var names = value is JArray list ? list.Select(item => Text(item, label)).ToList() : new List<string> { Text(value, label) };
+                        foreach (string name in names)
+                        {
+                            Type type = MCPTools.FindComponentType(name);
+                            if (type == null)
+                            {
+                                throw new QueryException($"{label}: component type '{name}' not found. Make sure the script has been compiled.");
+                            }
+                            parts.Add((go, path) => go.GetComponent(type) != null);
+                        }
+                        break;
+                    }
+                    
+                    case "active":
+                    {
+                        if (value.Type != JTokenType.Boolean)
+                        {
+                            throw new QueryException($"{label} must be true or false");
+                        }
+                        bool active = value.Value<bool>();
+                        parts.Add((go, path) => go.activeInHierarchy == active);
+                        break;
+                    }
+                    
+                    case "under":
+                    {
+                        string name = Text(value, label);
+                        GameObject root = MCPObjectIndex.Find(name);
+                        if (root == null)
+                        {
+                            throw new QueryException($"GameObject '{name}' not found");
+                        }
+                        Transform rootTransform = root.transform;
+                        parts.Add((go, path) => go.transform != rootTransform && go.transform.IsChildOf(rootTransform));
+                        break;
+                    }
+                    
+                    case "any":
+                    {
+                        JArray options = value as JArray;
+                        if (options == null || options.Count == 0)
+                        {
+                            throw new QueryException($"{label} must be a non-empty array of predicates");
+                        }
+                        var compiled = new Predicate[options.Count];
+                        for (int i = 0; i < options.Count; i++)
+                        {
+                            compiled[i] = Compile(Nested(options[i], $"{label}[{i}]"), $"{label}[{i}]", ref needsPath);
+                        }
+                        parts.Add((go, path) => compiled.Any(option => option(go, path)));
+                        break;
+                    }
+                    
+                    case "not":
+                    {
+                        Predicate negated = Compile(Nested(value, label), label, ref needsPath);
+                        parts.Add((go, path) => !negated(go, path));
+                        break;
+                    }
+                    
+                    default:
+                        throw new QueryException($"Unknown predicate '{label}'. Valid predicates: {string.Join(", ", PredicateKeys)}");
+                }
+            }
+            
+            if (parts.Count == 0)
+            {
+                return (go, path) => true;
+            }
+            if (parts.Count == 1)
+            {
+                return parts[0];
+            }
+            Predicate[] all = parts.ToArray();
+            return (go, path) =>
+            {
+                for (int i = 0; i < all.Length; i++)
+                {
+                    if (!all[i](go, path))
+                    {
+                        return false;
+                    }
+                }
+                return true;
+            };
+        }
+        
+        private static string Text(JToken value, string where)
+        {
+            if (value == null || value.Type != JTokenType.String || string.IsNullOrEmpty(value.ToString()))
+            {
+                throw new QueryException($"{where} must be a non-empty string");
+            }
+            return value.ToString();
+        }
+        
+        private static JObject Nested(JToken value, string where)
+        {
+            JObject nested = value as JObject;
+            if (nested == null)
+            {
+                throw new QueryException($"{where} must be a predicate object");
+            }
+            return nested;
+        }
+        
+        // A layer name or index
+        private static int Layer(JToken value, string where)
+        {
+            if (value.Type == JTokenType.Integer)
+            {
+                int index = value.Value<int>();
+                if (index < 0 || index > 31)
+                {
+                    throw new QueryException($"{where} must be a layer name or an index from 0 to 31; got {index}");
+                }
+                return index;
+            }
+            
+            string name = Text(value, where);
+            int layer = LayerMask.NameToLayer(name);
+            if (layer < 0)
+            {
+                throw new QueryException($"{where}: unknown layer '{name}'");
+            }
+            return layer;
+        }
+        
+        // '*' matches within one path segment, '**' across segments, '?' one character.
+        // Patterns without wildcards compare as plain strings.
+        internal static Func<string, bool> Glob(string pattern, bool ignoreCase = false)
+        {
+            if (pattern.IndexOfAny(new[] { '*', '?' }) < 0)
+            {
+                StringComparison comparison = ignoreCase ? StringComparison.OrdinalIgnoreCase : StringComparison.Ordinal;
+                return text => string.Equals(text, pattern, comparison);
+            }
+            
+            var regex = new StringBuilder("^");
+            for (int i = 0; i < pattern.Length; i++)
+            {
+                char c = pattern[i];
+                if (c == '*' && i + 1 < pattern.Length && pattern[i + 1] == '*')
+                {
+                    regex.Append(".*");
+                    i++;
+                }
+                else if (c == '*')
+                {
+                    regex.Append("[^/]*");
+                }
+                else if (c == '?')
+                {
+                    regex.Append("[^/]");
+                }
+                else
+                {
+                    regex.Append(Regex.Escape(c.ToString()));
+                }
+            }
+            regex.Append('$');
+            
+            var options = RegexOptions.CultureInvariant | (ignoreCase ? RegexOptions.IgnoreCase : RegexOptions.None);
+            var compiled = new Regex(regex.ToString(), options);
+            return text => compiled.IsMatch(text);
+        }
+        
+        private static JObject Error(string message)
+        {
+            return new JObject
+            {
+                ["success"] = false,
+                ["error"] = message
+            };
+        }
+    }
+}
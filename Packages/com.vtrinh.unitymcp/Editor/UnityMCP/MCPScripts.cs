@@ -0,0 +1,315 @@
+using UnityEngine;
+using UnityEditor;
+using UnityEditor.Compilation;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    // unity_create_scripts: write many scripts, refresh and compile once, and
+    // report compiler messages for just those files. CreateScripts runs on the
+    // main thread; MCPServer then blocks in WaitForCompile on the listener
+    // thread. If compilation succeeds, the assembly reload is held back until
+    // the response has been sent.
+    [InitializeOnLoad]
+    public static class MCPScripts
+    {
+        // Never wait longer than this, to stay inside the 30 second request timeout
+        public const double MaxWaitSeconds = 25.0;
+        
+        // Reload lock is released this long after compilation even if nobody collected the result
+        private const double ReloadLockSeconds = 5.0;
+        
+        private class CompileWait
+        {
+            public HashSet<string> files;
+            public double waitSeconds;
+            public JArray errors = new JArray();
+            public JArray warnings = new JArray();
+            public int otherErrorCount;
+            public bool started;
+            public bool finished;
+            public DateTime finishedAt;
+            public ManualResetEvent done = new ManualResetEvent(false);
+        }
+        
+        private static readonly object waitLock = new object();
+        private static readonly Dictionary<int, CompileWait> waits = new Dictionary<int, CompileWait>();
+        private static int nextWaitId = 1;
+        private static bool reloadLocked = false;
+        
+        static MCPScripts()
+        {
+            CompilationPipeline.compilationStarted += OnCompilationStarted;
+            CompilationPipeline.assemblyCompilationFinished += OnAssemblyCompilationFinished;
+            CompilationPipeline.compilationFinished += OnCompilationFinished;
+            EditorApplication.update += ReleaseReloadLock;
+        }
+        
+        private static string NormalizePath(string path)
+        {
+            return Path.GetFullPath(path).Replace('\\', '/');
+        }
+        
+        // Main thread: write every script, then one refresh and one compile request
+        public static JObject CreateScripts(JObject args)
+        {
+            JArray scripts = args["scripts"] as JArray;
+            double waitSeconds = Math.Min(args["waitSeconds"]?.ToObject<double>() ?? 20.0, MaxWaitSeconds);
+            
+            if (scripts == null || scripts.Count == 0)
+            {
+                return new JObject
+                {
+                    ["success"] = false,
+                    ["error"] = "scripts must be a non-empty array of {name, content, path} entries"
+                };
+            }
+            
+            // Validate everything before writing anything
+            for (int i = 0; i < scripts.Count; i++)
+            {
+                var script = scripts[i] as JObject;
+                if (string.IsNullOrEmpty(script?["name"]?.ToString()))
+                {
+                    return new JObject
+                    {
+                        ["success"] = false,
+                        ["error"] = $"Script {i}: name is required"
+                    };
+                }
+                if (string.IsNullOrEmpty(script["content"]?.ToString()))
+                {
+                    return new JObject
+                    {
+                        ["success"] = false,
+                        ["error"] = $"Script {i}: content is required"
+                    };
+                }
+            }
+            
+            var written = new JArray();
+            var files = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+            
+            try
+            {
+                foreach (JObject script in scripts)
+                {
+                    string name = script["name"].ToString();
+                    string path = script["path"]?.ToString() ?? "Assets/Scripts/";
+                    
+                    if (!Directory.Exists(path))
+                    {
+                        Directory.CreateDirectory(path);
+                    }
+                    if (!name.EndsWith(".cs"))
+                    {
+                        name += ".cs";
+                    }
+                    
+                    string fullPath = Path.Combine(path, name);
+                    File.WriteAllText(fullPath, script["content"].ToString());
+                    files.Add(NormalizePath(fullPath));
+                    written.Add(new JObject
+                    {
+                        ["scriptPath"] = fullPath,
+                        ["scriptName"] = name
+                    });
+                }
+            }
+            catch (Exception e)
+            {
+                // Pick up whatever was written so the project and the disk agree
+                AssetDatabase.Refresh();
+                return new JObject
+                {
+                    ["success"] = false,
+                    ["error"] = $"Failed to write scripts: {e.Message}",
+                    ["scripts"] = written
+                };
+            }
+            
+            var result = new JObject
+            {
+                ["success"] = true,
+                ["scripts"] = written
+            };
+            
+            if (waitSeconds > 0)
+            {
+                lock (waitLock)
+                {
+                    int waitId = nextWaitId++;
+                    waits[waitId] = new CompileWait { files = files, waitSeconds = waitSeconds };
+                    result["waitId"] = waitId;
+                }
+            }
+            
+            AssetDatabase.Refresh();
+            CompilationPipeline.RequestScriptCompilation();
+            Debug.Log($"[MCP] Created {written.Count} scripts, compilation requested");
+            
+            return result;
+        }
+        
+        // Listener thread: block until the compile requested by CreateScripts finishes and
+        // add the diagnostics to its response. Returns the wait id to Release once sent.
+        public static int WaitForCompile(JObject response)
+        {
+            int waitId = response["waitId"]?.ToObject<int>() ?? 0;
+            response.Remove("waitId");
+            
+            CompileWait wait;
+            lock (waitLock)
+            {
+                if (!waits.TryGetValue(waitId, out wait))
+                {
+                    return 0;
+                }
+            }
+            
+            bool finished = wait.done.WaitOne(TimeSpan.FromSeconds(wait.waitSeconds));
+            
+            lock (waitLock)
+            {
+                response["compiled"] = finished;
+                response["timedOut"] = !finished;
+                response["errorCount"] = wait.errors.Count;
+                response["warningCount"] = wait.warnings.Count;
+                response["errors"] = wait.errors;
+                response["warnings"] = wait.warnings;
+                // Errors in files this call did not touch still block the reload
+                response["otherErrorCount"] = wait.otherErrorCount;
+            }
+            return waitId;
+        }
+        
+        // Listener thread, after the response is sent: lets the assembly reload proceed
+        public static void Release(int waitId)
+        {
+            lock (waitLock)
+            {
+                waits.Remove(waitId);
+            }
+        }
+        
+        private static void OnCompilationStarted(object context)
+        {
+            lock (waitLock)
+            {
+                foreach (var wait in waits.Values)
+                {
+                    wait.started = true;
+                }
+            }
+        }
+        
+        private static void OnAssemblyCompilationFinished(string assemblyPath, CompilerMessage[] messages)
+        {
+            lock (waitLock)
+            {
+                foreach (var wait in waits.Values)
+                {
+                    if (!wait.started || wait.finished)
+                    {
+                        continue;
+                    }
+                    
+                    foreach (var message in messages)
+                    {
+                        bool touched = !string.IsNullOrEmpty(message.file) && wait.files.Contains(NormalizePath(message.file));
+                        if (!touched)
+                        {
+                            if (message.type == CompilerMessageType.Error)
+                            {
+                                wait.otherErrorCount++;
+                            }
+                            continue;
+                        }
+                        
+                        var entry = new JObject
+                        {
+                            ["file"] = message.file,
+                            ["line"] = message.line,
+                            ["column"] = message.column,
+                            ["message"] = message.message
+                        };
+                        
+                        if (message.type == CompilerMessageType.Error)
+                        {
+                            wait.errors.Add(entry);
+                        }
+                        else
+                        {
+                            wait.warnings.Add(entry);
+                        }
+                    }
+                }
+            }
+        }
+        
+        private static void OnCompilationFinished(object context)
+        {
+            lock (waitLock)
+            {
+                bool anyFinished = false;
+                foreach (var wait in waits.Values)
+                {
+                    if (wait.started && !wait.finished)
+                    {
+                        wait.finished = true;
+                        wait.finishedAt = DateTime.UtcNow;
+                        wait.done.Set();
+                        anyFinished = true;
+                    }
+                }
+                
+                // Keep the domain (and the listener) alive until the waiting responses are sent
+                if (anyFinished && !reloadLocked)
+                {
+                    EditorApplication.LockReloadAssemblies();
+                    reloadLocked = true;
+                }
+            }
+        }
+        
+        private static void ReleaseReloadLock()
+        {
+            if (!reloadLocked)
+            {
+                return;
+            }
+            
+            lock (waitLock)
+            {
+                // Results nobody collected (e.g. unity_create_scripts inside unity_batch) expire
+                var expired = new List<int>();
+                foreach (var pair in waits)
+                {
+                    if (pair.Value.finished && (DateTime.UtcNow - pair.Value.finishedAt).TotalSeconds > ReloadLockSeconds)
+                    {
+                        expired.Add(pair.Key);
+                    }
+                }
+                foreach (int waitId in expired)
+                {
+                    waits.Remove(waitId);
+                }
+                
+                foreach (var wait in waits.Values)
+                {
+                    if (wait.finished)
+                    {
+                        return;
+                    }
+                }
+                
+                EditorApplication.UnlockReloadAssemblies();
+                reloadLocked = false;
+            }
+        }
+    }
+}
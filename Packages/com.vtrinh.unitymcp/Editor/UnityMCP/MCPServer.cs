@@ -6,7 +6,11 @@ using System.Net;
 using System.Threading;
 using System.Text;
 using System.IO;
+using System.IO.Compression;
 using System.Collections.Generic;
+using System.Collections.Concurrent;
+using Stopwatch = System.Diagnostics.Stopwatch;
+using Newtonsoft.Json;
 using Newtonsoft.Json.Linq;
 
 namespace UnityMCP
@@ -20,6 +24,69 @@ namespace UnityMCP
         private static int port = 8765;
         private static bool shouldRestart = false;
         
+        // Set from the start of an assembly reload until the server is back; requests
+        // arriving meanwhile are turned away unrun instead of queued
+        private static volatile bool reloading = false;
+        
+        // Listener threads waiting on a main-thread request or sending its response;
+        // StopServer lets them finish before closing the listeners
+        private static int responsesPending;
+        
+        // How long StopServer waits for those responses to go out
+        private const int StopDrainMilliseconds = 500;
+        
+        // Responses at least this large are gzipped when the client accepts it
+        private const int GzipThreshold = 16 * 1024;
+        
+        // Main-thread work per editor update. At least one request runs every update;
+        // further requests only start while the frame is inside its budget.
+        private const double FrameBudgetMilliseconds = 8.0;
+        
+        // Share of the budget queued reads always get first, wherever in the update
+        // they arrive. A read share left unused when the update runs over budget
+        // (a slow write or heavy request) is still spent on reads.
+        private const double ReadShare = 0.5;
+        
+        // Once the oldest write or heavy request has waited this long, one of them per
+        // update skips ahead of the remaining reads
+        private const double MaxLaneWaitMilliseconds = 250.0;
+        
+        // Priority lanes, drained in this order
+        private enum Lane { Read, Write, Heavy }
+        private static readonly string[] LaneNames = { "read", "write", "heavy" };
+        
+        private static readonly HashSet<string> ReadTools = new HashSet<string>
+        {
+            "unity_ping",
+            "unity_get_scene_info",
+            "unity_list_all_gameobjects",
+            "unity_query_gameobjects",
+            "unity_spatial_query",
+            "unity_search_assets",
+            "unity_find_gameobject",
+            "unity_is_compiling",
+            "unity_wait_for_compile",
+            "unity_get_logs"
+        };
+        
+        // Asset database, scene file and compile work; at most one of these per update
+        private static readonly HashSet<string> HeavyTools = new HashSet<string>
+        {
+            "unity_create_scene",
+            "unity_save_scene",
+            "unity_load_scene",
+            "unity_add_scene_to_build",
+            "unity_save_prefab",
+            "unity_update_prefab",
+            "unity_create_prefab_from_asset",
+            "unity_instantiate_prefabs",
+            "unity_create_prefabs_from_assets",
+            "unity_create_script",
+            "unity_create_scripts",
+            "unity_set_asset_property",
+            "unity_force_compile"
+        };
+        
         // Command queue for main thread execution
         private class PendingRequest
         {
@@ -27,10 +94,38 @@ namespace UnityMCP
             public JObject args;
             public ManualResetEvent resetEvent;
             public JObject response;
+            public bool quiet;
+            public Lane lane;
+            public long enqueuedAt;
+            public double waitMs;
+            public double runMs;
+            // Set for an MCPJobs job: nobody waits on resetEvent, MCPJobs.Run keeps the result
+            public string jobId;
         }
         
-        private static Queue<PendingRequest> pendingRequests = new Queue<PendingRequest>();
-        private static object queueLock = new object();
+        private class LaneStats
+        {
+            public long executed;
+            public double totalWaitMs;
+            public double maxWaitMs;
+            public double totalRunMs;
+            public double maxRunMs;
+        }
+        
+        // Listener threads enqueue without taking a lock; only the main thread dequeues
+        private static readonly ConcurrentQueue<PendingRequest>[] lanes =
+        {
+            new ConcurrentQueue<PendingRequest>(),
+            new ConcurrentQueue<PendingRequest>(),
+            new ConcurrentQueue<PendingRequest>()
+        };
+        
+        private static readonly object statsLock = new object();
+        private static LaneStats[] laneStats = NewLaneStats();
+        private static long busyFrames;
+        private static long framesOverBudget;
+        private static double maxFrameMs;
+        private static DateTime statsSince = DateTime.UtcNow;
         
         // Auto-start on Unity load
         static MCPServer()
@@ -52,36 +147,215 @@ namespace UnityMCP
                 StartServer();
             }
             
-            // Process all pending requests on main thread
-            lock (queueLock)
+            // Run queued requests, highest priority lane first, until the frame budget is spent
+            long frameStart = Stopwatch.GetTimestamp();
+            bool ranHeavy = false;
+            bool promoted = false;
+            double readMs = 0;
+            int executed = 0;
+            
+            while (true)
             {
-                while (pendingRequests.Count > 0)
+                var request = NextRequest(ElapsedMilliseconds(frameStart), readMs, ranHeavy, ref promoted);
+                if (request == null)
+                {
+                    break;
+                }
+                ranHeavy |= request.lane == Lane.Heavy;
+                
+                long runStart = Stopwatch.GetTimestamp();
+                try
                 {
-                    var request = pendingRequests.Dequeue();
-                    
-                    try
+                    if (request.jobId != null)
                     {
-                        Debug.Log($"[MCP] Executing: {request.tool}");
-                        request.response = MCPTools.Execute(request.tool, request.args);
-                        Debug.Log($"[MCP] Executed successfully");
+                        MCPJobs.Run(request.jobId);
                     }
-                    catch (Exception e)
+                    else
                     {
-                        Debug.LogError($"[MCP] Execution error: {e.Message}");
-                        request.response = CreateError(e.Message);
+                        if (!request.quiet) Debug.Log($"[MCP] Executing: {request.tool}");
+                        request.response = MCPTools.Execute(request.tool, request.args);
+                        if (!request.quiet) Debug.Log($"[MCP] Executed successfully");
                     }
-                    finally
+                }
+                catch (Exception e)
+                {
+                    Debug.LogError($"[MCP] Execution error: {e.Message}");
+                    request.response = CreateError(e.Message);
+                }
+                finally
+                {
+                    request.waitMs = MCPTiming.Milliseconds(request.enqueuedAt, runStart);
+                    request.runMs = ElapsedMilliseconds(runStart);
+                    request.resetEvent?.Set();
+                }
+                
+                if (request.lane == Lane.Read)
+                {
+                    readMs += request.runMs;
+                }
+                RecordRequest(request);
+                executed++;
+            }
+            
+            if (executed > 0)
+            {
+                RecordFrame(ElapsedMilliseconds(frameStart));
+            }
+        }
+        
+        // Any thread. Queues an MCPJobs job in the heavy lane, so it counts against the
+        // update's budget and its one heavy slot like any other heavy request.
+        public static void EnqueueJob(string jobId)
+        {
+            lanes[(int)Lane.Heavy].Enqueue(new PendingRequest
+            {
+                tool = "unity_submit_job",
+                jobId = jobId,
+                lane = Lane.Heavy,
+                enqueuedAt = Stopwatch.GetTimestamp()
+            });
+        }
+        
+        private static Lane LaneFor(string tool)
+        {
+            if (ReadTools.Contains(tool))
+                return Lane.Read;
+            if (HeavyTools.Contains(tool))
+                return Lane.Heavy;
+            return Lane.Write;
+        }
+        
+        // Main thread. Reads first until they have run for ReadShare of the budget, then
+        // one overdue write or heavy request, then reads, writes and heavy work in that
+        // order, one heavy per update. Past the budget, only reads with share left run.
+        private static PendingRequest NextRequest(double elapsedMs, double readMs, bool ranHeavy, ref bool promoted)
+        {
+            var reads = lanes[(int)Lane.Read];
+            var writes = lanes[(int)Lane.Write];
+            var heavy = lanes[(int)Lane.Heavy];
+            PendingRequest request;
+            
+            if (readMs < FrameBudgetMilliseconds * ReadShare && reads.TryDequeue(out request))
+            {
+                return request;
+            }
+            if (elapsedMs >= FrameBudgetMilliseconds)
+            {
+                return null;
+            }
+            
+            if (!promoted)
+            {
+                if (!ranHeavy && heavy.TryPeek(out request) && ElapsedMilliseconds(request.enqueuedAt) >= MaxLaneWaitMilliseconds)
+                {
+                    promoted = true;
+                    heavy.TryDequeue(out request);
+                    return request;
+                }
+                if (writes.TryPeek(out request) && ElapsedMilliseconds(request.enqueuedAt) >= MaxLaneWaitMilliseconds)
+                {
+                    promoted = true;
+                    writes.TryDequeue(out request);
+                    return request;
+                }
+            }
+            
+            if (reads.TryDequeue(out request) || writes.TryDequeue(out request))
+            {
+                return request;
+            }
+            if (!ranHeavy && heavy.TryDequeue(out request))
+            {
+                return request;
+            }
+            return null;
+        }
+        
+        private static double ElapsedMilliseconds(long since)
+        {
+            return (Stopwatch.GetTimestamp() - since) * 1000.0 / Stopwatch.Frequency;
+        }
+        
+        private static LaneStats[] NewLaneStats()
+        {
+            return new[] { new LaneStats(), new LaneStats(), new LaneStats() };
+        }
+        
+        private static void RecordRequest(PendingRequest request)
+        {
+            lock (statsLock)
+            {
+                var stats = laneStats[(int)request.lane];
+                stats.executed++;
+                stats.totalWaitMs += request.waitMs;
+                stats.maxWaitMs = Math.Max(stats.maxWaitMs, request.waitMs);
+                stats.totalRunMs += request.runMs;
+                stats.maxRunMs = Math.Max(stats.maxRunMs, request.runMs);
+            }
+        }
+        
+        private static void RecordFrame(double frameMs)
+        {
+            lock (statsLock)
+            {
+                busyFrames++;
+                if (frameMs > FrameBudgetMilliseconds)
+                {
+                    framesOverBudget++;
+                }
+                maxFrameMs = Math.Max(maxFrameMs, frameMs);
+            }
+        }
+        
+        // unity_get_scheduler_stats, answered on the listener thread
+        private static JObject GetSchedulerStats(JObject args)
+        {
+            var lanesInfo = new JObject();
+            JObject result;
+            
+            lock (statsLock)
+            {
+                for (int lane = 0; lane < lanes.Length; lane++)
+                {
+                    var stats = laneStats[lane];
+                    lanesInfo[LaneNames[lane]] = new JObject
                     {
-                        request.resetEvent.Set();
-                    }
+                        ["depth"] = lanes[lane].Count,
+                        ["executed"] = stats.executed,
+                        ["avgWaitMs"] = stats.executed > 0 ? Math.Round(stats.totalWaitMs / stats.executed, 3) : 0,
+                        ["maxWaitMs"] = Math.Round(stats.maxWaitMs, 3),
+                        ["avgRunMs"] = stats.executed > 0 ? Math.Round(stats.totalRunMs / stats.executed, 3) : 0,
+                        ["maxRunMs"] = Math.Round(stats.maxRunMs, 3)
+                    };
+                }
+                
+                result = new JObject
+                {
+                    ["success"] = true,
+                    ["frameBudgetMs"] = FrameBudgetMilliseconds,
+                    ["busyFrames"] = busyFrames,
+                    ["framesOverBudget"] = framesOverBudget,
+                    ["maxFrameMs"] = Math.Round(maxFrameMs, 3),
+                    ["sinceSeconds"] = Math.Round((DateTime.UtcNow - statsSince).TotalSeconds, 3),
+                    ["lanes"] = lanesInfo
+                };
+                
+                if (args["reset"]?.ToObject<bool>() == true)
+                {
+                    laneStats = NewLaneStats();
+                    busyFrames = 0;
+                    framesOverBudget = 0;
+                    maxFrameMs = 0;
+                    statsSince = DateTime.UtcNow;
                 }
             }
+            return result;
         }
         
         private static void OnBeforeAssemblyReload()
         {
             Debug.Log("[MCP] Stopping server for assembly reload...");
-            StopServer();
+            StopServer(true);
         }
         
         private static void OnAfterAssemblyReload()
@@ -105,8 +379,11 @@ namespace UnityMCP
                 serverThread.IsBackground = true;
                 serverThread.Start();
                 isRunning = true;
+                reloading = false;
                 
                 Debug.Log($"[MCP] ✅ Server started on http://localhost:{port}");
+                
+                MCPStreamServer.Start();
             }
             catch (Exception e)
             {
@@ -115,19 +392,49 @@ namespace UnityMCP
         }
         
         public static void StopServer()
+        {
+            StopServer(false);
+        }
+        
+        private static void StopServer(bool forReload)
         {
             if (!isRunning) return;
             
+            reloading = forReload;
             isRunning = false;
-            listener?.Stop();
-            listener?.Close();
             
-            // Clear pending requests
-            lock (queueLock)
+            // Fail pending requests rather than leave their threads waiting out the timeout.
+            // None of them ran, so clients may safely send them again; "reloading" tells
+            // them to wait for the editor to come back first. Queued jobs stay queued:
+            // MCPJobs saves them across a reload and puts them back in the heavy lane.
+            var jobsKept = new List<PendingRequest>();
+            foreach (var lane in lanes)
             {
-                pendingRequests.Clear();
+                while (lane.TryDequeue(out var request))
+                {
+                    if (request.jobId != null)
+                    {
+                        jobsKept.Add(request);
+                        continue;
+                    }
+                    request.response = reloading
+                        ? ReloadingError()
+                        : CreateError("Server stopped before the request ran");
+                    request.resetEvent.Set();
+                }
+            }
+            foreach (var request in jobsKept)
+            {
+                lanes[(int)Lane.Heavy].Enqueue(request);
             }
             
+            // Let those answers reach the client before the connections close
+            SpinWait.SpinUntil(() => Volatile.Read(ref responsesPending) == 0, StopDrainMilliseconds);
+            
+            listener?.Stop();
+            listener?.Close();
+            MCPStreamServer.Stop();
+            
             Debug.Log("[MCP] Server stopped");
         }
         
@@ -160,8 +467,16 @@ namespace UnityMCP
         
         private static void HandleRequest(HttpListenerContext context)
         {
+            var timing = new MCPTiming();
             try
             {
+                // Status probe (scene version) - answered without waiting for the main thread
+                if (context.Request.HttpMethod == "GET")
+                {
+                    SendResponse(context, MCPChangeTracker.GetStatus());
+                    return;
+                }
+
                 // Read request
                 string requestBody;
                 using (var reader = new StreamReader(context.Request.InputStream))
@@ -173,42 +488,142 @@ namespace UnityMCP
                 var request = JObject.Parse(requestBody);
                 string tool = request["tool"]?.ToString();
                 var args = request["args"] as JObject ?? new JObject();
+                timing.Parsed();
                 
+                Dispatch(tool, args, timing, response => SendResponse(context, response, timing));
+            }
+            catch (Exception e)
+            {
+                Debug.LogError($"[MCP] Request error: {e.Message}");
+                SendResponse(context, CreateError(e.Message), timing);
+            }
+        }
+        
+        // Route one tool call and hand its response to `send`. Runs on a listener thread;
+        // shared by the HTTP listener and MCPStreamServer. Main-thread time goes into `timing`.
+        public static void Dispatch(string tool, JObject args, MCPTiming timing, Action<JObject> send)
+        {
+            // Reading the console must not add to it
+            bool readsLogs = tool == "unity_get_logs";
+            if (!readsLogs)
+            {
                 Debug.Log($"[MCP] Received: {tool}");
-                
-                // Queue request for main thread
-                var pendingRequest = new PendingRequest
+            }
+            
+            if (readsLogs && (args["waitSeconds"]?.ToObject<double>() ?? 0) > 0)
+            {
+                send(LongPollLogs(args, timing));
+            }
+            else if (tool == "unity_get_scheduler_stats")
+            {
+                send(GetSchedulerStats(args));
+            }
+            else if (MCPJobs.IsJobTool(tool))
+            {
+                // Job bookkeeping never waits for the main thread
+                send(MCPJobs.Execute(tool, args));
+            }
+            else if (tool == "unity_create_scripts")
+            {
+                // Write and request compilation on the main thread, wait for it here
+                Interlocked.Increment(ref responsesPending);
+                try
                 {
-                    tool = tool,
-                    args = args,
-                    resetEvent = new ManualResetEvent(false),
-                    response = null
-                };
-                
-                lock (queueLock)
+                    var response = ExecuteOnMainThread(tool, args, timing);
+                    int waitId = MCPScripts.WaitForCompile(response);
+                    send(response);
+                    MCPScripts.Release(waitId);
+                }
+                finally
                 {
-                    pendingRequests.Enqueue(pendingRequest);
+                    Interlocked.Decrement(ref responsesPending);
                 }
-                
-                // Wait for main thread to process (30 second timeout)
-                if (pendingRequest.resetEvent.WaitOne(30000))
+            }
+            else
+            {
+                Interlocked.Increment(ref responsesPending);
+                try
                 {
-                    SendResponse(context, pendingRequest.response);
+                    send(ExecuteOnMainThread(tool, args, timing, readsLogs));
                 }
-                else
+                finally
                 {
-                    Debug.LogError("[MCP] Request timeout");
-                    SendResponse(context, CreateError("Timeout: Unity main thread didn't process request"));
+                    Interlocked.Decrement(ref responsesPending);
                 }
             }
-            catch (Exception e)
+        }
+        
+        // Queue a tool call for the main thread and wait for it (30 second timeout)
+        private static JObject ExecuteOnMainThread(string tool, JObject args, MCPTiming timing, bool quiet = false)
+        {
+            if (reloading)
             {
-                Debug.LogError($"[MCP] Request error: {e.Message}");
-                SendResponse(context, CreateError(e.Message));
+                return ReloadingError();
             }
+            
+            var pendingRequest = new PendingRequest
+            {
+                tool = tool,
+                args = args,
+                resetEvent = new ManualResetEvent(false),
+                response = null,
+                quiet = quiet,
+                lane = LaneFor(tool),
+                enqueuedAt = Stopwatch.GetTimestamp()
+            };
+            
+            lanes[(int)pendingRequest.lane].Enqueue(pendingRequest);
+            
+            if (pendingRequest.resetEvent.WaitOne(30000))
+            {
+                timing.AddMainThread(pendingRequest.waitMs, pendingRequest.runMs);
+                return pendingRequest.response;
+            }
+            
+            Debug.LogError("[MCP] Request timeout");
+            return CreateError("Timeout: Unity main thread didn't process request");
         }
         
-        private static void SendResponse(HttpListenerContext context, JObject response)
+        // Re-run unity_get_logs whenever something is logged, until it returns entries
+        // or waitSeconds pass. The wait happens here on the listener thread, so the
+        // editor keeps running in the meantime.
+        private static JObject LongPollLogs(JObject args, MCPTiming timing)
+        {
+            double waitSeconds = Math.Min(args["waitSeconds"].ToObject<double>(), MCPLogs.MaxWaitSeconds);
+            var deadline = DateTime.UtcNow.AddSeconds(waitSeconds);
+            
+            while (true)
+            {
+                long seen = MCPLogs.LogSequence;
+                var response = ExecuteOnMainThread("unity_get_logs", args, timing, true);
+                
+                if (response["success"]?.ToObject<bool>() != true)
+                {
+                    return response;
+                }
+                
+                var remaining = deadline - DateTime.UtcNow;
+                bool hasEntries = response["logs"] is JArray logs && logs.Count > 0;
+                if (hasEntries || remaining <= TimeSpan.Zero)
+                {
+                    response["timedOut"] = !hasEntries;
+                    return response;
+                }
+                
+                MCPLogs.WaitForNewLogs(seen, remaining);
+            }
+        }
+        
+        // Request failed unrun because of an assembly reload; clients may send it again
+        // once the server is back
+        private static JObject ReloadingError()
+        {
+            var error = CreateError("Unity is reloading scripts; the request did not run");
+            error["reloading"] = true;
+            return error;
+        }
+        
+        private static void SendResponse(HttpListenerContext context, JObject response, MCPTiming timing = null)
         {
             try
             {
@@ -216,12 +631,36 @@ namespace UnityMCP
                 context.Response.StatusCode = 200;
                 context.Response.AddHeader("Access-Control-Allow-Origin", "*");
                 
-                var responseBytes = Encoding.UTF8.GetBytes(response.ToString());
+                // Serialize once, without indentation
+                long serializeStart = Stopwatch.GetTimestamp();
+                string json = response.ToString(Formatting.None);
+                var responseBytes = Encoding.UTF8.GetBytes(json);
+                
+                string acceptEncoding = context.Request.Headers["Accept-Encoding"];
+                if (responseBytes.Length >= GzipThreshold && acceptEncoding != null && acceptEncoding.Contains("gzip"))
+                {
+                    using (var buffer = new MemoryStream())
+                    {
+                        using (var gzip = new GZipStream(buffer, CompressionLevel.Fastest))
+                        {
+                            gzip.Write(responseBytes, 0, responseBytes.Length);
+                        }
+                        responseBytes = buffer.ToArray();
+                    }
+                    context.Response.AddHeader("Content-Encoding", "gzip");
+                }
+                
+                if (timing != null)
+                {
+                    timing.AddSerialize(serializeStart);
+                    context.Response.AddHeader("X-MCP-Timing", timing.ToString());
+                }
+                
                 context.Response.ContentLength64 = responseBytes.Length;
                 context.Response.OutputStream.Write(responseBytes, 0, responseBytes.Length);
                 context.Response.OutputStream.Close();
                 
-                Debug.Log($"[MCP] Response sent: {response.ToString().Substring(0, Math.Min(100, response.ToString().Length))}");
+                Debug.Log($"[MCP] Response sent: {json.Substring(0, Math.Min(100, json.Length))}");
             }
             catch (Exception e)
             {
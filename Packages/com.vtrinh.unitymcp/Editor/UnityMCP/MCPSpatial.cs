@@ -0,0 +1,641 @@
+using UnityEngine;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using System;
+using System.Collections.Generic;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    // unity_spatial_query: radius, box overlap, k-nearest and raycast queries over the
+    // world bounds of every object with a Renderer or Collider in the active scene.
+    //
+    // Queries run on a bounding volume hierarchy (a binary tree of boxes, 4 objects
+    // per leaf) that is kept between calls. ObjectChangeEvents say what to re-read: an
+    // edit to a GameObject or Transform (moving, re-parenting, toggling active) marks
+    // the entries in its subtree, an edit to any other component marks its object's
+    // entry. The next query gives only those entries fresh bounds and refits the
+    // leaves holding them and the boxes above, without re-sorting. The transform tools
+    // mark what they move straight away, since the events arrive after they return.
+    // Creating or destroying objects, adding components, undo, hierarchy changes made
+    // without Undo and scene changes rebuild the tree, as does refitting more than a
+    // quarter of it, since refitted boxes grow loose as objects drift apart. In play
+    // mode scripts and physics move objects without events, so there every entry's
+    // localToWorldMatrix and active state are compared instead.
+    [InitializeOnLoad]
+    public static class MCPSpatial
+    {
+        private const int LeafSize = 4;
+        private const int DefaultLimit = 10;
+        private const int MaxLimit = 10000;
+        
+        private class Entry
+        {
+            public GameObject go;
+            public Transform transform;
+            public Renderer[] renderers;
+            public Collider[] colliders;
+            public Bounds bounds;
+            public bool hasBounds;
+            public bool active;
+            public Matrix4x4 matrix;
+        }
+        
+        // Leaves hold order[start .. start + count); internal nodes have count 0
+        private struct Node
+        {
+            public Bounds bounds;
+            public int parent;
+            public int left;
+            public int right;
+            public int start;
+            public int count;
+        }
+        
+        private static Entry[] entries = new Entry[0];
+        private static int[] order = new int[0];
+        private static Node[] nodes = new Node[0];
+        private static int nodeCount;
+        // Entry index -> the leaf holding it
+        private static int[] leafOf = new int[0];
+        // Instance IDs of each entry's GameObject and bounds components -> entry index
+        private static readonly Dictionary<int, int> entryById = new Dictionary<int, int>();
+        // Objects and components changed since the last query, by instance ID
+        private static readonly HashSet<int> changedIds = new HashSet<int>();
+        private static bool dirty = true;
+        private static int indexedSceneHandle;
+        private static int refittedSinceBuild;
+        
+        static MCPSpatial()
+        {
+            Undo.undoRedoPerformed += Invalidate;
+            ObjectChangeEvents.changesPublished += OnChangesPublished;
+            MCPChangeTracker.UnpublishedHierarchyChange += Invalidate;
+        }
+        
+        public static void Invalidate()
+        {
+            dirty = true;
+        }
+        
+        // For tools that move objects: the next query re-reads the subtree even if it
+        // runs before this update's ObjectChangeEvents are published
+        public static void MarkMoved(Transform transform)
+        {
+            changedIds.Add(transform.GetInstanceID());
+        }
+        
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            for (int i = 0; i < stream.length; i++)
+            {
+                switch (stream.GetEventType(i))
+                {
+                    case ObjectChangeKind.ChangeGameObjectOrComponentProperties:
+                        stream.GetChangeGameObjectOrComponentPropertiesEvent(i, out var properties);
+                        changedIds.Add(properties.instanceId);
+                        break;
+                    
+                    case ObjectChangeKind.ChangeGameObjectParent:
+                        stream.GetChangeGameObjectParentEvent(i, out var parent);
+                        changedIds.Add(parent.instanceId);
+                        break;
+                    
+                    case ObjectChangeKind.ChangeScene:
+                    case ObjectChangeKind.CreateGameObjectHierarchy:
+                    case ObjectChangeKind.DestroyGameObjectHierarchy:
+                    case ObjectChangeKind.ChangeGameObjectStructure:
+                    case ObjectChangeKind.ChangeGameObjectStructureHierarchy:
+                    case ObjectChangeKind.UpdatePrefabInstances:
+                        dirty = true;
+                        break;
+                }
+            }
+        }
+        
+        public static JObject SpatialQuery(JObject args)
+        {
+            string query = args["query"]?.ToString();
+            int limit = args["limit"]?.Value<int>() ?? DefaultLimit;
+            if (limit < 1 || limit > MaxLimit)
+            {
+                return Error($"limit must be between 1 and {MaxLimit}; got {limit}");
+            }
+            
+            bool rebuilt = Refresh(out int refitted);
+            var hits = new List<KeyValuePair<int, float>>();
+            Vector3 origin = Vector3.zero;
+            Vector3 direction = Vector3.zero;
+            
+            switch (query)
+            {
+                case "radius":
+                {
+                    if (!ReadVector(args, "center", out Vector3 center, out string problem))
+                    {
+                        return Error(problem);
+                    }
+                    float radius = args["radius"]?.Value<float>() ?? -1f;
+                    if (radius < 0f)
+                    {
+                        return Error("radius query needs a radius of 0 or more");
+                    }
+                    float sqrRadius = radius * radius;
+                    Collect(bounds => bounds.SqrDistance(center) <= sqrRadius, bounds => Mathf.Sqrt(bounds.SqrDistance(center)), hits);
+                    break;
+                }
+                
+                case "box":
+                {
+                    if (!ReadVector(args, "boundsMin", out Vector3 min, out string problem) || !ReadVector(args, "boundsMax", out Vector3 max, out problem))
+                    {
+                        return Error(problem);
+                    }
+                    var box = new Bounds();
+                    box.SetMinMax(Vector3.Min(min, max), Vector3.Max(min, max));
+                    Vector3 center = box.center;
+                    Collect(bounds => bounds.Intersects(box), bounds => Mathf.Sqrt(bounds.SqrDistance(center)), hits);
+                    break;
+                }
+                
+                case "nearest":
+                {
+                    if (!ReadVector(args, "center", out Vector3 center, out string problem))
+                    {
+                        return Error(problem);
+                    }
+                    float maxDistance = args["maxDistance"]?.Value<float>() ?? float.PositiveInfinity;
+                    Nearest(center, limit, maxDistance, hits);
+                    break;
+                }
+                
+                case "raycast":
+                {
+                    if (!ReadVector(args, "origin", out origin, out string problem) || !ReadVector(args, "direction", out direction, out problem))
+                    {
+                        return Error(problem);
+                    }
+                    if (direction.sqrMagnitude < 1e-12f)
+                    {
+                        return Error("raycast direction must not be zero");
+                    }
+                    direction.Normalize();
+                    var ray = new Ray(origin, direction);
+                    float maxDistance = args["maxDistance"]?.Value<float>() ?? float.PositiveInfinity;
+                    Collect(
+                        bounds => bounds.IntersectRay(ray, out float distance) && distance <= maxDistance,
+                        // Negative when the ray starts inside the box
+                        bounds => bounds.IntersectRay(ray, out float distance) ? Mathf.Max(0f, distance) : 0f,
+                        hits
+                    );
+                    break;
+                }
+                
+                default:
+                    return Error($"Unknown query '{query}'. Valid queries: radius, box, nearest, raycast");
+            }
+            
+            hits.Sort((a, b) => a.Value.CompareTo(b.Value));
+            bool truncated = hits.Count > limit;
+            
+            var results = new JArray();
+            for (int i = 0; i < hits.Count && results.Count < limit; i++)
+            {
+                Entry entry = entries[hits[i].Key];
+                if (entry.go == null)
+                {
+                    // Destroyed earlier in this update; its event has not arrived yet
+                    dirty = true;
+                    continue;
+                }
+                float distance = hits[i].Value;
+                var hit = new JObject
+                {
+                    ["handle"] = MCPObjectIndex.Handle(entry.go),
+                    ["name"] = entry.go.name,
+                    ["distance"] = distance
+                };
+                if (query == "raycast")
+                {
+                    Vector3 point = origin + direction * distance;
+                    hit["point"] = new JArray { point.x, point.y, point.z };
+                }
+                results.Add(hit);
+            }
+            
+            return new JObject
+            {
+                ["success"] = true,
+                ["query"] = query,
+                ["count"] = results.Count,
+                ["truncated"] = truncated,
+                ["hits"] = results,
+                ["index"] = new JObject
+                {
+                    ["objects"] = entries.Length,
+                    ["rebuilt"] = rebuilt,
+                    ["refitted"] = refitted
+                }
+            };
+        }
+        
+        // ==================== INDEX MAINTENANCE ====================
+        
+        // Bring the tree up to date with the scene; true if it had to be rebuilt
+        private static bool Refresh(out int refitted)
+        {
+            refitted = 0;
+            var scene = EditorSceneManager.GetActiveScene();
+            if (dirty || scene.handle != indexedSceneHandle)
+            {
+                Build(scene);
+                return true;
+            }
+            
+            var marked = new HashSet<int>();
+            if (EditorApplication.isPlaying)
+            {
+                for (int index = 0; index < entries.Length; index++)
+                {
+                    Entry entry = entries[index];
+                    if (entry.go == null || entry.transform.localToWorldMatrix != entry.matrix || entry.go.activeInHierarchy != entry.active)
+                    {
+                        marked.Add(index);
+                    }
+                }
+            }
+            else
+            {
+                foreach (int id in changedIds)
+                {
+                    Mark(id, marked);
+                }
+            }
+            changedIds.Clear();
+            if (dirty)
+            {
+                Build(scene);
+                return true;
+            }
+            if (marked.Count == 0)
+            {
+                return false;
+            }
+            
+            foreach (int index in marked)
+            {
+                if (entries[index].go == null)
+                {
+                    // Destroyed before its event arrived
+                    Build(scene);
+                    return true;
+                }
+                ReadBounds(entries[index]);
+            }
+            refitted = marked.Count;
+            
+            refittedSinceBuild += refitted;
+            if (refittedSinceBuild * 4 > entries.Length)
+            {
+                Build(scene);
+                return true;
+            }
+            Refit(marked);
+            return false;
+        }
+        
+        // The entries a change to this object affects: its whole subtree when it is a
+        // GameObject or Transform, otherwise its own object's entry
+        private static void Mark(int id, HashSet<int> marked)
+        {
+            var changed = EditorUtility.InstanceIDToObject(id);
+            if (changed is GameObject go)
+            {
+                MarkSubtree(go.transform, marked);
+            }
+            else if (changed is Transform transform)
+            {
+                MarkSubtree(transform, marked);
+            }
+            else if (changed is Component component)
+            {
+                // Renderers and colliders are indexed by their own ID; a MeshFilter or
+                // similar changes the bounds of its object's renderer
+                if (entryById.TryGetValue(id, out int index) || entryById.TryGetValue(component.gameObject.GetInstanceID(), out index))
+                {
+                    marked.Add(index);
+                }
+            }
+        }
+        
+        private static void MarkSubtree(Transform transform, HashSet<int> marked)
+        {
+            if (transform.gameObject.scene.handle != indexedSceneHandle)
+            {
+                // Moved to another scene
+                dirty = true;
+                return;
+            }
+            if (entryById.TryGetValue(transform.gameObject.GetInstanceID(), out int index))
+            {
+                marked.Add(index);
+            }
+            foreach (Transform child in transform)
+            {
+                MarkSubtree(child, marked);
+            }
+        }
+        
+        private static void Build(UnityEngine.SceneManagement.Scene scene)
+        {
+            var found = new List<Entry>();
+            entryById.Clear();
+            changedIds.Clear();
+            
+            void Visit(GameObject go)
+            {
+                var renderers = go.GetComponents<Renderer>();
+                var colliders = go.GetComponents<Collider>();
+                if (renderers.Length > 0 || colliders.Length > 0)
+                {
+                    var entry = new Entry { go = go, transform = go.transform, renderers = renderers, colliders = colliders };
+                    ReadBounds(entry);
+                    entryById[go.GetInstanceID()] = found.Count;
+                    foreach (var renderer in renderers) entryById[renderer.GetInstanceID()] = found.Count;
+                    foreach (var collider in colliders) entryById[collider.GetInstanceID()] = found.Count;
+                    found.Add(entry);
+                }
+                foreach (Transform child in go.transform)
+                {
+                    Visit(child.gameObject);
+                }
+            }
+            
+            foreach (var root in scene.GetRootGameObjects())
+            {
+                Visit(root);
+            }
+            
+            entries = found.ToArray();
+            order = new int[entries.Length];
+            for (int i = 0; i < order.Length; i++)
+            {
+                order[i] = i;
+            }
+            nodes = new Node[Math.Max(1, 2 * entries.Length / LeafSize + 1)];
+            nodeCount = 0;
+            leafOf = new int[entries.Length];
+            if (entries.Length > 0)
+            {
+                BuildNode(0, entries.Length, -1);
+            }
+            
+            dirty = false;
+            indexedSceneHandle = scene.handle;
+            refittedSinceBuild = 0;
+        }
+        
+        // Splits at the median of the longest axis of the entries' centers; returns the node index
+        private static int BuildNode(int start, int count, int parent)
+        {
+            if (nodeCount == nodes.Length)
+            {
+                Array.Resize(ref nodes, nodes.Length * 2);
+            }
+            int index = nodeCount++;
+            
+            Bounds bounds = entries[order[start]].bounds;
+            Bounds centers = new Bounds(bounds.center, Vector3.zero);
+            for (int i = start + 1; i < start + count; i++)
+            {
+                bounds.Encapsulate(entries[order[i]].bounds);
+                centers.Encapsulate(entries[order[i]].bounds.center);
+            }
+            
+            if (count <= LeafSize)
+            {
+                nodes[index] = new Node { bounds = bounds, parent = parent, left = -1, right = -1, start = start, count = count };
+                for (int i = start; i < start + count; i++)
+                {
+                    leafOf[order[i]] = index;
+                }
+                return index;
+            }
+            
+            Vector3 size = centers.size;
+            int axis = size.x >= size.y && size.x >= size.z ? 0 : size.y >= size.z ? 1 : 2;
+            Array.Sort(order, start, count, Comparer<int>.Create(
+                (a, b) => entries[a].bounds.center[axis].CompareTo(entries[b].bounds.center[axis])
+            ));
+            
+            int half = count / 2;
+            int left = BuildNode(start, half, index);
+            int right = BuildNode(start + half, count - half, index);
+            nodes[index] = new Node { bounds = bounds, parent = parent, left = left, right = right, start = start, count = 0 };
+            return index;
+        }
+        
+        // Refits the leaves holding the changed entries and their ancestors. Children
+        // always come after their parent, so going backwards refits each box once,
+        // after the boxes below it
+        private static void Refit(HashSet<int> changed)
+        {
+            var stale = new List<int>();
+            var seen = new HashSet<int>();
+            foreach (int entry in changed)
+            {
+                for (int index = leafOf[entry]; index >= 0 && seen.Add(index); index = nodes[index].parent)
+                {
+                    stale.Add(index);
+                }
+            }
+            stale.Sort();
+            
+            for (int s = stale.Count - 1; s >= 0; s--)
+            {
+                int index = stale[s];
+                Node node = nodes[index];
+                if (node.count > 0)
+                {
+                    node.bounds = entries[order[node.start]].bounds;
+                    for (int i = node.start + 1; i < node.start + node.count; i++)
+                    {
+                        node.bounds.Encapsulate(entries[order[i]].bounds);
+                    }
+                }
+                else
+                {
+                    node.bounds = nodes[node.left].bounds;
+                    node.bounds.Encapsulate(nodes[node.right].bounds);
+                }
+                nodes[index] = node;
+            }
+        }
+        
+        // Union of the object's own renderer and collider bounds; inactive objects have none
+        private static void ReadBounds(Entry entry)
+        {
+            entry.matrix = entry.transform.localToWorldMatrix;
+            entry.active = entry.go.activeInHierarchy;
+            entry.hasBounds = false;
+            entry.bounds = new Bounds(entry.transform.position, Vector3.zero);
+            if (!entry.active)
+            {
+                return;
+            }
+            
+            foreach (var renderer in entry.renderers)
+            {
+                if (renderer != null && renderer.enabled)
+                {
+                    Include(entry, renderer.bounds);
+                }
+            }
+            foreach (var collider in entry.colliders)
+            {
+                if (collider != null && collider.enabled)
+                {
+                    Include(entry, collider.bounds);
+                }
+            }
+        }
+        
+        private static void Include(Entry entry, Bounds bounds)
+        {
+            if (entry.hasBounds)
+            {
+                entry.bounds.Encapsulate(bounds);
+            }
+            else
+            {
+                entry.bounds = bounds;
+                entry.hasBounds = true;
+            }
+        }
+        
+        // ==================== QUERIES ====================
+        
+        // Every entry whose box passes the test, with its distance
+        private static void Collect(Func<Bounds, bool> test, Func<Bounds, float> distance, List<KeyValuePair<int, float>> hits)
+        {
+            if (entries.Length == 0)
+            {
+                return;
+            }
+            
+            var stack = new Stack<int>();
+            stack.Push(0);
+            while (stack.Count > 0)
+            {
+                Node node = nodes[stack.Pop()];
+                if (!test(node.bounds))
+                {
+                    continue;
+                }
+                if (node.count == 0)
+                {
+                    stack.Push(node.right);
+                    stack.Push(node.left);
+                    continue;
+                }
+                for (int i = node.start; i < node.start + node.count; i++)
+                {
+                    Entry entry = entries[order[i]];
+                    if (entry.hasBounds && test(entry.bounds))
+                    {
+                        hits.Add(new KeyValuePair<int, float>(order[i], distance(entry.bounds)));
+                    }
+                }
+            }
+        }
+        
+        // The k entries closest to center: nearer child first, skipping boxes farther than the k-th best
+        private static void Nearest(Vector3 center, int k, float maxDistance, List<KeyValuePair<int, float>> hits)
+        {
+            if (entries.Length == 0)
+            {
+                return;
+            }
+            
+            float worst = maxDistance * maxDistance;
+            
+            void Visit(int index)
+            {
+                Node node = nodes[index];
+                if (node.count == 0)
+                {
+                    int near = node.left;
+                    int far = node.right;
+                    float nearDistance = nodes[near].bounds.SqrDistance(center);
+                    float farDistance = nodes[far].bounds.SqrDistance(center);
+                    if (farDistance < nearDistance)
+                    {
+                        (near, far) = (far, near);
+                        (nearDistance, farDistance) = (farDistance, nearDistance);
+                    }
+                    if (nearDistance <= worst) Visit(near);
+                    if (farDistance <= worst) Visit(far);
+                    return;
+                }
+                
+                for (int i = node.start; i < node.start + node.count; i++)
+                {
+                    Entry entry = entries[order[i]];
+                    if (!entry.hasBounds)
+                    {
+                        continue;
+                    }
+                    float distance = entry.bounds.SqrDistance(center);
+                    if (distance > worst)
+                    {
+                        continue;
+                    }
+                    
+                    // hits stays sorted by squared distance, at most k long
+                    int at = hits.FindIndex(hit => hit.Value > distance);
+                    hits.Insert(at < 0 ? hits.Count : at, new KeyValuePair<int, float>(order[i], distance));
+                    if (hits.Count > k)
+                    {
+                        hits.RemoveAt(k);
+                    }
+                    if (hits.Count == k)
+                    {
+                        worst = hits[k - 1].Value;
+                    }
+                }
+            }
+            
+            if (nodes[0].bounds.SqrDistance(center) <= worst)
+            {
+                Visit(0);
+            }
+            for (int i = 0; i < hits.Count; i++)
+            {
+                hits[i] = new KeyValuePair<int, float>(hits[i].Key, Mathf.Sqrt(hits[i].Value));
+            }
+        }
+        
+        private static bool ReadVector(JObject args, string key, out Vector3 vector, out string problem)
+        {
+            vector = Vector3.zero;
+            problem = null;
+            JArray array = args[key] as JArray;
+            if (array == null || array.Count != 3)
+            {
+                problem = $"{args["query"]} query needs {key} as [x, y, z]";
+                return false;
+            }
+            vector = new Vector3((float)array[0], (float)array[1], (float)array[2]);
+            return true;
+        }
+        
+        private static JObject Error(string message)
+        {
+            return new JObject
+            {
+                ["success"] = false,
+                ["error"] = message
+            };
+        }
+    }
+}
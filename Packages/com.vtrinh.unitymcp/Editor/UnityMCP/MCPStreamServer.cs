@@ -0,0 +1,199 @@
+using UnityEngine;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Net;
+using System.Net.Sockets;
+using System.Text;
+using System.Threading;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using Stopwatch = System.Diagnostics.Stopwatch;
+
+namespace UnityMCP
+{
+    // Persistent, multiplexed transport next to the HTTP listener. A client keeps
+    // one TCP connection open and sends newline-delimited JSON frames:
+    //
+    //   {"id": 7, "tool": "unity_ping", "args": {}}    tool call
+    //   {"id": 8, "status": true}                      status probe (scene version)
+    //
+    // Each frame is answered with {"id": 7, "timing": "...", "result": {...}}
+    // (timing as in MCPTiming) on the same connection, in completion order rather than request order, so a long-poll
+    // never holds up the calls behind it. Tool calls go through MCPServer.Dispatch
+    // exactly like HTTP requests. Started and stopped together with MCPServer,
+    // so connections drop on assembly reload and clients reconnect afterwards.
+    public static class MCPStreamServer
+    {
+        private static int port = 8766;
+        private static TcpListener listener;
+        private static Thread acceptThread;
+        private static volatile bool isRunning = false;
+        
+        private static readonly List<TcpClient> clients = new List<TcpClient>();
+        private static readonly object clientsLock = new object();
+        private static readonly UTF8Encoding Utf8 = new UTF8Encoding(false);
+        
+        private class Connection
+        {
+            public TcpClient client;
+            public Stream stream;
+            public readonly object writeLock = new object();
+        }
+        
+        public static void Start()
+        {
+            if (isRunning) return;
+            
+            try
+            {
+                listener = new TcpListener(IPAddress.Loopback, port);
+                listener.Start();
+                isRunning = true;
+                
+                acceptThread = new Thread(AcceptLoop);
+                acceptThread.IsBackground = true;
+                acceptThread.Start();
+                
+                Debug.Log($"[MCP] Stream transport listening on tcp://localhost:{port}");
+            }
+            catch (Exception e)
+            {
+                // HTTP keeps working; clients fall back to it
+                isRunning = false;
+                Debug.LogError($"[MCP] Failed to start stream transport: {e.Message}");
+            }
+        }
+        
+        public static void Stop()
+        {
+            if (!isRunning) return;
+            
+            isRunning = false;
+            listener?.Stop();
+            
+            lock (clientsLock)
+            {
+                foreach (var client in clients)
+                {
+                    client.Close();
+                }
+                clients.Clear();
+            }
+        }
+        
+        private static void AcceptLoop()
+        {
+            while (isRunning)
+            {
+                try
+                {
+                    var client = listener.AcceptTcpClient();
+                    client.NoDelay = true;
+                    lock (clientsLock)
+                    {
+                        clients.Add(client);
+                    }
+                    
+                    var thread = new Thread(() => ConnectionLoop(client));
+                    thread.IsBackground = true;
+                    thread.Start();
+                }
+                catch (Exception e) when (e is SocketException || e is ObjectDisposedException)
+                {
+                    // Expected when stopping
+                    break;
+                }
+                catch (Exception e)
+                {
+                    Debug.LogError($"[MCP] Stream accept error: {e.Message}");
+                }
+            }
+        }
+        
+        // One reader thread per connection; every frame is handled on the thread pool
+        private static void ConnectionLoop(TcpClient client)
+        {
+            var connection = new Connection { client = client, stream = client.GetStream() };
+            
+            try
+            {
+                using (var reader = new StreamReader(connection.stream, Utf8))
+                {
+                    string line;
+                    while (isRunning && (line = reader.ReadLine()) != null)
+                    {
+                        if (line.Length == 0) continue;
+                        string frame = line;
+                        ThreadPool.QueueUserWorkItem((_) => HandleFrame(connection, frame));
+                    }
+                }
+            }
+            catch (Exception e) when (e is IOException || e is ObjectDisposedException)
+            {
+                // Connection closed by the client or by Stop
+            }
+            finally
+            {
+                lock (clientsLock)
+                {
+                    clients.Remove(client);
+                }
+                client.Close();
+            }
+        }
+        
+        private static void HandleFrame(Connection connection, string frame)
+        {
+            var timing = new MCPTiming();
+            long id = 0;
+            try
+            {
+                var request = JObject.Parse(frame);
+                id = request["id"]?.ToObject<long>() ?? 0;
+                timing.Parsed();
+                
+                if (request["status"]?.ToObject<bool>() == true)
+                {
+                    Send(connection, id, MCPChangeTracker.GetStatus(), timing);
+                    return;
+                }
+                
+                string tool = request["tool"]?.ToString();
+                var args = request["args"] as JObject ?? new JObject();
+                MCPServer.Dispatch(tool, args, timing, response => Send(connection, id, response, timing));
+            }
+            catch (Exception e)
+            {
+                Debug.LogError($"[MCP] Stream request error: {e.Message}");
+                Send(connection, id, new JObject
+                {
+                    ["success"] = false,
+                    ["error"] = e.Message
+                }, timing);
+            }
+        }
+        
+        private static void Send(Connection connection, long id, JObject response, MCPTiming timing)
+        {
+            // The result is written last so clients can take its JSON text as is
+            long serializeStart = Stopwatch.GetTimestamp();
+            string result = response.ToString(Formatting.None);
+            timing.AddSerialize(serializeStart);
+            var bytes = Utf8.GetBytes("{\"id\":" + id + ",\"timing\":\"" + timing + "\",\"result\":" + result + "}\n");
+            
+            try
+            {
+                lock (connection.writeLock)
+                {
+                    connection.stream.Write(bytes, 0, bytes.Length);
+                }
+            }
+            catch (Exception e)
+            {
+                // Client went away (or an assembly reload closed it); nothing to answer
+                Debug.LogWarning($"[MCP] Stream send error: {e.Message}");
+            }
+        }
+    }
+}
@@ -0,0 +1,57 @@
+using System.Globalization;
+using Stopwatch = System.Diagnostics.Stopwatch;
+
+namespace UnityMCP
+{
+    // Where one request's time went inside the editor. Filled in as the request passes
+    // through the bridge and sent back with the response, as the X-MCP-Timing header
+    // over HTTP and as "timing" in the MCPStreamServer envelope:
+    //
+    //   parse=0.052;queue=6.113;exec=1.870;serialize=0.094;total=8.301
+    //
+    // parse      reading and parsing the request on the listener thread
+    // queue      waiting in a lane for an editor update (summed over a long-poll's passes)
+    // exec       MCPTools.Execute on the main thread
+    // serialize  turning the response into JSON (and gzip)
+    // total      from receiving the request until the response is written; the rest of
+    //            it is listener-thread waiting (long-polls, compile waits)
+    public class MCPTiming
+    {
+        private readonly long receivedAt = Stopwatch.GetTimestamp();
+        private double parseMs;
+        private double queueMs;
+        private double execMs;
+        private double serializeMs;
+        
+        public static double Milliseconds(long from, long to)
+        {
+            return (to - from) * 1000.0 / Stopwatch.Frequency;
+        }
+        
+        public void Parsed()
+        {
+            parseMs = Milliseconds(receivedAt, Stopwatch.GetTimestamp());
+        }
+        
+        // Listener thread, once the main thread has signalled the request
+        public void AddMainThread(double waitMs, double runMs)
+        {
+            queueMs += waitMs;
+            execMs += runMs;
+        }
+        
+        public void AddSerialize(long since)
+        {
+            serializeMs += Milliseconds(since, Stopwatch.GetTimestamp());
+        }
+        
+        public override string ToString()
+        {
+            double totalMs = Milliseconds(receivedAt, Stopwatch.GetTimestamp());
+            return string.Format(
+                CultureInfo.InvariantCulture,
+                "parse={0:0.###};queue={1:0.###};exec={2:0.###};serialize={3:0.###};total={4:0.###}",
+                parseMs, queueMs, execMs, serializeMs, totalMs);
+        }
+    }
+}
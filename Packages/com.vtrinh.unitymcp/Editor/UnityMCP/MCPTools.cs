@@ -5,6 +5,7 @@ using UnityEditor;
 using UnityEditor.SceneManagement;
 using Newtonsoft.Json.Linq;
 using System.Linq;
+using System.Collections.Generic;
 using TMPro;
 using System;
 #if ENABLE_INPUT_SYSTEM
@@ -25,10 +26,19 @@ namespace UnityMCP
                         return Ping();
                     
                     case "unity_get_scene_info":
-                        return GetSceneInfo();
+                        return GetSceneInfo(args);
                     
                     case "unity_list_all_gameobjects":
-                        return ListAllGameObjects();
+                        return ListAllGameObjects(args);
+                    
+                    case "unity_query_gameobjects":
+                        return MCPQuery.QueryGameObjects(args);
+                    
+                    case "unity_spatial_query":
+                        return MCPSpatial.SpatialQuery(args);
+                    
+                    case "unity_search_assets":
+                        return MCPAssetIndex.Search(args);
 
                     case "unity_create_primitive":
                         return CreatePrimitive(args);
@@ -39,11 +49,17 @@ namespace UnityMCP
                     case "unity_create_prefab_from_asset":
                         return CreatePrefabFromAsset(args);
                     
+                    case "unity_instantiate_prefabs":
+                        return MCPPrefabs.InstantiatePrefabs(args);
+                    
+                    case "unity_create_prefabs_from_assets":
+                        return MCPPrefabs.CreatePrefabsFromAssets(args);
+                    
                     case "unity_add_script_component":
                         return AddScriptComponent(args);
                     
                     case "unity_update_prefab":
-                        return UpdatePrefab(args);
+                        return MCPPrefabs.UpdatePrefab(args);
                     
                     case "unity_force_compile":
                         return ForceCompile();
@@ -103,6 +119,9 @@ namespace UnityMCP
                     case "unity_set_scale":
                         return SetScale(args);
                     
+                    case "unity_set_transforms":
+                        return MCPTransforms.SetTransforms(args);
+                    
                     case "unity_set_tag":
                         return SetTag(args);
 
@@ -135,6 +154,9 @@ namespace UnityMCP
                     case "unity_create_script":
                         return CreateScript(args);
                     
+                    case "unity_create_scripts":
+                        return MCPScripts.CreateScripts(args);
+                    
                     case "unity_add_component":
                         return AddComponent(args);
                     
@@ -161,6 +183,10 @@ namespace UnityMCP
                     case "unity_add_particle_trail":
                         return AddParticleTrail(args);
                     
+                    // Batch Execution
+                    case "unity_batch":
+                        return Batch(args);
+                    
                     default:
                         throw new System.Exception($"Unknown tool: {tool}");
                 }
@@ -188,64 +214,339 @@ namespace UnityMCP
         }
         
         // Tool 2: Get Scene Info
-        private static JObject GetSceneInfo()
+        private static readonly string[] SceneInfoFields = { "sceneName", "scenePath", "isLoaded", "rootObjectCount", "rootObjects" };
+        
+        private static JObject GetSceneInfo(JObject args)
         {
             var scene = EditorSceneManager.GetActiveScene();
+            var fields = ParseFields(args, SceneInfoFields);
+            int pageSize = args["pageSize"]?.Value<int>() ?? 0;
+            int offset = ParseCursor(args, out bool sceneChanged);
             var rootObjects = scene.GetRootGameObjects();
             
-            return new JObject
+            var result = new JObject { ["success"] = true };
+            if (fields == null || fields.Contains("sceneName")) result["sceneName"] = scene.name;
+            if (fields == null || fields.Contains("scenePath")) result["scenePath"] = scene.path;
+            if (fields == null || fields.Contains("isLoaded")) result["isLoaded"] = scene.isLoaded;
+            if (fields == null || fields.Contains("rootObjectCount")) result["rootObjectCount"] = rootObjects.Length;
+            
+            if (fields == null || fields.Contains("rootObjects"))
             {
-                ["success"] = true,
-                ["sceneName"] = scene.name,
-                ["scenePath"] = scene.path,
-                ["isLoaded"] = scene.isLoaded,
-                ["rootObjectCount"] = rootObjects.Length,
-                ["rootObjects"] = new JArray(
-                    rootObjects.Select(go => go.name)
-                )
-            };
+                int start = Mathf.Min(offset, rootObjects.Length);
+                int end = pageSize > 0 ? Mathf.Min(start + pageSize, rootObjects.Length) : rootObjects.Length;
+                result["rootObjects"] = new JArray(
+                    rootObjects.Skip(start).Take(end - start).Select(go => go.name)
+                );
+                if (end < rootObjects.Length)
+                {
+                    result["nextCursor"] = MakeCursor(end);
+                }
+                if (sceneChanged)
+                {
+                    result["sceneChanged"] = true;
+                }
+            }
+            
+            return result;
+        }
+        
+        // ==================== HIERARCHY LISTING ====================
+        
+        private static readonly string[] GameObjectFields = { "instanceId", "name", "path", "active", "tag", "layer", "position" };
+        
+        // Requested fields for a listing; null means all of them
+        internal static HashSet<string> ParseFields(JObject args, string[] valid)
+        {
+            var fieldsArray = args["fields"] as JArray;
+            if (fieldsArray == null || fieldsArray.Count == 0)
+            {
+                return null;
+            }
+            
+            var fields = new HashSet<string>();
+            foreach (var token in fieldsArray)
+            {
+                string field = token.ToString();
+                if (Array.IndexOf(valid, field) < 0)
+                {
+                    throw new System.Exception($"Unknown field '{field}'. Valid fields: {string.Join(", ", valid)}");
+                }
+                fields.Add(field);
+            }
+            return fields;
         }
         
-        private static JObject ListAllGameObjects()
+        // Paging cursors are "<offset>:<scene version when issued>"
+        private static int ParseCursor(JObject args, out bool sceneChanged)
+        {
+            sceneChanged = false;
+            string cursor = args["cursor"]?.ToString();
+            if (string.IsNullOrEmpty(cursor))
+            {
+                return 0;
+            }
+            
+            var parts = cursor.Split(':');
+            if (parts.Length != 2 || !int.TryParse(parts[0], out int offset) || offset < 0 || !long.TryParse(parts[1], out long version))
+            {
+                throw new System.Exception($"Invalid cursor '{cursor}'");
+            }
+            
+            // Offsets still work after an edit, but objects may shift between pages
+            sceneChanged = version != MCPChangeTracker.SceneVersion;
+            return offset;
+        }
+        
+        private static string MakeCursor(int offset)
+        {
+            return $"{offset}:{MCPChangeTracker.SceneVersion}";
+        }
+        
+        internal static JObject DescribeGameObject(GameObject go, string path, HashSet<string> fields)
+        {
+            var obj = new JObject();
+            if (fields == null || fields.Contains("instanceId")) obj["instanceId"] = go.GetInstanceID();
+            if (fields == null || fields.Contains("name")) obj["name"] = go.name;
+            if (fields == null || fields.Contains("path")) obj["path"] = path;
+            if (fields == null || fields.Contains("active")) obj["active"] = go.activeInHierarchy;
+            if (fields == null || fields.Contains("tag")) obj["tag"] = go.tag;
+            if (fields == null || fields.Contains("layer")) obj["layer"] = LayerMask.LayerToName(go.layer);
+            if (fields == null || fields.Contains("position"))
+            {
+                var position = go.transform.position;
+                obj["position"] = new JArray { position.x, position.y, position.z };
+            }
+            return obj;
+        }
+        
+        private static void ProjectFields(JArray objects, HashSet<string> fields)
+        {
+            if (fields == null)
+            {
+                return;
+            }
+            
+            foreach (JObject obj in objects)
+            {
+                foreach (var property in obj.Properties().ToList())
+                {
+                    if (!fields.Contains(property.Name))
+                    {
+                        property.Remove();
+                    }
+                }
+            }
+        }
+        
+        // Whether a listing asked for encoding "columnar" rather than the default "rows"
+        internal static bool IsColumnar(JObject args)
+        {
+            string encoding = args["encoding"]?.ToString() ?? "rows";
+            if (encoding != "rows" && encoding != "columnar")
+            {
+                throw new System.Exception($"Unknown encoding '{encoding}'. Valid encodings: rows, columnar");
+            }
+            return encoding == "columnar";
+        }
+        
+        // One array per field instead of one object per row, with vectors flattened:
+        // {"count": 2, "name": ["A", "B"], "position": [x0, y0, z0, x1, y1, z1]}
+        internal static JObject ToColumns(JArray objects)
+        {
+            var columns = new JObject { ["count"] = objects.Count };
+            foreach (JObject obj in objects)
+            {
+                foreach (var property in obj.Properties())
+                {
+                    var column = columns[property.Name] as JArray;
+                    if (column == null)
+                    {
+                        column = new JArray();
+                        columns[property.Name] = column;
+                    }
+                    
+                    if (property.Value is JArray values)
+                    {
+                        foreach (var value in values)
+                        {
+                            column.Add(value);
+                        }
+                    }
+                    else
+                    {
+                        column.Add(property.Value);
+                    }
+                }
+            }
+            return columns;
+        }
+        
+        private static JObject ListAllGameObjects(JObject args)
         {
             var scene = EditorSceneManager.GetActiveScene();
-            var rootObjects = scene.GetRootGameObjects();
+            var fields = ParseFields(args, GameObjectFields);
+            bool columnar = IsColumnar(args);
+            
+            // Delta since an earlier revision; unknown or expired tokens fall through to a full snapshot
+            var sinceToken = args["sinceRevision"];
+            bool hasSince = sinceToken != null && sinceToken.Type != JTokenType.Null;
+            if (hasSince)
+            {
+                long sinceRevision = sinceToken.Value<long>();
+                // A token from another scene skips the refresh, so the snapshot below can share
+                // the tracker's walk
+                if (MCPChangeTracker.CanDelta(sinceRevision))
+                {
+                    long current = MCPChangeTracker.RefreshHierarchy();
+                    if (MCPChangeTracker.CanDelta(sinceRevision))
+                    {
+                        var delta = MCPChangeTracker.GetHierarchyDelta(sinceRevision);
+                        ProjectFields((JArray)delta["added"], fields);
+                        ProjectFields((JArray)delta["changed"], fields);
+                        if (columnar)
+                        {
+                            delta["added"] = ToColumns((JArray)delta["added"]);
+                            delta["changed"] = ToColumns((JArray)delta["changed"]);
+                            delta["removed"] = ToColumns((JArray)delta["removed"]);
+                        }
+                        delta["success"] = true;
+                        delta["sceneName"] = scene.name;
+                        delta["revision"] = current;
+                        delta["sinceRevision"] = sinceRevision;
+                        delta["full"] = false;
+                        return delta;
+                    }
+                }
+            }
+            
+            string rootPath = args["rootPath"]?.ToString();
+            int maxDepth = args["maxDepth"]?.Value<int>() ?? -1;
+            int pageSize = args["pageSize"]?.Value<int>() ?? 0;
+            int offset = ParseCursor(args, out bool sceneChanged);
+            bool firstPage = string.IsNullOrEmpty(args["cursor"]?.ToString());
+            
+            GameObject[] startObjects;
+            if (!string.IsNullOrEmpty(rootPath))
+            {
+                var root = MCPObjectIndex.Find(rootPath);
+                if (root == null)
+                {
+                    return new JObject
+                    {
+                        ["success"] = false,
+                        ["error"] = $"GameObject '{rootPath}' not found"
+                    };
+                }
+                startObjects = new[] { root };
+            }
+            else
+            {
+                startObjects = scene.GetRootGameObjects();
+            }
             
             var allObjects = new JArray();
+            int index = 0;
+            bool hasMore = false;
             
-            void AddGameObjectAndChildren(GameObject go, string parentPath = "")
+            // False once the page is full
+            bool AddToPage(GameObject go, string path)
             {
-                string path = string.IsNullOrEmpty(parentPath) ? go.name : $"{parentPath}/{go.name}";
+                if (hasMore)
+                {
+                    return false;
+                }
+                if (index >= offset)
+                {
+                    if (pageSize > 0 && allObjects.Count >= pageSize)
+                    {
+                        hasMore = true;
+                        return false;
+                    }
+                    allObjects.Add(DescribeGameObject(go, path, fields));
+                }
+                index++;
+                return true;
+            }
+            
+            // Pre-order walk; stops as soon as the page is full
+            bool AddGameObjectAndChildren(GameObject go, string path, int depth)
+            {
+                if (!AddToPage(go, path))
+                {
+                    return false;
+                }
                 
-                allObjects.Add(new JObject
+                if (maxDepth >= 0 && depth >= maxDepth)
                 {
-                    ["name"] = go.name,
-                    ["path"] = path,
-                    ["active"] = go.activeInHierarchy,
-                    ["tag"] = go.tag,
-                    ["layer"] = LayerMask.LayerToName(go.layer),
-                    ["position"] = new JArray { go.transform.position.x, go.transform.position.y, go.transform.position.z }
-                });
+                    return true;
+                }
                 
                 // Recursively add children
                 foreach (Transform child in go.transform)
                 {
-                    AddGameObjectAndChildren(child.gameObject, path);
+                    if (!AddGameObjectAndChildren(child.gameObject, $"{path}/{child.name}", depth + 1))
+                    {
+                        return false;
+                    }
                 }
+                return true;
             }
             
-            foreach (var rootObject in rootObjects)
+            // The revision token comes with the first page, and only when asked for
+            bool wantRevision = firstPage && (hasSince || args["revision"]?.ToObject<bool>() == true);
+            long revision = 0;
+            if (wantRevision && string.IsNullOrEmpty(rootPath) && maxDepth < 0 &&
+                MCPChangeTracker.NeedsFullWalk)
             {
-                AddGameObjectAndChildren(rootObject);
+                // The tracker has to walk the whole scene anyway; it visits objects in the
+                // same order, so one walk fills both
+                revision = MCPChangeTracker.RefreshHierarchy((go, path) => AddToPage(go, path));
+            }
+            else
+            {
+                foreach (var startObject in startObjects)
+                {
+                    if (!AddGameObjectAndChildren(startObject, GetGameObjectPath(startObject), 0))
+                    {
+                        break;
+                    }
+                }
+                if (wantRevision)
+                {
+                    revision = MCPChangeTracker.RefreshHierarchy();
+                }
             }
             
-            return new JObject
+            var result = new JObject
             {
                 ["success"] = true,
-                ["sceneName"] = scene.name,
-                ["totalObjects"] = allObjects.Count,
-                ["objects"] = allObjects
+                ["sceneName"] = scene.name
             };
+            
+            if (wantRevision)
+            {
+                result["revision"] = revision;
+                result["full"] = true;
+            }
+            
+            result["totalObjects"] = allObjects.Count;
+            if (columnar)
+            {
+                result["columns"] = ToColumns(allObjects);
+            }
+            else
+            {
+                result["objects"] = allObjects;
+            }
+            if (hasMore)
+            {
+                result["nextCursor"] = MakeCursor(index);
+            }
+            if (sceneChanged)
+            {
+                result["sceneChanged"] = true;
+            }
+            return result;
         }
         
         // Create Primitive (Sphere, Capsule, Cylinder, Cube, etc.)
@@ -294,6 +595,7 @@ namespace UnityMCP
             primitive.transform.position = position;
             
             Undo.RegisterCreatedObjectUndo(primitive, $"Create {name}");
+            MCPObjectIndex.Add(primitive);
             Selection.activeGameObject = primitive;
             EditorSceneManager.MarkSceneDirty(EditorSceneManager.GetActiveScene());
             
@@ -305,7 +607,8 @@ namespace UnityMCP
                 ["name"] = primitive.name,
                 ["primitiveType"] = primitiveType,
                 ["position"] = new JArray { position.x, position.y, position.z },
-                ["instanceId"] = primitive.GetInstanceID()
+                ["instanceId"] = primitive.GetInstanceID(),
+                ["handle"] = MCPObjectIndex.Handle(primitive)
             };
         }
         
@@ -387,78 +690,127 @@ namespace UnityMCP
             };
         }
         
-        // Tool 7: Get Console Logs
+        // Tool 7: Get Console Logs (filters, cursor and cached reflection live in MCPLogs)
         private static JObject GetLogs(JObject args)
         {
-            int count = args["count"]?.ToObject<int>() ?? 50;
-            bool includeStackTrace = args["includeStackTrace"]?.ToObject<bool>() ?? false;
-            
-            // Access Unity console logs using reflection
-            var logEntriesType = System.Type.GetType("UnityEditor.LogEntries,UnityEditor.dll");
-            var getCountMethod = logEntriesType.GetMethod("GetCount");
-            var startGettingEntriesMethod = logEntriesType.GetMethod("StartGettingEntries");
-            var getEntryInternalMethod = logEntriesType.GetMethod("GetEntryInternal");
-            var endGettingEntriesMethod = logEntriesType.GetMethod("EndGettingEntries");
-            
-            var logEntryType = System.Type.GetType("UnityEditor.LogEntry,UnityEditor.dll");
+            return MCPLogs.GetLogs(args);
+        }
+        
+        // ==================== BATCH EXECUTION ====================
+        
+        // Runs an ordered list of {tool, args} entries inside a single main-thread
+        // pass (one EditorApplication.update tick) and returns one result per entry.
+        // All entries share one undo group so the whole batch undoes in one step.
+        // A restart or forced compile would tear down the listener mid-batch, and
+        // unity_create_scripts returns a waitId only a direct call collects.
+        private static readonly HashSet<string> NotBatchable = new HashSet<string>
+        {
+            "unity_restart_server",
+            "unity_force_compile",
+            "unity_create_scripts"
+        };
+        
+        private static JObject Batch(JObject args)
+        {
+            JArray calls = args["calls"] as JArray;
+            bool stopOnError = args["stopOnError"]?.ToObject<bool>() ?? true;
             
-            int totalCount = (int)getCountMethod.Invoke(null, null);
-            int startIndex = System.Math.Max(0, totalCount - count);
+            if (calls == null || calls.Count == 0)
+            {
+                return new JObject
+                {
+                    ["success"] = false,
+                    ["error"] = "calls must be a non-empty array of {tool, args} entries"
+                };
+            }
             
-            startGettingEntriesMethod.Invoke(null, null);
+            Undo.IncrementCurrentGroup();
+            int undoGroup = Undo.GetCurrentGroup();
+            Undo.SetCurrentGroupName("MCP Batch");
             
-            var logs = new JArray();
+            var results = new JArray();
+            int succeeded = 0;
+            int failed = 0;
+            int stoppedAt = -1;
             
-            try
+            for (int i = 0; i < calls.Count; i++)
             {
-                for (int i = startIndex; i < totalCount; i++)
+                if (stoppedAt >= 0)
                 {
-                    var logEntry = System.Activator.CreateInstance(logEntryType);
-                    var args_array = new object[] { i, logEntry };
-                    getEntryInternalMethod.Invoke(null, args_array);
-                    logEntry = args_array[1];
-                    
-                    // Extract log entry details
-                    var message = logEntryType.GetField("message").GetValue(logEntry) as string;
-                    var file = logEntryType.GetField("file").GetValue(logEntry) as string;
-                    var line = (int)logEntryType.GetField("line").GetValue(logEntry);
-                    var mode = (int)logEntryType.GetField("mode").GetValue(logEntry);
-                    var instanceID = (int)logEntryType.GetField("instanceID").GetValue(logEntry);
-                    
-                    // Determine log type
-                    string logType = "Log";
-                    if ((mode & (int)LogType.Error) != 0)
-                        logType = "Error";
-                    else if ((mode & (int)LogType.Warning) != 0)
-                        logType = "Warning";
-                    
-                    var logObj = new JObject
+                    results.Add(new JObject
+                    {
+                        ["success"] = false,
+                        ["skipped"] = true,
+                        ["error"] = $"Skipped: entry {stoppedAt} failed and stopOnError is set"
+                    });
+                    continue;
+                }
+                
+                JObject entry = calls[i] as JObject;
+                string tool = entry?["tool"]?.ToString();
+                JObject entryArgs = entry?["args"] as JObject ?? new JObject();
+                
+                JObject result;
+                if (string.IsNullOrEmpty(tool))
+                {
+                    result = new JObject
                     {
-                        ["index"] = i,
-                        ["type"] = logType,
-                        ["message"] = message
+                        ["success"] = false,
+                        ["error"] = $"Entry {i} has no tool name"
                     };
-                    
-                    if (includeStackTrace && !string.IsNullOrEmpty(file))
+                }
+                else if (tool == "unity_batch")
+                {
+                    result = new JObject
+                    {
+                        ["success"] = false,
+                        ["error"] = "Nested unity_batch calls are not supported"
+                    };
+                }
+                else if (NotBatchable.Contains(tool))
+                {
+                    result = new JObject
                     {
-                        logObj["file"] = file;
-                        logObj["line"] = line;
+                        ["success"] = false,
+                        ["error"] = $"{tool} cannot run inside unity_batch; call it on its own"
+                    };
+                }
+                else
+                {
+                    result = Execute(tool, entryArgs);
+                }
+                
+                results.Add(result);
+                MCPJobs.ReportProgress((float)(i + 1) / calls.Count, $"{i + 1}/{calls.Count} entries");
+                
+                if (result["success"]?.ToObject<bool>() == true)
+                {
+                    succeeded++;
+                }
+                else
+                {
+                    failed++;
+                    if (stopOnError)
+                    {
+                        stoppedAt = i;
                     }
-                    
-                    logs.Add(logObj);
                 }
             }
-            finally
-            {
-                endGettingEntriesMethod.Invoke(null, null);
-            }
+            
+            Undo.CollapseUndoOperations(undoGroup);
+            
+            Debug.Log($"[MCP] Batch executed {calls.Count} entries ({succeeded} succeeded, {failed} failed)");
             
             return new JObject
             {
                 ["success"] = true,
-                ["totalCount"] = totalCount,
-                ["returnedCount"] = logs.Count,
-                ["logs"] = logs
+                ["allSucceeded"] = failed == 0,
+                ["total"] = calls.Count,
+                ["succeeded"] = succeeded,
+                ["failed"] = failed,
+                ["skipped"] = calls.Count - succeeded - failed,
+                ["stoppedAt"] = stoppedAt,
+                ["results"] = results
             };
         }
         
@@ -647,15 +999,13 @@ namespace UnityMCP
             try
             {
                 // Find scene path
-                string[] sceneGUIDs = AssetDatabase.FindAssets($"{sceneName} t:Scene");
+                string scenePath = MCPAssetIndex.FindScene(sceneName);
                 
-                if (sceneGUIDs.Length == 0)
+                if (scenePath == null)
                 {
                     throw new System.Exception($"Scene '{sceneName}' not found");
                 }
                 
-                string scenePath = AssetDatabase.GUIDToAssetPath(sceneGUIDs[0]);
-                
                 // Load the scene
                 var loadedScene = EditorSceneManager.OpenScene(scenePath, OpenSceneMode.Single);
                 
@@ -763,7 +1113,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -809,7 +1159,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -828,7 +1178,9 @@ namespace UnityMCP
                     ["name"] = obj.name,
                     ["path"] = path,
                     ["position"] = new JArray { pos.x, pos.y, pos.z },
-                    ["active"] = obj.activeSelf
+                    ["active"] = obj.activeSelf,
+                    ["instanceId"] = obj.GetInstanceID(),
+                    ["handle"] = MCPObjectIndex.Handle(obj)
                 };
             }
             catch (System.Exception e)
@@ -866,7 +1218,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -884,6 +1236,7 @@ namespace UnityMCP
                 
                 Undo.RecordObject(obj.transform, "Set Position");
                 obj.transform.position = newPos;
+                MCPSpatial.MarkMoved(obj.transform);
                 
                 Debug.Log($"[MCP] Set position of '{name}' to {newPos}");
                 
@@ -921,7 +1274,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -934,7 +1287,7 @@ namespace UnityMCP
                 Transform newParent = null;
                 if (!string.IsNullOrEmpty(parentName))
                 {
-                    GameObject parentObj = GameObject.Find(parentName);
+                    GameObject parentObj = MCPObjectIndex.Find(parentName);
                     if (parentObj == null)
                     {
                         return new JObject
@@ -949,6 +1302,7 @@ namespace UnityMCP
                 
                 Undo.RecordObject(obj.transform, "Set Parent");
                 obj.transform.SetParent(newParent, worldPositionStays);
+                MCPSpatial.MarkMoved(obj.transform);
                 
                 string parentInfo = newParent != null ? newParent.name : "none";
                 Debug.Log($"[MCP] Set parent of '{name}' to '{parentInfo}' (worldPositionStays: {worldPositionStays})");
@@ -995,7 +1349,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -1013,6 +1367,7 @@ namespace UnityMCP
                 
                 Undo.RecordObject(obj.transform, "Set Rotation");
                 obj.transform.eulerAngles = newRot;
+                MCPSpatial.MarkMoved(obj.transform);
                 
                 Debug.Log($"[MCP] Set rotation of '{name}' to {newRot}");
                 
@@ -1058,7 +1413,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -1076,6 +1431,7 @@ namespace UnityMCP
                 
                 Undo.RecordObject(obj.transform, "Set Scale");
                 obj.transform.localScale = newScale;
+                MCPSpatial.MarkMoved(obj.transform);
                 
                 Debug.Log($"[MCP] Set scale of '{name}' to {newScale}");
                 
@@ -1121,7 +1477,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -1197,7 +1553,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -1341,7 +1697,7 @@ namespace UnityMCP
                 Camera camera = null;
                 
                 // Try to find the camera
-                GameObject cameraObj = GameObject.Find(cameraName);
+                GameObject cameraObj = MCPObjectIndex.Find(cameraName);
                 if (cameraObj != null)
                 {
                     camera = cameraObj.GetComponent<Camera>();
@@ -1449,7 +1805,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -1514,7 +1870,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -1680,6 +2036,46 @@ namespace UnityMCP
             }
         }
         
+        // Resolved component types by the name tools were given; reset by every domain reload
+        private static readonly Dictionary<string, System.Type> componentTypes = new Dictionary<string, System.Type>();
+        
+        // A component type by short name ("Rigidbody", "Image", "TextMeshProUGUI", a
+        // project script) or full name; null if there is none. Shared by the component
+        // and prefab tools and unity_query_gameobjects.
+        internal static System.Type FindComponentType(string name)
+        {
+            if (string.IsNullOrEmpty(name))
+            {
+                return null;
+            }
+            if (componentTypes.TryGetValue(name, out System.Type cached))
+            {
+                return cached;
+            }
+            
+            System.Type type = System.Type.GetType(name + ", Assembly-CSharp")
+                            ?? System.Type.GetType(name + ", UnityEngine")
+                            ?? System.Type.GetType("UnityEngine." + name + ", UnityEngine")
+                            ?? System.Type.GetType("UnityEngine.UI." + name + ", Unity.ugui")
+                            ?? System.Type.GetType("TMPro." + name + ", Unity.TextMeshPro");
+            if (type == null)
+            {
+                // Try searching all assemblies
+                foreach (var assembly in System.AppDomain.CurrentDomain.GetAssemblies())
+                {
+                    type = assembly.GetType(name);
+                    if (type != null) break;
+                }
+            }
+            if (type == null || !typeof(Component).IsAssignableFrom(type))
+            {
+                return null;
+            }
+            
+            componentTypes[name] = type;
+            return type;
+        }
+        
         private static JObject AddComponent(JObject args)
         {
             string gameObjectName = args["gameObjectName"]?.ToString();
@@ -1705,7 +2101,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(gameObjectName);
+                GameObject obj = MCPObjectIndex.Find(gameObjectName);
                 if (obj == null)
                 {
                     return new JObject
@@ -1715,19 +2111,7 @@ namespace UnityMCP
                     };
                 }
                 
-                // Try to add component by type name
-                System.Type type = System.Type.GetType(componentType + ", Assembly-CSharp") 
-                                ?? System.Type.GetType(componentType + ", UnityEngine");
-                
-                if (type == null)
-                {
-                    // Try searching all assemblies
-                    foreach (var assembly in System.AppDomain.CurrentDomain.GetAssemblies())
-                    {
-                        type = assembly.GetType(componentType);
-                        if (type != null) break;
-                    }
-                }
+                System.Type type = FindComponentType(componentType);
                 
                 if (type == null)
                 {
@@ -1784,7 +2168,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(gameObjectName);
+                GameObject obj = MCPObjectIndex.Find(gameObjectName);
                 if (obj == null)
                 {
                     return new JObject
@@ -1794,20 +2178,7 @@ namespace UnityMCP
                     };
                 }
                 
-                // Try to find component by type name
-                System.Type type = System.Type.GetType(componentType + ", Assembly-CSharp") 
-                                ?? System.Type.GetType(componentType + ", UnityEngine")
-                                ?? System.Type.GetType("UnityEngine." + componentType + ", UnityEngine");
-                
-                if (type == null)
-                {
-                    // Try searching all assemblies
-                    foreach (var assembly in System.AppDomain.CurrentDomain.GetAssemblies())
-                    {
-                        type = assembly.GetType(componentType);
-                        if (type != null) break;
-                    }
-                }
+                System.Type type = FindComponentType(componentType);
                 
                 if (type == null)
                 {
@@ -1886,7 +2257,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(gameObjectName);
+                GameObject obj = MCPObjectIndex.Find(gameObjectName);
                 if (obj == null)
                 {
                     return new JObject
@@ -1897,20 +2268,7 @@ namespace UnityMCP
                 }
                 
                 // Find component
-                System.Type type = System.Type.GetType(componentType + ", Assembly-CSharp") 
-                                ?? System.Type.GetType(componentType + ", UnityEngine")
-                                ?? System.Type.GetType("UnityEngine." + componentType + ", UnityEngine")
-                                ?? System.Type.GetType("UnityEngine.UI." + componentType + ", Unity.ugui")
-                                ?? System.Type.GetType("TMPro." + componentType + ", Unity.TextMeshPro");
-                
-                if (type == null)
-                {
-                    foreach (var assembly in System.AppDomain.CurrentDomain.GetAssemblies())
-                    {
-                        type = assembly.GetType(componentType);
-                        if (type != null) break;
-                    }
-                }
+                System.Type type = FindComponentType(componentType);
                 
                 if (type == null)
                 {
@@ -1984,7 +2342,7 @@ namespace UnityMCP
                         if (refType == "reference" && !string.IsNullOrEmpty(refPath))
                         {
                             Debug.Log($"[MCP] Attempting to load asset from: {refPath}");
-                            UnityEngine.Object asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(refPath);
+                            UnityEngine.Object asset = MCPAssetIndex.Load(refPath, out string loadProblem);
                             if (asset != null)
                             {
                                 prop.objectReferenceValue = asset;
@@ -1993,11 +2351,11 @@ namespace UnityMCP
                             }
                             else
                             {
-                                Debug.LogError($"[MCP] ✗ Could not load asset from path: {refPath}");
+                                Debug.LogError($"[MCP] ✗ {loadProblem}");
                                 return new JObject
                                 {
                                     ["success"] = false,
-                                    ["error"] = $"Could not load asset from path: {refPath}"
+                                    ["error"] = loadProblem
                                 };
                             }
                         }
@@ -2006,7 +2364,7 @@ namespace UnityMCP
                     {
                         // Try to find GameObject by name
                         string valueStr = valueToken.ToString();
-                        GameObject refObj = GameObject.Find(valueStr);
+                        GameObject refObj = MCPObjectIndex.Find(valueStr);
                         if (refObj != null)
                         {
                             prop.objectReferenceValue = refObj;
@@ -2180,7 +2538,7 @@ namespace UnityMCP
                         if (refType == "reference" && !string.IsNullOrEmpty(refPath))
                         {
                             Debug.Log($"[MCP] Attempting to load asset reference from: {refPath}");
-                            UnityEngine.Object refAsset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(refPath);
+                            UnityEngine.Object refAsset = MCPAssetIndex.Load(refPath, out string loadProblem);
                             if (refAsset != null)
                             {
                                 prop.objectReferenceValue = refAsset;
@@ -2189,11 +2547,11 @@ namespace UnityMCP
                             }
                             else
                             {
-                                Debug.LogError($"[MCP] ✗ Could not load asset from path: {refPath}");
+                                Debug.LogError($"[MCP] ✗ {loadProblem}");
                                 return new JObject
                                 {
                                     ["success"] = false,
-                                    ["error"] = $"Could not load asset from path: {refPath}"
+                                    ["error"] = loadProblem
                                 };
                             }
                         }
@@ -2214,7 +2572,7 @@ namespace UnityMCP
                                 if (refType == "reference" && !string.IsNullOrEmpty(refPath))
                                 {
                                     Debug.Log($"[MCP] Attempting to load asset reference from parsed JSON: {refPath}");
-                                    UnityEngine.Object refAsset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(refPath);
+                                    UnityEngine.Object refAsset = MCPAssetIndex.Load(refPath, out string loadProblem);
                                     if (refAsset != null)
                                     {
                                         prop.objectReferenceValue = refAsset;
@@ -2223,7 +2581,7 @@ namespace UnityMCP
                                     }
                                     else
                                     {
-                                        Debug.LogError($"[MCP] ✗ Could not load asset from path: {refPath}");
+                                        Debug.LogError($"[MCP] ✗ {loadProblem}");
                                     }
                                 }
                             }
@@ -2233,10 +2591,10 @@ namespace UnityMCP
                             }
                         }
                         
-                        // If not set yet, try to load as asset path directly
+                        // If not set yet, try to load as asset path, GUID or name directly
                         if (!wasSet)
                         {
-                            UnityEngine.Object refAsset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(valueStr);
+                            UnityEngine.Object refAsset = MCPAssetIndex.Load(valueStr, out _);
                             if (refAsset != null)
                             {
                                 prop.objectReferenceValue = refAsset;
@@ -2347,7 +2705,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject buttonObj = GameObject.Find(buttonName);
+                GameObject buttonObj = MCPObjectIndex.Find(buttonName);
                 if (buttonObj == null)
                 {
                     return new JObject
@@ -2368,10 +2726,11 @@ namespace UnityMCP
                 }
                 
                 // Find or create SceneLoader component
-                GameObject sceneLoaderObj = GameObject.Find("SceneLoader");
+                GameObject sceneLoaderObj = MCPObjectIndex.Find("SceneLoader");
                 if (sceneLoaderObj == null)
                 {
                     sceneLoaderObj = new GameObject("SceneLoader");
+                    MCPObjectIndex.Add(sceneLoaderObj);
                 }
                 
                 // Check if SceneLoader component exists
@@ -2501,7 +2860,8 @@ namespace UnityMCP
                     {
                         ["success"] = true,
                         ["message"] = "Canvas already exists",
-                        ["canvasPath"] = GetGameObjectPath(existingCanvas.gameObject)
+                        ["canvasPath"] = GetGameObjectPath(existingCanvas.gameObject),
+                        ["handle"] = MCPObjectIndex.Handle(existingCanvas.gameObject)
                     };
                 }
                 
@@ -2566,6 +2926,7 @@ namespace UnityMCP
                 }
                 
                 Undo.RegisterCreatedObjectUndo(canvasObj, "Create Canvas");
+                MCPObjectIndex.Add(canvasObj);
                 
                 Debug.Log($"[MCP] Created canvas: {name}");
                 
@@ -2573,6 +2934,7 @@ namespace UnityMCP
                 {
                     ["success"] = true,
                     ["canvasPath"] = GetGameObjectPath(canvasObj),
+                    ["handle"] = MCPObjectIndex.Handle(canvasObj),
                     ["renderMode"] = canvas.renderMode.ToString(),
                     ["referenceResolution"] = new JArray(scaler.referenceResolution.x, scaler.referenceResolution.y),
                     ["matchValue"] = scaler.matchWidthOrHeight,
@@ -2627,7 +2989,8 @@ namespace UnityMCP
                     {
                         ["success"] = true,
                         ["message"] = "EventSystem already exists",
-                        ["path"] = GetGameObjectPath(existingSystem.gameObject)
+                        ["path"] = GetGameObjectPath(existingSystem.gameObject),
+                        ["handle"] = MCPObjectIndex.Handle(existingSystem.gameObject)
                     };
                 }
                 
@@ -2638,6 +3001,7 @@ namespace UnityMCP
                 {
                     ["success"] = true,
                     ["path"] = GetGameObjectPath(eventSystemObj),
+                    ["handle"] = MCPObjectIndex.Handle(eventSystemObj),
                     ["components"] = GetEventSystemComponents(eventSystemObj)
                 };
             }
@@ -2668,6 +3032,7 @@ namespace UnityMCP
 #endif
             
             Undo.RegisterCreatedObjectUndo(eventSystemObj, "Create EventSystem");
+            MCPObjectIndex.Add(eventSystemObj);
             
             return eventSystemObj;
         }
@@ -2697,7 +3062,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject parentObj = GameObject.Find(parent);
+                GameObject parentObj = MCPObjectIndex.Find(parent);
                 if (parentObj == null)
                 {
                     throw new System.Exception($"Parent '{parent}' not found. Create a canvas first.");
@@ -2745,6 +3110,7 @@ namespace UnityMCP
                 tmp.color = Color.white;
                 
                 Undo.RegisterCreatedObjectUndo(buttonObj, "Create Button");
+                MCPObjectIndex.Add(buttonObj);
                 
                 Debug.Log($"[MCP] Created button: {name}");
                 
@@ -2753,6 +3119,8 @@ namespace UnityMCP
                     ["success"] = true,
                     ["buttonPath"] = GetGameObjectPath(buttonObj),
                     ["textPath"] = GetGameObjectPath(textObj),
+                    ["handle"] = MCPObjectIndex.Handle(buttonObj),
+                    ["textHandle"] = MCPObjectIndex.Handle(textObj),
                     ["components"] = new JArray("Button", "Image", "RectTransform")
                 };
             }
@@ -2776,7 +3144,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject parentObj = GameObject.Find(parent);
+                GameObject parentObj = MCPObjectIndex.Find(parent);
                 if (parentObj == null)
                 {
                     throw new System.Exception($"Parent '{parent}' not found");
@@ -2824,6 +3192,7 @@ namespace UnityMCP
                 }
                 
                 Undo.RegisterCreatedObjectUndo(textObj, "Create Text");
+                MCPObjectIndex.Add(textObj);
                 
                 Debug.Log($"[MCP] Created text: {name}");
                 
@@ -2831,6 +3200,7 @@ namespace UnityMCP
                 {
                     ["success"] = true,
                     ["textPath"] = GetGameObjectPath(textObj),
+                    ["handle"] = MCPObjectIndex.Handle(textObj),
                     ["components"] = new JArray("TextMeshProUGUI", "RectTransform")
                 };
             }
@@ -2851,7 +3221,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject parentObj = GameObject.Find(parent);
+                GameObject parentObj = MCPObjectIndex.Find(parent);
                 if (parentObj == null)
                 {
                     throw new System.Exception($"Parent '{parent}' not found");
@@ -2878,6 +3248,7 @@ namespace UnityMCP
                 image.color = ParseColor(args["color"]?.ToString() ?? "#FFFFFF");
                 
                 Undo.RegisterCreatedObjectUndo(imageObj, "Create Image");
+                MCPObjectIndex.Add(imageObj);
                 
                 Debug.Log($"[MCP] Created image: {name}");
                 
@@ -2885,6 +3256,7 @@ namespace UnityMCP
                 {
                     ["success"] = true,
                     ["imagePath"] = GetGameObjectPath(imageObj),
+                    ["handle"] = MCPObjectIndex.Handle(imageObj),
                     ["components"] = new JArray("Image", "RectTransform")
                 };
             }
@@ -2905,7 +3277,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject parentObj = GameObject.Find(parent);
+                GameObject parentObj = MCPObjectIndex.Find(parent);
                 if (parentObj == null)
                 {
                     throw new System.Exception($"Parent '{parent}' not found");
@@ -2925,6 +3297,7 @@ namespace UnityMCP
                 image.color = ParseColor(args["color"]?.ToString() ?? "#000000AA"); // Semi-transparent black
                 
                 Undo.RegisterCreatedObjectUndo(panelObj, "Create Panel");
+                MCPObjectIndex.Add(panelObj);
                 
                 Debug.Log($"[MCP] Created panel: {name}");
                 
@@ -2932,6 +3305,7 @@ namespace UnityMCP
                 {
                     ["success"] = true,
                     ["panelPath"] = GetGameObjectPath(panelObj),
+                    ["handle"] = MCPObjectIndex.Handle(panelObj),
                     ["components"] = new JArray("Image", "RectTransform")
                 };
             }
@@ -2956,7 +3330,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject parentObj = GameObject.Find(parent);
+                GameObject parentObj = MCPObjectIndex.Find(parent);
                 if (parentObj == null)
                 {
                     throw new System.Exception($"Parent '{parent}' not found");
@@ -3061,6 +3435,7 @@ namespace UnityMCP
                 }
                 
                 Undo.RegisterCreatedObjectUndo(layoutObj, $"Create {layoutType} Layout");
+                MCPObjectIndex.Add(layoutObj);
                 
                 Debug.Log($"[MCP] Created {layoutType} layout: {name}");
                 
@@ -3068,6 +3443,7 @@ namespace UnityMCP
                 {
                     ["success"] = true,
                     ["layoutPath"] = GetGameObjectPath(layoutObj),
+                    ["handle"] = MCPObjectIndex.Handle(layoutObj),
                     ["layoutType"] = layoutType,
                     ["components"] = new JArray(componentType, "RectTransform")
                 };
@@ -3108,7 +3484,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(objectPath);
+                GameObject obj = MCPObjectIndex.Find(objectPath);
                 if (obj == null)
                 {
                     throw new System.Exception($"GameObject '{objectPath}' not found");
@@ -3226,7 +3602,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(name);
+                GameObject obj = MCPObjectIndex.Find(name);
                 if (obj == null)
                 {
                     return new JObject
@@ -3372,7 +3748,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(gameObjectName);
+                GameObject obj = MCPObjectIndex.Find(gameObjectName);
                 if (obj == null)
                 {
                     return new JObject
@@ -3457,7 +3833,7 @@ namespace UnityMCP
             
             try
             {
-                GameObject obj = GameObject.Find(gameObjectName);
+                GameObject obj = MCPObjectIndex.Find(gameObjectName);
                 if (obj == null)
                 {
                     return new JObject
@@ -3568,6 +3944,7 @@ namespace UnityMCP
                 }
                 
                 // Instantiate in scene
+                MCPJobs.ReportProgress(0.3f, "Instantiating asset");
                 GameObject instance = PrefabUtility.InstantiatePrefab(assetPrefab) as GameObject;
                 if (instance == null)
                 {
@@ -3618,6 +3995,7 @@ namespace UnityMCP
                 }
                 
                 // Save as prefab
+                MCPJobs.ReportProgress(0.6f, "Saving prefab");
                 GameObject prefab = PrefabUtility.SaveAsPrefabAsset(instance, prefabPath);
                 
                 // Clean up instance
@@ -3654,196 +4032,6 @@ namespace UnityMCP
             }
         }
         
-        private static JObject UpdatePrefab(JObject args)
-        {
-            string prefabPath = args["prefabPath"]?.ToString();
-            string action = args["action"]?.ToString(); // "add_component", "remove_component", "set_property"
-            
-            if (string.IsNullOrEmpty(prefabPath))
-            {
-                return new JObject
-                {
-                    ["success"] = false,
-                    ["error"] = "Prefab path is required"
-                };
-            }
-            
-            // Ensure path starts with Assets/
-            if (!prefabPath.StartsWith("Assets/"))
-            {
-                prefabPath = "Assets/" + prefabPath;
-            }
-            
-            // Ensure path ends with .prefab
-            if (!prefabPath.EndsWith(".prefab"))
-            {
-                prefabPath += ".prefab";
-            }
-            
-            // Check if prefab exists
-            if (!System.IO.File.Exists(prefabPath))
-            {
-                return new JObject
-                {
-                    ["success"] = false,
-                    ["error"] = $"Prefab not found: {prefabPath}"
-                };
-            }
-            
-            try
-            {
-                // Load prefab contents for editing
-                GameObject prefabRoot = PrefabUtility.LoadPrefabContents(prefabPath);
-                
-                if (prefabRoot == null)
-                {
-                    return new JObject
-                    {
-                        ["success"] = false,
-                        ["error"] = "Failed to load prefab"
-                    };
-                }
-                
-                // Perform the requested action
-                bool modified = false;
-                string actionResult = "";
-                
-                switch (action)
-                {
-                    case "add_component":
-                        string componentType = args["componentType"]?.ToString();
-                        if (!string.IsNullOrEmpty(componentType))
-                        {
-                            System.Type type = System.Type.GetType(componentType);
-                            if (type != null)
-                            {
-                                prefabRoot.AddComponent(type);
-                                modified = true;
-                                actionResult = $"Added component: {componentType}";
-                            }
-                            else
-                            {
-                                actionResult = $"Component type not found: {componentType}";
-                            }
-                        }
-                        break;
-                    
-                    case "remove_component":
-                        string removeComponentType = args["componentType"]?.ToString();
-                        if (!string.IsNullOrEmpty(removeComponentType))
-                        {
-                            Component comp = prefabRoot.GetComponent(removeComponentType);
-                            if (comp != null)
-                            {
-                                UnityEngine.Object.DestroyImmediate(comp);
-                                modified = true;
-                                actionResult = $"Removed component: {removeComponentType}";
-                            }
-                            else
-                            {
-                                actionResult = $"Component not found: {removeComponentType}";
-                            }
-                        }
-                        break;
-                    
-                    case "set_property":
-                        string propComponentType = args["componentType"]?.ToString();
-                        string propertyName = args["propertyName"]?.ToString();
-                        JToken valueToken = args["value"];
-                        
-                        if (!string.IsNullOrEmpty(propComponentType) && !string.IsNullOrEmpty(propertyName))
-                        {
-                            Component component = prefabRoot.GetComponent(propComponentType);
-                            if (component != null)
-                            {
-                                SerializedObject so = new SerializedObject(component);
-                                SerializedProperty prop = so.FindProperty(propertyName);
-                                
-                                if (prop != null)
-                                {
-                                    // Set value based on type (reuse logic from SetComponentProperty)
-                                    if (valueToken.Type == JTokenType.Object)
-                                    {
-                                        JObject valueObj = valueToken as JObject;
-                                        string refType = valueObj["type"]?.ToString();
-                                        string refPath = valueObj["path"]?.ToString();
-                                        
-                                        if (refType == "reference" && !string.IsNullOrEmpty(refPath))
-                                        {
-                                            UnityEngine.Object asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(refPath);
-                                            if (asset != null)
-                                            {
-                                                prop.objectReferenceValue = asset;
-                                            }
-                                        }
-                                    }
-                                    else if (valueToken.Type == JTokenType.String)
-                                    {
-                                        prop.stringValue = valueToken.ToString();
-                                    }
-                                    else if (valueToken.Type == JTokenType.Integer)
-                                    {
-                                        prop.intValue = valueToken.ToObject<int>();
-                                    }
-                                    else if (valueToken.Type == JTokenType.Float)
-                                    {
-                                        prop.floatValue = valueToken.ToObject<float>();
-                                    }
-                                    else if (valueToken.Type == JTokenType.Boolean)
-                                    {
-                                        prop.boolValue = valueToken.ToObject<bool>();
-                                    }
-                                    
-                                    so.ApplyModifiedProperties();
-                                    modified = true;
-                                    actionResult = $"Set property '{propertyName}' on {propComponentType}";
-                                }
-                                else
-                                {
-                                    actionResult = $"Property '{propertyName}' not found on {propComponentType}";
-                                }
-                            }
-                            else
-                            {
-                                actionResult = $"Component not found: {propComponentType}";
-                            }
-                        }
-                        break;
-                    
-                    default:
-                        actionResult = "No action specified or unknown action";
-                        break;
-                }
-                
-                // Save if modified
-                if (modified)
-                {
-                    PrefabUtility.SaveAsPrefabAsset(prefabRoot, prefabPath);
-                    AssetDatabase.Refresh();
-                    Debug.Log($"[MCP] Updated prefab: {prefabPath} - {actionResult}");
-                }
-                
-                // Important: Unload the prefab contents
-                PrefabUtility.UnloadPrefabContents(prefabRoot);
-                
-                return new JObject
-                {
-                    ["success"] = true,
-                    ["prefabPath"] = prefabPath,
-                    ["modified"] = modified,
-                    ["action"] = actionResult
-                };
-            }
-            catch (System.Exception e)
-            {
-                return new JObject
-                {
-                    ["success"] = false,
-                    ["error"] = e.Message
-                };
-            }
-        }
-        
         // ==================== HELPER METHODS ====================
         
         private static string GetGameObjectPath(GameObject obj)
@@ -0,0 +1,274 @@
+using UnityEngine;
+using UnityEditor;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    // unity_set_transforms: positions, rotations and scales of many objects in one
+    // call. Values arrive as flat arrays with 3 numbers per target ([x0, y0, z0, x1,
+    // ...], the layout of columnar listings), or as one base64 buffer of little-endian
+    // float32s holding the packedChannels of each target in turn. Every target is
+    // resolved before anything changes; the transforms are then recorded with a
+    // single Undo.RecordObjects and written in one pass, as one undo step.
+    public static class MCPTransforms
+    {
+        private static readonly string[] Channels = { "position", "rotation", "scale" };
+        private static readonly string[] ArrayKeys = { "positions", "rotations", "scales" };
+        
+        // Missing targets named in the error message; the rest are counted
+        private const int MaxListedMissing = 10;
+        
+        public static JObject SetTransforms(JObject args)
+        {
+            JArray targets = args["targets"] as JArray;
+            if (targets == null || targets.Count == 0)
+            {
+                return Error("targets must be a non-empty array of GameObject names, paths or handles");
+            }
+            
+            string space = args["space"]?.ToString() ?? "world";
+            if (space != "world" && space != "local")
+            {
+                return Error($"Unknown space '{space}'. Use 'world' or 'local'");
+            }
+            bool world = space == "world";
+            bool relative = args["relative"]?.ToObject<bool>() ?? false;
+            bool skipMissing = args["skipMissing"]?.ToObject<bool>() ?? false;
+            int count = targets.Count;
+            
+            // One array per channel: 3 floats per target, or 3 for all of them
+            var values = new float[Channels.Length][];
+            string problem = args["packed"] != null
+                ? ReadPacked(args, count, values)
+                : ReadArrays(args, count, values);
+            if (problem != null)
+            {
+                return Error(problem);
+            }
+            if (values.All(channel => channel == null))
+            {
+                return Error("Nothing to set: pass positions, rotations, scales or packed");
+            }
+            
+            var transforms = new Transform[count];
+            var recorded = new List<UnityEngine.Object>(count);
+            var missing = new JArray();
+            for (int i = 0; i < count; i++)
+            {
+                string target = targets[i]?.ToString();
+                GameObject obj = MCPObjectIndex.Find(target);
+                if (obj == null)
+                {
+                    missing.Add(target);
+                    continue;
+                }
+                transforms[i] = obj.transform;
+                recorded.Add(obj.transform);
+            }
+            
+            if (missing.Count > 0 && !skipMissing)
+            {
+                string listed = string.Join(", ", missing.Take(MaxListedMissing).Select(name => $"'{name}'"));
+                if (missing.Count > MaxListedMissing)
+                {
+                    listed += $" and {missing.Count - MaxListedMissing} more";
+                }
+                return Error($"{missing.Count} of {count} targets not found: {listed}. Nothing was changed; pass skipMissing to update the rest");
+            }
+            
+            Undo.IncrementCurrentGroup();
+            int undoGroup = Undo.GetCurrentGroup();
+            Undo.SetCurrentGroupName("MCP Set Transforms");
+            Undo.RecordObjects(recorded.ToArray(), "MCP Set Transforms");
+            
+            float[] positions = values[0];
+            float[] rotations = values[1];
+            float[] scales = values[2];
+            Space rotateSpace = world ? Space.World : Space.Self;
+            for (int i = 0; i < count; i++)
+            {
+                Transform transform = transforms[i];
+                if (transform == null)
+                {
+                    continue;
+                }
+                
+                if (positions != null)
+                {
+                    Vector3 position = Read(positions, i);
+                    if (world)
+                    {
+                        transform.position = relative ? transform.position + position : position;
+                    }
+                    else
+                    {
+                        transform.localPosition = relative ? transform.localPosition + position : position;
+                    }
+                }
+                
+                if (rotations != null)
+                {
+                    Vector3 rotation = Read(rotations, i);
+                    if (relative)
+                    {
+                        transform.Rotate(rotation, rotateSpace);
+                    }
+                    else if (world)
+                    {
+                        transform.eulerAngles = rotation;
+                    }
+                    else
+                    {
+                        transform.localEulerAngles = rotation;
+                    }
+                }
+                
+                if (scales != null)
+                {
+                    // Scale is always local: lossyScale cannot be set
+                    Vector3 scale = Read(scales, i);
+                    transform.localScale = relative ? Vector3.Scale(transform.localScale, scale) : scale;
+                }
+                MCPSpatial.MarkMoved(transform);
+            }
+            
+            Undo.CollapseUndoOperations(undoGroup);
+            
+            Debug.Log($"[MCP] Set transforms of {recorded.Count} objects ({space}{(relative ? ", relative" : "")})");
+            
+            var result = new JObject
+            {
+                ["success"] = true,
+                ["updated"] = recorded.Count,
+                ["space"] = space,
+                ["relative"] = relative
+            };
+            if (missing.Count > 0)
+            {
+                result["notFound"] = missing;
+            }
+            return result;
+        }
+        
+        // A channel holds 3 floats per item, or 3 shared by all of them
+        internal static Vector3 Read(float[] channel, int index)
+        {
+            int offset = channel.Length == 3 ? 0 : index * 3;
+            return new Vector3(channel[offset], channel[offset + 1], channel[offset + 2]);
+        }
+        
+        // Null, with floats left null, when the key is absent; otherwise the problem with it, if any
+        internal static string ReadChannel(JObject args, string key, int count, string per, out float[] floats)
+        {
+            floats = null;
+            if (args[key] == null)
+            {
+                return null;
+            }
+            
+            JArray array = args[key] as JArray;
+            if (array == null || (array.Count != count * 3 && array.Count != 3))
+            {
+                return $"{key} must hold 3 numbers per {per} ({count * 3}), or 3 for all of them; got {array?.Count ?? 0}";
+            }
+            
+            floats = new float[array.Count];
+            for (int i = 0; i < floats.Length; i++)
+            {
+                floats[i] = (float)array[i];
+            }
+            return null;
+        }
+        
+        private static string ReadArrays(JObject args, int count, float[][] values)
+        {
+            for (int channel = 0; channel < ArrayKeys.Length; channel++)
+            {
+                string problem = ReadChannel(args, ArrayKeys[channel], count, "target", out values[channel]);
+                if (problem != null)
+                {
+                    return problem;
+                }
+            }
+            return null;
+        }
+        
+        private static string ReadPacked(JObject args, int count, float[][] values)
+        {
+            if (ArrayKeys.Any(key => args[key] != null))
+            {
+                return "Pass either packed or positions/rotations/scales, not both";
+            }
+            
+            var slots = new List<int>();
+            JArray channels = args["packedChannels"] as JArray ?? new JArray { "position" };
+            foreach (JToken token in channels)
+            {
+                int channel = Array.IndexOf(Channels, token.ToString());
+                if (channel < 0)
+                {
+                    return $"Unknown packed channel '{token}'. Use position, rotation or scale";
+                }
+                if (slots.Contains(channel))
+                {
+                    return $"packedChannels lists '{token}' twice";
+                }
+                slots.Add(channel);
+            }
+            if (slots.Count == 0)
+            {
+                return "packedChannels must name at least one of position, rotation or scale";
+            }
+            
+            byte[] bytes;
+            try
+            {
+                bytes = Convert.FromBase64String(args["packed"].ToString());
+            }
+            catch (FormatException)
+            {
+                return "packed is not valid base64";
+            }
+            
+            int stride = slots.Count * 3;
+            int expected = count * stride * sizeof(float);
+            if (bytes.Length != expected)
+            {
+                return $"packed holds {bytes.Length} bytes; {count} targets with {slots.Count} channels need {expected} ({stride} float32s each)";
+            }
+            
+            if (!BitConverter.IsLittleEndian)
+            {
+                for (int i = 0; i < bytes.Length; i += sizeof(float))
+                {
+                    Array.Reverse(bytes, i, sizeof(float));
+                }
+            }
+            var floats = new float[count * stride];
+            Buffer.BlockCopy(bytes, 0, floats, 0, bytes.Length);
+            
+            for (int slot = 0; slot < slots.Count; slot++)
+            {
+                var channel = new float[count * 3];
+                for (int i = 0; i < count; i++)
+                {
+                    Array.Copy(floats, i * stride + slot * 3, channel, i * 3, 3);
+                }
+                values[slots[slot]] = channel;
+            }
+            return null;
+        }
+        
+        private static JObject Error(string message)
+        {
+            return new JObject
+            {
+                ["success"] = false,
+                ["error"] = message
+            };
+        }
+    }
+}
@@ -0,0 +1 @@
+"""Benchmarks for the Unity MCP server - run from mcp-server/ with `python -m benchmarks.<name>`"""
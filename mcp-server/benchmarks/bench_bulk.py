@@ -0,0 +1,136 @@
+"""Bulk edits: one call per object and property vs unity_batch vs one bulk tool call.
+
+Runs against the in-process editor emulator, which like MCPServer.cs only
+runs requests on a simulated EditorApplication.update tick. Moves, rotates
+and scales `--objects` objects three ways:
+
+- per call: unity_set_position, unity_set_rotation and unity_set_scale for
+  each object, one after another, as an agent does today
+- batch: the same calls as one unity_batch
+- set_transforms: one unity_set_transforms call with flat arrays, and again
+  with a packed float32 buffer
+
+    cd mcp-server
+    python -m benchmarks.bench_bulk --objects 200
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import struct
+import time
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator
+
+
+def layout(objects: int, offset: float):
+    names = [f"Enemy{index}" for index in range(objects)]
+    positions = [value for index in range(objects) for value in (index + offset, 0.0, index * 0.5)]
+    rotations = [value for index in range(objects) for value in (0.0, (index * 7 + offset) % 360, 0.0)]
+    scales = [value for _ in range(objects) for value in (1.0 + offset / 10, 1.0, 1.0)]
+    return names, positions, rotations, scales
+
+
+async def per_call(client, names, positions, rotations, scales) -> int:
+    for index, name in enumerate(names):
+        vector = slice(index * 3, index * 3 + 3)
+        for tool, key, values in (
+            ("unity_set_position", "position", positions),
+            ("unity_set_rotation", "rotation", rotations),
+            ("unity_set_scale", "scale", scales),
+        ):
+            result = await client.call(tool, {"name": name, key: values[vector]})
+            assert result.get("success"), result
+    return len(names) * 3
+
+
+async def batch(client, names, positions, rotations, scales) -> int:
+    calls = []
+    for index, name in enumerate(names):
+        vector = slice(index * 3, index * 3 + 3)
+        calls.append({"tool": "unity_set_position", "args": {"name": name, "position": positions[vector]}})
+        calls.append({"tool": "unity_set_rotation", "args": {"name": name, "rotation": rotations[vector]}})
+        calls.append({"tool": "unity_set_scale", "args": {"name": name, "scale": scales[vector]}})
+    result = await client.call("unity_batch", {"calls": calls})
+    assert result.get("allSucceeded"), result
+    return 1
+
+
+async def set_transforms(client, names, positions, rotations, scales) -> int:
+    result = await client.call("unity_set_transforms", {
+        "targets": names, "positions": positions, "rotations": rotations, "scales": scales,
+    })
+    assert result.get("updated") == len(names), result
+    return 1
+
+
+async def set_transforms_packed(client, names, positions, rotations, scales) -> int:
+    floats = []
+    for index in range(len(names)):
+        vector = slice(index * 3, index * 3 + 3)
+        floats += positions[vector] + rotations[vector] + scales[vector]
+    packed = base64.b64encode(struct.pack(f"<{len(floats)}f", *floats)).decode("ascii")
+    result = await client.call("unity_set_transforms", {
+        "targets": names, "packed": packed, "packedChannels": ["position", "rotation", "scale"],
+    })
+    assert result.get("updated") == len(names), result
+    return 1
+
+
+MODES = {
+    "per_call": per_call,
+    "batch": batch,
+    "set_transforms": set_transforms,
+    "set_transforms_packed": set_transforms_packed,
+}
+
+
+async def run(objects: int, repeat: int, tick: float) -> dict:
+    results = {"objects": objects, "repeat": repeat, "tick_ms": tick * 1000, "modes": {}}
+    with EditorEmulator(port=0, tick=tick, stream_port=0) as emulator:
+        async with UnityClient(emulator.url, stream_port=emulator.stream_port) as client:
+            setup = [
+                {"tool": "unity_create_primitive", "args": {"name": f"Enemy{index}", "primitiveType": "Capsule"}}
+                for index in range(objects)
+            ]
+            result = await client.call("unity_batch", {"calls": setup})
+            assert result.get("allSucceeded"), result
+
+            for mode, function in MODES.items():
+                samples = []
+                for iteration in range(repeat):
+                    # Different values each time, so every pass really edits the scene
+                    values = layout(objects, float(iteration + 1))
+                    start = time.perf_counter()
+                    requests = await function(client, *values)
+                    samples.append((time.perf_counter() - start) * 1000)
+                results["modes"][mode] = {"requests": requests, "latency": summarize(samples)}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tick-ms", type=float, default=4.0, help="Simulated EditorApplication.update interval")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.objects, options.repeat, options.tick_ms / 1000))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['objects']} objects, {results['repeat']} passes, tick {results['tick_ms']:g}ms")
+    print(f"{'mode':<24}{'requests':>9}{'p50 ms':>11}{'max ms':>11}")
+    for mode, result in results["modes"].items():
+        latency = result["latency"]
+        print(f"{mode:<24}{result['requests']:>9}{latency['p50_ms']:>11.2f}{latency['max_ms']:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
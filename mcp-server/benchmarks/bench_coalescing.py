@@ -0,0 +1,101 @@
+"""Throughput of concurrent tool calls with and without request coalescing.
+
+Runs against a local stub of MCPServer.cs that, like the real bridge, only
+executes requests on a simulated EditorApplication.update tick, one at a time.
+`--concurrency` callers each issue calls back to back until `--calls` are done.
+
+    cd mcp-server
+    python -m benchmarks.bench_coalescing --calls 2000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from bridge import UnityClient, RequestCoalescer
+from benchmarks.stats import summarize
+from benchmarks.stub_unity import StubUnity
+
+TOOL = "unity_set_position"
+ARGS = {"name": "Player", "position": [1, 2, 3]}
+
+
+async def drive(dispatcher, calls: int, concurrency: int) -> dict:
+    """Run `calls` calls from `concurrency` concurrent callers through `dispatcher`"""
+    samples = []
+    remaining = calls
+
+    async def caller():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            result = await dispatcher.call(TOOL, ARGS)
+            samples.append((time.perf_counter() - start) * 1000)
+            assert result.get("success"), result
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "calls_per_s": round(calls / elapsed, 1),
+        "latency": summarize(samples),
+    }
+
+
+async def run(calls: int, concurrency: int, tick: float, windows: list, max_batch: int) -> dict:
+    results = {
+        "tool": TOOL,
+        "calls": calls,
+        "concurrency": concurrency,
+        "tick_ms": tick * 1000,
+        "max_batch": max_batch,
+        "runs": {},
+    }
+
+    with StubUnity(tick=tick) as stub:
+        async with UnityClient(stub.url) as client:
+            stub.requests = 0
+            results["runs"]["direct"] = await drive(client, calls, concurrency)
+            results["runs"]["direct"]["http_requests"] = stub.requests
+
+            for window in windows:
+                coalescer = RequestCoalescer(client, window=window / 1000, max_batch=max_batch)
+                stub.requests = 0
+                label = f"coalesce {window:g}ms"
+                results["runs"][label] = await drive(coalescer, calls, concurrency)
+                results["runs"][label]["http_requests"] = stub.requests
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--tick-ms", type=float, default=4.0, help="Simulated editor update interval")
+    parser.add_argument("--windows", type=float, nargs="+", default=[1.0, 2.0, 5.0], help="Coalescing windows in ms")
+    parser.add_argument("--max-batch", type=int, default=32)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.calls, options.concurrency, options.tick_ms / 1000, options.windows, options.max_batch))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['calls']} {TOOL} calls, {results['concurrency']} concurrent callers, "
+          f"{results['tick_ms']:g}ms editor tick, max batch {results['max_batch']}")
+    print(f"{'mode':<18}{'calls/s':>10}{'requests':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for label, run_stats in results["runs"].items():
+        latency = run_stats["latency"]
+        print(f"{label:<18}{run_stats['calls_per_s']:>10.1f}{run_stats['http_requests']:>10}"
+              f"{latency['p50_ms']:>10.3f}{latency['p95_ms']:>10.3f}{latency['p99_ms']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
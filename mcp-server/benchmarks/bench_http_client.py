@@ -0,0 +1,86 @@
+"""Per-call latency: new AsyncClient per call vs the pooled UnityClient.
+
+Runs against a local stub of MCPServer.cs so only client construction and
+connection setup are measured, not Unity's main thread.
+
+    cd mcp-server
+    python -m benchmarks.bench_http_client --calls 500
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from benchmarks.stub_unity import StubUnity
+
+TOOL = "unity_set_position"
+ARGS = {"name": "Player", "position": [1, 2, 3]}
+
+
+async def per_call_client(url: str, calls: int) -> list:
+    """Previous behaviour: a fresh AsyncClient (and TCP connection) per call"""
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.post(url, json={"tool": TOOL, "args": ARGS})
+            response.json()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def pooled_client(url: str, calls: int) -> list:
+    """Current behaviour: one keep-alive UnityClient for the whole session"""
+    samples = []
+    async with UnityClient(url) as client:
+        for _ in range(calls):
+            start = time.perf_counter()
+            await client.call(TOOL, ARGS)
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def run(calls: int, warmup: int) -> dict:
+    with StubUnity() as stub:
+        await per_call_client(stub.url, warmup)
+        before = await per_call_client(stub.url, calls)
+        await pooled_client(stub.url, warmup)
+        after = await pooled_client(stub.url, calls)
+
+    return {
+        "tool": TOOL,
+        "calls": calls,
+        "per_call_client": summarize(before),
+        "pooled_client": summarize(after),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.calls, options.warmup))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['calls']} sequential {TOOL} calls against a local stub")
+    print(f"{'client':<18}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for label in ("per_call_client", "pooled_client"):
+        stats = results[label]
+        print(f"{label:<18}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}")
+    speedup = results["per_call_client"]["mean_ms"] / max(results["pooled_client"]["mean_ms"], 1e-9)
+    print(f"mean speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
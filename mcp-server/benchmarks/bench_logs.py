@@ -0,0 +1,124 @@
+"""Tailing the console with unity_get_logs long-polls while the bridge is busy.
+
+Runs against the in-process editor emulator. A second caller keeps reading
+the scene, so the bridge logs its per-request trace lines ("[MCP] Received:",
+"[MCP] Response sent:") throughout, and a tail calls unity_get_logs with the
+last `nextIndex` and `--wait` seconds:
+
+- idle: nothing else is logged; the long-poll must wait the full `--wait`
+  and come back with `timedOut` and no entries (fails otherwise)
+- wake: a test log arrives `--delay` seconds into the wait; reports how
+  long after it the long-poll returned
+- bridge: the same, but the line is one of the bridge's own non-trace
+  lines ("[MCP] Created ..."); it must wake the tail and be returned
+
+    cd mcp-server
+    python -m benchmarks.bench_logs --wait 2
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator
+from emulator.editor import TRACE_PREFIXES
+
+
+async def busy_reader(client, stop: asyncio.Event) -> int:
+    """Read the scene until stopped; each call only logs trace lines"""
+    calls = 0
+    while not stop.is_set():
+        await client.call("unity_get_scene_info", {})
+        calls += 1
+    return calls
+
+
+async def tail(client, wait: float) -> tuple:
+    cursor = (await client.call("unity_get_logs", {"count": 1}))["nextIndex"]
+    start = time.perf_counter()
+    result = await client.call("unity_get_logs", {"sinceIndex": cursor, "waitSeconds": wait})
+    return time.perf_counter() - start, result
+
+
+async def idle(client, wait: float, delay: float) -> float:
+    elapsed, result = await tail(client, wait)
+    assert result.get("success"), result
+    assert result["timedOut"] and not result["logs"], f"idle tail returned early: {result['logs']}"
+    assert elapsed >= wait * 0.95, f"idle tail returned after {elapsed:.2f} s of {wait:g}"
+    return elapsed * 1000
+
+
+async def woken_by(client, wait: float, delay: float, tool: str, args: dict) -> tuple:
+    async def call_later():
+        await asyncio.sleep(delay)
+        await client.call(tool, args)
+
+    caller = asyncio.create_task(call_later())
+    elapsed, result = await tail(client, wait)
+    await caller
+    assert result.get("success") and not result["timedOut"], result
+    assert not any(entry["message"].startswith(TRACE_PREFIXES) for entry in result["logs"]), result["logs"]
+    return (elapsed - delay) * 1000, result
+
+
+async def wake(client, wait: float, delay: float) -> float:
+    latency, _ = await woken_by(client, wait, delay, "unity_test_log", {"message": "bench_logs"})
+    return latency
+
+
+async def bridge(client, wait: float, delay: float) -> float:
+    latency, result = await woken_by(client, wait, delay, "unity_create_primitive", {"primitiveType": "cube", "name": "LogBench"})
+    await client.call("unity_delete_gameobject", {"name": "LogBench"})
+    assert any(entry["message"].startswith("[MCP] Created") for entry in result["logs"]), result["logs"]
+    return latency
+
+
+MODES = {
+    "idle": idle,
+    "wake": wake,
+    "bridge": bridge,
+}
+
+
+async def run(wait: float, delay: float, iterations: int) -> dict:
+    results = {"wait_s": wait, "delay_s": delay, "iterations": iterations, "modes": {}}
+    with EditorEmulator(port=0, tick=0.001, stream_port=0) as emulator:
+        async with UnityClient(emulator.url, stream_port=emulator.stream_port) as client:
+            stop = asyncio.Event()
+            reader = asyncio.create_task(busy_reader(client, stop))
+            try:
+                for mode, function in MODES.items():
+                    samples = [await function(client, wait, delay) for _ in range(iterations)]
+                    results["modes"][mode] = {"latency": summarize(samples)}
+            finally:
+                stop.set()
+                results["reader_calls"] = await reader
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--wait", type=float, default=2.0, help="waitSeconds for each long-poll")
+    parser.add_argument("--delay", type=float, default=0.5, help="wake: seconds until the test log")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.wait, options.delay, options.iterations))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"waitSeconds {results['wait_s']:g}, {results['reader_calls']} reader calls logging trace lines meanwhile")
+    print(f"{'mode':<8}{'p50 ms':>10}{'p95 ms':>10}   (idle: time waited; wake, bridge: time after the log)")
+    for mode, result in results["modes"].items():
+        latency = result["latency"]
+        print(f"{mode:<8}{latency['p50_ms']:>10.2f}{latency['p95_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Configuring a prefab: N single-operation unity_update_prefab calls vs one call.
+
+Each mode applies the same `--fields` set_property operations to one prefab:
+
+- single: one unity_update_prefab call per field, one after another, as
+  agents did while the tool took a single action
+- batch: the same single-field calls inside one unity_batch, which saves
+  round-trips but still loads, saves and reimports the prefab per field
+- multi: one unity_update_prefab call with all fields as `operations`,
+  applied to one loaded copy and saved once
+
+By default it runs against the in-process editor emulator, where each
+unity_update_prefab call costs `--cycle-ms` to stand in for
+LoadPrefabContents, SaveAsPrefabAsset and the reimport that follows. With
+`--url` and `--prefab` it measures a live editor instead; the operations
+alternately set the prefab root's local position to [0, 0, 0] and local
+scale to [1, 1, 1], so run it on a prefab whose root already has those.
+
+    cd mcp-server
+    python -m benchmarks.bench_prefab_update --fields 6
+    python -m benchmarks.bench_prefab_update --url http://localhost:8765 --prefab Assets/Prefabs/Enemy.prefab
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator, EmulatedEditor, GameObject
+
+PREFAB_PATH = "Assets/MCPBench/Hero.prefab"
+
+DEFAULTS = [("m_LocalPosition", [0, 0, 0]), ("m_LocalScale", [1, 1, 1])]
+
+
+def operations(fields: int) -> list:
+    return [
+        {"action": "set_property", "componentType": "Transform",
+         "propertyName": DEFAULTS[i % 2][0], "value": DEFAULTS[i % 2][1]}
+        for i in range(fields)
+    ]
+
+
+async def single(client, prefab, ops) -> int:
+    for operation in ops:
+        result = await client.call("unity_update_prefab", {"prefabPath": prefab, **operation})
+        assert result.get("success"), result
+    return len(ops)
+
+
+async def batch(client, prefab, ops) -> int:
+    calls = [{"tool": "unity_update_prefab", "args": {"prefabPath": prefab, **operation}} for operation in ops]
+    result = await client.call("unity_batch", {"calls": calls})
+    assert result.get("allSucceeded"), result
+    return 1
+
+
+async def multi(client, prefab, ops) -> int:
+    result = await client.call("unity_update_prefab", {"prefabPath": prefab, "operations": ops})
+    assert result.get("success"), result
+    return 1
+
+
+MODES = {
+    "single": single,
+    "batch": batch,
+    "multi": multi,
+}
+
+
+async def measure(url: str, stream_port, prefab: str, fields: int, iterations: int) -> dict:
+    ops = operations(fields)
+    modes = {}
+    async with UnityClient(url, stream_port=stream_port) as client:
+        for mode, function in MODES.items():
+            samples = []
+            calls = 0
+            for _ in range(iterations):
+                start = time.perf_counter()
+                calls = await function(client, prefab, ops)
+                samples.append((time.perf_counter() - start) * 1000)
+            modes[mode] = {"calls": calls, "latency": summarize(samples)}
+    return modes
+
+
+async def run(options) -> dict:
+    results = {"fields": options.fields, "iterations": options.iterations}
+    if options.url:
+        results["target"] = "live"
+        results["modes"] = await measure(options.url, None, options.prefab, options.fields, options.iterations)
+        return results
+
+    editor = EmulatedEditor(latency={"unity_update_prefab": options.cycle_ms / 1000})
+    editor.prefabs[PREFAB_PATH] = GameObject("Hero", ["CapsuleCollider", "Rigidbody"])
+    results["target"] = f"emulator, {options.cycle_ms:g} ms per load/save cycle"
+    with EditorEmulator(port=0, tick=0.001, editor=editor, stream_port=0) as emulator:
+        results["modes"] = await measure(emulator.url, emulator.stream_port, PREFAB_PATH, options.fields, options.iterations)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fields", type=int, default=6, help="set_property operations per prefab")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--cycle-ms", type=float, default=40.0,
+                        help="Emulated cost of one prefab load/save/reimport cycle")
+    parser.add_argument("--url", help="Benchmark a live editor at this URL instead of the emulator")
+    parser.add_argument("--prefab", help="With --url: prefab to update")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+    if options.url and not options.prefab:
+        parser.error("--url needs --prefab")
+
+    results = asyncio.run(run(options))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['fields']} fields, {results['iterations']} runs per mode ({results['target']})")
+    print(f"{'mode':<10}{'calls':>7}{'p50 ms':>10}{'p95 ms':>10}")
+    for mode, result in results["modes"].items():
+        latency = result["latency"]
+        print(f"{mode:<10}{result['calls']:>7}{latency['p50_ms']:>10.2f}{latency['p95_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
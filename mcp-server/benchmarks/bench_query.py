@@ -0,0 +1,143 @@
+"""Finding a few objects in a large scene: list and filter vs unity_query_gameobjects.
+
+Runs against the in-process editor emulator with a generated scene in which
+one object in `--every` is an active, Respawn-tagged "Enemy". Each mode
+answers the same question, "handles of the active Enemy* objects tagged
+Respawn", and reports response size and end-to-end latency:
+
+- list: unity_list_all_gameobjects, then filtering on the client
+- list_columnar: the same with encoding "columnar" and only the needed fields
+- query: unity_query_gameobjects returning handles only
+- query_fields: the same plus name and position for each match
+
+Component predicates are not compared: listings do not include components,
+so the list modes cannot answer "objects with an Enemy component" at all.
+
+    cd mcp-server
+    python -m benchmarks.bench_query --objects 5000
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import time
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator, EmulatedEditor, GameObject, Scene
+
+WHERE = {"name": "Enemy*", "tag": "Respawn", "active": True}
+
+
+def build_scene(objects: int, children: int, every: int) -> Scene:
+    """Roots with `children` children each; every `every`th object is a matching Enemy"""
+    scene = Scene.default()
+    root = None
+    for i in range(objects):
+        if i % every == 0:
+            obj = GameObject(f"Enemy{i}", ["Enemy"])
+            obj.tag = "Respawn"
+        else:
+            obj = GameObject(f"Prop{i}")
+        obj.local_position = [i * 0.5, 0.0, -i * 0.25]
+        if i % (children + 1) == 0:
+            root = scene.add(obj)
+        else:
+            scene.add(obj, root)
+    return scene
+
+
+async def list_rows(client) -> tuple:
+    result = await client.call("unity_list_all_gameobjects", {})
+    handles = [
+        f"id:{obj['instanceId']}" for obj in result["objects"]
+        if fnmatch.fnmatchcase(obj["name"], WHERE["name"]) and obj["tag"] == WHERE["tag"] and obj["active"]
+    ]
+    return handles, result
+
+
+async def list_columnar(client) -> tuple:
+    result = await client.call("unity_list_all_gameobjects", {
+        "fields": ["instanceId", "name", "tag", "active"], "encoding": "columnar",
+    })
+    columns = result["columns"]
+    handles = [
+        f"id:{instance_id}"
+        for instance_id, name, tag, active in zip(columns["instanceId"], columns["name"], columns["tag"], columns["active"])
+        if fnmatch.fnmatchcase(name, WHERE["name"]) and tag == WHERE["tag"] and active
+    ]
+    return handles, result
+
+
+async def query(client) -> tuple:
+    result = await client.call("unity_query_gameobjects", {"where": WHERE, "limit": 10000})
+    return result["handles"], result
+
+
+async def query_fields(client) -> tuple:
+    result = await client.call("unity_query_gameobjects", {
+        "where": WHERE, "limit": 10000, "fields": ["name", "position"],
+    })
+    return [obj["handle"] for obj in result["objects"]], result
+
+
+MODES = {
+    "list": list_rows,
+    "list_columnar": list_columnar,
+    "query": query,
+    "query_fields": query_fields,
+}
+
+
+async def run(objects: int, children: int, every: int, iterations: int) -> dict:
+    editor = EmulatedEditor(scene=build_scene(objects, children, every))
+    results = {"objects": objects + 2, "iterations": iterations, "modes": {}}
+
+    with EditorEmulator(port=0, tick=0.001, editor=editor, stream_port=0) as emulator:
+        async with UnityClient(emulator.url, stream_port=emulator.stream_port) as client:
+            expected = None
+            for mode, function in MODES.items():
+                samples = []
+                for _ in range(iterations):
+                    start = time.perf_counter()
+                    handles, result = await function(client)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    assert result.get("success"), result
+                if expected is None:
+                    expected = handles
+                assert handles == expected, f"{mode} found {len(handles)} objects, expected {len(expected)}"
+
+                results["modes"][mode] = {
+                    "matches": len(handles),
+                    "response_bytes": len(result.raw.encode("utf-8")),
+                    "latency": summarize(samples),
+                }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=5000, help="GameObjects to generate")
+    parser.add_argument("--children", type=int, default=9, help="Children per root object")
+    parser.add_argument("--every", type=int, default=50, help="One matching object in this many")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.objects, options.children, options.every, options.iterations))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['objects']} objects, {results['iterations']} calls per mode")
+    print(f"{'mode':<16}{'matches':>9}{'KB':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for mode, result in results["modes"].items():
+        latency = result["latency"]
+        print(f"{mode:<16}{result['matches']:>9}{result['response_bytes'] / 1024:>10.1f}"
+              f"{latency['p50_ms']:>10.2f}{latency['p95_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
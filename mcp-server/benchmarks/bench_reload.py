@@ -0,0 +1,103 @@
+"""Tool calls across an assembly reload: straight to the editor vs through the reload gate.
+
+Runs against the in-process editor emulator. Several simulated agents keep
+calling a mix of reads and writes while the emulator goes through one
+reload, like MCPServer.OnBeforeAssemblyReload and the restart after it.
+"direct" sends every call as is, so calls made during the reload fail and
+an agent would have to retry them. "gated" goes through ReloadGate, which
+holds them and replays them in order once unity_ping answers again.
+
+    cd mcp-server
+    python -m benchmarks.bench_reload --agents 8 --reload-s 2
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from bridge import ReloadGate, UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator
+
+CALLS = [
+    ("unity_find_gameobject", {"name": "Main Camera"}, True),
+    ("unity_set_position", {"name": "Main Camera", "position": [0, 1, -10]}, False),
+]
+
+
+async def agent(backend, stop_at: float, samples: list, outcomes: dict) -> None:
+    index = 0
+    while time.perf_counter() < stop_at:
+        tool, args, _ = CALLS[index % len(CALLS)]
+        index += 1
+        start = time.perf_counter()
+        try:
+            result = await backend.call(tool, args)
+            outcome = "succeeded" if result.get("success") else "failed"
+        except Exception:
+            outcome = "failed"
+        samples.append((time.perf_counter() - start) * 1000)
+        outcomes[outcome] += 1
+        if outcome == "failed":
+            # An agent backs off a little before its next call
+            await asyncio.sleep(0.05)
+
+
+async def run_mode(mode: str, emulator: EditorEmulator, agents: int, duration: float, reload_s: float) -> dict:
+    async with UnityClient(emulator.url, stream_port=emulator.stream_port, stream_retry=0.1) as client:
+        backend = client
+        if mode == "gated":
+            read_only = [tool for tool, _, read in CALLS if read]
+            backend = ReloadGate(client, ping=client.ping, read_only_tools=read_only, probe_interval=0.05)
+        await backend.call("unity_ping", {})
+
+        samples, outcomes = [], {"succeeded": 0, "failed": 0}
+        stop_at = time.perf_counter() + duration
+        reload = threading.Timer(duration / 3, emulator.reload, args=(reload_s,))
+        reload.start()
+        await asyncio.gather(*(agent(backend, stop_at, samples, outcomes) for _ in range(agents)))
+        await asyncio.get_running_loop().run_in_executor(None, reload.join)
+
+        result = {**outcomes, "latency": summarize(samples)}
+        if mode == "gated":
+            result["readiness"] = backend.readiness()
+            await backend.close()
+        return result
+
+
+async def run(agents: int, duration: float, reload_s: float, tick: float) -> dict:
+    results = {"agents": agents, "duration_s": duration, "reload_s": reload_s, "tick_ms": tick * 1000, "modes": {}}
+    with EditorEmulator(port=0, tick=tick, stream_port=0) as emulator:
+        for mode in ("direct", "gated"):
+            results["modes"][mode] = await run_mode(mode, emulator, agents, duration, reload_s)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=8)
+    parser.add_argument("--duration-s", type=float, default=6.0, help="How long each mode runs")
+    parser.add_argument("--reload-s", type=float, default=2.0, help="How long the simulated reload takes")
+    parser.add_argument("--tick-ms", type=float, default=4.0, help="Simulated EditorApplication.update interval")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.agents, options.duration_s, options.reload_s, options.tick_ms / 1000))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['agents']} agents for {results['duration_s']:g}s, one {results['reload_s']:g}s reload, "
+          f"tick {results['tick_ms']:g}ms")
+    print(f"{'mode':<8}{'succeeded':>11}{'failed':>8}{'p50':>9}{'p99':>10}{'max':>10}")
+    for mode, result in results["modes"].items():
+        latency = result["latency"]
+        print(f"{mode:<8}{result['succeeded']:>11}{result['failed']:>8}{latency['p50_ms']:>9.2f}"
+              f"{latency['p99_ms']:>10.1f}{latency['max_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
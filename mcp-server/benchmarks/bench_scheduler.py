@@ -0,0 +1,122 @@
+"""Editor responsiveness and read latency under a mixed burst of tool calls.
+
+Runs against the in-process editor emulator with simulated execution costs:
+cheap reads, mutations, and heavy asset operations. Readers, writers and
+heavy callers each issue calls back to back. It compares the previous
+drain-everything-per-update main thread with the lane scheduler and its
+per-update budget. "max frame" is the longest single main-thread update,
+which is how long the Editor UI froze. "read wait" is the average time a read
+sat in the queue, which the scheduler controls; the end-to-end p95s also
+include the HTTP round-trip and vary a lot between runs, so every figure is
+the median over `--runs` runs.
+
+    cd mcp-server
+    python -m benchmarks.bench_scheduler --calls 200
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator
+from emulator.server import FRAME_BUDGET
+
+# (caller kind, tool, args, simulated cost in seconds)
+WORKLOAD = {
+    "read": ("unity_find_gameobject", {"name": "Main Camera"}, 0.0005),
+    "write": ("unity_set_position", {"name": "Main Camera", "position": [0, 1, -10]}, 0.002),
+    "heavy": ("unity_save_scene", {}, 0.025),
+}
+
+MODES = [
+    ("drain-all", None),
+    ("lanes+budget", FRAME_BUDGET),
+]
+
+
+async def drive(client: UnityClient, callers: dict, calls: int) -> dict:
+    """Run `calls` calls per caller kind, `callers[kind]` concurrent callers each"""
+    samples = {kind: [] for kind in WORKLOAD}
+
+    async def caller(kind: str, share: int):
+        tool, args, _ = WORKLOAD[kind]
+        for _ in range(share):
+            start = time.perf_counter()
+            result = await client.call(tool, args)
+            samples[kind].append((time.perf_counter() - start) * 1000)
+            assert result.get("success"), result
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        caller(kind, calls // count)
+        for kind, count in callers.items()
+        for _ in range(count)
+    ))
+    elapsed = time.perf_counter() - start
+    return {"elapsed_s": round(elapsed, 3), "latency": {kind: summarize(values) for kind, values in samples.items()}}
+
+
+def median_of(runs):
+    """Field-by-field median of equally shaped (nested) run results"""
+    first = runs[0]
+    if isinstance(first, dict):
+        return {key: median_of([run[key] for run in runs]) for key in first}
+    return round(statistics.median(runs), 3)
+
+
+async def run(calls: int, callers: dict, tick: float, repeats: int = 1) -> dict:
+    latency = {tool: cost for tool, _, cost in WORKLOAD.values()}
+    results = {"calls_per_kind": calls, "callers": callers, "tick_ms": tick * 1000, "runs": repeats, "modes": {}}
+
+    for label, budget in MODES:
+        runs = []
+        for _ in range(repeats):
+            with EditorEmulator(port=0, tick=tick, latency=latency, frame_budget=budget) as emulator:
+                async with UnityClient(emulator.url, max_connections=sum(callers.values()) + 1) as client:
+                    run_result = await drive(client, callers, calls)
+                    stats = await client.call("unity_get_scheduler_stats", {})
+            run_result["max_frame_ms"] = stats["maxFrameMs"]
+            run_result["busy_frames"] = stats["busyFrames"]
+            # Time spent queued for the main thread, without the HTTP round-trip
+            run_result["avg_wait_ms"] = {kind: stats["lanes"][kind]["avgWaitMs"] for kind in WORKLOAD}
+            runs.append(run_result)
+        results["modes"][label] = median_of(runs)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200, help="Calls per caller kind")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--heavy", type=int, default=2)
+    parser.add_argument("--tick-ms", type=float, default=4.0, help="Simulated EditorApplication.update interval")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode; figures are medians")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    callers = {"read": options.readers, "write": options.writers, "heavy": options.heavy}
+    results = asyncio.run(run(options.calls, callers, options.tick_ms / 1000, options.runs))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['calls_per_kind']} calls per kind, callers {callers}, tick {results['tick_ms']:.1f}ms, "
+          f"median of {results['runs']} runs")
+    print(f"{'mode':<14}{'elapsed s':>10}{'max frame':>11}{'read wait':>11}{'read p50':>10}{'read p95':>10}"
+          f"{'write p95':>11}{'heavy p95':>11}")
+    for label, mode in results["modes"].items():
+        latency = mode["latency"]
+        print(f"{label:<14}{mode['elapsed_s']:>10.2f}{mode['max_frame_ms']:>11.1f}{mode['avg_wait_ms']['read']:>11.2f}"
+              f"{latency['read']['p50_ms']:>10.1f}{latency['read']['p95_ms']:>10.1f}"
+              f"{latency['write']['p95_ms']:>11.1f}{latency['heavy']['p95_ms']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Spatial questions on a large scene: list and filter vs unity_spatial_query.
+
+Runs against the in-process editor emulator with `--objects` scattered
+primitives and asks "what is within 10 m of a point" repeatedly:
+
+- list: unity_list_all_gameobjects with columnar positions, distances
+  computed on the client (and only to object centers, not bounds)
+- rebuild: unity_spatial_query with the bounds tree rebuilt for every call,
+  which is what rescanning the scene per query costs
+- cached: unity_spatial_query on the kept tree
+- refit: unity_spatial_query after `--moved` objects were moved with
+  unity_set_transforms (untimed), so the tree is refitted first
+
+    cd mcp-server
+    python -m benchmarks.bench_spatial --objects 5000
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator, EmulatedEditor, GameObject, Scene
+
+CENTER = [0.0, 0.0, 0.0]
+RADIUS = 10.0
+
+
+def build_scene(objects: int, extent: float) -> Scene:
+    scene = Scene.default()
+    generator = random.Random(7)
+    for i in range(objects):
+        obj = GameObject(f"Rock{i}", ["MeshFilter", "MeshRenderer", "BoxCollider"])
+        obj.local_position = [generator.uniform(-extent, extent), 0.0, generator.uniform(-extent, extent)]
+        scene.add(obj)
+    return scene
+
+
+async def list_filter(client, editor) -> tuple:
+    result = await client.call("unity_list_all_gameobjects", {
+        "fields": ["instanceId", "position"], "encoding": "columnar",
+    })
+    columns = result["columns"]
+    positions = columns.get("position", [])
+    handles = [
+        f"id:{instance_id}"
+        for index, instance_id in enumerate(columns.get("instanceId", []))
+        if math.dist(positions[index * 3:index * 3 + 3], CENTER) <= RADIUS
+    ]
+    return handles, result
+
+
+async def query(client, editor) -> tuple:
+    result = await client.call("unity_spatial_query", {
+        "query": "radius", "center": CENTER, "radius": RADIUS, "limit": 10000,
+    })
+    return [hit["handle"] for hit in result["hits"]], result
+
+
+async def query_rebuild(client, editor) -> tuple:
+    # Same as a structural change in the scene: the next query rebuilds the tree
+    editor.scene.structure_version += 1
+    return await query(client, editor)
+
+
+async def run(objects: int, moved: int, iterations: int) -> dict:
+    extent = math.sqrt(objects) * 2
+    editor = EmulatedEditor(scene=build_scene(objects, extent))
+    results = {"objects": objects, "moved": moved, "iterations": iterations, "modes": {}}
+    generator = random.Random(11)
+
+    with EditorEmulator(port=0, tick=0.001, editor=editor, stream_port=0) as emulator:
+        async with UnityClient(emulator.url, stream_port=emulator.stream_port) as client:
+            async def move_some():
+                targets = [f"Rock{generator.randrange(objects)}" for _ in range(moved)]
+                positions = [
+                    value for _ in targets
+                    for value in (generator.uniform(-extent, extent), 0.0, generator.uniform(-extent, extent))
+                ]
+                result = await client.call("unity_set_transforms", {"targets": targets, "positions": positions})
+                assert result.get("success"), result
+
+            modes = [
+                ("list", list_filter, None),
+                ("rebuild", query_rebuild, None),
+                ("cached", query, None),
+                ("refit", query, move_some),
+            ]
+            await query(client, editor)
+            for mode, function, before in modes:
+                samples = []
+                index = {}
+                for _ in range(iterations):
+                    if before is not None:
+                        await before()
+                    start = time.perf_counter()
+                    handles, result = await function(client, editor)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    assert result.get("success"), result
+                    index = result.get("index", {})
+                results["modes"][mode] = {
+                    "matches": len(handles),
+                    "response_bytes": len(result.raw.encode("utf-8")),
+                    "rebuilt": index.get("rebuilt"),
+                    "refitted": index.get("refitted"),
+                    "latency": summarize(samples),
+                }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=5000, help="Objects with bounds to generate")
+    parser.add_argument("--moved", type=int, default=20, help="Objects moved before each refit query")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.objects, options.moved, options.iterations))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['objects']} objects, radius {RADIUS:g}, {results['iterations']} calls per mode")
+    print(f"{'mode':<10}{'matches':>9}{'KB':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for mode, result in results["modes"].items():
+        latency = result["latency"]
+        print(f"{mode:<10}{result['matches']:>9}{result['response_bytes'] / 1024:>10.1f}"
+              f"{latency['p50_ms']:>10.2f}{latency['p95_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Server startup and per-call tool overhead: rebuilt/re-validated per call vs the precompiled registry.
+
+Startup is the wall time of a fresh interpreter importing unity_mcp_server,
+which builds and checks TOOL_REGISTRY once. The per-call sections compare
+what happened on every request before with what happens now:
+
+- list_tools: Tool(**tool) for every definition vs the list built at import
+- arguments: jsonschema.validate (what mcp runs by default, recompiling the
+  schema each call) vs TOOL_REGISTRY.prepare, over the benchmark samples
+- invalid calls: a round-trip to the editor emulator to get the error back
+  vs rejecting them locally
+
+    cd mcp-server
+    python -m benchmarks.bench_startup --runs 10
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+import jsonschema
+from mcp.types import Tool
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from benchmarks.tool_samples import SAMPLES
+from emulator import EditorEmulator
+from tools import ALL_TOOLS, TOOL_REGISTRY, InvalidToolCall, ToolRegistry
+
+INVALID_CALLS = [
+    ("unity_set_position", {"name": "Main Camera", "position": [1, 2]}),
+    ("unity_create_primitive", {"name": "Bad", "position": "0,0,0"}),
+    ("unity_get_logs", {"waitSeconds": 60}),
+]
+
+
+def timed(function, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def startup(runs: int) -> dict:
+    """Wall time of a new interpreter importing the server module"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import unity_mcp_server"], check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def list_tools(repeat: int) -> dict:
+    prebuilt = [Tool(**tool) for tool in ALL_TOOLS]
+    return {
+        "rebuilt_per_call": summarize(timed(lambda: [Tool(**tool) for tool in ALL_TOOLS], repeat)),
+        "prebuilt": summarize(timed(lambda: prebuilt, repeat)),
+    }
+
+
+def arguments(repeat: int) -> dict:
+    calls = [(name, sample["args"]) for name, sample in SAMPLES.items() if name in TOOL_REGISTRY]
+    schemas = {name: TOOL_REGISTRY.definitions[name]["inputSchema"] for name, _ in calls}
+    before, after = [], []
+    for _ in range(repeat):
+        for name, args in calls:
+            start = time.perf_counter()
+            jsonschema.validate(instance=args, schema=schemas[name])
+            middle = time.perf_counter()
+            TOOL_REGISTRY.prepare(name, args)
+            end = time.perf_counter()
+            before.append((middle - start) * 1000)
+            after.append((end - middle) * 1000)
+    return {"tools": len(calls), "jsonschema": summarize(before), "registry": summarize(after)}
+
+
+def reject_locally(name: str, args: dict) -> None:
+    try:
+        TOOL_REGISTRY.prepare(name, args)
+    except InvalidToolCall:
+        return
+    raise AssertionError(f"{name} {args} was not rejected")
+
+
+async def invalid_calls(repeat: int, tick: float) -> dict:
+    round_trip, local = [], []
+    with EditorEmulator(port=0, tick=tick) as emulator:
+        async with UnityClient(emulator.url) as client:
+            await client.call("unity_ping", {})
+            for _ in range(repeat):
+                for name, args in INVALID_CALLS:
+                    start = time.perf_counter()
+                    await client.call(name, args)
+                    round_trip.append((time.perf_counter() - start) * 1000)
+                    local.extend(timed(lambda: reject_locally(name, args), 1))
+    return {"editor_round_trip": summarize(round_trip), "rejected_locally": summarize(local)}
+
+
+def run(runs: int, repeat: int, tick: float) -> dict:
+    return {
+        "tools": len(TOOL_REGISTRY),
+        "startup": startup(runs),
+        "registry_build": summarize(timed(lambda: ToolRegistry(ALL_TOOLS), runs)),
+        "list_tools": list_tools(repeat),
+        "arguments": arguments(repeat),
+        "invalid_calls": asyncio.run(invalid_calls(repeat, tick)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Interpreter starts and registry builds to time")
+    parser.add_argument("--repeat", type=int, default=200, help="Repetitions of each per-call measurement")
+    parser.add_argument("--tick-ms", type=float, default=4.0, help="Simulated EditorApplication.update interval")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = run(options.runs, options.repeat, options.tick_ms / 1000)
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    def row(label, stats):
+        print(f"{label:<34}{stats['p50_ms']:>10.4f}{stats['p99_ms']:>10.4f}")
+
+    print(f"{results['tools']} tools")
+    print(f"{'':<34}{'p50 ms':>10}{'p99 ms':>10}")
+    row("startup (import unity_mcp_server)", results["startup"])
+    row("registry build", results["registry_build"])
+    row("list_tools, rebuilt per call", results["list_tools"]["rebuilt_per_call"])
+    row("list_tools, prebuilt", results["list_tools"]["prebuilt"])
+    row("arguments, jsonschema.validate", results["arguments"]["jsonschema"])
+    row("arguments, registry", results["arguments"]["registry"])
+    row("invalid call, editor round-trip", results["invalid_calls"]["editor_round_trip"])
+    row("invalid call, rejected locally", results["invalid_calls"]["rejected_locally"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""Per-tool latency, throughput and payload benchmark for every tool in ALL_TOOLS.
+
+For each tool: cold latency (first call in the run), warm p50/p95/p99 over
+repeated calls, and request/response payload sizes. For a few tools, also
+throughput at several concurrency levels. Runs against the in-process
+editor emulator by default, or a live editor with --url. Results can be
+written as JSON with server and package versions, for tracking regressions
+between releases.
+
+    cd mcp-server
+    python -m benchmarks.bench_tools --output bench.json
+    python -m benchmarks.bench_tools --compare bench.json
+    python -m benchmarks.bench_tools --url http://localhost:8765 --iterations 20
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import subprocess
+import time
+import tomllib
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from benchmarks.tool_samples import DISRUPTIVE, REPLACES_SCENE, SAMPLES, SETUP_CALLS, TEARDOWN_CALLS
+from emulator import EditorEmulator
+from tools import ALL_TOOLS, BRIDGE_TOOLS
+
+SERVER_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_JSON = SERVER_ROOT.parent / "Packages" / "com.vtrinh.unitymcp" / "package.json"
+
+DEFAULT_THROUGHPUT_TOOLS = ["unity_ping", "unity_find_gameobject", "unity_set_position"]
+DEFAULT_CONCURRENCY = [1, 4, 16, 64]
+
+
+def versions() -> dict:
+    """Versions of unity_mcp_server.py, the Unity package and the git checkout"""
+    result = {"python": platform.python_version()}
+    try:
+        with open(SERVER_ROOT / "pyproject.toml", "rb") as f:
+            result["server"] = tomllib.load(f)["project"]["version"]
+    except (OSError, KeyError, tomllib.TOMLDecodeError):
+        result["server"] = None
+    try:
+        result["package"] = json.loads(PACKAGE_JSON.read_text())["version"]
+    except (OSError, KeyError, ValueError):
+        result["package"] = None
+    try:
+        result["git"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SERVER_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        result["git"] = None
+    return result
+
+
+async def run_calls(client: UnityClient, calls) -> None:
+    for tool, args in calls or []:
+        await client.call(tool, args)
+
+
+def unknown_tool(result: dict) -> bool:
+    """True when the editor (or emulator) does not implement the tool at all"""
+    return not result.get("success") and str(result.get("error", "")).startswith("Unknown tool")
+
+
+async def bench_tool(client: UnityClient, raw: httpx.AsyncClient, url: str, tool: str, sample: dict, iterations: int) -> Optional[dict]:
+    """Cold and warm latency plus payload sizes for one tool; None if the target does not implement it"""
+    samples = []
+    successes = 0
+    last_error = None
+    cold_ms = None
+
+    for i in range(iterations + 1):
+        await run_calls(client, sample.get("before"))
+        start = time.perf_counter()
+        result = await client.call(tool, sample["args"])
+        elapsed = (time.perf_counter() - start) * 1000
+        await run_calls(client, sample.get("after"))
+
+        if i == 0:
+            if unknown_tool(result):
+                return None
+            cold_ms = round(elapsed, 3)
+        else:
+            samples.append(elapsed)
+        if result.get("success"):
+            successes += 1
+        else:
+            last_error = result.get("error")
+
+    # Payload sizes as they go over the wire
+    await run_calls(client, sample.get("before"))
+    request_body = json.dumps({"tool": tool, "args": sample["args"]}).encode("utf-8")
+    response = await raw.post(url, content=request_body, headers={"Content-Type": "application/json"})
+    await run_calls(client, sample.get("after"))
+
+    report = {
+        "cold_ms": cold_ms,
+        "warm": summarize(samples),
+        "request_bytes": len(request_body),
+        "response_bytes": len(response.content),
+        "success_rate": round(successes / (iterations + 1), 3),
+    }
+    if last_error:
+        report["last_error"] = last_error
+    return report
+
+
+async def bench_throughput(client: UnityClient, tool: str, args: dict, concurrency: int, calls: int) -> dict:
+    """Calls per second with `concurrency` callers issuing back-to-back calls"""
+    samples = []
+    remaining = calls
+
+    async def caller():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await client.call(tool, args)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {"calls_per_s": round(calls / elapsed, 1), "latency": summarize(samples)}
+
+
+async def run_suite(url: str, target: str, options) -> dict:
+    include_disruptive = target == "emulator" or options.include_disruptive
+    selected = [tool["name"] for tool in ALL_TOOLS if not options.tools or tool["name"] in options.tools]
+    # Disruptive tools may replace the open scene, so they go last
+    ordered = [name for name in selected if name not in DISRUPTIVE] + [name for name in selected if name in DISRUPTIVE]
+
+    results = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "target": target,
+            "url": url,
+            "versions": versions(),
+            "iterations": options.iterations,
+            "max_connections": options.max_connections,
+        },
+        "tools": {},
+        "skipped": {},
+        "throughput": {},
+    }
+
+    async with UnityClient(url, max_connections=options.max_connections) as client, httpx.AsyncClient(timeout=30.0) as raw:
+        # Time to first response on a fresh connection
+        start = time.perf_counter()
+        ping = await client.call("unity_ping", {})
+        results["meta"]["connect_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        results["meta"]["unity_version"] = ping.get("unityVersion")
+
+        await run_calls(client, SETUP_CALLS)
+
+        local_tools = {tool["name"] for tool in BRIDGE_TOOLS}
+        for name in ordered:
+            if name in local_tools:
+                results["skipped"][name] = "answered by the MCP server, not Unity"
+            elif name not in SAMPLES:
+                results["skipped"][name] = "no sample arguments in benchmarks/tool_samples.py"
+            elif name in DISRUPTIVE and not include_disruptive:
+                results["skipped"][name] = "disruptive; pass --include-disruptive to run against a live editor"
+            else:
+                report = await bench_tool(client, raw, url, name, SAMPLES[name], options.iterations)
+                if report is None:
+                    results["skipped"][name] = f"not implemented by the {target} editor (Unknown tool)"
+                else:
+                    results["tools"][name] = report
+                if name in REPLACES_SCENE:
+                    await run_calls(client, TEARDOWN_CALLS)
+                    await run_calls(client, SETUP_CALLS)
+
+        for name in options.throughput_tools:
+            args = SAMPLES.get(name, {}).get("args", {})
+            results["throughput"][name] = {
+                str(level): await bench_throughput(client, name, args, level, options.throughput_calls)
+                for level in options.concurrency
+            }
+
+        await run_calls(client, TEARDOWN_CALLS)
+
+    return results
+
+
+async def run(options) -> dict:
+    if options.url:
+        return await run_suite(options.url, "live", options)
+
+    latency = {tool: ms / 1000 for tool, ms in (options.emulator_latency or {}).items()}
+    with EditorEmulator(port=0, tick=options.tick_ms / 1000, latency=latency) as emulator:
+        return await run_suite(emulator.url, "emulator", options)
+
+
+def print_report(results: dict) -> None:
+    meta = results["meta"]
+    versions_info = meta["versions"]
+    print(f"target: {meta['target']} ({meta['url']}), unity {meta.get('unity_version')}, "
+          f"server {versions_info['server']}, package {versions_info['package']}, git {versions_info['git']}")
+    print(f"first call on a new connection: {meta['connect_ms']:.3f}ms")
+    print()
+    print(f"{'tool':<34}{'cold':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'req B':>8}{'resp B':>9}{'ok':>6}")
+    for name, stats in results["tools"].items():
+        warm = stats["warm"]
+        print(f"{name:<34}{stats['cold_ms']:>9.2f}{warm['p50_ms']:>9.2f}{warm['p95_ms']:>9.2f}{warm['p99_ms']:>9.2f}"
+              f"{stats['request_bytes']:>8}{stats['response_bytes']:>9}{stats['success_rate']:>6.0%}")
+    for name, reason in results["skipped"].items():
+        print(f"{name:<34}skipped: {reason}")
+
+    if results["throughput"]:
+        print()
+        print(f"{'throughput':<34}{'conc':>6}{'calls/s':>10}{'p50':>9}{'p95':>9}{'p99':>9}")
+        for name, levels in results["throughput"].items():
+            for level, stats in levels.items():
+                latency = stats["latency"]
+                print(f"{name:<34}{level:>6}{stats['calls_per_s']:>10.1f}{latency['p50_ms']:>9.2f}"
+                      f"{latency['p95_ms']:>9.2f}{latency['p99_ms']:>9.2f}")
+
+
+def print_comparison(baseline: dict, results: dict) -> None:
+    """Warm p50/p95 change per tool against an earlier JSON result"""
+    base_versions = baseline["meta"]["versions"]
+    print()
+    print(f"vs baseline: server {base_versions['server']}, package {base_versions['package']}, "
+          f"git {base_versions['git']} ({baseline['meta']['timestamp']})")
+    print(f"{'tool':<34}{'p50 before':>11}{'p50 now':>10}{'change':>9}{'p95 before':>12}{'p95 now':>10}")
+    for name, stats in results["tools"].items():
+        before = baseline["tools"].get(name)
+        if before is None:
+            continue
+        old, new = before["warm"]["p50_ms"], stats["warm"]["p50_ms"]
+        change = f"{(new - old) / old:+.0%}" if old else "n/a"
+        print(f"{name:<34}{old:>11.2f}{new:>10.2f}{change:>9}{before['warm']['p95_ms']:>12.2f}{stats['warm']['p95_ms']:>10.2f}")
+
+
+def parse_latency(value: str):
+    tool, _, ms = value.partition("=")
+    if not tool or not ms:
+        raise argparse.ArgumentTypeError(f"expected TOOL=MS, got '{value}'")
+    return tool, float(ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Benchmark a live editor at this URL instead of the emulator")
+    parser.add_argument("--tools", nargs="+", help="Only benchmark these tools")
+    parser.add_argument("--iterations", type=int, default=30, help="Warm calls per tool")
+    parser.add_argument("--max-connections", type=int, default=10)
+    parser.add_argument("--throughput-tools", nargs="*", default=DEFAULT_THROUGHPUT_TOOLS)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--throughput-calls", type=int, default=500, help="Calls per concurrency level")
+    parser.add_argument("--include-disruptive", action="store_true",
+                        help="Also run tools that replace the scene, write assets or recompile (live editor only)")
+    parser.add_argument("--tick-ms", type=float, default=4.0, help="Emulator editor tick")
+    parser.add_argument("--emulator-latency", type=parse_latency, action="append", metavar="TOOL=MS",
+                        help="Emulator execution cost for one tool (repeatable)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Earlier JSON results to compare warm latency against")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+    options.emulator_latency = dict(options.emulator_latency or [])
+
+    results = asyncio.run(run(options))
+
+    if options.output:
+        Path(options.output).write_text(json.dumps(results, indent=2))
+    if options.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+        if options.compare:
+            print_comparison(json.loads(Path(options.compare).read_text()), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Per-call latency and concurrent throughput: HTTP POST per call vs the persistent stream.
+
+Runs against the in-process editor emulator, which serves both transports
+like MCPServer.cs and MCPStreamServer.cs. "http" is one keep-alive HTTP
+request per call; "stream" multiplexes every call over one TCP connection
+with newline-delimited JSON frames.
+
+    cd mcp-server
+    python -m benchmarks.bench_transport --calls 2000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator
+
+TOOLS = [
+    ("unity_ping", {}),
+    ("unity_find_gameobject", {"name": "Main Camera"}),
+]
+
+
+async def sequential(client: UnityClient, tool: str, args: dict, calls: int) -> dict:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = await client.call(tool, args)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert result.get("success"), result
+    return summarize(samples)
+
+
+async def concurrent(client: UnityClient, tool: str, args: dict, calls: int, concurrency: int) -> dict:
+    remaining = calls
+
+    async def caller():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            result = await client.call(tool, args)
+            assert result.get("success"), result
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {"elapsed_s": round(elapsed, 3), "calls_per_s": round(calls / elapsed, 1)}
+
+
+async def run(calls: int, concurrency: int, tick: float) -> dict:
+    results = {"calls": calls, "concurrency": concurrency, "tick_ms": tick * 1000, "transports": {}}
+
+    with EditorEmulator(port=0, tick=tick, stream_port=0) as emulator:
+        for transport in ("http", "stream"):
+            stream_port = emulator.stream_port if transport == "stream" else None
+            async with UnityClient(emulator.url, max_connections=concurrency, stream_port=stream_port) as client:
+                await client.call("unity_ping", {})
+                assert client.transport == transport
+                results["transports"][transport] = {
+                    tool: {
+                        "sequential": await sequential(client, tool, args, calls),
+                        "concurrent": await concurrent(client, tool, args, calls, concurrency),
+                    }
+                    for tool, args in TOOLS
+                }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--tick-ms", type=float, default=1.0, help="Simulated EditorApplication.update interval")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.calls, options.concurrency, options.tick_ms / 1000))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['calls']} calls per run, concurrency {results['concurrency']}, tick {results['tick_ms']:g}ms")
+    print(f"{'transport':<10}{'tool':<24}{'p50':>9}{'p95':>9}{'p99':>9}{'calls/s':>11}")
+    for transport, tools in results["transports"].items():
+        for tool, result in tools.items():
+            latency = result["sequential"]
+            print(f"{transport:<10}{tool:<24}{latency['p50_ms']:>9.3f}{latency['p95_ms']:>9.3f}"
+                  f"{latency['p99_ms']:>9.3f}{result['concurrent']['calls_per_s']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Payload size and latency of a large unity_list_all_gameobjects per wire format.
+
+Runs against the in-process editor emulator with a generated scene. For each
+mode it reports the bytes sent by the editor, the bytes of the text handed to
+the MCP client, and end-to-end latency including that formatting step.
+"pretty" is the previous behaviour: the editor's indented JSON, parsed and
+re-serialized with indent=2.
+
+    cd mcp-server
+    python -m benchmarks.bench_wire_format --objects 5000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from bridge import UnityClient
+from benchmarks.stats import summarize
+from emulator import EditorEmulator, EmulatedEditor, GameObject, Scene
+
+TOOL = "unity_list_all_gameobjects"
+
+# (label, tool args, gzip, MCP text formatting)
+MODES = [
+    ("pretty", {}, False, "pretty"),
+    ("compact", {}, False, "compact"),
+    ("compact+columnar", {"encoding": "columnar"}, False, "compact"),
+    ("compact+gzip", {}, True, "compact"),
+    ("columnar+gzip", {"encoding": "columnar"}, True, "compact"),
+]
+
+
+def build_scene(objects: int, children: int) -> Scene:
+    """Roots with `children` children each, `objects` GameObjects in total"""
+    scene = Scene.default()
+    root = None
+    for i in range(objects):
+        obj = GameObject(f"Object{i}")
+        obj.local_position = [i * 0.5, (i % 7) * 1.25, -i * 0.125]
+        if i % (children + 1) == 0:
+            root = scene.add(obj)
+        else:
+            scene.add(obj, root)
+    return scene
+
+
+def format_text(result: dict, style: str) -> str:
+    """Same as format_result in unity_mcp_server.py"""
+    if style == "pretty":
+        return json.dumps(result, indent=2)
+    return result.raw
+
+
+async def wire_bytes(url: str, args: dict, gzip: bool, pretty: bool) -> int:
+    """Response body size on the wire for one call"""
+    async with httpx.AsyncClient(timeout=30.0) as raw:
+        response = await raw.post(
+            url,
+            json={"tool": TOOL, "args": args},
+            headers={"Accept-Encoding": "gzip" if gzip else "identity"}
+        )
+    if pretty:
+        # MCPServer.cs used to send JObject.ToString(), which indents by 2
+        return len(json.dumps(response.json(), indent=2).encode("utf-8"))
+    return response.num_bytes_downloaded
+
+
+async def run(objects: int, children: int, iterations: int) -> dict:
+    editor = EmulatedEditor(scene=build_scene(objects, children))
+    results = {"tool": TOOL, "objects": objects + 2, "iterations": iterations, "modes": {}}
+
+    with EditorEmulator(port=0, tick=0.001, editor=editor) as emulator:
+        for label, args, gzip, style in MODES:
+            async with UnityClient(emulator.url, gzip=gzip) as client:
+                samples = []
+                text = ""
+                for _ in range(iterations):
+                    start = time.perf_counter()
+                    result = await client.call(TOOL, args)
+                    text = format_text(result, style)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    assert result.get("success"), result
+
+            results["modes"][label] = {
+                "wire_bytes": await wire_bytes(emulator.url, args, gzip, style == "pretty"),
+                "text_bytes": len(text.encode("utf-8")),
+                "latency": summarize(samples),
+            }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=5000, help="GameObjects to generate")
+    parser.add_argument("--children", type=int, default=9, help="Children per root object")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    options = parser.parse_args()
+
+    results = asyncio.run(run(options.objects, options.children, options.iterations))
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{TOOL} on {results['objects']} objects, {results['iterations']} calls per mode")
+    print(f"{'mode':<20}{'wire KB':>10}{'text KB':>10}{'p50':>10}{'p95':>10}")
+    for label, mode in results["modes"].items():
+        latency = mode["latency"]
+        print(f"{label:<20}{mode['wire_bytes'] / 1024:>10.1f}{mode['text_bytes'] / 1024:>10.1f}"
+              f"{latency['p50_ms']:>10.2f}{latency['p95_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
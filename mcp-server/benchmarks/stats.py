@@ -0,0 +1,25 @@
+"""Small latency statistics helpers shared by the benchmarks"""
+
+from typing import Dict, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted sequence (0 for no samples)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100.0 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def summarize(samples_ms: Sequence[float]) -> Dict[str, float]:
+    """Count, mean and p50/p95/p99/max of latency samples in milliseconds"""
+    count = len(samples_ms)
+    return {
+        "count": count,
+        "mean_ms": round(sum(samples_ms) / count, 3) if count else 0.0,
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms), 3) if count else 0.0,
+    }
@@ -0,0 +1,98 @@
+"""Minimal local stand-in for MCPServer.cs used by the micro-benchmarks.
+
+Speaks the same protocol as the Unity bridge - POST {"tool", "args"} and get
+back {"success", ...} - over HTTP/1.1 with keep-alive, but does no real work.
+With `tick` set, requests wait for the next simulated EditorApplication.update
+and execute one at a time, like MCPServer.ProcessRequests.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        body = json.dumps(self.server.stub.handle(request.get("tool"), request.get("args") or {})).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubUnity:
+    """Threaded stub server on localhost; use as a context manager.
+
+    `respond(tool, args)` builds the response dict and may be overridden.
+    `tick` is the simulated editor update interval in seconds (0 disables).
+    """
+
+    def __init__(self, port: int = 0, tick: float = 0.0):
+        self.tick = tick
+        self.requests = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._main_thread = threading.Lock()
+        self._tick_changed = threading.Condition()
+        self._tick_count = 0
+        self._running = False
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def respond(self, tool, args):
+        return {"success": True, "tool": tool, "message": "pong"}
+
+    def handle(self, tool, args):
+        """Run one request the way MCPServer.cs would: wait for a tick, then execute serially"""
+        if self.tick > 0:
+            with self._tick_changed:
+                seen = self._tick_count
+                self._tick_changed.wait_for(lambda: self._tick_count != seen)
+
+        with self._main_thread:
+            self.requests += 1
+            if tool == "unity_batch":
+                calls = args.get("calls") or []
+                results = [self.respond(call.get("tool"), call.get("args") or {}) for call in calls]
+                return {
+                    "success": True,
+                    "allSucceeded": all(result.get("success") for result in results),
+                    "total": len(calls),
+                    "results": results
+                }
+            return self.respond(tool, args)
+
+    def _ticker(self):
+        stop = threading.Event()
+        while self._running:
+            stop.wait(self.tick)
+            with self._tick_changed:
+                self._tick_count += 1
+                self._tick_changed.notify_all()
+
+    def __enter__(self) -> "StubUnity":
+        self._running = True
+        self._thread.start()
+        if self.tick > 0:
+            threading.Thread(target=self._ticker, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._running = False
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,178 @@
+"""Sample arguments for benchmarking every tool in ALL_TOOLS.
+
+SETUP_CALLS build a small fixture scene of "Bench*" objects once per run.
+Each SAMPLES entry gives the timed call's args plus optional untimed
+`before`/`after` calls that keep repeated iterations idempotent (e.g.
+re-creating the object a delete removes).
+
+DISRUPTIVE tools replace the open scene, write assets, change build settings
+or reload the domain. They only run against the emulator unless explicitly
+requested. After a REPLACES_SCENE tool, the fixture is torn down and built
+again in the scene it left open.
+"""
+
+SETUP_CALLS = [
+    ("unity_create_primitive", {"name": "BenchCube", "primitiveType": "Cube", "position": [0, 0, 0]}),
+    ("unity_create_primitive", {"name": "BenchTarget", "primitiveType": "Sphere", "position": [2, 0, 0]}),
+    ("unity_create_primitive", {"name": "BenchParent", "primitiveType": "Cube", "position": [-2, 0, 0]}),
+    ("unity_ui_create_canvas", {"name": "BenchCanvas"}),
+    ("unity_ui_create_image", {"name": "BenchImage", "parent": "BenchCanvas"}),
+    ("unity_ui_create_button", {"name": "BenchButton", "parent": "BenchCanvas", "text": "Bench"}),
+]
+
+TEARDOWN_CALLS = [
+    ("unity_delete_gameobject", {"name": "BenchCube"}),
+    ("unity_delete_gameobject", {"name": "BenchTarget"}),
+    ("unity_delete_gameobject", {"name": "BenchParent"}),
+    ("unity_delete_gameobject", {"name": "BenchCanvas"}),
+]
+
+DISRUPTIVE = frozenset({
+    "unity_force_compile",
+    "unity_restart_server",
+    "unity_create_scene",
+    "unity_save_scene",
+    "unity_load_scene",
+    "unity_add_scene_to_build",
+    "unity_save_prefab",
+    "unity_update_prefab",
+    "unity_create_prefab_from_asset",
+    "unity_instantiate_prefabs",
+    "unity_create_prefabs_from_assets",
+    "unity_create_script",
+    "unity_create_scripts",
+    "unity_set_asset_property",
+})
+
+REPLACES_SCENE = frozenset({
+    "unity_create_scene",
+    "unity_load_scene",
+})
+
+SAMPLES = {
+    # Core
+    "unity_ping": {"args": {}},
+    "unity_force_compile": {"args": {}},
+    "unity_is_compiling": {"args": {}},
+    "unity_wait_for_compile": {"args": {}},
+    "unity_get_logs": {"args": {"count": 50}},
+    "unity_test_log": {"args": {"message": "MCP benchmark"}},
+    "unity_restart_server": {"args": {}},
+    "unity_get_scene_info": {"args": {}},
+
+    # Scene Management
+    "unity_create_scene": {"args": {"name": "MCPBenchScene", "path": "Assets/MCPBench/", "setup": "Default"}},
+    "unity_save_scene": {"args": {}},
+    "unity_load_scene": {"args": {"sceneName": "MCPBenchScene"}},
+    "unity_add_scene_to_build": {"args": {"scenePath": "Assets/MCPBench/MCPBenchScene.unity"}},
+
+    # UI
+    "unity_ui_create_canvas": {"args": {"name": "BenchCanvas"}},
+    "unity_ui_create_event_system": {"args": {}},
+    "unity_ui_create_button": {
+        "args": {"name": "BenchSpawnButton", "parent": "BenchCanvas", "text": "Spawn"},
+        "after": [("unity_delete_gameobject", {"name": "BenchCanvas/BenchSpawnButton"})],
+    },
+    "unity_ui_create_text": {
+        "args": {"name": "BenchSpawnText", "parent": "BenchCanvas", "text": "Spawn"},
+        "after": [("unity_delete_gameobject", {"name": "BenchCanvas/BenchSpawnText"})],
+    },
+    "unity_ui_create_image": {
+        "args": {"name": "BenchSpawnImage", "parent": "BenchCanvas"},
+        "after": [("unity_delete_gameobject", {"name": "BenchCanvas/BenchSpawnImage"})],
+    },
+    "unity_ui_create_panel": {
+        "args": {"name": "BenchSpawnPanel", "parent": "BenchCanvas"},
+        "after": [("unity_delete_gameobject", {"name": "BenchCanvas/BenchSpawnPanel"})],
+    },
+    "unity_ui_create_layout": {
+        "args": {"name": "BenchSpawnLayout", "parent": "BenchCanvas", "layoutType": "vertical"},
+        "after": [("unity_delete_gameobject", {"name": "BenchCanvas/BenchSpawnLayout"})],
+    },
+    "unity_ui_set_sprite": {"args": {"objectPath": "BenchCanvas/BenchImage", "spritePath": "Assets/MCPBench/BenchSprite.png"}},
+    "unity_set_anchors": {"args": {"name": "BenchCanvas/BenchImage", "preset": "center"}},
+    "unity_set_ui_size": {"args": {"name": "BenchCanvas/BenchImage", "size": [120, 80]}},
+    "unity_set_image_fill": {"args": {"name": "BenchCanvas/BenchImage", "fillAmount": 0.5}},
+
+    # GameObject Management
+    "unity_create_primitive": {
+        "args": {"name": "BenchSpawn", "primitiveType": "Cube", "position": [0, 5, 0]},
+        "after": [("unity_delete_gameobject", {"name": "BenchSpawn"})],
+    },
+    "unity_delete_gameobject": {
+        "args": {"name": "BenchDoomed"},
+        "before": [("unity_create_primitive", {"name": "BenchDoomed", "primitiveType": "Cube"})],
+    },
+    "unity_find_gameobject": {"args": {"name": "BenchCube"}},
+    "unity_set_position": {"args": {"name": "BenchCube", "position": [1, 2, 3]}},
+    "unity_set_parent": {"args": {"name": "BenchTarget", "parent": "BenchParent", "worldPositionStays": True}},
+    "unity_set_camera_background": {"args": {"clearFlags": "solidcolor", "backgroundColor": [0.1, 0.1, 0.1]}},
+    "unity_add_particle_trail": {"args": {"name": "BenchCube", "color": "cyan"}},
+    "unity_list_all_gameobjects": {"args": {}},
+    "unity_query_gameobjects": {"args": {"where": {"name": "Bench*", "active": True}, "fields": ["name", "path"]}},
+    "unity_spatial_query": {"args": {"query": "radius", "center": [0, 0, 0], "radius": 5}},
+    "unity_search_assets": {"args": {"type": "Prefab", "folder": "Assets/MCPBench"}},
+    "unity_set_rotation": {"args": {"name": "BenchCube", "rotation": [0, 45, 0]}},
+    "unity_set_scale": {"args": {"name": "BenchCube", "scale": [1, 1, 1]}},
+    "unity_set_transforms": {"args": {
+        "targets": ["BenchCube", "BenchTarget", "BenchParent"],
+        "positions": [0, 0, 0, 2, 0, 0, -2, 0, 0],
+        "rotations": [0, 0, 0],
+    }},
+    "unity_set_tag": {"args": {"name": "BenchCube", "tag": "Player"}},
+
+    # Prefabs
+    "unity_save_prefab": {"args": {"gameObjectName": "BenchCube", "prefabPath": "Assets/MCPBench/BenchCube.prefab"}},
+    "unity_update_prefab": {"args": {"prefabPath": "Assets/MCPBench/BenchCube.prefab", "action": "add_component", "componentType": "Rigidbody"}},
+    "unity_create_prefab_from_asset": {"args": {"assetPath": "Assets/MCPBench/BenchCube.prefab", "prefabPath": "Assets/MCPBench/BenchCubeCopy.prefab"}},
+    "unity_instantiate_prefabs": {
+        "args": {"prefabPath": "Assets/MCPBench/BenchCube.prefab", "count": 4, "parent": "BenchParent",
+                 "name": "BenchInstance_{i}", "pattern": {"type": "grid", "columns": 2}},
+        "after": [("unity_delete_gameobject", {"name": f"BenchParent/BenchInstance_{i}"}) for i in range(4)],
+    },
+    "unity_create_prefabs_from_assets": {"args": {
+        "assetGlob": "Assets/MCPBench/BenchCube.prefab", "outputFolder": "Assets/MCPBench/Copies",
+        "name": "{name}Copy", "components": ["Rigidbody"],
+    }},
+
+    # Scripts and Components
+    "unity_create_script": {"args": {"name": "MCPBenchBehaviour", "path": "Assets/MCPBench/", "content": "using UnityEngine;\n\npublic class MCPBenchBehaviour : MonoBehaviour { }\n"}},
+    "unity_create_scripts": {"args": {"scripts": [
+        {"name": "MCPBenchMover", "path": "Assets/MCPBench/", "content": "using UnityEngine;\n\npublic class MCPBenchMover : MonoBehaviour { }\n"},
+        {"name": "MCPBenchSpinner", "path": "Assets/MCPBench/", "content": "using UnityEngine;\n\npublic class MCPBenchSpinner : MonoBehaviour { }\n"},
+    ]}},
+    "unity_add_component": {
+        "args": {"gameObjectName": "BenchCube", "componentType": "Rigidbody"},
+        "after": [("unity_remove_component", {"gameObjectName": "BenchCube", "componentType": "Rigidbody"})],
+    },
+    "unity_add_script_component": {
+        "args": {"gameObjectName": "BenchCube", "scriptName": "MCPBenchBehaviour"},
+        "after": [("unity_remove_component", {"gameObjectName": "BenchCube", "componentType": "MCPBenchBehaviour"})],
+    },
+    "unity_set_component_property": {
+        "args": {"gameObjectName": "BenchCube", "componentType": "Rigidbody", "propertyName": "mass", "value": 2.0},
+        "before": [("unity_add_component", {"gameObjectName": "BenchCube", "componentType": "Rigidbody"})],
+        "after": [("unity_remove_component", {"gameObjectName": "BenchCube", "componentType": "Rigidbody"})],
+    },
+    "unity_set_button_onclick": {"args": {"buttonName": "BenchButton", "action": "Quit"}},
+    "unity_remove_component": {
+        "args": {"gameObjectName": "BenchCube", "componentType": "Rigidbody"},
+        "before": [("unity_add_component", {"gameObjectName": "BenchCube", "componentType": "Rigidbody"})],
+    },
+    "unity_set_asset_property": {"args": {"assetPath": "Assets/MCPBench/BenchConfig.asset", "propertyName": "value", "value": 1}},
+
+    # Batch Execution
+    "unity_batch": {"args": {"calls": [
+        {"tool": "unity_set_position", "args": {"name": "BenchCube", "position": [0, 1, 0]}},
+        {"tool": "unity_set_rotation", "args": {"name": "BenchCube", "rotation": [0, 90, 0]}},
+        {"tool": "unity_set_scale", "args": {"name": "BenchCube", "scale": [2, 2, 2]}},
+        {"tool": "unity_find_gameobject", "args": {"name": "BenchCube"}},
+    ], "stopOnError": False}},
+
+    # Asynchronous Jobs
+    "unity_submit_job": {"args": {"tool": "unity_ping"}},
+    "unity_get_job_status": {"args": {}},
+
+    # Editor Diagnostics
+    "unity_get_scheduler_stats": {"args": {}},
+}
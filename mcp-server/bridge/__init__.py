@@ -0,0 +1,10 @@
+"""Unity bridge - transport between the MCP server and the Unity Editor"""
+
+from .client import UnityClient, UnityResponse
+from .coalescer import RequestCoalescer
+from .cache import ResponseCache
+from .stream import StreamConnection
+from .reload import ReloadGate
+from .metrics import CallMetrics
+
+__all__ = ['UnityClient', 'UnityResponse', 'RequestCoalescer', 'ResponseCache', 'StreamConnection', 'ReloadGate', 'CallMetrics']
@@ -0,0 +1,111 @@
+"""Read-through cache for scene-derived read-only tool results"""
+
+import json
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+
+class ResponseCache:
+    """Caches successful results of `cached_tools` in front of `backend`.
+
+    Each entry remembers the editor scene version it was read at. A hit is
+    only served while `version()` still returns that value, so edits made by
+    hand in the Editor invalidate it too. When the version is unavailable,
+    reads go straight to Unity and nothing is cached.
+
+    Any call to a tool outside `read_only_tools` clears the cache. Reads
+    that overlap such a call are not stored, so a stale read can never land
+    after the invalidation. Read-only calls with `reset: true` clear
+    counters, so they always reach the backend.
+    """
+
+    def __init__(
+        self,
+        backend,
+        version: Callable[[], Awaitable[Optional[int]]],
+        cached_tools: Iterable[str],
+        read_only_tools: Iterable[str],
+        max_entries: int = 256,
+    ):
+        self.backend = backend
+        self.version = version
+        self.cached_tools = frozenset(cached_tools)
+        self.read_only_tools = frozenset(read_only_tools) | self.cached_tools
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._generation = 0
+        self._writes_in_flight = 0
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.uncacheable = 0
+        self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "staleEvictions": self.stale,
+            "versionUnavailable": self.uncacheable,
+            "invalidations": self.invalidations,
+            "cachedTools": sorted(self.cached_tools),
+        }
+
+    def clear(self) -> None:
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+        self._generation += 1
+
+    async def call(self, tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        if tool in self.read_only_tools and args.get("reset"):
+            return await self.backend.call(tool, args)
+        if tool in self.cached_tools:
+            return await self._read(tool, args)
+        if tool in self.read_only_tools:
+            return await self.backend.call(tool, args)
+
+        # Mutating call: drop everything before and after it runs
+        self.clear()
+        self._writes_in_flight += 1
+        try:
+            return await self.backend.call(tool, args)
+        finally:
+            self._writes_in_flight -= 1
+            self.clear()
+
+    async def _read(self, tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        key = (tool, json.dumps(args, sort_keys=True, separators=(",", ":")))
+        generation = self._generation
+        version = await self.version()
+
+        if version is None:
+            self.uncacheable += 1
+            self.misses += 1
+            return await self.backend.call(tool, args)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+            self.stale += 1
+
+        self.misses += 1
+        result = await self.backend.call(tool, args)
+
+        if result.get("success") and self._writes_in_flight == 0 and generation == self._generation:
+            self._entries[key] = (version, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
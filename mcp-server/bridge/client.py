@@ -0,0 +1,227 @@
+"""Persistent HTTP client for the Unity Editor bridge"""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from .metrics import CallMetrics, parse_timing
+from .stream import StreamClosed, StreamConnection
+
+
+class UnityResponse(dict):
+    """Decoded tool result that keeps the editor's JSON text in `raw`.
+
+    Lets callers forward the response as sent by Unity instead of
+    serializing the dict again.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: str):
+        super().__init__(json.loads(raw))
+        self.raw = raw
+
+
+class UnityClient:
+    """Long-lived, keep-alive HTTP client for MCPServer.cs.
+
+    A single instance is owned by the MCP server lifecycle, so every tool call
+    reuses a pooled TCP connection instead of building a new AsyncClient and
+    opening a new connection to Unity.
+
+    With `stream_port`, calls go over one persistent, multiplexed connection
+    to MCPStreamServer.cs instead, reopened on the next call after it drops
+    (assembly reloads close it). While it cannot be opened, calls use HTTP and
+    the stream is retried every `stream_retry` seconds.
+
+    With `metrics`, every round trip is recorded with the editor's phase
+    timings (X-MCP-Timing over HTTP, the envelope's "timing" on the stream).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_connections: int = 10,
+        connect_timeout: float = 2.0,
+        read_timeout: float = 30.0,
+        tool_timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        tool_waits: Optional[Dict[str, float]] = None,
+        keepalive_expiry: float = 30.0,
+        status_timeout: float = 5.0,
+        gzip: bool = False,
+        stream_port: Optional[int] = None,
+        stream_retry: float = 2.0,
+        metrics: Optional[CallMetrics] = None,
+    ):
+        self.url = url
+        self.status_url = url.rstrip("/") + "/status"
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.default_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.status_timeout = httpx.Timeout(status_timeout, connect=connect_timeout)
+        self.tool_timeouts = {
+            name: httpx.Timeout(read, connect=connect)
+            for name, (connect, read) in (tool_timeouts or {}).items()
+        }
+        # Tools that wait up to their waitSeconds argument (capped at the
+        # value here) after their main-thread work, on top of its timeout
+        self.tool_waits = dict(tool_waits or {})
+        # MCPServer.cs gzips large responses only when asked to
+        self.headers = {"Accept-Encoding": "gzip" if gzip else "identity"}
+        self._client: Optional[httpx.AsyncClient] = None
+
+        self.stream_port = stream_port
+        self.stream_retry = stream_retry
+        self.connect_timeout = connect_timeout
+        self._stream: Optional[StreamConnection] = None
+        self._stream_retry_at = 0.0
+        self._stream_lock = asyncio.Lock()
+        self.metrics = metrics
+
+    async def start(self) -> None:
+        """Open the connection pool (idempotent)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.default_timeout,
+                limits=self.limits,
+                headers=self.headers,
+            )
+
+    async def close(self) -> None:
+        """Close the connection pool and drop idle connections"""
+        if self._stream is not None:
+            await self._stream.close()
+            self._stream = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def transport(self) -> str:
+        """Current transport: "stream" while the persistent connection is open, else "http"."""
+        return "stream" if self._stream is not None and not self._stream.closed else "http"
+
+    async def _get_stream(self) -> Optional[StreamConnection]:
+        """The open stream connection, reconnecting if due; None means use HTTP"""
+        if self.stream_port is None:
+            return None
+        if self._stream is not None and not self._stream.closed:
+            return self._stream
+        if time.monotonic() < self._stream_retry_at:
+            return None
+
+        async with self._stream_lock:
+            if self._stream is not None and not self._stream.closed:
+                return self._stream
+            stream = StreamConnection(urlsplit(self.url).hostname or "localhost", self.stream_port, self.connect_timeout)
+            try:
+                await stream.connect()
+            except (OSError, asyncio.TimeoutError):
+                # Editor not listening (reloading, or an older package): HTTP until the next retry
+                self._stream = None
+                self._stream_retry_at = time.monotonic() + self.stream_retry
+                return None
+            self._stream = stream
+            return stream
+
+    async def _stream_request(self, frame: Dict[str, Any], timeout: float) -> Optional[Tuple[str, Optional[str]]]:
+        """Result JSON text and timing over the stream, or None when the call should go over HTTP"""
+        stream = await self._get_stream()
+        if stream is None:
+            return None
+        try:
+            return await stream.request(frame, timeout)
+        except StreamClosed:
+            # Dropped before the request was sent; nothing reached Unity
+            return None
+
+    async def __aenter__(self) -> "UnityClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def timeout_for(self, tool: str, args: Optional[Dict[str, Any]] = None) -> httpx.Timeout:
+        """Connect/read timeouts for a tool, falling back to the client default.
+
+        For a tool in `tool_waits`, the read timeout also covers the
+        requested waitSeconds (the cap when it is not given).
+        """
+        timeout = self.tool_timeouts.get(tool, self.default_timeout)
+        cap = self.tool_waits.get(tool)
+        if cap is None:
+            return timeout
+        wait = (args or {}).get("waitSeconds")
+        wait = cap if wait is None else min(max(float(wait), 0.0), cap)
+        return httpx.Timeout(timeout.read + wait, connect=timeout.connect)
+
+    async def call(self, tool: str, args: Dict[str, Any]) -> UnityResponse:
+        """Send one tool call to Unity and return the decoded JSON response.
+
+        Transport errors (httpx.TimeoutException, httpx.ConnectError, ...)
+        propagate to the caller.
+        """
+        timeout = self.timeout_for(tool, args)
+        start = time.perf_counter()
+        streamed = await self._stream_request({"tool": tool, "args": args}, timeout.read)
+        if streamed is not None:
+            raw, timing = streamed
+        else:
+            if self._client is None:
+                await self.start()
+
+            response = await self._client.post(
+                self.url,
+                json={
+                    "tool": tool,
+                    "args": args
+                },
+                timeout=timeout
+            )
+            raw, timing = response.text, response.headers.get("X-MCP-Timing")
+
+        received = time.perf_counter()
+        result = UnityResponse(raw)
+        if self.metrics is not None:
+            self.metrics.record_round_trip(
+                tool,
+                (received - start) * 1000,
+                (time.perf_counter() - received) * 1000,
+                parse_timing(timing),
+            )
+        return result
+
+    async def ping(self) -> bool:
+        """True when unity_ping gets an answer from the editor's main thread"""
+        try:
+            response = await self.call("unity_ping", {})
+            return bool(response.get("success"))
+        except (httpx.HTTPError, ValueError):
+            return False
+
+    async def scene_version(self) -> Optional[int]:
+        """Current editor scene version from the status endpoint.
+
+        Served by MCPServer.cs without waiting for the main thread. Returns
+        None when it is unavailable (older Unity package, editor not
+        running), in which case callers must not trust cached reads.
+        """
+        try:
+            streamed = await self._stream_request({"status": True}, self.status_timeout.read)
+            if streamed is not None:
+                return int(json.loads(streamed[0])["sceneVersion"])
+
+            if self._client is None:
+                await self.start()
+            response = await self._client.get(self.status_url, timeout=self.status_timeout)
+            return int(response.json()["sceneVersion"])
+        except (httpx.HTTPError, ValueError, KeyError, TypeError):
+            return None
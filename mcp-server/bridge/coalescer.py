@@ -0,0 +1,102 @@
+"""Opt-in coalescing of concurrent tool calls into unity_batch requests"""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .client import UnityClient
+
+# Tools that must always go to Unity on their own: batches cannot nest,
+# these trigger a domain reload or restart the listener mid-batch,
+# unity_get_logs / unity_create_scripts only wait for their result when sent
+# on their own, and the job and scheduler stats tools are answered off the
+# main thread.
+DEFAULT_EXCLUDED = frozenset({
+    "unity_batch",
+    "unity_force_compile",
+    "unity_restart_server",
+    "unity_get_logs",
+    "unity_create_scripts",
+    "unity_submit_job",
+    "unity_get_job_status",
+    "unity_wait_for_job",
+    "unity_get_job_result",
+    "unity_get_scheduler_stats",
+})
+
+
+class RequestCoalescer:
+    """Gathers calls that arrive within `window` seconds into one unity_batch.
+
+    The first call of a batch starts the window; the batch is flushed when the
+    window closes or `max_batch` calls are waiting, whichever comes first.
+    Calls are independent (stopOnError is false) and run in arrival order, and
+    each caller gets back exactly the result Unity produced for its entry.
+    A batch of one is sent as a plain call.
+    """
+
+    def __init__(
+        self,
+        client: UnityClient,
+        window: float = 0.005,
+        max_batch: int = 32,
+        exclude: Iterable[str] = DEFAULT_EXCLUDED,
+    ):
+        self.client = client
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self.exclude = frozenset(exclude)
+        self._pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def call(self, tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue one tool call and wait for its own result"""
+        if tool in self.exclude:
+            return await self.client.call(tool, args)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((tool, args, future))
+
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """Send whatever is waiting now, without waiting for the window"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            if len(batch) == 1:
+                tool, args, _ = batch[0]
+                results = [await self.client.call(tool, args)]
+            else:
+                response = await self.client.call("unity_batch", {
+                    "calls": [{"tool": tool, "args": args} for tool, args, _ in batch],
+                    "stopOnError": False
+                })
+                results = response.get("results")
+                if not response.get("success") or not isinstance(results, list) or len(results) != len(batch):
+                    # Unity rejected the batch as a whole; every caller sees that error
+                    results = [response] * len(batch)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,162 @@
+"""Per-tool latency histograms split by phase, with an optional JSONL trace"""
+
+import bisect
+import json
+import time
+from typing import Any, Dict, IO, Iterable, Optional
+
+# Upper bounds of the histogram buckets in milliseconds; the last bucket is open
+BUCKET_BOUNDS_MS = (
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500,
+    1000, 2500, 5000, 10000, 30000,
+)
+
+# Phases measured inside the editor (MCPTiming.cs), in the order they happen
+EDITOR_PHASES = ("parse", "queue", "exec", "serialize")
+
+
+def parse_timing(text: Optional[str]) -> Optional[Dict[str, float]]:
+    """Decode MCPTiming's "parse=0.05;queue=6.1;..." into milliseconds per phase"""
+    if not text:
+        return None
+    try:
+        return {
+            name: float(value)
+            for name, _, value in (part.partition("=") for part in text.split(";"))
+        }
+    except ValueError:
+        return None
+
+
+class LatencyHistogram:
+    """Fixed log-spaced buckets, so recording is O(log buckets) and memory constant"""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the pct-th sample (the max for the open bucket)"""
+        if not self.count:
+            return 0.0
+        rank = pct / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(BUCKET_BOUNDS_MS[index], self.max) if index < len(BUCKET_BOUNDS_MS) else self.max
+        return self.max
+
+    def summary(self, buckets: bool = False) -> Dict[str, Any]:
+        result = {
+            "count": self.count,
+            "meanMs": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50Ms": round(self.percentile(50), 3),
+            "p95Ms": round(self.percentile(95), 3),
+            "p99Ms": round(self.percentile(99), 3),
+            "maxMs": round(self.max, 3),
+        }
+        if buckets:
+            bounds = [str(bound) for bound in BUCKET_BOUNDS_MS] + ["inf"]
+            result["buckets"] = {bound: count for bound, count in zip(bounds, self.counts) if count}
+        return result
+
+
+class CallMetrics:
+    """Where tool call time goes, per tool and phase.
+
+    Two sources feed it. UnityClient records every round trip to the editor:
+    the editor's own phases from MCPTiming (parse, queue, exec, serialize,
+    plus `editorWait` for listener-thread waits such as long-polls),
+    `transport` (round trip minus the editor's total) and `decode`.
+    `call_tool` records each MCP call: `total`, and `format` for building the
+    reply. Cache hits and held calls therefore show up in `total` but not in
+    the editor phases, and coalesced calls are recorded under unity_batch.
+
+    With `trace_path`, every record is also appended to that file as one
+    JSON line.
+    """
+
+    def __init__(self, trace_path: Optional[str] = None):
+        self.trace_path = trace_path
+        self._trace: Optional[IO[str]] = None
+        self.reset()
+
+    def reset(self) -> None:
+        self._tools: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._calls: Dict[str, Dict[str, int]] = {}
+        self._since = time.monotonic()
+
+    def record_round_trip(self, tool: str, round_trip_ms: float, decode_ms: float,
+                          timing: Optional[Dict[str, float]]) -> None:
+        phases = {"roundTrip": round_trip_ms, "decode": decode_ms}
+        if timing is not None:
+            editor_total = timing.get("total", 0.0)
+            measured = 0.0
+            for phase in EDITOR_PHASES:
+                if phase in timing:
+                    phases[phase] = timing[phase]
+                    measured += timing[phase]
+            phases["editorWait"] = max(0.0, editor_total - measured)
+            phases["transport"] = max(0.0, round_trip_ms - editor_total)
+        self._add(tool, phases)
+        self._write({"event": "unity", "tool": tool, **phases})
+
+    def record_call(self, tool: str, total_ms: float, format_ms: float, success: bool) -> None:
+        counts = self._calls.setdefault(tool, {"calls": 0, "errors": 0})
+        counts["calls"] += 1
+        if not success:
+            counts["errors"] += 1
+        self._add(tool, {"total": total_ms, "format": format_ms})
+        self._write({"event": "call", "tool": tool, "success": success, "total": total_ms, "format": format_ms})
+
+    def snapshot(self, tools: Optional[Iterable[str]] = None, buckets: bool = False) -> Dict[str, Any]:
+        names = sorted(self._tools) if tools is None else [name for name in tools if name in self._tools]
+        result = {}
+        for name in names:
+            entry = dict(self._calls.get(name, {"calls": 0, "errors": 0}))
+            entry["phases"] = {
+                phase: histogram.summary(buckets)
+                for phase, histogram in self._tools[name].items()
+            }
+            result[name] = entry
+        return {
+            "sinceSeconds": round(time.monotonic() - self._since, 3),
+            "tracePath": self.trace_path,
+            "tools": result,
+        }
+
+    def close(self) -> None:
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+    def _add(self, tool: str, phases: Dict[str, float]) -> None:
+        histograms = self._tools.setdefault(tool, {})
+        for phase, ms in phases.items():
+            histogram = histograms.get(phase)
+            if histogram is None:
+                histogram = histograms[phase] = LatencyHistogram()
+            histogram.add(ms)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self.trace_path is None:
+            return
+        if self._trace is None:
+            # Line-buffered, so the trace can be tailed while the server runs
+            self._trace = open(self.trace_path, "a", buffering=1, encoding="utf-8")
+        record = {"ts": round(time.time(), 6), **{
+            key: round(value, 3) if isinstance(value, float) else value
+            for key, value in record.items()
+        }}
+        self._trace.write(json.dumps(record, separators=(",", ":")) + "\n")
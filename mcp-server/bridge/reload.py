@@ -0,0 +1,248 @@
+"""Holds tool calls while Unity reloads scripts and replays them afterwards"""
+
+import asyncio
+import bisect
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+# Readiness states
+UNKNOWN = "unknown"          # the editor has not answered yet
+READY = "ready"
+RELOADING = "reloading"      # holding calls until unity_ping answers again
+REPLAYING = "replaying"      # sending held calls, in arrival order
+UNAVAILABLE = "unavailable"  # did not come back within the deadline
+
+# The request never reached Unity
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# The connection dropped while Unity had the request
+_DROPPED = (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError)
+
+
+def _error(message: str, state: str) -> Dict[str, Any]:
+    return {"success": False, "error": message, "readiness": state}
+
+
+def _not_run(result: Dict[str, Any]) -> bool:
+    """MCPServer.StopServer failed the request unrun because of an assembly reload"""
+    return not result.get("success") and bool(result.get("reloading"))
+
+
+class ReloadGate:
+    """Rides out Unity domain reloads in front of `backend`.
+
+    Once the editor has answered at least once, losing it (connection
+    refused, or a request failed by MCPServer with `reloading: true`) starts
+    a reload window. Calls are then held in a queue of at most `max_waiting`,
+    `ping()` is retried every `probe_interval` seconds, and once it succeeds
+    the held calls are sent again one at a time, in the order they reached
+    the gate (not the order Unity turned them away). Calls made during the
+    replay wait for it to finish and then go through as usual. If the
+    editor is not back within `deadline` seconds the held calls fail with a
+    clear error, and later calls fail at once until the editor answers again.
+
+    A call that was already inside Unity when the connection dropped may
+    have run, so only `read_only_tools` are replayed in that case, and not
+    those with `reset: true`, which would clear counters twice.
+    """
+
+    def __init__(
+        self,
+        backend,
+        ping: Callable[[], Awaitable[bool]],
+        read_only_tools: Iterable[str],
+        max_waiting: int = 64,
+        deadline: float = 60.0,
+        probe_interval: float = 0.25,
+    ):
+        self.backend = backend
+        self.ping = ping
+        self.read_only_tools = frozenset(read_only_tools)
+        self.max_waiting = max_waiting
+        self.deadline = deadline
+        self.probe_interval = probe_interval
+        self.state = UNKNOWN
+        self._state_since = time.monotonic()
+        self._reload_started = 0.0
+        self._waiting: List[Tuple[int, str, Dict[str, Any], asyncio.Future]] = []
+        self._arrivals = itertools.count()
+        self._recovery: Optional[asyncio.Task] = None
+        self._replayed = asyncio.Event()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.reloads = 0
+        self.replayed = 0
+        self.rejected = 0
+        self.expired = 0
+        self.last_reload_seconds: Optional[float] = None
+
+    def readiness(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        info = {
+            "state": self.state,
+            "stateSeconds": round(now - self._state_since, 3),
+            "waiting": len(self._waiting),
+            "maxWaiting": self.max_waiting,
+            "reloads": self.reloads,
+            "replayed": self.replayed,
+            "rejected": self.rejected,
+            "expired": self.expired,
+            "lastReloadSeconds": self.last_reload_seconds,
+        }
+        if self.state in (RELOADING, REPLAYING):
+            info["deadlineSeconds"] = round(max(0.0, self._reload_started + self.deadline - now), 3)
+        return info
+
+    async def close(self) -> None:
+        if self._recovery is not None:
+            self._recovery.cancel()
+            self._recovery = None
+
+    async def call(self, tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        arrival = next(self._arrivals)
+        while self.state == REPLAYING:
+            # Held calls go first
+            await self._replayed.wait()
+        if self.state == RELOADING:
+            return await self._hold(arrival, tool, args)
+
+        try:
+            result = await self.backend.call(tool, args)
+        except _NOT_SENT:
+            if self.state == UNAVAILABLE:
+                return self._unavailable(tool)
+            if self.state == UNKNOWN:
+                # Never reached the editor: not a reload, report it as before
+                raise
+            self._begin_reload()
+            return await self._hold(arrival, tool, args)
+        except _DROPPED:
+            if self.state in (UNKNOWN, UNAVAILABLE):
+                raise
+            self._begin_reload()
+            if tool in self.read_only_tools and not args.get("reset"):
+                return await self._hold(arrival, tool, args)
+            return _error(
+                f"Unity started reloading scripts while {tool} was running, so it may or may "
+                "not have been applied. Check the scene before sending it again.",
+                self.state,
+            )
+
+        if _not_run(result):
+            if self.state == UNAVAILABLE:
+                return self._unavailable(tool)
+            self._begin_reload()
+            return await self._hold(arrival, tool, args)
+        if self.state in (UNKNOWN, UNAVAILABLE):
+            # Calls sent before a reload began can still succeed during it;
+            # only _recover ends a reload window
+            self._set_state(READY)
+        return result
+
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            self.state = state
+            self._state_since = time.monotonic()
+
+    def _begin_reload(self) -> None:
+        if self.state in (RELOADING, REPLAYING):
+            return
+        self.reloads += 1
+        self._reload_started = time.monotonic()
+        self._set_state(RELOADING)
+        self._recovery = asyncio.get_running_loop().create_task(self._recover())
+
+    async def _hold(self, arrival: int, tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        if len(self._waiting) >= self.max_waiting:
+            self.rejected += 1
+            return _error(
+                f"Unity is reloading scripts and {len(self._waiting)} calls are already waiting; "
+                f"{tool} was not sent. Check unity_get_readiness before retrying.",
+                self.state,
+            )
+        future = asyncio.get_running_loop().create_future()
+        bisect.insort(self._waiting, (arrival, tool, args, future), key=lambda entry: entry[0])
+        return await future
+
+    async def _recover(self) -> None:
+        while True:
+            if not await self._wait_for_editor():
+                self._expire()
+                return
+            self.last_reload_seconds = round(time.monotonic() - self._reload_started, 3)
+            self._replayed = asyncio.Event()
+            self._set_state(REPLAYING)
+            try:
+                if await self._replay():
+                    self._set_state(READY)
+                    self._recovery = None
+                    return
+                # Gone again before the queue was drained: a new reload window
+                self.reloads += 1
+                self._reload_started = time.monotonic()
+                self._set_state(RELOADING)
+            finally:
+                self._replayed.set()
+
+    async def _wait_for_editor(self) -> bool:
+        """Ping until the editor answers; False once the deadline passes"""
+        deadline = self._reload_started + self.deadline
+        while not await self.ping():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.probe_interval)
+        return True
+
+    async def _replay(self) -> bool:
+        """Send held calls in arrival order; False if the editor went away again"""
+        while self._waiting:
+            # Calls made before the reload began can still be added ahead of
+            # this one while it is being sent, so entries are removed by identity
+            entry = self._waiting[0]
+            _, tool, args, future = entry
+            if future.done():
+                # The caller gave up waiting
+                self._waiting.remove(entry)
+                continue
+            try:
+                result = await self.backend.call(tool, args)
+            except _NOT_SENT:
+                return False
+            except Exception as e:
+                self._waiting.remove(entry)
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if _not_run(result):
+                return False
+
+            self._waiting.remove(entry)
+            self.replayed += 1
+            if not future.done():
+                future.set_result(result)
+        return True
+
+    def _expire(self) -> None:
+        self._set_state(UNAVAILABLE)
+        self._recovery = None
+        while self._waiting:
+            _, tool, _, future = self._waiting.pop(0)
+            if not future.done():
+                self.expired += 1
+                future.set_result(_error(
+                    f"Unity did not come back within {self.deadline:g}s of reloading scripts; "
+                    f"{tool} was not run. Check unity_get_readiness before retrying.",
+                    UNAVAILABLE,
+                ))
+
+    def _unavailable(self, tool: str) -> Dict[str, Any]:
+        since = time.monotonic() - self._reload_started
+        return _error(
+            f"Unity has not answered since it started reloading scripts {since:.0f}s ago; "
+            f"{tool} was not sent. Check the Editor for compile errors or a modal dialog.",
+            UNAVAILABLE,
+        )
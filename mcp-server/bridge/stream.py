@@ -0,0 +1,118 @@
+"""Persistent, multiplexed connection to MCPStreamServer.cs.
+
+Frames are newline-delimited JSON. Requests carry an `id`; responses come
+back as {"id": ..., "timing": "...", "result": ...} in completion order, so
+any number of calls can be in flight on one connection.
+"""
+
+import asyncio
+import itertools
+import json
+import re
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+# MCPStreamServer writes the id and timing first and the result last, so the
+# result's JSON text can be sliced out without re-serializing it
+_RESPONSE_PREFIX = re.compile(rb'^\{"id":(\d+),(?:"timing":"([^"]*)",)?"result":')
+
+# Largest single frame accepted (a full listing of a big scene)
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+class StreamClosed(Exception):
+    """The connection was closed before the request was sent; safe to retry elsewhere"""
+
+
+class StreamConnection:
+    def __init__(self, host: str, port: int, connect_timeout: float = 2.0):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def closed(self) -> bool:
+        return self._writer is None or self._writer.is_closing()
+
+    async def connect(self) -> None:
+        """Open the connection; OSError / asyncio.TimeoutError propagate"""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, limit=MAX_FRAME_BYTES),
+            self.connect_timeout,
+        )
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def request(self, frame: Dict[str, Any], timeout: float) -> Tuple[str, Optional[str]]:
+        """Send one frame and return the JSON text of its result and its MCPTiming text.
+
+        Raises StreamClosed if the connection is already gone, httpx.ReadTimeout
+        after `timeout` seconds and httpx.ReadError if the connection drops
+        while waiting, matching the HTTP transport's errors.
+        """
+        if self.closed:
+            raise StreamClosed()
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        line = json.dumps({"id": request_id, **frame}, separators=(",", ":")).encode("utf-8") + b"\n"
+        try:
+            self._writer.write(line)
+            await self._writer.drain()
+        except (ConnectionError, RuntimeError) as e:
+            self._pending.pop(request_id, None)
+            raise StreamClosed() from e
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise httpx.ReadTimeout(f"No response from Unity within {timeout}s") from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        self._fail_pending("Connection to Unity closed")
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                match = _RESPONSE_PREFIX.match(line)
+                if match is None:
+                    continue
+                future = self._pending.get(int(match.group(1)))
+                if future is not None and not future.done():
+                    # Strip the closing brace of the envelope and the newline
+                    result = line[match.end():].rstrip(b"\r\n")[:-1].decode("utf-8")
+                    timing = match.group(2).decode("ascii") if match.group(2) is not None else None
+                    future.set_result((result, timing))
+        except (ConnectionError, OSError, ValueError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            # Editor stopped (assembly reload, quit): everything in flight is lost
+            self._fail_pending("Unity closed the connection")
+
+    def _fail_pending(self, message: str) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(httpx.ReadError(message))
+        self._pending.clear()
@@ -0,0 +1,7 @@
+"""In-memory Unity Editor emulator for load testing the MCP pipeline without Unity"""
+
+from .editor import EmulatedEditor
+from .scene import GameObject, Scene
+from .server import EditorEmulator
+
+__all__ = ['EditorEmulator', 'EmulatedEditor', 'GameObject', 'Scene']
@@ -0,0 +1,52 @@
+"""Run the editor emulator on the Unity bridge port.
+
+    cd mcp-server
+    python -m emulator --tick-ms 4 --latency unity_create_scene=50 --default-latency-ms 0.2
+"""
+
+import argparse
+import time
+
+from emulator import EditorEmulator
+
+
+def parse_latency(value: str):
+    """Parse TOOL=MS into (tool, seconds)"""
+    tool, _, ms = value.partition("=")
+    if not tool or not ms:
+        raise argparse.ArgumentTypeError(f"expected TOOL=MS, got '{value}'")
+    return tool, float(ms) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stream-port", type=int, default=8766, help="Persistent NDJSON transport port (-1 disables it)")
+    parser.add_argument("--tick-ms", type=float, default=4.0, help="Simulated EditorApplication.update interval")
+    parser.add_argument("--default-latency-ms", type=float, default=0.0, help="Execution cost of tools without --latency")
+    parser.add_argument("--latency", type=parse_latency, action="append", default=[], metavar="TOOL=MS",
+                        help="Execution cost of one tool (repeatable)")
+    options = parser.parse_args()
+
+    emulator = EditorEmulator(
+        host=options.host,
+        port=options.port,
+        tick=options.tick_ms / 1000,
+        latency=dict(options.latency),
+        default_latency=options.default_latency_ms / 1000,
+        stream_port=options.stream_port if options.stream_port >= 0 else None
+    )
+
+    with emulator:
+        stream = f", tcp://{options.host}:{emulator.stream_port}" if emulator.stream_port else ""
+        print(f"Unity Editor emulator listening on {emulator.url}{stream} (tick {options.tick_ms:g}ms)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print(f"Stopped after {emulator.requests} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1511 @@
+"""Tool implementations for the emulated editor, mirroring MCPTools.cs.
+
+Responses use the same keys and error messages as the C# handlers so the MCP
+server cannot tell the difference. Covered: core tools, SCENE_TOOLS,
+GAMEOBJECT_TOOLS, UI_TOOLS, unity_batch, component add/remove,
+unity_save_prefab and unity_update_prefab on the prefabs in
+`EmulatedEditor.prefabs`. Anything else fails with "Unknown tool", like MCPTools.Execute.
+"""
+
+import base64
+import copy
+import datetime
+import math
+import os
+import re
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .hierarchy import HierarchyTracker
+from .scene import GameObject, Scene
+from .spatial import SpatialIndex, intersects, ray_distance, sqr_distance
+
+UNITY_VERSION = "6000.2.6f2 (emulated)"
+
+PRIMITIVE_TYPES = {
+    "sphere": "SphereCollider",
+    "capsule": "CapsuleCollider",
+    "cylinder": "CapsuleCollider",
+    "plane": "MeshCollider",
+    "quad": "MeshCollider",
+    "cube": "BoxCollider",
+}
+
+ANCHOR_PRESETS = {
+    "top-left": ([0, 1], [0, 1]),
+    "top-center": ([0.5, 1], [0.5, 1]),
+    "top-right": ([1, 1], [1, 1]),
+    "middle-left": ([0, 0.5], [0, 0.5]),
+    "center": ([0.5, 0.5], [0.5, 0.5]),
+    "middle-right": ([1, 0.5], [1, 0.5]),
+    "bottom-left": ([0, 0], [0, 0]),
+    "bottom-center": ([0.5, 0], [0.5, 0]),
+    "bottom-right": ([1, 0], [1, 0]),
+    "stretch-horizontal": ([0, 0.5], [1, 0.5]),
+    "stretch-vertical": ([0.5, 0], [0.5, 1]),
+    "stretch-all": ([0, 0], [1, 1]),
+}
+
+CANVAS_PRESETS = {
+    "mobile_portrait": ([1080, 1920], 1.0),
+    "mobile_landscape": ([1920, 1080], 0.0),
+    "tablet": ([1536, 2048], 0.5),
+}
+
+CLEAR_FLAGS = {"skybox": "Skybox", "solidcolor": "SolidColor", "solid": "SolidColor", "depth": "Depth", "nothing": "Nothing"}
+
+FILL_METHODS = {"horizontal": "Horizontal", "vertical": "Vertical", "radial90": "Radial90", "radial180": "Radial180", "radial360": "Radial360"}
+
+SCENE_INFO_FIELDS = ["sceneName", "scenePath", "isLoaded", "rootObjectCount", "rootObjects"]
+
+TRANSFORM_CHANNELS = ["position", "rotation", "scale"]
+
+TRANSFORM_ARRAYS = ["positions", "rotations", "scales"]
+
+# Targets named in unity_set_transforms' not-found error, like MCPTransforms.MaxListedMissing
+MAX_LISTED_MISSING = 10
+
+GAMEOBJECT_FIELDS = ["instanceId", "name", "path", "active", "tag", "layer", "position"]
+
+# unity_query_gameobjects, like MCPQuery.PredicateKeys/QueryFields/DefaultLimit/MaxLimit
+QUERY_PREDICATES = ["name", "path", "tag", "layer", "component", "active", "under", "any", "not"]
+QUERY_FIELDS = GAMEOBJECT_FIELDS + ["components"]
+QUERY_DEFAULT_LIMIT = 100
+QUERY_MAX_LIMIT = 10000
+
+# unity_spatial_query, like MCPSpatial.DefaultLimit/MaxLimit
+SPATIAL_DEFAULT_LIMIT = 10
+SPATIAL_MAX_LIMIT = 10000
+
+# Layer names by index in a new project
+BUILTIN_LAYERS = ["Default", "TransparentFX", "Ignore Raycast", "", "Water", "UI"]
+
+LOG_TYPES = ["Log", "Warning", "Error"]
+
+# The bridge's own log lines, which unity_get_logs leaves out (MCPLogs.BridgePrefix)
+# The bridge's per-request trace lines, as MCPLogs.TracePrefixes; its other
+# [MCP] lines, errors and warnings stay visible
+TRACE_PREFIXES = (
+    "[MCP] Received: ",
+    "[MCP] Executing: ",
+    "[MCP] Executed successfully",
+    "[MCP] Response sent: ",
+)
+
+DEFAULT_TAGS = ["Untagged", "Respawn", "Finish", "EditorOnly", "MainCamera", "Player", "GameController"]
+
+
+# Tools that never change the scene; anything else bumps scene_version when it
+# succeeds. unity_batch entries bump it themselves.
+NO_SCENE_CHANGE = frozenset({
+    "unity_ping",
+    "unity_get_scene_info",
+    "unity_list_all_gameobjects",
+    "unity_query_gameobjects",
+    "unity_spatial_query",
+    "unity_find_gameobject",
+    "unity_is_compiling",
+    "unity_wait_for_compile",
+    "unity_get_logs",
+    "unity_test_log",
+    "unity_batch",
+})
+
+# Tools a unity_batch entry may not call, as in MCPTools.Batch
+NOT_BATCHABLE = frozenset({
+    "unity_restart_server",
+    "unity_force_compile",
+    "unity_create_scripts",
+})
+
+
+def _is_trace(entry: Dict[str, Any]) -> bool:
+    return entry["type"] == "Log" and entry["message"].startswith(TRACE_PREFIXES)
+
+
+def _error(message: str) -> Dict[str, Any]:
+    return {"success": False, "error": message}
+
+
+def _not_found(name: str) -> Dict[str, Any]:
+    return _error(f"GameObject '{name}' not found")
+
+
+def _apply_prefab_operation(root: GameObject, operation: Dict[str, Any]):
+    """(problem, None) or (None, what was done), like MCPPrefabs.ApplyOperation"""
+    action = operation.get("action")
+    target = root
+    target_path = operation.get("target")
+    if target_path:
+        for name in target_path.split("/"):
+            target = next((child for child in target.children if child.name == name), None)
+            if target is None:
+                return f"No child '{target_path}' in prefab '{root.name}'", None
+    on = "" if target is root else f" on '{target_path}'"
+
+    component = operation.get("componentType")
+    if not component:
+        return "componentType is required", None
+    short_name = component.split(".")[-1]
+
+    if action == "add_component":
+        target.add_component(short_name)
+        return None, f"Added component: {component}{on}"
+    if action not in ("remove_component", "set_property"):
+        return f"Unknown action '{action}'. Use add_component, remove_component or set_property", None
+    if not target.has(short_name):
+        return f"Component not found: {component}{on}", None
+    if action == "remove_component":
+        target.components.remove(short_name)
+        target.properties.pop(short_name, None)
+        return None, f"Removed component: {component}{on}"
+
+    property_name = operation.get("propertyName")
+    if not property_name:
+        return "propertyName is required", None
+    target.properties.setdefault(short_name, {})[property_name] = copy.deepcopy(operation.get("value"))
+    return None, f"Set property '{property_name}' on {component}{on}"
+
+
+def _vector(channel: List[float], index: int) -> List[float]:
+    """3 values per target, or the same 3 for every target"""
+    offset = 0 if len(channel) == 3 else index * 3
+    return channel[offset:offset + 3]
+
+
+def _glob(pattern: str) -> Callable[[str], bool]:
+    """Like MCPQuery.Glob: '*' within one path level, '**' across levels, '?' one character"""
+    if "*" not in pattern and "?" not in pattern:
+        return lambda text: text == pattern
+    regex = re.escape(pattern).replace(r"\*\*", ".*").replace(r"\*", "[^/]*").replace(r"\?", "[^/]")
+    return re.compile(f"^{regex}$").match
+
+
+def _columns(objects: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """One list per field with vectors flattened, like MCPTools.ToColumns"""
+    columns: Dict[str, Any] = {"count": len(objects)}
+    for obj in objects:
+        for key, value in obj.items():
+            column = columns.setdefault(key, [])
+            if isinstance(value, list):
+                column.extend(value)
+            else:
+                column.append(value)
+    return columns
+
+
+class EmulatedEditor:
+    """Editor state plus one method per tool; not thread-safe by design.
+
+    The HTTP front end only calls `execute` from its single main-thread loop,
+    the same way MCPServer.ProcessRequests calls MCPTools.Execute.
+    `latency` maps tool names to a simulated execution cost in seconds
+    (unlisted tools cost `default_latency`); unity_batch entries each pay
+    their own cost.
+    """
+
+    def __init__(
+        self,
+        scene: Optional[Scene] = None,
+        latency: Optional[Dict[str, float]] = None,
+        default_latency: float = 0.0,
+    ):
+        self.scene = scene or Scene.default()
+        self.latency = dict(latency or {})
+        self.default_latency = default_latency
+        self.executed = 0
+        # Like MCPChangeTracker.SceneVersion; read by the status endpoint
+        self.scene_version = int(time.time() * 1000)
+        self.hierarchy = HierarchyTracker()
+        self.spatial = SpatialIndex()
+        self.saved_scenes: Dict[str, Scene] = {}
+        # Prefab assets by path; there is no asset database, so callers put them here
+        self.prefabs: Dict[str, GameObject] = {}
+        self.build_scenes: List[str] = []
+        self.tags = list(DEFAULT_TAGS)
+        self.logs: List[Dict[str, Any]] = []
+        # Like MCPLogs.LogSequence; notified on every log, for long-polls
+        self.log_sequence = 0
+        self.log_signal = threading.Condition()
+        # Set by JobTable while a job runs, for report_progress
+        self.on_progress: Optional[Callable[[float, str], None]] = None
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            # Core
+            "unity_ping": self.ping,
+            "unity_get_scene_info": self.get_scene_info,
+            "unity_list_all_gameobjects": self.list_all_gameobjects,
+            "unity_query_gameobjects": self.query_gameobjects,
+            "unity_spatial_query": self.spatial_query,
+            "unity_is_compiling": self.is_compiling,
+            "unity_wait_for_compile": self.wait_for_compile,
+            "unity_get_logs": self.get_logs,
+            "unity_test_log": self.test_log,
+
+            # Scene Management
+            "unity_create_scene": self.create_scene,
+            "unity_save_scene": self.save_scene,
+            "unity_load_scene": self.load_scene,
+            "unity_add_scene_to_build": self.add_scene_to_build,
+
+            # GameObject Management
+            "unity_create_primitive": self.create_primitive,
+            "unity_delete_gameobject": self.delete_gameobject,
+            "unity_find_gameobject": self.find_gameobject,
+            "unity_set_position": self.set_position,
+            "unity_set_parent": self.set_parent,
+            "unity_set_rotation": self.set_rotation,
+            "unity_set_scale": self.set_scale,
+            "unity_set_transforms": self.set_transforms,
+            "unity_set_tag": self.set_tag,
+            "unity_set_camera_background": self.set_camera_background,
+            "unity_add_particle_trail": self.add_particle_trail,
+
+            # UI
+            "unity_ui_create_canvas": self.ui_create_canvas,
+            "unity_ui_create_event_system": self.ui_create_event_system,
+            "unity_ui_create_button": self.ui_create_button,
+            "unity_ui_create_text": self.ui_create_text,
+            "unity_ui_create_image": self.ui_create_image,
+            "unity_ui_create_panel": self.ui_create_panel,
+            "unity_ui_create_layout": self.ui_create_layout,
+            "unity_ui_set_sprite": self.ui_set_sprite,
+            "unity_set_anchors": self.set_anchors,
+            "unity_set_ui_size": self.set_ui_size,
+            "unity_set_image_fill": self.set_image_fill,
+
+            # Components
+            "unity_add_component": self.add_component,
+            "unity_add_script_component": self.add_script_component,
+            "unity_remove_component": self.remove_component,
+
+            # Prefabs
+            "unity_save_prefab": self.save_prefab,
+            "unity_update_prefab": self.update_prefab,
+
+            # Batch Execution
+            "unity_batch": self.batch,
+        }
+
+    def execute(self, tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one tool call; exceptions become error responses"""
+        handler = self.handlers.get(tool)
+        if tool != "unity_batch":
+            cost = self.latency.get(tool, self.default_latency)
+            if cost > 0:
+                time.sleep(cost)
+        self.executed += 1
+        published = self.scene.change_count
+        try:
+            if handler is None:
+                raise Exception(f"Unknown tool: {tool}")
+            result = handler(args or {})
+        except Exception as e:
+            return _error(str(e))
+
+        if result.get("success") and tool not in NO_SCENE_CHANGE:
+            self.scene_version += 1
+            # Like hierarchyChanged with no ObjectChangeEvents: nothing says which objects changed
+            if self.scene.change_count == published:
+                self.hierarchy.mark_dirty()
+                self.spatial.invalidate()
+        return result
+
+    def report_progress(self, progress: float, message: str) -> None:
+        """Like MCPJobs.ReportProgress; does nothing unless a job is running"""
+        if self.on_progress is not None:
+            self.on_progress(progress, message)
+
+    def mark_changed(self) -> None:
+        """Bump the scene version, as an edit made by hand in the Editor would"""
+        self.scene_version += 1
+        self.hierarchy.mark_dirty()
+        self.spatial.invalidate()
+
+    def log(self, message: str, log_type: str = "Log") -> None:
+        entry = {"type": log_type, "message": message}
+        self.logs.append(entry)
+        # Like MCPLogs.OnLogMessage: trace lines do not wake long-polls
+        if _is_trace(entry):
+            return
+        with self.log_signal:
+            self.log_sequence += 1
+            self.log_signal.notify_all()
+
+    # ==================== CORE ====================
+
+    def ping(self, args):
+        return {
+            "success": True,
+            "message": "pong",
+            "unityVersion": UNITY_VERSION,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
+        }
+
+    def get_scene_info(self, args):
+        fields = self._fields(args, SCENE_INFO_FIELDS)
+        page_size = args.get("pageSize") or 0
+        offset, scene_changed = self._cursor(args)
+        roots = self.scene.roots
+
+        info = {
+            "sceneName": self.scene.name,
+            "scenePath": self.scene.path,
+            "isLoaded": True,
+            "rootObjectCount": len(roots)
+        }
+        result = {"success": True, **{key: value for key, value in info.items() if key in fields}}
+        if "rootObjects" in fields:
+            start = min(offset, len(roots))
+            end = min(start + page_size, len(roots)) if page_size > 0 else len(roots)
+            result["rootObjects"] = [obj.name for obj in roots[start:end]]
+            if end < len(roots):
+                result["nextCursor"] = self._make_cursor(end)
+            if scene_changed:
+                result["sceneChanged"] = True
+        return result
+
+    # Hierarchy listing helpers, like ParseFields/ParseCursor in MCPTools.cs
+
+    def _fields(self, args, valid: List[str]) -> List[str]:
+        fields = args.get("fields")
+        if not fields:
+            return valid
+        for field in fields:
+            if field not in valid:
+                raise Exception(f"Unknown field '{field}'. Valid fields: {', '.join(valid)}")
+        return fields
+
+    def _cursor(self, args):
+        """(offset, scene changed since the cursor was issued)"""
+        cursor = args.get("cursor")
+        if not cursor:
+            return 0, False
+        offset, _, version = str(cursor).partition(":")
+        if not offset.isdigit() or not version.lstrip("-").isdigit():
+            raise Exception(f"Invalid cursor '{cursor}'")
+        return int(offset), int(version) != self.scene_version
+
+    def _make_cursor(self, offset: int) -> str:
+        return f"{offset}:{self.scene_version}"
+
+    def _columnar(self, args) -> bool:
+        encoding = args.get("encoding") or "rows"
+        if encoding not in ("rows", "columnar"):
+            raise Exception(f"Unknown encoding '{encoding}'. Valid encodings: rows, columnar")
+        return encoding == "columnar"
+
+    def list_all_gameobjects(self, args):
+        fields = self._fields(args, GAMEOBJECT_FIELDS)
+        columnar = self._columnar(args)
+
+        # Delta since an earlier revision; unknown or expired tokens fall through to a full snapshot
+        since = args.get("sinceRevision")
+        # A token from another scene skips the refresh, so the snapshot below can share the tracker's walk
+        if since is not None and self.hierarchy.can_delta(self.scene, int(since)):
+            revision = self.hierarchy.refresh(self.scene)
+            if self.hierarchy.can_delta(self.scene, int(since)):
+                delta = self.hierarchy.delta(int(since))
+                for key in ("added", "changed"):
+                    delta[key] = [{field: obj[field] for field in fields} for obj in delta[key]]
+                if columnar:
+                    for key in ("added", "changed", "removed"):
+                        delta[key] = _columns(delta[key])
+                return {
+                    "success": True,
+                    **delta,
+                    "sceneName": self.scene.name,
+                    "revision": revision,
+                    "sinceRevision": int(since),
+                    "full": False
+                }
+
+        root_path = args.get("rootPath")
+        max_depth = args.get("maxDepth")
+        page_size = args.get("pageSize") or 0
+        offset, scene_changed = self._cursor(args)
+
+        if root_path:
+            root = self.scene.find(root_path)
+            if root is None:
+                return _not_found(root_path)
+            start_objects = [root]
+        else:
+            start_objects = self.scene.roots
+
+        def walk(obj, path, depth):
+            yield obj, path
+            if max_depth is None or depth < max_depth:
+                for child in obj.children:
+                    yield from walk(child, f"{path}/{child.name}", depth + 1)
+
+        objects = []
+        index = 0
+        has_more = False
+
+        def add_to_page(obj, path) -> bool:
+            """False once the page is full"""
+            nonlocal index, has_more
+            if has_more:
+                return False
+            if index >= offset:
+                if page_size > 0 and len(objects) >= page_size:
+                    has_more = True
+                    return False
+                snapshot = {
+                    "instanceId": obj.instance_id,
+                    "name": obj.name,
+                    "path": path,
+                    "active": obj.active_in_hierarchy,
+                    "tag": obj.tag,
+                    "layer": obj.layer,
+                    "position": obj.position
+                }
+                objects.append({field: snapshot[field] for field in fields})
+            index += 1
+            return True
+
+        # The revision token comes with the first page, and only when asked for
+        want_revision = not args.get("cursor") and (since is not None or bool(args.get("revision")))
+        revision = None
+        if want_revision and not root_path and max_depth is None and self.hierarchy.needs_full_walk(self.scene):
+            # The tracker has to walk the whole scene anyway; it visits objects in the
+            # same order, so one walk fills both
+            revision = self.hierarchy.refresh(self.scene, add_to_page)
+        else:
+            for start in start_objects:
+                if not all(add_to_page(obj, path) for obj, path in walk(start, start.path, 0)):
+                    break
+            if want_revision:
+                revision = self.hierarchy.refresh(self.scene)
+
+        result = {"success": True, "sceneName": self.scene.name}
+        if want_revision:
+            result["revision"] = revision
+            result["full"] = True
+        result["totalObjects"] = len(objects)
+        if columnar:
+            result["columns"] = _columns(objects)
+        else:
+            result["objects"] = objects
+        if has_more:
+            result["nextCursor"] = self._make_cursor(index)
+        if scene_changed:
+            result["sceneChanged"] = True
+        return result
+
+    def query_gameobjects(self, args):
+        where = args.get("where")
+        if where is not None and not isinstance(where, dict):
+            return _error('where must be an object, e.g. {"component": "Enemy", "active": true}')
+        where = where or {}
+        limit = args.get("limit", QUERY_DEFAULT_LIMIT)
+        if limit < 1 or limit > QUERY_MAX_LIMIT:
+            return _error(f"limit must be between 1 and {QUERY_MAX_LIMIT}; got {limit}")
+        fields = self._fields(args, QUERY_FIELDS) if args.get("fields") else None
+        columnar = self._columnar(args)
+        try:
+            predicate = self._compile_query(where, "where")
+        except ValueError as e:
+            return _error(str(e))
+
+        # A top-level 'under' narrows the walk to that subtree
+        if where.get("under"):
+            objects = (found for child in self.scene.find(where["under"]).children for found in child.walk())
+        else:
+            objects = self.scene.walk()
+
+        matches = []
+        scanned = 0
+        truncated = False
+        for obj in objects:
+            scanned += 1
+            if predicate(obj):
+                if len(matches) == limit:
+                    truncated = True
+                    break
+                matches.append(obj)
+
+        result = {"success": True, "count": len(matches), "scanned": scanned, "truncated": truncated}
+        if fields is None:
+            result["handles"] = [obj.handle for obj in matches]
+            return result
+
+        rows = []
+        for obj in matches:
+            snapshot = {
+                "handle": obj.handle,
+                "instanceId": obj.instance_id,
+                "name": obj.name,
+                "path": obj.path,
+                "active": obj.active_in_hierarchy,
+                "tag": obj.tag,
+                "layer": obj.layer,
+                "position": obj.position,
+                "components": list(obj.components)
+            }
+            rows.append({key: value for key, value in snapshot.items() if key == "handle" or key in fields})
+        if columnar:
+            result["columns"] = _columns(rows)
+        else:
+            result["objects"] = rows
+        return result
+
+    def _compile_query(self, where: Dict[str, Any], at: str) -> Callable[[GameObject], bool]:
+        """Like MCPQuery.Compile: every key must hold; ValueError for a bad predicate"""
+        def text(value, label):
+            if not isinstance(value, str) or not value:
+                raise ValueError(f"{label} must be a non-empty string")
+            return value
+
+        def nested(value, label):
+            if not isinstance(value, dict):
+                raise ValueError(f"{label} must be a predicate object")
+            return value
+
+        parts = []
+        for key, value in where.items():
+            label = f"{at}.{key}"
+            if key == "name":
+                match_name = _glob(text(value, label))
+                parts.append(lambda obj, match=match_name: bool(match(obj.name)))
+            elif key == "path":
+                match_path = _glob(text(value, label).lstrip("/"))
+                parts.append(lambda obj, match=match_path: bool(match(obj.path)))
+            elif key == "tag":
+                tag = text(value, label)
+                if tag not in self.tags:
+                    raise ValueError(f"{label}: unknown tag '{tag}'")
+                parts.append(lambda obj, tag=tag: obj.tag == tag)
+            elif key == "layer":
+                if isinstance(value, int) and not isinstance(value, bool):
+                    if value < 0 or value > 31:
+                        raise ValueError(f"{label} must be a layer name or an index from 0 to 31; got {value}")
+                    layer = BUILTIN_LAYERS[value] if value < len(BUILTIN_LAYERS) else ""
+                else:
+                    layer = text(value, label)
+                    if layer not in BUILTIN_LAYERS:
+                        raise ValueError(f"{label}: unknown layer '{layer}'")
+                parts.append(lambda obj, layer=layer: obj.layer == layer)
+            elif key == "component":
+                # Emulated objects hold component names, so any name resolves
+                names = value if isinstance(value, list) else [value]
+                for name in names:
+                    short_name = text(name, label).split(".")[-1]
+                    parts.append(lambda obj, component=short_name: obj.has(component))
+            elif key == "active":
+                if not isinstance(value, bool):
+                    raise ValueError(f"{label} must be true or false")
+                parts.append(lambda obj, active=value: obj.active_in_hierarchy == active)
+            elif key == "under":
+                name = text(value, label)
+                root = self.scene.find(name)
+                if root is None:
+                    raise ValueError(f"GameObject '{name}' not found")
+                parts.append(lambda obj, root=root: self._below(obj, root))
+            elif key == "any":
+                if not isinstance(value, list) or not value:
+                    raise ValueError(f"{label} must be a non-empty array of predicates")
+                options = [
+                    self._compile_query(nested(option, f"{label}[{i}]"), f"{label}[{i}]")
+                    for i, option in enumerate(value)
+                ]
+                parts.append(lambda obj, options=options: any(option(obj) for option in options))
+            elif key == "not":
+                negated = self._compile_query(nested(value, label), label)
+                parts.append(lambda obj, negated=negated: not negated(obj))
+            else:
+                raise ValueError(f"Unknown predicate '{label}'. Valid predicates: {', '.join(QUERY_PREDICATES)}")
+
+        return lambda obj: all(part(obj) for part in parts)
+
+    @staticmethod
+    def _below(obj: GameObject, root: GameObject) -> bool:
+        parent = obj.parent
+        while parent is not None:
+            if parent is root:
+                return True
+            parent = parent.parent
+        return False
+
+    def spatial_query(self, args):
+        query = args.get("query")
+        limit = args.get("limit", SPATIAL_DEFAULT_LIMIT)
+        if limit < 1 or limit > SPATIAL_MAX_LIMIT:
+            return _error(f"limit must be between 1 and {SPATIAL_MAX_LIMIT}; got {limit}")
+
+        def vector(key):
+            value = args.get(key)
+            if not isinstance(value, list) or len(value) != 3:
+                raise ValueError(f"{query} query needs {key} as [x, y, z]")
+            return [float(v) for v in value]
+
+        rebuilt, refitted = self.spatial.refresh(self.scene)
+        index = self.spatial
+        try:
+            if query == "radius":
+                center = vector("center")
+                radius = args.get("radius", -1)
+                if radius < 0:
+                    return _error("radius query needs a radius of 0 or more")
+                hits = index.collect(
+                    lambda box: sqr_distance(box, center) <= radius * radius,
+                    lambda box: math.sqrt(sqr_distance(box, center))
+                )
+            elif query == "box":
+                low, high = vector("boundsMin"), vector("boundsMax")
+                box_min = [min(a, b) for a, b in zip(low, high)]
+                box_max = [max(a, b) for a, b in zip(low, high)]
+                center = [(a + b) / 2 for a, b in zip(box_min, box_max)]
+                hits = index.collect(
+                    lambda box: intersects(box, (box_min, box_max)),
+                    lambda box: math.sqrt(sqr_distance(box, center))
+                )
+            elif query == "nearest":
+                hits = index.nearest(vector("center"), limit, args.get("maxDistance", math.inf))
+            elif query == "raycast":
+                origin, direction = vector("origin"), vector("direction")
+                length = math.sqrt(sum(value * value for value in direction))
+                if length < 1e-6:
+                    return _error("raycast direction must not be zero")
+                direction = [value / length for value in direction]
+                max_distance = args.get("maxDistance", math.inf)
+
+                def hit_distance(box):
+                    distance = ray_distance(box, origin, direction)
+                    return distance if distance is not None and distance <= max_distance else None
+
+                hits = index.collect(lambda box: hit_distance(box) is not None, hit_distance)
+            else:
+                return _error(f"Unknown query '{query}'. Valid queries: radius, box, nearest, raycast")
+        except ValueError as e:
+            return _error(str(e))
+
+        hits.sort(key=lambda hit: hit[1])
+        results = []
+        for member, distance in hits[:limit]:
+            obj = index.entries[member].obj
+            hit = {"handle": obj.handle, "name": obj.name, "distance": distance}
+            if query == "raycast":
+                hit["point"] = [start + step * distance for start, step in zip(origin, direction)]
+            results.append(hit)
+
+        return {
+            "success": True,
+            "query": query,
+            "count": len(results),
+            "truncated": len(hits) > limit,
+            "hits": results,
+            "index": {"objects": len(index.entries), "rebuilt": rebuilt, "refitted": refitted}
+        }
+
+    def is_compiling(self, args):
+        return {"success": True, "isCompiling": False, "message": "Unity is idle"}
+
+    def wait_for_compile(self, args):
+        return {
+            "success": True,
+            "message": "Unity is not compiling, ready to proceed",
+            "isCompiling": False,
+            "waitedSeconds": 0
+        }
+
+    def get_logs(self, args):
+        count = int(args.get("count", 50))
+        types = args.get("types") or None
+        contains = (args.get("contains") or "").lower()
+        pattern = args.get("pattern")
+        since = args.get("sinceIndex")
+
+        for log_type in types or []:
+            if log_type not in LOG_TYPES:
+                raise Exception(f"Unknown log type '{log_type}'. Valid types: {', '.join(LOG_TYPES)}")
+        try:
+            regex = re.compile(pattern) if pattern else None
+        except re.error as e:
+            raise Exception(f"Invalid pattern: {e}")
+
+        def matches(entry):
+            return (not _is_trace(entry)
+                    and (types is None or entry["type"] in types)
+                    and contains in entry["message"].lower()
+                    and (regex is None or regex.search(entry["message"])))
+
+        total = len(self.logs)
+        next_index = total
+        reset = False
+        logs = []
+        if since is not None:
+            # Oldest first from the cursor, stopping once `count` entries match
+            start = int(since)
+            if start > total:
+                # Console was cleared since the cursor was issued
+                start, reset = 0, True
+            for index in range(start, total):
+                if matches(self.logs[index]):
+                    logs.append({"index": index, **self.logs[index]})
+                    if len(logs) >= count:
+                        next_index = index + 1
+                        break
+        else:
+            # Newest `count` matching entries, returned oldest first
+            for index in range(total - 1, -1, -1):
+                if len(logs) >= count:
+                    break
+                if matches(self.logs[index]):
+                    logs.append({"index": index, **self.logs[index]})
+            logs.reverse()
+
+        result = {
+            "success": True,
+            "totalCount": total,
+            "returnedCount": len(logs),
+            "nextIndex": next_index,
+            "logs": logs
+        }
+        if reset:
+            result["reset"] = True
+        return result
+
+    def test_log(self, args):
+        message = args.get("message", "Test log from MCP")
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        full_message = f"TEST LOG [{timestamp}]: {message}"
+        self.log(full_message)
+        self.log(f"TEST WARNING [{timestamp}]: This is a test warning", "Warning")
+        return {
+            "success": True,
+            "message": "Test log written to Unity console",
+            "timestamp": timestamp,
+            "loggedMessage": full_message
+        }
+
+    # ==================== SCENE MANAGEMENT ====================
+
+    def create_scene(self, args):
+        name = args.get("name")
+        if not name:
+            return _error("Scene name is required")
+        path = os.path.join(args.get("path", "Assets/Scenes/"), name + ".unity")
+
+        if args.get("setup", "Default") == "Empty":
+            self.scene = Scene(name, path)
+        else:
+            self.scene = Scene.default(name, path)
+        self.saved_scenes[path] = copy.deepcopy(self.scene)
+
+        self.log(f"[MCP] Created scene: {path}")
+        return {"success": True, "sceneName": name, "scenePath": path}
+
+    def save_scene(self, args):
+        path = args.get("path")
+        if path:
+            self.scene.path = path
+            self.scene.name = os.path.splitext(os.path.basename(path))[0]
+        if not self.scene.path:
+            return _error("Failed to save scene")
+        self.saved_scenes[self.scene.path] = copy.deepcopy(self.scene)
+
+        self.log(f"[MCP] Saved scene: {self.scene.path}")
+        return {"success": True, "scenePath": self.scene.path, "sceneName": self.scene.name}
+
+    def load_scene(self, args):
+        scene_name = args.get("sceneName")
+        if not scene_name:
+            return _error("Scene name is required")
+        path = next((path for path in self.saved_scenes if scene_name in os.path.basename(path)), None)
+        if path is None:
+            return _error(f"Scene '{scene_name}' not found")
+
+        self.scene = copy.deepcopy(self.saved_scenes[path])
+        self.log(f"[MCP] Loaded scene: {path}")
+        return {
+            "success": True,
+            "sceneName": self.scene.name,
+            "scenePath": self.scene.path,
+            "rootObjectCount": len(self.scene.roots)
+        }
+
+    def add_scene_to_build(self, args):
+        scene_path = args.get("scenePath")
+        if not scene_path:
+            return _error("Scene path is required")
+        if scene_path in self.build_scenes:
+            return {
+                "success": True,
+                "message": f"Scene '{scene_path}' is already in build settings",
+                "buildIndex": self.build_scenes.index(scene_path)
+            }
+        self.build_scenes.append(scene_path)
+        return {
+            "success": True,
+            "scenePath": scene_path,
+            "buildIndex": len(self.build_scenes) - 1,
+            "totalScenes": len(self.build_scenes)
+        }
+
+    # ==================== GAMEOBJECT MANAGEMENT ====================
+
+    def create_primitive(self, args):
+        name = args.get("name", "Primitive")
+        primitive_type = args.get("primitiveType", "Cube")
+        position = args.get("position")
+        collider = PRIMITIVE_TYPES.get(primitive_type.lower(), "BoxCollider")
+
+        obj = self.scene.add(GameObject(name, ["MeshFilter", "MeshRenderer", collider]))
+        if position is not None and len(position) == 3:
+            obj.position = position
+
+        self.log(f"[MCP] Created {primitive_type} primitive '{name}' at {tuple(obj.position)}")
+        return {
+            "success": True,
+            "name": obj.name,
+            "primitiveType": primitive_type,
+            "position": obj.position,
+            "instanceId": obj.instance_id,
+            "handle": obj.handle
+        }
+
+    def delete_gameobject(self, args):
+        name = args.get("name")
+        if not name:
+            return _error("GameObject name is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        path = obj.path
+        self.scene.detach(obj)
+        self.log(f"[MCP] Deleted GameObject: {name}")
+        return {"success": True, "message": f"Deleted GameObject: {path}"}
+
+    def find_gameobject(self, args):
+        name = args.get("name")
+        if not name:
+            return _error("GameObject name is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+        return {
+            "success": True,
+            "name": obj.name,
+            "path": obj.path,
+            "position": obj.position,
+            "active": obj.active,
+            "instanceId": obj.instance_id,
+            "handle": obj.handle
+        }
+
+    def set_position(self, args):
+        name = args.get("name")
+        position = args.get("position")
+        if not name:
+            return _error("GameObject name is required")
+        if not isinstance(position, list) or len(position) != 3:
+            return _error("Position must be an array of 3 numbers [x, y, z]")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        obj.position = position
+        self.scene.publish(obj)
+        return {"success": True, "name": name, "newPosition": obj.position}
+
+    def set_parent(self, args):
+        name = args.get("name")
+        parent_name = args.get("parent")
+        if not name:
+            return _error("GameObject name is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        parent = None
+        if parent_name:
+            parent = self.scene.find(parent_name)
+            if parent is None:
+                return _error(f"Parent GameObject '{parent_name}' not found")
+
+        self.scene.set_parent(obj, parent, args.get("worldPositionStays", True))
+        return {"success": True, "name": name, "parent": parent.name if parent else "none"}
+
+    def set_rotation(self, args):
+        name = args.get("name")
+        rotation = args.get("rotation")
+        if not name:
+            return _error("GameObject name is required")
+        if not isinstance(rotation, list) or len(rotation) != 3:
+            return _error("Rotation must be an array of 3 numbers [x, y, z] in degrees")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        obj.rotation = [float(v) for v in rotation]
+        self.scene.publish(obj)
+        return {"success": True, "name": name, "newRotation": obj.rotation}
+
+    def set_scale(self, args):
+        name = args.get("name")
+        scale = args.get("scale")
+        if not name:
+            return _error("GameObject name is required")
+        if not isinstance(scale, list) or len(scale) != 3:
+            return _error("Scale must be an array of 3 numbers [x, y, z]")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        obj.scale = [float(v) for v in scale]
+        self.scene.publish(obj)
+        return {"success": True, "name": name, "newScale": obj.scale}
+
+    def set_transforms(self, args):
+        """Like MCPTransforms.SetTransforms. There is no parent rotation here, so
+        world and local rotations are the same and relative ones add as Euler angles."""
+        targets = args.get("targets")
+        if not isinstance(targets, list) or not targets:
+            return _error("targets must be a non-empty array of GameObject names, paths or handles")
+        space = args.get("space", "world")
+        if space not in ("world", "local"):
+            return _error(f"Unknown space '{space}'. Use 'world' or 'local'")
+        relative = bool(args.get("relative", False))
+        count = len(targets)
+
+        if args.get("packed") is not None:
+            channels = self._packed_transforms(args, count)
+        else:
+            channels = self._transform_arrays(args, count)
+        if isinstance(channels, str):
+            return _error(channels)
+        if not any(channels):
+            return _error("Nothing to set: pass positions, rotations, scales or packed")
+
+        found, missing = [], []
+        for target in targets:
+            obj = self.scene.find(str(target))
+            if obj is None:
+                missing.append(target)
+            found.append(obj)
+        if missing and not args.get("skipMissing", False):
+            listed = ", ".join(f"'{name}'" for name in missing[:MAX_LISTED_MISSING])
+            if len(missing) > MAX_LISTED_MISSING:
+                listed += f" and {len(missing) - MAX_LISTED_MISSING} more"
+            return _error(f"{len(missing)} of {count} targets not found: {listed}. "
+                          "Nothing was changed; pass skipMissing to update the rest")
+
+        positions, rotations, scales = channels
+        for index, obj in enumerate(found):
+            if obj is None:
+                continue
+            if positions:
+                value = _vector(positions, index)
+                if space == "world":
+                    current = obj.position
+                    obj.position = [c + v for c, v in zip(current, value)] if relative else value
+                else:
+                    current = obj.local_position
+                    obj.local_position = [c + v for c, v in zip(current, value)] if relative else value
+            if rotations:
+                value = _vector(rotations, index)
+                obj.rotation = [c + v for c, v in zip(obj.rotation, value)] if relative else value
+            if scales:
+                value = _vector(scales, index)
+                obj.scale = [c * v for c, v in zip(obj.scale, value)] if relative else value
+            self.scene.publish(obj)
+
+        result = {"success": True, "updated": count - len(missing), "space": space, "relative": relative}
+        if missing:
+            result["notFound"] = missing
+        return result
+
+    def _transform_arrays(self, args, count: int):
+        channels = []
+        for key in TRANSFORM_ARRAYS:
+            values = args.get(key)
+            if values is None:
+                channels.append(None)
+                continue
+            if not isinstance(values, list) or len(values) not in (count * 3, 3):
+                got = len(values) if isinstance(values, list) else 0
+                return f"{key} must hold 3 numbers per target ({count * 3}), or 3 for all of them; got {got}"
+            channels.append([float(v) for v in values])
+        return channels
+
+    def _packed_transforms(self, args, count: int):
+        if any(args.get(key) is not None for key in TRANSFORM_ARRAYS):
+            return "Pass either packed or positions/rotations/scales, not both"
+        slots = []
+        for name in args.get("packedChannels") or ["position"]:
+            if name not in TRANSFORM_CHANNELS:
+                return f"Unknown packed channel '{name}'. Use position, rotation or scale"
+            if TRANSFORM_CHANNELS.index(name) in slots:
+                return f"packedChannels lists '{name}' twice"
+            slots.append(TRANSFORM_CHANNELS.index(name))
+        try:
+            data = base64.b64decode(args["packed"], validate=True)
+        except ValueError:
+            return "packed is not valid base64"
+        stride = len(slots) * 3
+        expected = count * stride * 4
+        if len(data) != expected:
+            return (f"packed holds {len(data)} bytes; {count} targets with {len(slots)} channels "
+                    f"need {expected} ({stride} float32s each)")
+
+        floats = struct.unpack(f"<{count * stride}f", data)
+        channels = [None, None, None]
+        for slot, channel in enumerate(slots):
+            channels[channel] = [
+                value
+                for index in range(count)
+                for value in floats[index * stride + slot * 3:index * stride + slot * 3 + 3]
+            ]
+        return channels
+
+    def set_tag(self, args):
+        name = args.get("name")
+        tag = args.get("tag")
+        if not name:
+            return _error("GameObject name is required")
+        if not tag:
+            return _error("Tag is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        if tag not in self.tags:
+            self.tags.append(tag)
+        obj.tag = tag
+        self.scene.publish(obj)
+        return {"success": True, "name": name, "tag": tag}
+
+    def set_camera_background(self, args):
+        camera_name = args.get("cameraName", "Main Camera")
+        clear_flags = args.get("clearFlags")
+        color = args.get("backgroundColor")
+
+        obj = self.scene.find(camera_name)
+        if (obj is None or not obj.has("Camera")) and camera_name == "Main Camera":
+            obj = next((o for o in self.scene.walk() if o.tag == "MainCamera" and o.has("Camera")), None)
+        if obj is None or not obj.has("Camera"):
+            return _error(f"Camera '{camera_name}' not found")
+
+        camera = obj.properties.setdefault("Camera", {"clearFlags": "Skybox", "backgroundColor": [0, 0, 0, 0]})
+        if clear_flags:
+            if clear_flags.lower() not in CLEAR_FLAGS:
+                return _error(f"Unknown clearFlags '{clear_flags}'. Valid options: skybox, solidcolor, depth, nothing")
+            camera["clearFlags"] = CLEAR_FLAGS[clear_flags.lower()]
+        if isinstance(color, list) and len(color) >= 3:
+            camera["backgroundColor"] = [float(c) for c in color[:3]] + [float(color[3]) if len(color) >= 4 else 1.0]
+
+        return {
+            "success": True,
+            "cameraName": camera_name,
+            "clearFlags": camera["clearFlags"],
+            "backgroundColor": camera["backgroundColor"]
+        }
+
+    def add_particle_trail(self, args):
+        name = args.get("name")
+        if not name:
+            return _error("GameObject name is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        settings = {
+            "color": args.get("color", "yellow"),
+            "emissionRate": args.get("emissionRate", 50),
+            "startSize": args.get("startSize", 0.3),
+            "startLifetime": args.get("startLifetime", 0.3)
+        }
+        obj.add_component("ParticleSystem", **settings)
+        obj.add_component("ParticleSystemRenderer")
+        self.scene.structure_version += 1
+        return {"success": True, "name": name, **settings}
+
+    # ==================== UI TOOLS ====================
+
+    def _ui_parent(self, parent_name: str, hint: str = "") -> GameObject:
+        parent = self.scene.find(parent_name)
+        if parent is None:
+            raise Exception(f"Parent '{parent_name}' not found{hint}")
+        return parent
+
+    def _ui_element(self, name: str, parent: GameObject, size: List[float], position=None, components=()) -> GameObject:
+        obj = self.scene.add(GameObject(name, ["RectTransform", *components]), parent)
+        obj.properties["RectTransform"] = {
+            "anchorMin": [0.5, 0.5],
+            "anchorMax": [0.5, 0.5],
+            "anchoredPosition": [float(v) for v in (position or [0, 0])[:2]],
+            "sizeDelta": [float(v) for v in size[:2]]
+        }
+        return obj
+
+    def _create_event_system(self) -> GameObject:
+        return self.scene.add(GameObject("EventSystem", ["EventSystem", "StandaloneInputModule"]))
+
+    def ui_create_canvas(self, args):
+        name = args.get("name", "Canvas")
+        preset = args.get("preset")
+
+        existing = self.scene.find_with_component("Canvas")
+        if existing is not None and existing.name == name:
+            return {"success": True, "message": "Canvas already exists", "canvasPath": existing.path,
+                    "handle": existing.handle}
+
+        resolution, match = CANVAS_PRESETS.get((preset or "").lower(), ([1920, 1080], 0.5))
+        if args.get("referenceResolution") and len(args["referenceResolution"]) == 2:
+            resolution = args["referenceResolution"]
+        if args.get("matchValue") is not None:
+            match = args["matchValue"]
+
+        canvas = self.scene.add(GameObject(name, ["RectTransform", "Canvas", "CanvasScaler", "GraphicRaycaster"]))
+        canvas.properties["Canvas"] = {
+            "renderMode": args.get("renderMode", "ScreenSpaceOverlay"),
+            "sortingOrder": args.get("sortingOrder", 0),
+            "pixelPerfect": args.get("pixelPerfect", False)
+        }
+        canvas.properties["CanvasScaler"] = {"referenceResolution": resolution, "matchWidthOrHeight": match}
+        if self.scene.find_with_component("EventSystem") is None:
+            self._create_event_system()
+
+        self.log(f"[MCP] Created canvas: {name}")
+        return {
+            "success": True,
+            "canvasPath": canvas.path,
+            "handle": canvas.handle,
+            "renderMode": canvas.properties["Canvas"]["renderMode"],
+            "referenceResolution": resolution,
+            "matchValue": match,
+            "components": ["Canvas", "CanvasScaler", "GraphicRaycaster"]
+        }
+
+    def ui_create_event_system(self, args):
+        existing = self.scene.find_with_component("EventSystem")
+        if existing is not None:
+            return {"success": True, "message": "EventSystem already exists", "path": existing.path,
+                    "handle": existing.handle}
+        obj = self._create_event_system()
+        return {"success": True, "path": obj.path, "handle": obj.handle, "components": ["EventSystem", "StandaloneInputModule"]}
+
+    def ui_create_button(self, args):
+        parent = self._ui_parent(args.get("parent", "Canvas"), ". Create a canvas first.")
+        button = self._ui_element(args.get("name", "Button"), parent, args.get("size") or [200, 60], args.get("position"), ["Image", "Button"])
+        text = self._ui_element("Text", button, [0, 0], components=["TextMeshProUGUI"])
+        text.properties["TextMeshProUGUI"] = {"text": args.get("text", "Button"), "fontSize": args.get("textSize", 24)}
+
+        self.log(f"[MCP] Created button: {button.name}")
+        return {
+            "success": True,
+            "buttonPath": button.path,
+            "textPath": text.path,
+            "handle": button.handle,
+            "textHandle": text.handle,
+            "components": ["Button", "Image", "RectTransform"]
+        }
+
+    def ui_create_text(self, args):
+        parent = self._ui_parent(args.get("parent", "Canvas"))
+        text = self._ui_element(args.get("name", "Text"), parent, args.get("size") or [200, 50], args.get("position"), ["TextMeshProUGUI"])
+        text.properties["TextMeshProUGUI"] = {
+            "text": args.get("text", "Text"),
+            "fontSize": args.get("fontSize", 24),
+            "color": args.get("color", "#FFFFFF")
+        }
+        return {"success": True, "textPath": text.path, "handle": text.handle, "components": ["TextMeshProUGUI", "RectTransform"]}
+
+    def ui_create_image(self, args):
+        parent = self._ui_parent(args.get("parent", "Canvas"))
+        image = self._ui_element(args.get("name", "Image"), parent, args.get("size") or [100, 100], args.get("position"), ["Image"])
+        image.properties["Image"] = {"color": args.get("color", "#FFFFFF")}
+        return {"success": True, "imagePath": image.path, "handle": image.handle, "components": ["Image", "RectTransform"]}
+
+    def ui_create_panel(self, args):
+        parent = self._ui_parent(args.get("parent", "Canvas"))
+        panel = self._ui_element(args.get("name", "Panel"), parent, [0, 0], components=["Image"])
+        panel.properties["RectTransform"].update({"anchorMin": [0, 0], "anchorMax": [1, 1]})
+        panel.properties["Image"] = {"color": args.get("color", "#000000AA")}
+        return {"success": True, "panelPath": panel.path, "handle": panel.handle, "components": ["Image", "RectTransform"]}
+
+    def ui_create_layout(self, args):
+        layout_type = args.get("layoutType", "vertical")
+        component, size = {
+            "vertical": ("VerticalLayoutGroup", [200, 400]),
+            "horizontal": ("HorizontalLayoutGroup", [400, 100]),
+            "grid": ("GridLayoutGroup", [400, 400]),
+        }.get(layout_type.lower(), ("VerticalLayoutGroup", [200, 400]))
+
+        parent = self._ui_parent(args.get("parent", "Canvas"))
+        layout = self._ui_element(args.get("name", "LayoutGroup"), parent, size, components=[component])
+        layout.properties[component] = {"spacing": args.get("spacing", 10)}
+        return {
+            "success": True,
+            "layoutPath": layout.path,
+            "handle": layout.handle,
+            "layoutType": layout_type,
+            "components": [component, "RectTransform"]
+        }
+
+    def ui_set_sprite(self, args):
+        object_path = args.get("objectPath")
+        sprite_path = args.get("spritePath")
+        if not object_path:
+            return _error("objectPath is required")
+        if not sprite_path:
+            return _error("spritePath is required")
+        obj = self.scene.find(object_path)
+        if obj is None:
+            raise Exception(f"GameObject '{object_path}' not found")
+        if not obj.has("Image"):
+            raise Exception(f"GameObject '{object_path}' does not have an Image component")
+
+        sprite_name = args.get("spriteName") or os.path.splitext(os.path.basename(sprite_path))[0]
+        obj.properties.setdefault("Image", {})["sprite"] = sprite_path
+        return {"success": True, "objectPath": object_path, "spriteName": sprite_name, "spritePath": sprite_path}
+
+    def _rect_transform(self, name: str):
+        obj = self.scene.find(name)
+        if obj is None:
+            return None, _not_found(name)
+        if not obj.has("RectTransform"):
+            return None, _error(f"GameObject '{name}' does not have a RectTransform (not a UI element)")
+        return obj.properties.setdefault("RectTransform", {
+            "anchorMin": [0.5, 0.5], "anchorMax": [0.5, 0.5], "anchoredPosition": [0, 0], "sizeDelta": [100, 100]
+        }), None
+
+    def set_anchors(self, args):
+        name = args.get("name")
+        preset = args.get("preset")
+        if not name:
+            return _error("GameObject name is required")
+        rect, error = self._rect_transform(name)
+        if error:
+            return error
+
+        if preset:
+            if preset.lower() not in ANCHOR_PRESETS:
+                return _error(f"Unknown preset '{preset}'. Valid presets: {', '.join(ANCHOR_PRESETS)}")
+            rect["anchorMin"], rect["anchorMax"] = (list(v) for v in ANCHOR_PRESETS[preset.lower()])
+        for key in ("anchorMin", "anchorMax", "anchoredPosition"):
+            value = args.get(key)
+            if isinstance(value, list) and len(value) == 2:
+                rect[key] = [float(v) for v in value]
+
+        return {
+            "success": True,
+            "name": name,
+            "anchorMin": rect["anchorMin"],
+            "anchorMax": rect["anchorMax"],
+            "anchoredPosition": rect["anchoredPosition"]
+        }
+
+    def set_ui_size(self, args):
+        name = args.get("name")
+        size = args.get("size")
+        if not name:
+            return _error("GameObject name is required")
+        if not isinstance(size, list) or len(size) != 2:
+            return _error("Size must be an array of [width, height]")
+        rect, error = self._rect_transform(name)
+        if error:
+            return error
+
+        rect["sizeDelta"] = [float(v) for v in size]
+        return {"success": True, "name": name, "size": rect["sizeDelta"]}
+
+    def set_image_fill(self, args):
+        name = args.get("name")
+        fill_method = args.get("fillMethod")
+        if not name:
+            return _error("GameObject name is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+        if not obj.has("Image"):
+            return _error(f"GameObject '{name}' does not have an Image component")
+
+        image = obj.properties.setdefault("Image", {})
+        image["type"] = "Filled"
+        image.setdefault("fillMethod", "Radial360")
+        image.setdefault("fillOrigin", 0)
+        if fill_method:
+            if fill_method.lower() not in FILL_METHODS:
+                return _error(f"Unknown fill method '{fill_method}'. Valid options: horizontal, vertical, radial90, radial180, radial360")
+            image["fillMethod"] = FILL_METHODS[fill_method.lower()]
+        image["fillAmount"] = float(args.get("fillAmount", 1.0))
+
+        return {"success": True, "name": name, "fillMethod": image["fillMethod"], "fillOrigin": image["fillOrigin"]}
+
+    # ==================== COMPONENTS ====================
+
+    def add_component(self, args):
+        name = args.get("gameObjectName")
+        component = args.get("componentType")
+        if not name:
+            return _error("GameObject name is required")
+        if not component:
+            return _error("Component type is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        obj.add_component(component.split(".")[-1])
+        self.scene.structure_version += 1
+        return {"success": True, "gameObject": name, "component": component}
+
+    def add_script_component(self, args):
+        name = args.get("gameObjectName")
+        script = args.get("scriptName")
+        if not name:
+            return _error("GameObject name is required")
+        if not script:
+            return _error("Script name is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        obj.add_component(script)
+        self.scene.structure_version += 1
+        return {"success": True, "gameObject": name, "scriptName": script}
+
+    def remove_component(self, args):
+        name = args.get("gameObjectName")
+        component = args.get("componentType")
+        if not name:
+            return _error("GameObject name is required")
+        if not component:
+            return _error("Component type is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+
+        short_name = component.split(".")[-1]
+        if not obj.has(short_name) or short_name == "Transform":
+            return _error(f"Component '{component}' not found on GameObject '{name}'")
+        obj.components.remove(short_name)
+        self.scene.structure_version += 1
+        obj.properties.pop(short_name, None)
+        return {
+            "success": True,
+            "gameObject": name,
+            "component": component,
+            "message": f"Removed {component} from {name}"
+        }
+
+    # ==================== PREFABS ====================
+
+    def save_prefab(self, args):
+        """Like SaveAsPrefab: stores a copy of the object and its children in `prefabs`"""
+        name = args.get("gameObjectName")
+        path = args.get("prefabPath")
+        if not name:
+            return _error("GameObject name is required")
+        if not path:
+            return _error("Prefab path is required")
+        obj = self.scene.find(name)
+        if obj is None:
+            return _not_found(name)
+        if not path.startswith("Assets/"):
+            path = "Assets/" + path
+        if not path.endswith(".prefab"):
+            path += ".prefab"
+
+        # Copy the subtree only, not the parent it hangs from
+        self.prefabs[path] = copy.deepcopy(obj, {id(obj.parent): None})
+        self.log(f"[MCP] Created prefab: {path}")
+        return {"success": True, "prefabPath": path, "gameObjectName": name}
+
+    def update_prefab(self, args):
+        """Like MCPPrefabs.UpdatePrefab: every operation on one copy, saved once"""
+        path = args.get("prefabPath")
+        if not path:
+            return _error("Prefab path is required")
+        if not path.startswith("Assets/"):
+            path = "Assets/" + path
+        if not path.endswith(".prefab"):
+            path += ".prefab"
+        if path not in self.prefabs:
+            return _error(f"Prefab not found: {path}")
+
+        operations = args.get("operations")
+        single = operations is None
+        if single:
+            if args.get("action") is None:
+                return _error("Pass operations, or a single action")
+            operations = [args]
+        elif args.get("action") is not None:
+            return _error("Pass either operations or action, not both")
+        if not operations:
+            return _error("operations must not be empty")
+
+        # LoadPrefabContents: edits go to a copy until it is saved
+        root = copy.deepcopy(self.prefabs[path])
+        results = []
+        for i, operation in enumerate(operations):
+            if not isinstance(operation, dict):
+                return _error(f"operations[{i}] must be an object")
+            problem, done = _apply_prefab_operation(root, operation)
+            if problem is not None:
+                where = "" if single else f"operations[{i}] ({operation.get('action')}): "
+                return _error(f"{where}{problem}. Nothing was saved")
+            results.append(done)
+        self.prefabs[path] = root
+
+        self.log(f"[MCP] Updated prefab: {path} - {'; '.join(results)}")
+        result = {
+            "success": True,
+            "prefabPath": path,
+            "modified": True,
+            "operations": len(operations),
+            "results": results,
+        }
+        if single:
+            result["action"] = results[0]
+        return result
+
+    # ==================== BATCH EXECUTION ====================
+
+    def batch(self, args):
+        calls = args.get("calls")
+        if not isinstance(calls, list) or not calls:
+            return _error("calls must be a non-empty array of {tool, args} entries")
+        stop_on_error = args.get("stopOnError", True)
+
+        results = []
+        succeeded = failed = 0
+        stopped_at = None
+        for index, entry in enumerate(calls):
+            if stopped_at is not None:
+                results.append({"success": False, "skipped": True, "error": f"Skipped: entry {stopped_at} failed and stopOnError is set"})
+                continue
+
+            tool = (entry or {}).get("tool")
+            if not tool:
+                result = _error(f"Entry {index} has no tool name")
+            elif tool == "unity_batch":
+                result = _error("Nested unity_batch calls are not supported")
+            elif tool in NOT_BATCHABLE:
+                result = _error(f"{tool} cannot run inside unity_batch; call it on its own")
+            else:
+                result = self.execute(tool, entry.get("args") or {})
+            results.append(result)
+            self.report_progress((index + 1) / len(calls), f"{index + 1}/{len(calls)} entries")
+
+            if result.get("success"):
+                succeeded += 1
+            else:
+                failed += 1
+                if stop_on_error:
+                    stopped_at = index
+
+        return {
+            "success": True,
+            "allSucceeded": failed == 0,
+            "total": len(calls),
+            "succeeded": succeeded,
+            "failed": failed,
+            "skipped": len(calls) - succeeded - failed,
+            "stoppedAt": stopped_at,
+            "results": results
+        }
@@ -0,0 +1,175 @@
+"""Per-object hierarchy revisions, mirroring the tracker in MCPChangeTracker.cs.
+
+`refresh` re-reads only the subtrees of objects the scene published as
+changed (its stand-in for ObjectChangeEvents). It walks the whole scene on
+first use, after a scene change and after `mark_dirty`, which the editor
+calls when a change published nothing. Objects that differ from their last
+known state get the next revision and a change log entry, so a caller
+holding an older revision can be sent just the objects added, changed and
+removed since then.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .scene import GameObject, Scene
+
+MAX_CHANGE_HISTORY = 10000
+
+
+def _snapshot(obj: GameObject, path: str) -> Dict[str, Any]:
+    return {
+        "instanceId": obj.instance_id,
+        "name": obj.name,
+        "path": path,
+        "active": obj.active_in_hierarchy,
+        "tag": obj.tag,
+        "layer": obj.layer,
+        "position": obj.position
+    }
+
+
+class _Tracked:
+    __slots__ = ("obj", "snapshot", "parent_id", "children", "added_revision", "revision")
+
+    def __init__(self, obj: GameObject, added_revision: int):
+        self.obj = obj
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.parent_id = 0
+        self.children = set()
+        self.added_revision = added_revision
+        self.revision = 0
+
+
+class HierarchyTracker:
+    def __init__(self):
+        self.revision = int(time.time() * 1000)
+        self._oldest_delta: Optional[int] = None
+        self._scene: Optional[Scene] = None
+        self._full_walk = True
+        self._tracked: Dict[int, _Tracked] = {}
+        # (revision, instance id, removed path or None, added revision), in revision order
+        self._log: List[tuple] = []
+
+    def mark_dirty(self) -> None:
+        """A change with no object to pin it on: the next refresh walks the whole scene"""
+        self._full_walk = True
+
+    def needs_full_walk(self, scene: Scene) -> bool:
+        return self._full_walk or scene is not self._scene or self._oldest_delta is None
+
+    def refresh(self, scene: Scene, visitor: Optional[Callable[[GameObject, str], Any]] = None) -> int:
+        """When a full walk is needed, `visitor` sees every object with its path in hierarchy order"""
+        if scene is not self._scene or self._oldest_delta is None:
+            # New scene (or first use): start tracking from scratch
+            self._tracked.clear()
+            self._log.clear()
+            self.revision = max(self.revision + 1, int(time.time() * 1000))
+            self._oldest_delta = self.revision
+            self._scene = scene
+            self._full_walk = True
+
+        next_revision = self.revision + 1
+        logged = len(self._log)
+        changed, scene.changed = scene.changed, set()
+
+        if self._full_walk:
+            self._full_walk = False
+            seen = set()
+            for root in scene.roots:
+                self._visit(root, root.name, 0, next_revision, seen, visitor)
+            for instance_id in [key for key in self._tracked if key not in seen]:
+                self._untrack(instance_id, next_revision)
+        else:
+            for obj in changed:
+                self._relocate(obj, next_revision)
+
+        if len(self._log) > MAX_CHANGE_HISTORY:
+            # Forget the oldest half, whole revisions at a time; deltas older than that
+            # become full snapshots
+            drop = len(self._log) // 2
+            cutoff = self._log[drop - 1][0]
+            while drop < len(self._log) and self._log[drop][0] == cutoff:
+                drop += 1
+            self._oldest_delta = cutoff
+            del self._log[:drop]
+
+        if len(self._log) > logged:
+            self.revision = next_revision
+        return self.revision
+
+    def _relocate(self, obj: GameObject, revision: int) -> None:
+        """Re-read the subtree of a changed object, wherever it is now"""
+        if not self._scene.contains(obj):
+            self._untrack(obj.instance_id, revision)
+            return
+        parent_id = obj.parent.instance_id if obj.parent is not None else 0
+        self._visit(obj, obj.path, parent_id, revision, None, None)
+
+    def _visit(self, obj: GameObject, path: str, parent_id: int, revision: int, seen, visitor) -> None:
+        if seen is not None:
+            seen.add(obj.instance_id)
+        if visitor is not None:
+            visitor(obj, path)
+
+        tracked = self._tracked.get(obj.instance_id)
+        if tracked is None:
+            tracked = self._tracked[obj.instance_id] = _Tracked(obj, revision)
+        if tracked.parent_id != parent_id:
+            previous = self._tracked.get(tracked.parent_id)
+            if previous is not None:
+                previous.children.discard(obj.instance_id)
+            tracked.parent_id = parent_id
+        parent = self._tracked.get(parent_id)
+        if parent is not None:
+            parent.children.add(obj.instance_id)
+
+        snapshot = _snapshot(obj, path)
+        if snapshot != tracked.snapshot:
+            tracked.snapshot = snapshot
+            tracked.revision = revision
+            self._log.append((revision, obj.instance_id, None, tracked.added_revision))
+
+        for child in obj.children:
+            self._visit(child, f"{path}/{child.name}", obj.instance_id, revision, seen, visitor)
+
+        # Children that left without being published: removed, or moved elsewhere
+        if len(tracked.children) > len(obj.children):
+            current = {child.instance_id for child in obj.children}
+            for child_id in [key for key in tracked.children if key not in current]:
+                tracked.children.discard(child_id)
+                if seen is None and child_id in self._tracked:
+                    self._relocate(self._tracked[child_id].obj, revision)
+
+    def _untrack(self, instance_id: int, revision: int) -> None:
+        """Drop an object and its tracked descendants, logging each removal"""
+        tracked = self._tracked.pop(instance_id, None)
+        if tracked is None:
+            return
+        parent = self._tracked.get(tracked.parent_id)
+        if parent is not None:
+            parent.children.discard(instance_id)
+        self._log.append((revision, instance_id, tracked.snapshot["path"], tracked.added_revision))
+        for child_id in tracked.children:
+            self._untrack(child_id, revision)
+
+    def can_delta(self, scene: Scene, since: int) -> bool:
+        return scene is self._scene and self._oldest_delta is not None and self._oldest_delta <= since <= self.revision
+
+    def delta(self, since: int) -> Dict[str, Any]:
+        """Reads only the log after `since`, newest first, so each object is reported once"""
+        added, changed, removed = [], [], []
+        reported = set()
+        for revision, instance_id, removed_path, added_revision in reversed(self._log):
+            if revision <= since:
+                break
+            if instance_id in reported:
+                continue
+            reported.add(instance_id)
+            tracked = self._tracked.get(instance_id)
+            if tracked is not None:
+                (added if tracked.added_revision > since else changed).append(tracked.snapshot)
+            # Objects that came and went after `since` were never seen by the caller
+            elif removed_path is not None and added_revision <= since:
+                removed.append({"instanceId": instance_id, "path": removed_path})
+        return {"added": added, "changed": changed, "removed": removed, "totalObjects": len(self._tracked)}
@@ -0,0 +1,206 @@
+"""Asynchronous jobs, mirroring MCPJobs.cs.
+
+`execute` answers the job tools on the listener thread. Each submitted job is
+handed to `schedule`, which queues it in the scheduler's heavy lane; `run`
+runs it on the main thread when its turn comes. Finished jobs are kept for
+`retention` seconds, at most `max_retained` of them, oldest evicted first.
+"""
+
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+JOB_TOOLS = frozenset({
+    "unity_submit_job",
+    "unity_get_job_status",
+    "unity_wait_for_job",
+    "unity_get_job_result",
+})
+
+# Same limits as MCPJobs.cs
+MAX_WAIT_SECONDS = 25.0
+RETENTION_SECONDS = 600.0
+MAX_RETAINED_JOBS = 100
+
+
+def _error(message: str) -> Dict[str, Any]:
+    return {"success": False, "error": message}
+
+
+class _Job:
+    __slots__ = ("id", "tool", "args", "status", "progress", "message",
+                 "submitted_at", "started_at", "finished_at", "result", "done")
+
+    def __init__(self, job_id: str, tool: str, args: Dict[str, Any]):
+        self.id = job_id
+        self.tool = tool
+        self.args = args
+        self.status = "queued"
+        self.progress = 0.0
+        self.message: Optional[str] = None
+        self.submitted_at = time.monotonic()
+        self.started_at = 0.0
+        self.finished_at = 0.0
+        self.result: Optional[Dict[str, Any]] = None
+        self.done = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+
+class JobTable:
+    def __init__(
+        self,
+        schedule: Optional[Callable[[str], None]] = None,
+        retention: float = RETENTION_SECONDS,
+        max_retained: int = MAX_RETAINED_JOBS,
+    ):
+        self.schedule = schedule
+        self.retention = retention
+        self.max_retained = max_retained
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, _Job] = {}
+        self._queued = 0
+        self._ids = itertools.count(1)
+        self._current: Optional[_Job] = None
+
+    def execute(self, tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Listener thread, like MCPJobs.Execute"""
+        handler = {
+            "unity_submit_job": self._submit,
+            "unity_get_job_status": self._status,
+            "unity_wait_for_job": self._wait,
+            "unity_get_job_result": self._result,
+        }.get(tool)
+        if handler is None:
+            return _error(f"Unknown tool: {tool}")
+        return handler(args)
+
+    def report_progress(self, progress: float, message: str) -> None:
+        """Main thread, from inside a tool; does nothing outside a job"""
+        if self._current is None:
+            return
+        with self._lock:
+            self._current.progress = min(max(progress, 0.0), 1.0)
+            self._current.message = message
+
+    def run(self, job_id: str, editor) -> None:
+        """Main thread, when the job's turn in the heavy lane comes, like MCPJobs.Run"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != "queued":
+                return
+            self._queued -= 1
+            job.status = "running"
+            job.started_at = time.monotonic()
+
+        self._current = job
+        editor.on_progress = self.report_progress
+        try:
+            result = editor.execute(job.tool, job.args)
+        except Exception as e:
+            result = _error(str(e))
+        finally:
+            self._current = None
+            editor.on_progress = None
+
+        with self._lock:
+            job.result = result
+            job.status = "succeeded" if result.get("success") else "failed"
+            job.progress = 1.0
+            job.message = None
+            job.finished_at = time.monotonic()
+            job.done.set()
+            self._evict()
+
+    def _submit(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        tool = args.get("tool")
+        if not tool:
+            return _error("tool is required")
+        if tool in JOB_TOOLS:
+            return _error(f"{tool} cannot run as a job")
+
+        with self._lock:
+            self._evict()
+            job = _Job(f"job-{next(self._ids)}", tool, args.get("args") or {})
+            self._jobs[job.id] = job
+            self._queued += 1
+            queued = self._queued
+        if self.schedule is not None:
+            self.schedule(job.id)
+        return {"success": True, "jobId": job.id, "tool": tool, "status": "queued", "queuePosition": queued}
+
+    def _status(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = args.get("jobId")
+        with self._lock:
+            self._evict()
+            if not job_id:
+                jobs = sorted(self._jobs.values(), key=lambda job: job.submitted_at)
+                summaries = [self._describe(job) for job in jobs]
+                return {"success": True, "count": len(summaries), "jobs": summaries}
+            job = self._jobs.get(job_id)
+            if job is None:
+                return self._unknown(job_id)
+            return {**self._describe(job), "success": True}
+
+    def _wait(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = args.get("jobId")
+        wait_seconds = min(float(args.get("waitSeconds", 20.0)), MAX_WAIT_SECONDS)
+        if not job_id:
+            return _error("jobId is required")
+        with self._lock:
+            self._evict()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return self._unknown(job_id)
+
+        finished = job.done.wait(max(0.0, wait_seconds))
+        with self._lock:
+            response = {**self._describe(job), "success": True, "timedOut": not finished}
+            if finished:
+                response["result"] = job.result
+            return response
+
+    def _result(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = args.get("jobId")
+        if not job_id:
+            return _error("jobId is required")
+        with self._lock:
+            self._evict()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return self._unknown(job_id)
+            if not job.finished:
+                return _error(f"Job {job_id} is still {job.status}")
+            return {**job.result, "jobId": job.id}
+
+    def _evict(self) -> None:
+        """Caller holds the lock"""
+        now = time.monotonic()
+        finished = sorted((job for job in self._jobs.values() if job.finished), key=lambda job: job.finished_at)
+        excess = len(finished) - self.max_retained
+        for index, job in enumerate(finished):
+            if index < excess or now - job.finished_at > self.retention:
+                del self._jobs[job.id]
+
+    def _describe(self, job: _Job) -> Dict[str, Any]:
+        """Caller holds the lock"""
+        now = time.monotonic()
+        status = {"jobId": job.id, "tool": job.tool, "status": job.status, "progress": job.progress}
+        if job.message:
+            status["message"] = job.message
+        if job.status == "queued":
+            status["queuedSeconds"] = round(now - job.submitted_at, 3)
+        else:
+            end = job.finished_at if job.finished else now
+            status["elapsedSeconds"] = round(end - job.started_at, 3)
+        if job.finished:
+            status["expiresInSeconds"] = round(self.retention - (now - job.finished_at), 3)
+            if job.status == "failed":
+                status["error"] = job.result.get("error")
+        return status
+
+    def _unknown(self, job_id: str) -> Dict[str, Any]:
+        return _error(f"Unknown job '{job_id}'. Finished jobs are kept for {self.retention:.0f} seconds.")
@@ -0,0 +1,192 @@
+"""In-memory scene graph mirroring the parts of a Unity scene the tools touch.
+
+Transforms are translation-only: a child's world position is its parent's
+world position plus its local position. Rotation and scale are stored and
+reported but do not affect children, which is enough for load testing.
+"""
+
+import itertools
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+_instance_ids = itertools.count(10000)
+
+HANDLE_PREFIX = "id:"
+
+
+class GameObject:
+    """A scene object with a transform, tag, layer and named components"""
+
+    def __init__(self, name: str, components: Optional[List[str]] = None):
+        self.name = name
+        self.instance_id = next(_instance_ids)
+        self.parent: Optional["GameObject"] = None
+        self.children: List["GameObject"] = []
+        self.active = True
+        self.tag = "Untagged"
+        self.layer = "Default"
+        self.local_position = [0.0, 0.0, 0.0]
+        self.rotation = [0.0, 0.0, 0.0]
+        self.scale = [1.0, 1.0, 1.0]
+        self.components: List[str] = ["Transform"] + list(components or [])
+        # Component state keyed by component name (RectTransform, Image, Camera, ...)
+        self.properties: Dict[str, Dict] = {}
+
+    @property
+    def path(self) -> str:
+        """Hierarchy path, as MCPTools.GetGameObjectPath builds it"""
+        if self.parent is None:
+            return self.name
+        return f"{self.parent.path}/{self.name}"
+
+    @property
+    def handle(self) -> str:
+        """Stable handle, as MCPObjectIndex.Handle builds it"""
+        return f"{HANDLE_PREFIX}{self.instance_id}"
+
+    @property
+    def position(self) -> List[float]:
+        """World position"""
+        if self.parent is None:
+            return list(self.local_position)
+        return [p + l for p, l in zip(self.parent.position, self.local_position)]
+
+    @position.setter
+    def position(self, value: List[float]) -> None:
+        if self.parent is None:
+            self.local_position = [float(v) for v in value]
+        else:
+            self.local_position = [float(v) - p for v, p in zip(value, self.parent.position)]
+
+    @property
+    def active_in_hierarchy(self) -> bool:
+        return self.active and (self.parent is None or self.parent.active_in_hierarchy)
+
+    def has(self, component: str) -> bool:
+        return component in self.components
+
+    def add_component(self, component: str, **properties) -> None:
+        if component not in self.components:
+            self.components.append(component)
+        if properties:
+            self.properties.setdefault(component, {}).update(properties)
+
+    def walk(self) -> Iterator["GameObject"]:
+        """This object and all of its descendants, depth first"""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+class Scene:
+    """The active scene: named root objects plus lookup helpers"""
+
+    def __init__(self, name: str = "Untitled", path: str = ""):
+        self.name = name
+        self.path = path
+        self.roots: List[GameObject] = []
+        # Bumped when objects are added, removed or re-parented, or components change
+        self.structure_version = 0
+        # Objects added, removed, re-parented or edited since the hierarchy tracker last
+        # looked, like ObjectChangeEvents; `change_count` counts every publish
+        self.changed: Set[GameObject] = set()
+        self.change_count = 0
+        # Called with each published object, like ObjectChangeEvents.changesPublished
+        self.listeners: List[Callable[[GameObject], None]] = []
+
+    def __getstate__(self):
+        # Copies (saved and reloaded scenes) start without the listeners
+        return {**self.__dict__, "listeners": []}
+
+    def walk(self) -> Iterator[GameObject]:
+        for root in self.roots:
+            yield from root.walk()
+
+    def publish(self, obj: GameObject) -> None:
+        """Record that `obj` or its subtree changed"""
+        self.changed.add(obj)
+        self.change_count += 1
+        for listener in self.listeners:
+            listener(obj)
+
+    def contains(self, obj: GameObject) -> bool:
+        """Whether `obj` is still attached to this scene"""
+        while obj.parent is not None:
+            obj = obj.parent
+        return any(root is obj for root in self.roots)
+
+    def add(self, obj: GameObject, parent: Optional[GameObject] = None) -> GameObject:
+        """Attach `obj` under `parent` (or as a root), keeping its local position"""
+        if parent is None:
+            self.roots.append(obj)
+        else:
+            parent.children.append(obj)
+        obj.parent = parent
+        self.structure_version += 1
+        self.publish(obj)
+        return obj
+
+    def detach(self, obj: GameObject) -> None:
+        siblings = self.roots if obj.parent is None else obj.parent.children
+        siblings.remove(obj)
+        obj.parent = None
+        self.structure_version += 1
+        self.publish(obj)
+
+    def set_parent(self, obj: GameObject, parent: Optional[GameObject], world_position_stays: bool = True) -> None:
+        world = obj.position
+        self.detach(obj)
+        self.add(obj, parent)
+        if world_position_stays:
+            obj.position = world
+
+    def find(self, name: str) -> Optional[GameObject]:
+        """Like MCPObjectIndex.Find: a handle ("id:<instanceId>") or a name/path.
+
+        Names follow GameObject.Find: '/' walks a path, a leading '/' anchors
+        it at a root object, otherwise the path may start at any depth.
+        Unlike GameObject.Find, inactive objects match when no active one does.
+        """
+        if not name:
+            return None
+        if name.startswith(HANDLE_PREFIX):
+            instance_id = name[len(HANDLE_PREFIX):]
+            return next((obj for obj in self.walk() if str(obj.instance_id) == instance_id), None)
+
+        anchored = name.startswith("/")
+        parts = name.strip("/").split("/")
+        inactive_match = None
+        for obj in self.walk():
+            if obj.name != parts[-1]:
+                continue
+            segments = obj.path.split("/")
+            if anchored and segments != parts:
+                continue
+            if not anchored and segments[-len(parts):] != parts:
+                continue
+            if obj.active_in_hierarchy:
+                return obj
+            if inactive_match is None:
+                inactive_match = obj
+        return inactive_match
+
+    def find_with_component(self, component: str) -> Optional[GameObject]:
+        """Like Object.FindFirstObjectByType"""
+        return next((obj for obj in self.walk() if obj.has(component)), None)
+
+    @classmethod
+    def default(cls, name: str = "SampleScene", path: str = "Assets/Scenes/SampleScene.unity") -> "Scene":
+        """A scene with the DefaultGameObjects setup: Main Camera and Directional Light"""
+        scene = cls(name, path)
+
+        camera = GameObject("Main Camera", ["Camera", "AudioListener"])
+        camera.tag = "MainCamera"
+        camera.local_position = [0.0, 1.0, -10.0]
+        camera.properties["Camera"] = {"clearFlags": "Skybox", "backgroundColor": [0.192, 0.302, 0.475, 0.0]}
+        scene.add(camera)
+
+        light = GameObject("Directional Light", ["Light"])
+        light.local_position = [0.0, 3.0, 0.0]
+        light.rotation = [50.0, -30.0, 0.0]
+        scene.add(light)
+
+        return scene
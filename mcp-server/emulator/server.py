@@ -0,0 +1,605 @@
+"""HTTP front end for the emulated editor, modelled on MCPServer.cs.
+
+Listener threads parse each POST and queue it, then block until the single
+"main thread" has run it (30 second timeout), exactly like HandleRequest and
+ProcessRequests. The main thread wakes every `tick` seconds, the simulated
+EditorApplication.update interval, and runs queued requests by priority lane
+(reads, writes, heavy asset work) until the per-tick budget is spent, so
+per-tool execution costs delay everything queued behind them. Job tools are
+answered on the listener thread and one queued job runs per tick, like
+MCPJobs. `reload` takes the listeners down for a while, like an assembly
+reload.
+"""
+
+import gzip
+import json
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+from .editor import EmulatedEditor
+from .jobs import JOB_TOOLS, JobTable
+
+REQUEST_TIMEOUT = 30.0
+
+# Same cap and re-check interval as MCPLogs.cs
+MAX_LOG_WAIT = 25.0
+LOG_RECHECK = 0.5
+
+# How long a reload waits for answers to failed requests to go out, like
+# MCPServer.StopDrainMilliseconds
+STOP_DRAIN = 0.5
+
+# Responses at least this large are gzipped when the client accepts it
+GZIP_THRESHOLD = 16 * 1024
+
+# Same scheduling as MCPServer.ProcessRequests: per-update budget, the share
+# of it reads always get first (still spent after a slow request overran the
+# budget), and how long a write or heavy request may wait before one of them
+# per update skips ahead of the remaining reads
+FRAME_BUDGET = 0.008
+READ_SHARE = 0.5
+MAX_LANE_WAIT = 0.25
+
+# Priority lanes, drained in this order
+LANES = ("read", "write", "heavy")
+
+READ_TOOLS = frozenset({
+    "unity_ping",
+    "unity_get_scene_info",
+    "unity_list_all_gameobjects",
+    "unity_query_gameobjects",
+    "unity_spatial_query",
+    "unity_search_assets",
+    "unity_find_gameobject",
+    "unity_is_compiling",
+    "unity_wait_for_compile",
+    "unity_get_logs",
+})
+
+# At most one of these runs per update
+HEAVY_TOOLS = frozenset({
+    "unity_create_scene",
+    "unity_save_scene",
+    "unity_load_scene",
+    "unity_add_scene_to_build",
+    "unity_save_prefab",
+    "unity_update_prefab",
+    "unity_create_prefab_from_asset",
+    "unity_instantiate_prefabs",
+    "unity_create_prefabs_from_assets",
+    "unity_create_script",
+    "unity_create_scripts",
+    "unity_set_asset_property",
+    "unity_force_compile",
+})
+
+
+def _lane(tool: str) -> int:
+    if tool in READ_TOOLS:
+        return 0
+    if tool in HEAVY_TOOLS:
+        return 2
+    return 1
+
+
+class _Timing:
+    """Per-request phase times in milliseconds, like MCPTiming.cs"""
+
+    __slots__ = ("received_at", "parse", "queue", "exec", "serialize")
+
+    def __init__(self):
+        self.received_at = time.perf_counter()
+        self.parse = self.queue = self.exec = self.serialize = 0.0
+
+    def parsed(self) -> None:
+        self.parse = (time.perf_counter() - self.received_at) * 1000
+
+    def __str__(self) -> str:
+        total = (time.perf_counter() - self.received_at) * 1000
+        return (f"parse={self.parse:.3f};queue={self.queue:.3f};exec={self.exec:.3f};"
+                f"serialize={self.serialize:.3f};total={total:.3f}")
+
+
+class _PendingRequest:
+    __slots__ = ("tool", "args", "done", "response", "lane", "enqueued_at", "wait_ms", "run_ms", "job_id")
+
+    def __init__(self, tool: str, args: Dict[str, Any], job_id: Optional[str] = None):
+        self.tool = tool
+        self.args = args
+        self.done = threading.Event()
+        self.response: Optional[Dict[str, Any]] = None
+        # A job runs in the heavy lane whatever its tool, like MCPServer.EnqueueJob
+        self.job_id = job_id
+        self.lane = 2 if job_id is not None else _lane(tool)
+        self.enqueued_at = time.perf_counter()
+        self.wait_ms = 0.0
+        self.run_ms = 0.0
+
+
+def _reloading_error() -> Dict[str, Any]:
+    return {"success": False, "error": "Unity is reloading scripts; the request did not run", "reloading": True}
+
+
+def _new_lane_stats() -> list:
+    return [
+        {"executed": 0, "totalWaitMs": 0.0, "maxWaitMs": 0.0, "totalRunMs": 0.0, "maxRunMs": 0.0}
+        for _ in LANES
+    ]
+
+
+class _EmulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections.add(self.connection)
+
+    def finish(self):
+        self.server.connections.discard(self.connection)
+        super().finish()
+
+    def do_POST(self):
+        emulator = self.server.emulator
+        with emulator.responding():
+            try:
+                self._respond(emulator)
+            except (ConnectionError, OSError):
+                # Client went away, or a reload closed the connection
+                self.close_connection = True
+
+    def _respond(self, emulator):
+        timing = _Timing()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            timing.parsed()
+            response = emulator.dispatch(request.get("tool"), request.get("args") or {}, timing)
+        except Exception as e:
+            response = {"success": False, "error": str(e)}
+
+        # Serialized once, without indentation, like SendResponse
+        serialize_start = time.perf_counter()
+        body = json.dumps(response, separators=(",", ":")).encode("utf-8")
+        compress = len(body) >= GZIP_THRESHOLD and "gzip" in self.headers.get("Accept-Encoding", "")
+        if compress:
+            body = gzip.compress(body, compresslevel=1)
+        timing.serialize = (time.perf_counter() - serialize_start) * 1000
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("X-MCP-Timing", str(timing))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        # Status probe, answered without waiting for the main thread
+        body = json.dumps(self.server.emulator.status()).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StreamHandler(socketserver.StreamRequestHandler):
+    """One persistent connection, like MCPStreamServer.ConnectionLoop: NDJSON
+    frames in, {"id", "result"} frames out in completion order"""
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._write_lock = threading.Lock()
+        self.server.connections.add(self.connection)
+
+    def finish(self):
+        self.server.connections.discard(self.connection)
+        super().finish()
+
+    def handle(self):
+        try:
+            for line in self.rfile:
+                if line.strip():
+                    threading.Thread(target=self._handle_frame, args=(line,), daemon=True).start()
+        except (ConnectionError, OSError, ValueError):
+            pass
+
+    def _handle_frame(self, line: bytes) -> None:
+        emulator = self.server.emulator
+        with emulator.responding():
+            self._answer(emulator, line)
+
+    def _answer(self, emulator, line: bytes) -> None:
+        timing = _Timing()
+        request_id = 0
+        try:
+            request = json.loads(line)
+            request_id = int(request.get("id") or 0)
+            timing.parsed()
+            if request.get("status"):
+                response = emulator.status()
+            else:
+                response = emulator.dispatch(request.get("tool"), request.get("args") or {}, timing)
+        except Exception as e:
+            response = {"success": False, "error": str(e)}
+
+        serialize_start = time.perf_counter()
+        body = json.dumps(response, separators=(",", ":"))
+        timing.serialize = (time.perf_counter() - serialize_start) * 1000
+        frame = f'{{"id":{request_id},"timing":"{timing}","result":{body}}}\n'.encode("utf-8")
+        try:
+            with self._write_lock:
+                self.wfile.write(frame)
+        except (ConnectionError, OSError, ValueError):
+            # Client went away
+            pass
+
+
+def _shutdown_all(connections) -> None:
+    for connection in list(connections):
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+# HttpListener and MCPStreamServer take bursts of new connections; with
+# socketserver's default backlog of 5, a burst of callers waits out SYN retries
+LISTEN_BACKLOG = 128
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+
+class _StreamServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = LISTEN_BACKLOG
+
+
+class EditorEmulator:
+    """In-memory stand-in for the Unity Editor bridge; use as a context manager.
+
+    `latency` and `default_latency` are passed to the EmulatedEditor when
+    one is not supplied. `frame_budget` is the main-thread time per tick
+    after which no further request starts; None drains every queued request
+    each tick, as MCPServer did before it had lanes. `stream_port` also
+    opens the persistent transport of MCPStreamServer.cs (0 picks a free
+    port); None leaves it off.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        tick: float = 0.004,
+        latency: Optional[Dict[str, float]] = None,
+        default_latency: float = 0.0,
+        editor: Optional[EmulatedEditor] = None,
+        frame_budget: Optional[float] = FRAME_BUDGET,
+        stream_port: Optional[int] = None,
+    ):
+        self.tick = tick
+        self.frame_budget = frame_budget
+        self.editor = editor or EmulatedEditor(latency=latency, default_latency=default_latency)
+        self.requests = 0
+        self.jobs = JobTable(schedule=self._schedule_job)
+
+        self._lanes = tuple(deque() for _ in LANES)
+        self._queue_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._lane_stats = _new_lane_stats()
+        self._busy_frames = 0
+        self._frames_over_budget = 0
+        self._max_frame_ms = 0.0
+        self._stats_since = time.monotonic()
+        self._running = False
+        self._reloading = False
+        self._responses_pending = 0
+        self._pending_lock = threading.Condition()
+        self._main = threading.Thread(target=self._main_thread, name="emulator-main", daemon=True)
+        self._open_listeners(host, port, stream_port)
+
+    def _open_listeners(self, host: str, port: int, stream_port: Optional[int]) -> None:
+        self._server = _HTTPServer((host, port), _EmulatorHandler)
+        self._server.emulator = self
+        self._server.connections = set()
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, name="emulator-listener", daemon=True),
+        ]
+
+        self._stream_server = None
+        if stream_port is not None:
+            self._stream_server = _StreamServer((host, stream_port), _StreamHandler)
+            self._stream_server.emulator = self
+            self._stream_server.connections = set()
+            self._threads.append(
+                threading.Thread(target=self._stream_server.serve_forever, name="emulator-stream", daemon=True)
+            )
+
+    def _close_listeners(self) -> None:
+        # HttpListener.Stop also drops keep-alive connections
+        self._server.shutdown()
+        self._server.server_close()
+        _shutdown_all(self._server.connections)
+        if self._stream_server is not None:
+            self.close_streams()
+            self._stream_server.shutdown()
+            self._stream_server.server_close()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stream_port(self) -> Optional[int]:
+        if self._stream_server is None:
+            return None
+        return self._stream_server.server_address[1]
+
+    def status(self) -> Dict[str, Any]:
+        """Status probe, like MCPChangeTracker.GetStatus"""
+        return {"success": True, "sceneVersion": self.editor.scene_version}
+
+    def dispatch(self, tool: str, args: Dict[str, Any], timing: Optional[_Timing] = None) -> Dict[str, Any]:
+        """Route one tool call from a listener thread, like MCPServer.Dispatch"""
+        if tool == "unity_get_logs":
+            if float(args.get("waitSeconds") or 0) > 0:
+                return self.long_poll_logs(args, timing)
+            return self.submit(tool, args, timing)
+
+        # The per-request trace lines MCPServer logs around every other call
+        self.editor.log(f"[MCP] Received: {tool}")
+        if tool == "unity_get_scheduler_stats":
+            response = self.scheduler_stats(args)
+        elif tool in JOB_TOOLS:
+            response = self.jobs.execute(tool, args)
+        else:
+            response = self.submit(tool, args, timing)
+        self.editor.log(f"[MCP] Response sent: {tool}")
+        return response
+
+    def close_streams(self) -> None:
+        """Drop every stream connection, as an assembly reload does"""
+        if self._stream_server is not None:
+            _shutdown_all(self._stream_server.connections)
+
+    @contextmanager
+    def responding(self):
+        """Held by a listener thread until its response is written"""
+        with self._pending_lock:
+            self._responses_pending += 1
+        try:
+            yield
+        finally:
+            with self._pending_lock:
+                self._responses_pending -= 1
+                self._pending_lock.notify_all()
+
+    def reload(self, duration: float) -> None:
+        """Simulate an assembly reload; blocks for `duration` seconds.
+
+        Like MCPServer.OnBeforeAssemblyReload, queued and newly arriving
+        requests are failed with `reloading: true`, the listeners close and
+        the main thread stops running requests until they reopen on the
+        same ports. Queued jobs stay in the heavy lane, as MCPJobs restores
+        them after a reload.
+        """
+        self._reloading = True
+        with self._queue_lock:
+            for lane in self._lanes:
+                kept = [pending for pending in lane if pending.job_id is not None]
+                for pending in lane:
+                    if pending.job_id is None:
+                        pending.response = _reloading_error()
+                        pending.done.set()
+                lane.clear()
+                lane.extend(kept)
+
+        # Let those answers reach the client before the connections close
+        with self._pending_lock:
+            self._pending_lock.wait_for(lambda: self._responses_pending == 0, STOP_DRAIN)
+
+        host, port = self._server.server_address[:2]
+        stream_port = self.stream_port
+        self._close_listeners()
+        time.sleep(duration)
+        self._open_listeners(host, port, stream_port)
+        for thread in self._threads:
+            thread.start()
+        self._reloading = False
+
+    def submit(self, tool: str, args: Dict[str, Any], timing: Optional[_Timing] = None) -> Dict[str, Any]:
+        """Queue a request for the main thread and wait for its response"""
+        if self._reloading:
+            return _reloading_error()
+        pending = _PendingRequest(tool, args)
+        with self._queue_lock:
+            self.requests += 1
+            self._lanes[pending.lane].append(pending)
+
+        if pending.done.wait(REQUEST_TIMEOUT):
+            if timing is not None:
+                timing.queue += pending.wait_ms
+                timing.exec += pending.run_ms
+            return pending.response
+        return {"success": False, "error": "Timeout: Unity main thread didn't process request"}
+
+    def _schedule_job(self, job_id: str) -> None:
+        """Queue a submitted job in the heavy lane; nobody waits on its `done`"""
+        pending = _PendingRequest("unity_submit_job", {}, job_id)
+        with self._queue_lock:
+            self._lanes[pending.lane].append(pending)
+
+    def long_poll_logs(self, args: Dict[str, Any], timing: Optional[_Timing] = None) -> Dict[str, Any]:
+        """Re-run unity_get_logs on each new log until it matches or waitSeconds pass, like LongPollLogs"""
+        deadline = time.perf_counter() + min(float(args["waitSeconds"]), MAX_LOG_WAIT)
+        signal = self.editor.log_signal
+        while True:
+            with signal:
+                seen = self.editor.log_sequence
+            response = self.submit("unity_get_logs", args, timing)
+            if not response.get("success"):
+                return response
+
+            remaining = deadline - time.perf_counter()
+            if response["logs"] or remaining <= 0:
+                response["timedOut"] = not response["logs"]
+                return response
+            with signal:
+                if self.editor.log_sequence == seen:
+                    signal.wait(min(remaining, LOG_RECHECK))
+
+    def _main_thread(self) -> None:
+        next_tick = time.perf_counter()
+        while self._running:
+            next_tick += self.tick
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (slow tools); start counting from now
+                next_tick = time.perf_counter()
+            if self._reloading:
+                continue
+            self._process_requests()
+
+    def _process_requests(self) -> None:
+        """Run queued requests by lane until the frame budget is spent, like MCPServer.ProcessRequests"""
+        frame_start = time.perf_counter()
+        ran_heavy = False
+        promoted = False
+        read_time = 0.0
+        executed = 0
+        while True:
+            elapsed = time.perf_counter() - frame_start
+            with self._queue_lock:
+                pending, aged = self._next_request(elapsed, read_time, ran_heavy, promoted)
+            if pending is None:
+                break
+            ran_heavy |= pending.lane == 2
+            promoted |= aged
+
+            run_start = time.perf_counter()
+            try:
+                if pending.job_id is not None:
+                    self.jobs.run(pending.job_id, self.editor)
+                else:
+                    pending.response = self.editor.execute(pending.tool, pending.args)
+            except Exception as e:
+                pending.response = {"success": False, "error": str(e)}
+            finally:
+                pending.wait_ms = (run_start - pending.enqueued_at) * 1000
+                pending.run_ms = (time.perf_counter() - run_start) * 1000
+                pending.done.set()
+            if pending.lane == 0:
+                read_time += pending.run_ms / 1000
+            self._record_request(pending)
+            executed += 1
+
+        if executed:
+            self._record_frame(time.perf_counter() - frame_start)
+
+    def _next_request(self, elapsed: float, read_time: float, ran_heavy: bool, promoted: bool):
+        """Caller holds the queue lock; returns (request, aged) like MCPServer.NextRequest"""
+        reads, writes, heavy = self._lanes
+        budget = self.frame_budget
+        if reads and (budget is None or read_time < budget * READ_SHARE):
+            return reads.popleft(), False
+        if budget is not None and elapsed >= budget:
+            return None, False
+        if not promoted:
+            now = time.perf_counter()
+            if heavy and not ran_heavy and now - heavy[0].enqueued_at >= MAX_LANE_WAIT:
+                return heavy.popleft(), True
+            if writes and now - writes[0].enqueued_at >= MAX_LANE_WAIT:
+                return writes.popleft(), True
+        if reads:
+            return reads.popleft(), False
+        if writes:
+            return writes.popleft(), False
+        if heavy and not ran_heavy:
+            return heavy.popleft(), False
+        return None, False
+
+    def _record_request(self, pending: _PendingRequest) -> None:
+        with self._stats_lock:
+            stats = self._lane_stats[pending.lane]
+            stats["executed"] += 1
+            stats["totalWaitMs"] += pending.wait_ms
+            stats["maxWaitMs"] = max(stats["maxWaitMs"], pending.wait_ms)
+            stats["totalRunMs"] += pending.run_ms
+            stats["maxRunMs"] = max(stats["maxRunMs"], pending.run_ms)
+
+    def _record_frame(self, frame_seconds: float) -> None:
+        frame_ms = frame_seconds * 1000
+        with self._stats_lock:
+            self._busy_frames += 1
+            if self.frame_budget is not None and frame_seconds > self.frame_budget:
+                self._frames_over_budget += 1
+            self._max_frame_ms = max(self._max_frame_ms, frame_ms)
+
+    def scheduler_stats(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """unity_get_scheduler_stats, answered on the listener thread"""
+        with self._stats_lock:
+            lanes = {}
+            for lane, name in enumerate(LANES):
+                stats = self._lane_stats[lane]
+                executed = stats["executed"]
+                lanes[name] = {
+                    "depth": len(self._lanes[lane]),
+                    "executed": executed,
+                    "avgWaitMs": round(stats["totalWaitMs"] / executed, 3) if executed else 0,
+                    "maxWaitMs": round(stats["maxWaitMs"], 3),
+                    "avgRunMs": round(stats["totalRunMs"] / executed, 3) if executed else 0,
+                    "maxRunMs": round(stats["maxRunMs"], 3),
+                }
+            result = {
+                "success": True,
+                "frameBudgetMs": self.frame_budget * 1000 if self.frame_budget is not None else None,
+                "busyFrames": self._busy_frames,
+                "framesOverBudget": self._frames_over_budget,
+                "maxFrameMs": round(self._max_frame_ms, 3),
+                "sinceSeconds": round(time.monotonic() - self._stats_since, 3),
+                "lanes": lanes,
+            }
+            if args.get("reset"):
+                self._lane_stats = _new_lane_stats()
+                self._busy_frames = 0
+                self._frames_over_budget = 0
+                self._max_frame_ms = 0.0
+                self._stats_since = time.monotonic()
+        return result
+
+    def start(self) -> "EditorEmulator":
+        self._running = True
+        self._main.start()
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._running = False
+        self._close_listeners()
+
+    def __enter__(self) -> "EditorEmulator":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
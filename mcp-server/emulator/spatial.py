@@ -0,0 +1,243 @@
+"""Bounding volume hierarchy for unity_spatial_query, mirroring MCPSpatial.cs.
+
+Objects with a renderer or collider component get a box around their world
+position, a unit cube scaled by their scale (emulated transforms have no
+rotation or meshes). The tree is rebuilt when the scene's structure changes.
+Objects the scene publishes mark the entries in their subtree, and the next
+query re-reads only those and refits the leaves holding them and the boxes
+above, the same way the editor keeps its index.
+"""
+
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+from .scene import GameObject, Scene
+
+LEAF_SIZE = 4
+
+Box = Tuple[List[float], List[float]]
+
+
+def has_bounds(obj: GameObject) -> bool:
+    return any(component.endswith(("Renderer", "Collider")) for component in obj.components)
+
+
+def _union(a: Box, b: Box) -> Box:
+    return [min(x, y) for x, y in zip(a[0], b[0])], [max(x, y) for x, y in zip(a[1], b[1])]
+
+
+def sqr_distance(box: Box, point: List[float]) -> float:
+    """Squared distance from point to the box, 0 inside; like Bounds.SqrDistance"""
+    total = 0.0
+    for low, high, value in zip(box[0], box[1], point):
+        if value < low:
+            total += (low - value) ** 2
+        elif value > high:
+            total += (value - high) ** 2
+    return total
+
+
+def intersects(a: Box, b: Box) -> bool:
+    return all(a_low <= b_high and b_low <= a_high for a_low, a_high, b_low, b_high in zip(a[0], a[1], b[0], b[1]))
+
+
+def ray_distance(box: Box, origin: List[float], direction: List[float]) -> Optional[float]:
+    """Distance along a normalized ray to the box, 0 from inside; None if it misses"""
+    near, far = 0.0, math.inf
+    for low, high, start, step in zip(box[0], box[1], origin, direction):
+        if abs(step) < 1e-12:
+            if start < low or start > high:
+                return None
+            continue
+        t1, t2 = (low - start) / step, (high - start) / step
+        near, far = max(near, min(t1, t2)), min(far, max(t1, t2))
+        if near > far:
+            return None
+    return near
+
+
+class _Entry:
+    __slots__ = ("obj", "box", "state")
+
+    def __init__(self, obj: GameObject):
+        self.obj = obj
+        self.box: Optional[Box] = None
+        self.state = None
+
+    def read(self) -> None:
+        """Fresh bounds; inactive objects have none"""
+        position, scale, active = self.obj.position, self.obj.scale, self.obj.active_in_hierarchy
+        self.state = (tuple(position), tuple(scale), active)
+        if not active:
+            self.box = None
+            return
+        extents = [abs(value) / 2 for value in scale]
+        self.box = [p - e for p, e in zip(position, extents)], [p + e for p, e in zip(position, extents)]
+
+
+class SpatialIndex:
+    """The tree over one scene, refreshed by `refresh` before each query"""
+
+    def __init__(self):
+        self.entries: List[_Entry] = []
+        self.order: List[int] = []
+        # [box, left, right, start, count, parent]; leaves have count > 0
+        self.nodes: List[list] = []
+        # Entry index -> the leaf holding it
+        self._leaf_of: List[int] = []
+        self._entry_by_id: Dict[int, int] = {}
+        # Objects published since the last query
+        self._changed: Set[GameObject] = set()
+        self._scene: Optional[Scene] = None
+        self._structure = -1
+        self._dirty = True
+        self._refitted_since_build = 0
+
+    def invalidate(self) -> None:
+        """A change nothing was published for: the next query rebuilds"""
+        self._dirty = True
+
+    def refresh(self, scene: Scene) -> Tuple[bool, int]:
+        """(rebuilt, entries refitted), like MCPSpatial.Refresh"""
+        if self._dirty or scene is not self._scene or scene.structure_version != self._structure:
+            self._build(scene)
+            return True, 0
+
+        marked = set()
+        for obj in self._changed:
+            for member in obj.walk():
+                index = self._entry_by_id.get(member.instance_id)
+                if index is not None:
+                    marked.add(index)
+        self._changed.clear()
+        if not marked:
+            return False, 0
+
+        for index in marked:
+            self.entries[index].read()
+        refitted = len(marked)
+        self._refitted_since_build += refitted
+        if self._refitted_since_build * 4 > len(self.entries):
+            self._build(scene)
+            return True, refitted
+        self._refit(marked)
+        return False, refitted
+
+    def _build(self, scene: Scene) -> None:
+        if scene is not self._scene:
+            if self._scene is not None:
+                self._scene.listeners.remove(self._changed.add)
+            scene.listeners.append(self._changed.add)
+        self._changed.clear()
+        self.entries = [_Entry(obj) for obj in scene.walk() if has_bounds(obj)]
+        for entry in self.entries:
+            entry.read()
+        self._entry_by_id = {entry.obj.instance_id: index for index, entry in enumerate(self.entries)}
+        self.order = list(range(len(self.entries)))
+        self.nodes = []
+        self._leaf_of = [0] * len(self.entries)
+        if self.entries:
+            self._build_node(0, len(self.entries), -1)
+        self._scene = scene
+        self._structure = scene.structure_version
+        self._dirty = False
+        self._refitted_since_build = 0
+
+    def _entry_box(self, index: int) -> Box:
+        entry = self.entries[index]
+        if entry.box is not None:
+            return entry.box
+        position = list(entry.state[0])
+        return position, list(position)
+
+    def _build_node(self, start: int, count: int, parent: int) -> int:
+        index = len(self.nodes)
+        self.nodes.append(None)
+        members = self.order[start:start + count]
+        box = self._entry_box(members[0])
+        for member in members[1:]:
+            box = _union(box, self._entry_box(member))
+
+        if count <= LEAF_SIZE:
+            self.nodes[index] = [box, -1, -1, start, count, parent]
+            for member in members:
+                self._leaf_of[member] = index
+            return index
+
+        centers = {member: [(low + high) / 2 for low, high in zip(*self._entry_box(member))] for member in members}
+        spans = [max(center[axis] for center in centers.values()) - min(center[axis] for center in centers.values()) for axis in range(3)]
+        axis = spans.index(max(spans))
+        self.order[start:start + count] = sorted(members, key=lambda member: centers[member][axis])
+
+        half = count // 2
+        left = self._build_node(start, half, index)
+        right = self._build_node(start + half, count - half, index)
+        self.nodes[index] = [box, left, right, start, 0, parent]
+        return index
+
+    def _refit(self, changed: Set[int]) -> None:
+        """Refit the leaves holding `changed` and their ancestors, children first"""
+        stale = set()
+        for member in changed:
+            index = self._leaf_of[member]
+            while index >= 0 and index not in stale:
+                stale.add(index)
+                index = self.nodes[index][5]
+        for index in sorted(stale, reverse=True):
+            node = self.nodes[index]
+            _, left, right, start, count, _ = node
+            if count:
+                box = self._entry_box(self.order[start])
+                for member in self.order[start + 1:start + count]:
+                    box = _union(box, self._entry_box(member))
+            else:
+                box = _union(self.nodes[left][0], self.nodes[right][0])
+            node[0] = box
+
+    def collect(self, test, distance) -> List[Tuple[int, float]]:
+        """(entry, distance) for every entry whose box passes the test"""
+        hits = []
+        stack = [0] if self.nodes else []
+        while stack:
+            box, left, right, start, count, _ = self.nodes[stack.pop()]
+            if not test(box):
+                continue
+            if not count:
+                stack += [right, left]
+                continue
+            for member in self.order[start:start + count]:
+                entry_box = self.entries[member].box
+                if entry_box is not None and test(entry_box):
+                    hits.append((member, distance(entry_box)))
+        return hits
+
+    def nearest(self, center: List[float], k: int, max_distance: float) -> List[Tuple[int, float]]:
+        """The k entries closest to center, nearer child first"""
+        hits: List[Tuple[int, float]] = []
+        worst = max_distance * max_distance
+
+        def visit(index):
+            nonlocal worst
+            box, left, right, start, count, _ = self.nodes[index]
+            if not count:
+                children = sorted((sqr_distance(self.nodes[child][0], center), child) for child in (left, right))
+                for child_distance, child in children:
+                    if child_distance <= worst:
+                        visit(child)
+                return
+            for member in self.order[start:start + count]:
+                entry_box = self.entries[member].box
+                if entry_box is None:
+                    continue
+                distance = sqr_distance(entry_box, center)
+                if distance > worst:
+                    continue
+                at = next((i for i, hit in enumerate(hits) if hit[1] > distance), len(hits))
+                hits.insert(at, (member, distance))
+                del hits[k:]
+                if len(hits) == k:
+                    worst = hits[-1][1]
+
+        if self.nodes and sqr_distance(self.nodes[0][0], center) <= worst:
+            visit(0)
+        return [(member, math.sqrt(distance)) for member, distance in hits]
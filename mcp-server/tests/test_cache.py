@@ -0,0 +1,136 @@
+"""bridge.cache.ResponseCache: scene-version checks and write invalidation"""
+
+import asyncio
+
+from bridge import ResponseCache
+
+
+class Backend:
+    """Counts calls; every result is a fresh success"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def call(self, tool, args):
+        self.calls.append((tool, args))
+        return {"success": True, "n": len(self.calls)}
+
+
+def make_cache(versions, cached_tools=("unity_get_scene_info",)):
+    backend = Backend()
+    scene = {"version": 1}
+
+    async def version():
+        return scene["version"] if versions else None
+
+    cache = ResponseCache(
+        backend,
+        version,
+        cached_tools=cached_tools,
+        read_only_tools=["unity_find_gameobject", "unity_cache_stats"],
+    )
+    return cache, backend, scene
+
+
+def test_repeated_read_is_served_from_the_cache():
+    async def main():
+        cache, backend, _ = make_cache(versions=True)
+        first = await cache.call("unity_get_scene_info", {})
+        second = await cache.call("unity_get_scene_info", {})
+        assert second is first
+        assert len(backend.calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    asyncio.run(main())
+
+
+def test_scene_version_change_invalidates_the_entry():
+    async def main():
+        cache, backend, scene = make_cache(versions=True)
+        await cache.call("unity_get_scene_info", {})
+        scene["version"] += 1
+        await cache.call("unity_get_scene_info", {})
+        assert len(backend.calls) == 2
+        assert cache.stale == 1
+
+    asyncio.run(main())
+
+
+def test_mutating_call_clears_the_cache():
+    async def main():
+        cache, backend, _ = make_cache(versions=True)
+        await cache.call("unity_get_scene_info", {})
+        await cache.call("unity_set_position", {"name": "Cube", "position": [0, 1, 0]})
+        await cache.call("unity_get_scene_info", {})
+        assert [tool for tool, _ in backend.calls] == [
+            "unity_get_scene_info", "unity_set_position", "unity_get_scene_info",
+        ]
+
+    asyncio.run(main())
+
+
+def test_read_only_call_keeps_the_cache():
+    async def main():
+        cache, backend, _ = make_cache(versions=True)
+        await cache.call("unity_get_scene_info", {})
+        await cache.call("unity_find_gameobject", {"name": "Cube"})
+        await cache.call("unity_get_scene_info", {})
+        assert len(backend.calls) == 2
+
+    asyncio.run(main())
+
+
+def test_nothing_is_cached_without_a_scene_version():
+    async def main():
+        cache, backend, _ = make_cache(versions=False)
+        await cache.call("unity_get_scene_info", {})
+        await cache.call("unity_get_scene_info", {})
+        assert len(backend.calls) == 2
+        assert cache.uncacheable == 2
+
+    asyncio.run(main())
+
+
+def test_reset_always_reaches_the_backend():
+    async def main():
+        cache, backend, _ = make_cache(versions=True, cached_tools=("unity_get_scene_info", "unity_cache_stats"))
+        await cache.call("unity_cache_stats", {})
+        await cache.call("unity_cache_stats", {"reset": True})
+        await cache.call("unity_cache_stats", {"reset": True})
+        assert len(backend.calls) == 3
+
+    asyncio.run(main())
+
+
+def test_reset_does_not_invalidate_other_entries():
+    async def main():
+        cache, backend, _ = make_cache(versions=True)
+        await cache.call("unity_get_scene_info", {})
+        await cache.call("unity_cache_stats", {"reset": True})
+        await cache.call("unity_get_scene_info", {})
+        assert [tool for tool, _ in backend.calls] == ["unity_get_scene_info", "unity_cache_stats"]
+
+    asyncio.run(main())
+
+
+def test_read_overlapping_a_write_is_not_stored():
+    async def main():
+        cache, backend, _ = make_cache(versions=True)
+        release = asyncio.Event()
+        plain_call = backend.call
+
+        async def slow_write(tool, args):
+            if tool == "unity_set_position":
+                await release.wait()
+            return await plain_call(tool, args)
+
+        backend.call = slow_write
+        write = asyncio.create_task(cache.call("unity_set_position", {"name": "Cube", "position": [0, 0, 0]}))
+        await asyncio.sleep(0)
+        await cache.call("unity_get_scene_info", {})
+        release.set()
+        await write
+        await cache.call("unity_get_scene_info", {})
+        assert [tool for tool, _ in backend.calls].count("unity_get_scene_info") == 2
+
+    asyncio.run(main())
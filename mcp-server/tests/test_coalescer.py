@@ -0,0 +1,94 @@
+"""bridge.coalescer.RequestCoalescer: batching and the tools kept out of batches"""
+
+import asyncio
+
+import pytest
+
+from bridge import RequestCoalescer
+from bridge.coalescer import DEFAULT_EXCLUDED
+from tools.batch_tools import NOT_BATCHABLE
+
+
+class Client:
+    """Answers unity_batch with one result per entry, anything else directly"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def call(self, tool, args):
+        self.calls.append((tool, args))
+        if tool == "unity_batch" and "calls" in args:
+            return {"success": True, "results": [
+                {"success": True, "tool": entry["tool"], "args": entry["args"]} for entry in args["calls"]
+            ]}
+        return {"success": True, "tool": tool, "args": args}
+
+
+def test_concurrent_calls_share_one_batch_and_keep_their_own_results():
+    async def main():
+        client = Client()
+        coalescer = RequestCoalescer(client, window=0.01)
+        results = await asyncio.gather(*(
+            coalescer.call("unity_set_position", {"name": f"Cube{i}"}) for i in range(5)
+        ))
+        assert [tool for tool, _ in client.calls] == ["unity_batch"]
+        assert client.calls[0][1]["stopOnError"] is False
+        assert [result["args"]["name"] for result in results] == [f"Cube{i}" for i in range(5)]
+
+    asyncio.run(main())
+
+
+def test_batch_of_one_is_sent_as_a_plain_call():
+    async def main():
+        client = Client()
+        result = await RequestCoalescer(client, window=0.001).call("unity_ping", {})
+        assert client.calls == [("unity_ping", {})]
+        assert result["tool"] == "unity_ping"
+
+    asyncio.run(main())
+
+
+def test_max_batch_flushes_without_waiting_for_the_window():
+    async def main():
+        client = Client()
+        coalescer = RequestCoalescer(client, window=60, max_batch=3)
+        await asyncio.wait_for(asyncio.gather(*(coalescer.call("unity_ping", {}) for _ in range(3))), 1)
+        assert len(client.calls) == 1
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("tool", sorted(DEFAULT_EXCLUDED))
+def test_excluded_tools_bypass_the_batch(tool):
+    async def main():
+        client = Client()
+        coalescer = RequestCoalescer(client, window=0.01)
+        await asyncio.gather(
+            coalescer.call("unity_ping", {}),
+            coalescer.call(tool, {}),
+            coalescer.call("unity_ping", {}),
+        )
+        assert (tool, {}) in client.calls
+        batch = next(args for name, args in client.calls if name == "unity_batch" and args)
+        assert [entry["tool"] for entry in batch["calls"]] == ["unity_ping", "unity_ping"]
+
+    asyncio.run(main())
+
+
+def test_tools_unity_batch_rejects_are_excluded():
+    assert NOT_BATCHABLE <= DEFAULT_EXCLUDED
+
+
+def test_rejected_batch_error_reaches_every_caller():
+    async def main():
+        client = Client()
+
+        async def reject(tool, args):
+            return {"success": False, "error": "calls must be a non-empty array"}
+
+        client.call = reject
+        coalescer = RequestCoalescer(client, window=0.01)
+        results = await asyncio.gather(coalescer.call("unity_ping", {}), coalescer.call("unity_ping", {}))
+        assert all(result["error"] == "calls must be a non-empty array" for result in results)
+
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""emulator.hierarchy.HierarchyTracker: deltas from published changes, mirroring MCPChangeTracker.cs"""
+
+import pytest
+
+from emulator import EmulatedEditor
+from emulator.hierarchy import HierarchyTracker
+
+
+def listing(editor, **args):
+    result = editor.execute("unity_list_all_gameobjects", args)
+    assert result["success"], result
+    return result
+
+
+def names(objects):
+    return sorted(obj["path"] for obj in objects)
+
+
+@pytest.fixture
+def editor():
+    editor = EmulatedEditor()
+    for name in ("A", "B"):
+        editor.execute("unity_create_primitive", {"name": name})
+    editor.execute("unity_create_primitive", {"name": "Child"})
+    editor.execute("unity_set_parent", {"name": "Child", "parent": "A"})
+    return editor
+
+
+@pytest.fixture
+def visits(monkeypatch):
+    """How many objects the tracker reads per refresh"""
+    counted = []
+    visit = HierarchyTracker._visit
+
+    def counting(self, obj, *args):
+        counted.append(obj.name)
+        return visit(self, obj, *args)
+
+    monkeypatch.setattr(HierarchyTracker, "_visit", counting)
+    return counted
+
+
+def test_revision_only_when_asked_for(editor):
+    assert "revision" not in listing(editor)
+    assert "revision" in listing(editor, revision=True)
+
+
+def test_delta_reports_added_changed_and_removed(editor):
+    since = listing(editor, revision=True)["revision"]
+    editor.execute("unity_create_primitive", {"name": "C"})
+    editor.execute("unity_set_position", {"name": "A", "position": [1, 2, 3]})
+    editor.execute("unity_delete_gameobject", {"name": "B"})
+
+    delta = listing(editor, sinceRevision=since)
+    assert delta["full"] is False
+    assert names(delta["added"]) == ["C"]
+    # Moving A moves its child too
+    assert names(delta["changed"]) == ["A", "A/Child"]
+    assert names(delta["removed"]) == ["B"]
+    assert delta["totalObjects"] == 5
+
+
+def test_reparent_changes_paths_of_the_moved_subtree(editor):
+    since = listing(editor, revision=True)["revision"]
+    editor.execute("unity_set_parent", {"name": "A", "parent": "B"})
+    delta = listing(editor, sinceRevision=since)
+    assert names(delta["changed"]) == ["B/A", "B/A/Child"]
+    assert not delta["added"] and not delta["removed"]
+
+
+def test_objects_created_and_deleted_in_between_are_not_reported(editor):
+    since = listing(editor, revision=True)["revision"]
+    editor.execute("unity_create_primitive", {"name": "Temp"})
+    listing(editor, sinceRevision=since)
+    editor.execute("unity_delete_gameobject", {"name": "Temp"})
+    delta = listing(editor, sinceRevision=since)
+    assert not delta["added"] and not delta["changed"] and not delta["removed"]
+
+
+def test_a_delta_reads_only_the_changed_subtree(editor, visits):
+    since = listing(editor, revision=True)["revision"]
+    visits.clear()
+    editor.execute("unity_set_tag", {"name": "B", "tag": "Player"})
+    delta = listing(editor, sinceRevision=since)
+    assert names(delta["changed"]) == ["B"]
+    assert visits == ["B"]
+
+
+def test_a_full_listing_shares_the_tracker_walk(editor, visits):
+    result = listing(editor, revision=True)
+    scene_size = len(result["objects"])
+    assert len(visits) == scene_size
+    assert names(result["objects"]) == ["A", "A/Child", "B", "Directional Light", "Main Camera"]
+
+
+def test_an_unpublished_change_falls_back_to_a_full_walk(editor, visits):
+    since = listing(editor, revision=True)["revision"]
+    editor.scene.find("A").name = "Renamed"
+    editor.mark_changed()
+    visits.clear()
+    delta = listing(editor, sinceRevision=since)
+    assert names(delta["changed"]) == ["Renamed", "Renamed/Child"]
+    assert len(visits) == delta["totalObjects"]
+
+
+def test_a_token_from_another_scene_gets_a_full_snapshot(editor):
+    since = listing(editor, revision=True)["revision"]
+    assert editor.execute("unity_create_scene", {"name": "Other"})["success"]
+    result = listing(editor, sinceRevision=since)
+    assert result["full"] is True and "objects" in result
@@ -0,0 +1,46 @@
+"""Background jobs run through the emulator's heavy lane, like MCPJobs.cs"""
+
+import asyncio
+import threading
+
+import pytest
+
+from bridge import UnityClient
+from emulator import EditorEmulator
+
+CUBE = {"tool": "unity_create_primitive", "args": {"primitiveType": "cube", "name": "JobCube"}}
+
+
+@pytest.fixture
+def emulator():
+    with EditorEmulator(port=0, tick=0.001) as running:
+        yield running
+
+
+def test_a_job_runs_as_a_heavy_lane_request(emulator):
+    async def main():
+        async with UnityClient(emulator.url) as client:
+            submitted = await client.call("unity_submit_job", CUBE)
+            assert submitted["queuePosition"] == 1
+            done = await client.call("unity_wait_for_job", {"jobId": submitted["jobId"], "waitSeconds": 5})
+            assert done["status"] == "succeeded" and done["result"]["name"] == "JobCube"
+            return (await client.call("unity_get_scheduler_stats", {}))["lanes"]
+
+    lanes = asyncio.run(main())
+    assert lanes["heavy"]["executed"] == 1
+    assert lanes["write"]["executed"] == 0
+
+
+def test_queued_jobs_survive_a_reload(emulator):
+    async def main():
+        async with UnityClient(emulator.url) as client:
+            # Hold the main thread so the job is still queued when the reload starts;
+            # reload() clears the flag once the listeners are back
+            emulator._reloading = True
+            submitted = await client.call("unity_submit_job", CUBE)
+            reload = threading.Thread(target=emulator.reload, args=(0.05,))
+            reload.start()
+            await asyncio.to_thread(reload.join)
+            return await client.call("unity_wait_for_job", {"jobId": submitted["jobId"], "waitSeconds": 5})
+
+    assert asyncio.run(main())["status"] == "succeeded"
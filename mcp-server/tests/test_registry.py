@@ -0,0 +1,85 @@
+"""tools.registry: definition checks at startup, argument checks per call"""
+
+import pytest
+
+from tools import TOOL_REGISTRY, InvalidToolCall, ToolRegistry
+
+
+def tool(name, schema):
+    return {"name": name, "description": name, "inputSchema": schema}
+
+
+POINT = tool("point", {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "position": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3},
+        "space": {"type": "string", "enum": ["world", "local"], "default": "world"},
+        "tags": {"type": "array", "items": {"type": "string"}, "default": []},
+    },
+    "required": ["name"],
+})
+
+
+def test_defaults_are_filled_in_without_touching_the_callers_dict():
+    registry = ToolRegistry([POINT])
+    args = {"name": "Cube"}
+    prepared = registry.prepare("point", args)
+    assert prepared == {"name": "Cube", "space": "world", "tags": []}
+    assert args == {"name": "Cube"}
+
+
+def test_list_defaults_are_not_shared_between_calls():
+    registry = ToolRegistry([POINT])
+    first = registry.prepare("point", {"name": "A"})
+    first["tags"].append("changed")
+    assert registry.prepare("point", {"name": "B"})["tags"] == []
+
+
+def test_given_values_win_over_defaults():
+    registry = ToolRegistry([POINT])
+    assert registry.prepare("point", {"name": "Cube", "space": "local"})["space"] == "local"
+
+
+@pytest.mark.parametrize("args, message", [
+    ({}, "name"),
+    ({"name": 5}, "name"),
+    ({"name": "Cube", "position": [1, 2]}, "position"),
+    ({"name": "Cube", "position": [1, "2", 3]}, "position[1]"),
+    ({"name": "Cube", "space": "screen"}, "space"),
+])
+def test_invalid_arguments_name_the_offending_field(args, message):
+    registry = ToolRegistry([POINT])
+    with pytest.raises(InvalidToolCall, match="Invalid arguments for point") as raised:
+        registry.prepare("point", args)
+    assert message in str(raised.value)
+
+
+def test_unknown_tool():
+    with pytest.raises(InvalidToolCall, match="Unknown tool: unity_nope"):
+        TOOL_REGISTRY.prepare("unity_nope", {})
+
+
+@pytest.mark.parametrize("schema, problem", [
+    ({"type": "object", "properties": {}, "required": ["missing"]}, "missing"),
+    ({"type": "object", "properties": {"n": {"type": "integer", "default": "x"}}}, "default"),
+    ({"type": "object", "properties": {"s": {"type": "string", "pattern": "^a"}}}, "pattern"),
+])
+def test_broken_definitions_fail_at_startup(schema, problem):
+    with pytest.raises(ValueError, match="Invalid tool definitions") as raised:
+        ToolRegistry([tool("broken", schema)])
+    assert problem in str(raised.value)
+
+
+def test_batch_entries_are_checked_against_their_own_tool():
+    with pytest.raises(InvalidToolCall, match=r"calls\[1\]"):
+        TOOL_REGISTRY.prepare("unity_batch", {"calls": [
+            {"tool": "unity_ping"},
+            {"tool": "unity_set_position", "args": {"name": "Cube", "position": [1, 2]}},
+        ]})
+
+
+@pytest.mark.parametrize("name", ["unity_restart_server", "unity_force_compile", "unity_create_scripts"])
+def test_batch_rejects_tools_that_cannot_be_batched(name):
+    with pytest.raises(InvalidToolCall, match="calls"):
+        TOOL_REGISTRY.prepare("unity_batch", {"calls": [{"tool": name}]})
@@ -0,0 +1,152 @@
+"""bridge.reload.ReloadGate: holding calls through a reload and replaying them"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from bridge import ReloadGate
+from bridge.reload import READY, RELOADING, UNAVAILABLE
+
+READ_ONLY = {"unity_get_scene_info", "unity_get_metrics"}
+
+
+class Editor:
+    """A backend that can go away (connection refused) and come back"""
+
+    def __init__(self):
+        self.up = True
+        self.drop_next = False
+        self.ran = []
+
+    async def call(self, tool, args):
+        if not self.up:
+            raise httpx.ConnectError("connection refused")
+        if self.drop_next:
+            # The request reached the editor, then the connection dropped
+            self.drop_next = False
+            self.up = False
+            raise httpx.ReadError("connection reset")
+        self.ran.append(tool)
+        return {"success": True, "tool": tool}
+
+    async def ping(self):
+        return self.up
+
+
+def make_gate(editor, **options):
+    return ReloadGate(editor, ping=editor.ping, read_only_tools=READ_ONLY, probe_interval=0.01, **options)
+
+
+async def ready_gate(editor, **options):
+    gate = make_gate(editor, **options)
+    await gate.call("unity_ping", {})
+    assert gate.state == READY
+    return gate
+
+
+def test_calls_during_a_reload_are_held_and_replayed_in_order():
+    async def main():
+        editor = Editor()
+        gate = await ready_gate(editor)
+        editor.up = False
+        calls = [asyncio.create_task(gate.call("unity_set_position", {"i": i})) for i in range(3)]
+        await asyncio.sleep(0.05)
+        assert gate.state == RELOADING
+        assert not any(call.done() for call in calls)
+
+        editor.up = True
+        results = await asyncio.wait_for(asyncio.gather(*calls), 1)
+        assert all(result["success"] for result in results)
+        assert editor.ran == ["unity_ping"] + ["unity_set_position"] * 3
+        assert gate.state == READY
+        assert gate.replayed == 3
+
+    asyncio.run(main())
+
+
+def test_read_dropped_mid_call_is_replayed():
+    async def main():
+        editor = Editor()
+        gate = await ready_gate(editor)
+        editor.drop_next = True
+        call = asyncio.create_task(gate.call("unity_get_scene_info", {}))
+        await asyncio.sleep(0.05)
+        editor.up = True
+        result = await asyncio.wait_for(call, 1)
+        assert result == {"success": True, "tool": "unity_get_scene_info"}
+
+    asyncio.run(main())
+
+
+def test_write_dropped_mid_call_is_not_replayed():
+    async def main():
+        editor = Editor()
+        gate = await ready_gate(editor)
+        editor.drop_next = True
+        result = await gate.call("unity_set_position", {})
+        assert not result["success"]
+        assert "may or may not have been applied" in result["error"]
+        editor.up = True
+        await asyncio.sleep(0.05)
+        assert editor.ran == ["unity_ping"]
+
+    asyncio.run(main())
+
+
+def test_reset_dropped_mid_call_is_not_replayed():
+    async def main():
+        editor = Editor()
+        gate = await ready_gate(editor)
+        editor.drop_next = True
+        result = await gate.call("unity_get_metrics", {"reset": True})
+        assert not result["success"]
+        assert "may or may not have been applied" in result["error"]
+        editor.up = True
+        await asyncio.sleep(0.05)
+        assert "unity_get_metrics" not in editor.ran
+
+    asyncio.run(main())
+
+
+def test_held_calls_expire_after_the_deadline():
+    async def main():
+        editor = Editor()
+        gate = await ready_gate(editor, deadline=0.05)
+        editor.up = False
+        result = await asyncio.wait_for(gate.call("unity_set_position", {}), 1)
+        assert result["readiness"] == UNAVAILABLE
+        assert "did not come back" in result["error"]
+        assert gate.expired == 1
+
+        later = await gate.call("unity_ping", {})
+        assert later["readiness"] == UNAVAILABLE
+
+    asyncio.run(main())
+
+
+def test_calls_beyond_max_waiting_are_rejected():
+    async def main():
+        editor = Editor()
+        gate = await ready_gate(editor, max_waiting=2)
+        editor.up = False
+        held = [asyncio.create_task(gate.call("unity_ping", {})) for _ in range(2)]
+        await asyncio.sleep(0.02)
+        rejected = await gate.call("unity_ping", {})
+        assert "already waiting" in rejected["error"]
+        assert gate.rejected == 1
+
+        editor.up = True
+        await asyncio.wait_for(asyncio.gather(*held), 1)
+
+    asyncio.run(main())
+
+
+def test_connection_refused_before_first_answer_is_raised():
+    async def main():
+        editor = Editor()
+        editor.up = False
+        await make_gate(editor).call("unity_ping", {})
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(main())
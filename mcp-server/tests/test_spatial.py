@@ -0,0 +1,63 @@
+"""emulator.spatial.SpatialIndex: refits from published changes, mirroring MCPSpatial.cs"""
+
+import pytest
+
+from emulator import EmulatedEditor, GameObject
+
+
+def near(editor, center, radius=1.0):
+    result = editor.execute("unity_spatial_query", {"query": "radius", "center": center, "radius": radius, "limit": 100})
+    assert result["success"], result
+    return sorted(hit["name"] for hit in result["hits"]), result["index"]
+
+
+@pytest.fixture
+def editor():
+    editor = EmulatedEditor()
+    for i in range(40):
+        editor.execute("unity_create_primitive", {"name": f"Rock{i}", "position": [i * 10, 0, 0]})
+    editor.execute("unity_create_primitive", {"name": "Child", "position": [0, 0, 5]})
+    editor.execute("unity_set_parent", {"name": "Child", "parent": "Rock0"})
+    near(editor, [0, 0, 0])
+    return editor
+
+
+def test_a_query_with_nothing_published_reads_nothing(editor):
+    _, index = near(editor, [0, 0, 0])
+    assert index["rebuilt"] is False
+    assert index["refitted"] == 0
+
+
+def test_moving_an_object_refits_only_its_subtree(editor):
+    editor.execute("unity_set_position", {"name": "Rock0", "position": [500, 0, 0]})
+
+    hits, index = near(editor, [500, 0, 5])
+    assert index == {"objects": 41, "rebuilt": False, "refitted": 2}
+    # The child moved with its parent
+    assert hits == ["Child"]
+    assert near(editor, [0, 0, 0])[0] == []
+
+
+def test_moved_boxes_are_found_on_both_sides_of_the_tree(editor):
+    editor.execute("unity_set_transforms", {"targets": ["Rock1", "Rock39"], "positions": [390, 0, 0, 10, 0, 0]})
+
+    assert near(editor, [10, 0, 0])[0] == ["Rock39"]
+    assert near(editor, [390, 0, 0])[0] == ["Rock1"]
+
+
+def test_an_unpublished_change_rebuilds(editor):
+    editor.scene.find("Rock1").local_position = [0, 0, -5]
+    editor.mark_changed()
+
+    hits, index = near(editor, [0, 0, -5])
+    assert index["rebuilt"] is True
+    assert hits == ["Rock1"]
+
+
+def test_a_loaded_scene_copy_does_not_feed_the_index(editor):
+    editor.execute("unity_save_scene", {"path": "Assets/Scenes/Rocks.unity"})
+    saved = editor.saved_scenes["Assets/Scenes/Rocks.unity"]
+    assert saved.listeners == []
+    saved.publish(GameObject("Elsewhere"))
+
+    assert near(editor, [0, 0, 0])[1]["refitted"] == 0
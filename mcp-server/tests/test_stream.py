@@ -0,0 +1,80 @@
+"""bridge.stream / UnityClient: the multiplexed connection, and reconnecting after it drops"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from bridge import StreamConnection, UnityClient
+from bridge.stream import StreamClosed
+from emulator import EditorEmulator
+
+
+@pytest.fixture
+def emulator():
+    with EditorEmulator(port=0, tick=0.001, stream_port=0) as running:
+        yield running
+
+
+def test_many_requests_share_one_connection(emulator):
+    async def main():
+        stream = StreamConnection("127.0.0.1", emulator.stream_port)
+        await stream.connect()
+        try:
+            answers = await asyncio.gather(*(stream.request({"tool": "unity_ping", "args": {}}, 5) for _ in range(20)))
+        finally:
+            await stream.close()
+        assert all('"success":true' in raw for raw, _ in answers)
+        assert all(timing for _, timing in answers)
+
+    asyncio.run(main())
+
+
+def test_closed_connection_refuses_new_requests(emulator):
+    async def main():
+        stream = StreamConnection("127.0.0.1", emulator.stream_port)
+        await stream.connect()
+        await stream.close()
+        with pytest.raises(StreamClosed):
+            await stream.request({"tool": "unity_ping", "args": {}}, 5)
+
+    asyncio.run(main())
+
+
+def test_requests_in_flight_fail_with_read_error_when_the_editor_drops(emulator):
+    async def main():
+        stream = StreamConnection("127.0.0.1", emulator.stream_port)
+        await stream.connect()
+        request = asyncio.create_task(stream.request({"tool": "unity_get_logs", "args": {"waitSeconds": 1}}, 10))
+        await asyncio.sleep(0.1)
+        emulator.close_streams()
+        with pytest.raises(httpx.ReadError):
+            await asyncio.wait_for(request, 2)
+        assert stream.closed
+
+    asyncio.run(main())
+
+
+def test_client_reconnects_after_the_stream_drops(emulator):
+    async def main():
+        async with UnityClient(emulator.url, stream_port=emulator.stream_port) as client:
+            assert (await client.call("unity_ping", {}))["success"]
+            assert client.transport == "stream"
+
+            emulator.close_streams()
+            await asyncio.sleep(0.1)
+            assert client.transport == "http"
+
+            assert (await client.call("unity_ping", {}))["success"]
+            assert client.transport == "stream"
+
+    asyncio.run(main())
+
+
+def test_client_uses_http_while_the_stream_is_unavailable(emulator):
+    async def main():
+        async with UnityClient(emulator.url, stream_port=1, stream_retry=60) as client:
+            assert (await client.call("unity_ping", {}))["success"]
+            assert client.transport == "http"
+
+    asyncio.run(main())
@@ -5,19 +5,39 @@ from .scene_tools import SCENE_TOOLS
 from .ui_tools import UI_TOOLS
 from .gameobject_tools import GAMEOBJECT_TOOLS
 from .prefab_tools import PREFAB_TOOLS
+from .asset_tools import ASSET_TOOLS
 from .script_tools import SCRIPT_TOOLS
+from .batch_tools import build_batch_tool
+from .job_tools import build_job_tools
+from .diagnostics_tools import DIAGNOSTICS_TOOLS
+from .bridge_tools import BRIDGE_TOOLS
+from .registry import ToolRegistry, InvalidToolCall
 
-# Combine all tools
-ALL_TOOLS = (
+# Tools that execute a single operation in Unity
+UNITY_TOOLS = (
     CORE_TOOLS +
     SCENE_TOOLS +
     UI_TOOLS +
     GAMEOBJECT_TOOLS +
     PREFAB_TOOLS +
+    ASSET_TOOLS +
     SCRIPT_TOOLS
 )
 
-__all__ = ['ALL_TOOLS']
+# unity_batch can dispatch to any single-operation tool
+BATCH_TOOLS = [build_batch_tool(UNITY_TOOLS)]
+
+# Any of those, including unity_batch, can run as a background job
+JOB_TOOLS = build_job_tools(UNITY_TOOLS + BATCH_TOOLS)
+
+# Combine all tools; DIAGNOSTICS_TOOLS cannot be batched or run as jobs, and
+# BRIDGE_TOOLS are answered by the MCP server, not Unity
+ALL_TOOLS = UNITY_TOOLS + BATCH_TOOLS + JOB_TOOLS + DIAGNOSTICS_TOOLS + BRIDGE_TOOLS
+
+# Checked and compiled once, on import; raises if a definition is broken
+TOOL_REGISTRY = ToolRegistry(ALL_TOOLS)
+
+__all__ = ['ALL_TOOLS', 'BRIDGE_TOOLS', 'TOOL_REGISTRY', 'ToolRegistry', 'InvalidToolCall']
 
 
 
@@ -0,0 +1,49 @@
+"""Asset Search Tools"""
+
+ASSET_TOOLS = [
+    {
+        "name": "unity_search_assets",
+        "description": "Search the project's assets under Assets/ by type, name, folder and label. Served from an index the editor keeps up to date as assets are imported, moved and deleted, so searches do not rescan the AssetDatabase. Returns GUID, path, name and main type for each match, sorted by path, one page at a time.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "type": {
+                    "type": "string",
+                    "description": "Main asset type, e.g. 'Material', 'AudioClip', 'ScriptableObject' subclass name, or one of 'Prefab', 'Model', 'Scene', 'Script', 'Texture'"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Asset name, case-insensitive. Supports * and ? wildcards; without them, matches names containing the text"
+                },
+                "folder": {
+                    "type": "string",
+                    "description": "Only assets in this folder (e.g. 'Assets/Prefabs' or 'Prefabs')"
+                },
+                "recursive": {
+                    "type": "boolean",
+                    "description": "With folder: include subfolders",
+                    "default": True
+                },
+                "label": {
+                    "type": "string",
+                    "description": "Only assets with this asset label"
+                },
+                "pageSize": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 1000,
+                    "description": "Assets per page",
+                    "default": 50
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "nextCursor from the previous page, to continue the same search"
+                }
+            },
+            "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
+        }
+    }
+]
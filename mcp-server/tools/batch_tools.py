@@ -0,0 +1,50 @@
+"""Batch Execution Tools"""
+
+# Tools a batch entry may not call: a restart or forced compile tears down
+# the listener mid-batch, and unity_create_scripts hands back a waitId that
+# only a direct call collects. MCPTools.Batch rejects them as well.
+NOT_BATCHABLE = frozenset({
+    "unity_restart_server",
+    "unity_force_compile",
+    "unity_create_scripts",
+})
+
+
+def build_batch_tool(tools):
+    """Build the unity_batch definition; entries may call any of `tools` except NOT_BATCHABLE"""
+    return {
+        "name": "unity_batch",
+        "description": "Execute many tool calls in one round-trip. Entries run in order inside a single Unity main-thread tick and share one undo group. Returns one result per entry in 'results'. Use this instead of many sequential calls when building levels or UI.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Ordered list of tool calls to execute",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {
+                                "type": "string",
+                                "enum": [tool["name"] for tool in tools if tool["name"] not in NOT_BATCHABLE],
+                                "description": "Name of the tool to call (e.g., 'unity_set_position')"
+                            },
+                            "args": {
+                                "type": "object",
+                                "description": "Arguments for the tool, same as calling it directly",
+                                "default": {}
+                            }
+                        },
+                        "required": ["tool"]
+                    }
+                },
+                "stopOnError": {
+                    "type": "boolean",
+                    "description": "If true, stop at the first failing entry and mark the rest as skipped. If false, run every entry.",
+                    "default": True
+                }
+            },
+            "required": ["calls"]
+        }
+    }
@@ -0,0 +1,61 @@
+"""MCP Server Tools - answered by the Python server itself, without a Unity round-trip"""
+
+BRIDGE_TOOLS = [
+    {
+        "name": "unity_cache_stats",
+        "description": "Show the MCP server's read cache statistics: entries, hits, misses, hit rate and invalidations. Reads of scene info, the object list and find results are cached until something changes the scene.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "reset": {
+                    "type": "boolean",
+                    "description": "Reset the hit/miss counters after reading them",
+                    "default": False
+                }
+            },
+            "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
+        }
+    },
+    {
+        "name": "unity_get_readiness",
+        "description": "Show whether Unity can take tool calls: ready, reloading (scripts are recompiling; calls are held and replayed in order once the editor is back), replaying, unavailable (it did not come back in time; calls fail at once) or unknown (not reached yet). Also reports how many calls are waiting and how long the last reload took. Check this instead of retrying failed calls.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
+        }
+    },
+    {
+        "name": "unity_get_metrics",
+        "description": "Show where tool call time goes, per tool: latency percentiles (p50/p95/p99/max) for each phase. Editor phases: parse, queue (waiting for an editor update), exec (running the tool on the main thread), serialize and editorWait (long-polls, compile waits). MCP server phases: transport (network and HTTP/stream overhead), decode, format and total. Use to find which tools and phases are slow.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "tool": {
+                    "type": "string",
+                    "description": "Only report this tool (e.g., 'unity_list_all_gameobjects')"
+                },
+                "histogram": {
+                    "type": "boolean",
+                    "description": "Include the raw bucket counts, keyed by bucket upper bound in ms",
+                    "default": False
+                },
+                "reset": {
+                    "type": "boolean",
+                    "description": "Reset the histograms after reading them",
+                    "default": False
+                }
+            },
+            "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
+        }
+    }
+]
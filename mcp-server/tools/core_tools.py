@@ -8,6 +8,9 @@ CORE_TOOLS = [
             "type": "object",
             "properties": {},
             "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
         }
     },
     {
@@ -26,6 +29,9 @@ CORE_TOOLS = [
             "type": "object",
             "properties": {},
             "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
         }
     },
     {
@@ -35,11 +41,14 @@ CORE_TOOLS = [
             "type": "object",
             "properties": {},
             "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
         }
     },
     {
         "name": "unity_get_logs",
-        "description": "Get recent Unity console logs (errors, warnings, and messages). Essential for debugging issues.",
+        "description": "Get recent Unity console logs (errors, warnings, and messages). Essential for debugging issues. Filter by type and message text, tail with sinceIndex/nextIndex, and use waitSeconds to block until a matching entry arrives instead of polling. The bridge's per-request trace lines ([MCP] Received/Executing/Response sent) are left out; its errors and warnings are not.",
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -52,9 +61,39 @@ CORE_TOOLS = [
                     "type": "boolean",
                     "description": "Include file and line number information",
                     "default": False
+                },
+                "sinceIndex": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Return entries from this console index on, oldest first (pass nextIndex from the previous call to tail the log)"
+                },
+                "types": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["Log", "Warning", "Error"]
+                    },
+                    "description": "Only return entries of these types"
+                },
+                "contains": {
+                    "type": "string",
+                    "description": "Only return entries whose message contains this text (case-insensitive)"
+                },
+                "pattern": {
+                    "type": "string",
+                    "description": "Only return entries whose message matches this regular expression"
+                },
+                "waitSeconds": {
+                    "type": "number",
+                    "minimum": 0,
+                    "maximum": 25,
+                    "description": "Long-poll: if nothing matches yet, wait up to this many seconds for a matching entry before returning (timedOut: true if none arrived)"
                 }
             },
             "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
         }
     },
     {
@@ -86,8 +125,29 @@ CORE_TOOLS = [
         "description": "Get information about the current Unity scene",
         "inputSchema": {
             "type": "object",
-            "properties": {},
+            "properties": {
+                "fields": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["sceneName", "scenePath", "isLoaded", "rootObjectCount", "rootObjects"]
+                    },
+                    "description": "Only include these fields (default: all)"
+                },
+                "pageSize": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Return at most this many root object names, plus a nextCursor if there are more"
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "nextCursor from the previous page"
+                }
+            },
             "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
         }
     }
 ]
@@ -0,0 +1,22 @@
+"""Editor Diagnostics Tools - answered on Unity's listener thread, so they work while the main thread is busy"""
+
+DIAGNOSTICS_TOOLS = [
+    {
+        "name": "unity_get_scheduler_stats",
+        "description": "Show how the editor schedules tool calls on its main thread: queue depth, executed count, average/max wait and run time per lane (read, write, heavy), plus frames that went over the per-update time budget. Use to diagnose slow responses under load.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "reset": {
+                    "type": "boolean",
+                    "description": "Reset the counters after reading them",
+                    "default": False
+                }
+            },
+            "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
+        }
+    }
+]
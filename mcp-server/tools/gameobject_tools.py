@@ -15,7 +15,7 @@ GAMEOBJECT_TOOLS = [
                 "primitiveType": {
                     "type": "string",
                     "description": "Type of primitive: Sphere, Capsule, Cylinder, Plane, Quad, or Cube",
-                    "default": "Sphere"
+                    "default": "Cube"
                 },
                 "position": {
                     "type": "array",
@@ -35,7 +35,7 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the GameObject to delete"
+                    "description": "Name of the GameObject to delete, or its handle (e.g. 'id:12345')"
                 }
             },
             "required": ["name"]
@@ -49,10 +49,13 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the GameObject to find"
+                    "description": "Name of the GameObject to find, or its handle (e.g. 'id:12345')"
                 }
             },
             "required": ["name"]
+        },
+        "annotations": {
+            "readOnlyHint": True
         }
     },
     {
@@ -63,7 +66,7 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the GameObject"
+                    "description": "Name of the GameObject, or its handle (e.g. 'id:12345')"
                 },
                 "position": {
                     "type": "array",
@@ -86,11 +89,11 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the child GameObject"
+                    "description": "Name of the child GameObject, or its handle (e.g. 'id:12345')"
                 },
                 "parent": {
                     "type": "string",
-                    "description": "Name of the parent GameObject. Leave empty or null to unparent."
+                    "description": "Name of the parent GameObject, or its handle (e.g. 'id:12345'). Leave empty or null to unparent."
                 },
                 "worldPositionStays": {
                     "type": "boolean",
@@ -109,7 +112,7 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "cameraName": {
                     "type": "string",
-                    "description": "Name of the camera GameObject",
+                    "description": "Name of the camera GameObject, or its handle (e.g. 'id:12345')",
                     "default": "Main Camera"
                 },
                 "clearFlags": {
@@ -135,7 +138,7 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the GameObject to add particle trail to"
+                    "description": "Name of the GameObject to add particle trail to, or its handle (e.g. 'id:12345')"
                 },
                 "color": {
                     "type": "string",
@@ -163,11 +166,203 @@ GAMEOBJECT_TOOLS = [
     },
     {
         "name": "unity_list_all_gameobjects",
-        "description": "List all GameObjects in the current scene (recursive). Returns full hierarchy with position, active state, tag, and layer.",
+        "description": "List all GameObjects in the current scene (recursive). Returns full hierarchy with position, active state, tag, and layer. Pass revision: true for a revision token, then pass that token back as sinceRevision to get only the objects added, changed and removed since then. Use fields, rootPath, maxDepth and pageSize/cursor to explore large scenes in bounded chunks.",
         "inputSchema": {
             "type": "object",
-            "properties": {},
+            "properties": {
+                "revision": {
+                    "type": "boolean",
+                    "description": "Also return a revision token for later sinceRevision calls (first page only)",
+                    "default": False
+                },
+                "sinceRevision": {
+                    "type": "integer",
+                    "description": "Revision from an earlier call; returns only added, changed and removed objects since then. Falls back to a full snapshot (full: true) if the revision is unknown, e.g. after a scene change or domain reload"
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["instanceId", "name", "path", "active", "tag", "layer", "position"]
+                    },
+                    "description": "Only include these fields per object (default: all)"
+                },
+                "rootPath": {
+                    "type": "string",
+                    "description": "Only list this GameObject and its descendants: a path such as 'Canvas/Panel' or a handle such as 'id:12345'"
+                },
+                "maxDepth": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Stop this many levels below the roots (0 = roots only)"
+                },
+                "pageSize": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Return at most this many objects, plus a nextCursor if there are more"
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "nextCursor from the previous page; pass the same rootPath, maxDepth and fields"
+                },
+                "encoding": {
+                    "type": "string",
+                    "enum": ["rows", "columnar"],
+                    "description": "rows (default): one object per GameObject in 'objects'. columnar: one array per field in 'columns', with positions flattened to [x0, y0, z0, x1, ...]; much smaller for large scenes"
+                }
+            },
             "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
+        }
+    },
+    {
+        "name": "unity_query_gameobjects",
+        "description": "Find GameObjects matching a predicate, evaluated inside the editor, and return only their handles (plus any requested fields). Much cheaper than listing the whole hierarchy and filtering it yourself. Every key of 'where' must hold, e.g. {\"component\": \"Enemy\", \"layer\": \"Enemies\", \"active\": true}; use 'any' for alternatives and 'not' to exclude.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "where": {
+                    "type": "object",
+                    "description": "Predicate; all keys must hold (an empty object matches everything)",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Name glob: '*' any characters, '?' one character (e.g. 'Enemy*')"
+                        },
+                        "path": {
+                            "type": "string",
+                            "description": "Hierarchy path glob: '*' within one level, '**' across levels (e.g. 'Level1/**/Spawn?')"
+                        },
+                        "tag": {
+                            "type": "string",
+                            "description": "Tag, which must exist in the project"
+                        },
+                        "layer": {
+                            "type": ["string", "integer"],
+                            "description": "Layer name or index (0-31)"
+                        },
+                        "component": {
+                            "type": ["string", "array"],
+                            "description": "Component type name, or a list of them that must all be present (e.g. 'Rigidbody', ['Enemy', 'Animator'])",
+                            "items": {"type": "string"}
+                        },
+                        "active": {
+                            "type": "boolean",
+                            "description": "Active in the hierarchy (true) or not (false)"
+                        },
+                        "under": {
+                            "type": "string",
+                            "description": "Only descendants of this GameObject (name, path or handle)"
+                        },
+                        "any": {
+                            "type": "array",
+                            "description": "At least one of these predicates must hold",
+                            "items": {"type": "object"},
+                            "minItems": 1
+                        },
+                        "not": {
+                            "type": "object",
+                            "description": "This predicate must not hold"
+                        }
+                    }
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["instanceId", "name", "path", "active", "tag", "layer", "position", "components"]
+                    },
+                    "description": "Return these fields for each match next to its handle (default: handles only)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 10000,
+                    "description": "Stop after this many matches; 'truncated' says whether there were more",
+                    "default": 100
+                },
+                "encoding": {
+                    "type": "string",
+                    "enum": ["rows", "columnar"],
+                    "description": "With fields: rows (default) or columnar, as in unity_list_all_gameobjects"
+                }
+            },
+            "required": []
+        },
+        "annotations": {
+            "readOnlyHint": True
+        }
+    },
+    {
+        "name": "unity_spatial_query",
+        "description": "Find GameObjects by where they are, using the world bounds of their Renderers and Colliders: within a radius of a point, overlapping a box, the nearest ones to a point, or hit by a ray (nearest first). Served from a bounds tree the editor keeps between calls, so repeated queries on large scenes do not rescan every object. Returns handles, names and distances, closest first.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "enum": ["radius", "box", "nearest", "raycast"],
+                    "description": "radius: bounds within radius of center. box: bounds overlapping boundsMin..boundsMax. nearest: the limit closest to center. raycast: bounds hit by the ray from origin along direction"
+                },
+                "center": {
+                    "type": "array",
+                    "description": "radius/nearest: the point [x, y, z]",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3
+                },
+                "radius": {
+                    "type": "number",
+                    "description": "radius: distance from center to an object's bounds",
+                    "minimum": 0
+                },
+                "boundsMin": {
+                    "type": "array",
+                    "description": "box: lower corner [x, y, z]",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3
+                },
+                "boundsMax": {
+                    "type": "array",
+                    "description": "box: upper corner [x, y, z]",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3
+                },
+                "origin": {
+                    "type": "array",
+                    "description": "raycast: start of the ray [x, y, z]",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3
+                },
+                "direction": {
+                    "type": "array",
+                    "description": "raycast: direction of the ray [x, y, z]; need not be normalized",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3
+                },
+                "maxDistance": {
+                    "type": "number",
+                    "description": "nearest/raycast: ignore objects farther than this (default: no limit)",
+                    "minimum": 0
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 10000,
+                    "description": "Return at most this many hits, closest first (for nearest: how many)",
+                    "default": 10
+                }
+            },
+            "required": ["query"]
+        },
+        "annotations": {
+            "readOnlyHint": True
         }
     },
     {
@@ -178,7 +373,7 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the GameObject"
+                    "description": "Name of the GameObject, or its handle (e.g. 'id:12345')"
                 },
                 "rotation": {
                     "type": "array",
@@ -199,7 +394,7 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the GameObject"
+                    "description": "Name of the GameObject, or its handle (e.g. 'id:12345')"
                 },
                 "scale": {
                     "type": "array",
@@ -212,6 +407,68 @@ GAMEOBJECT_TOOLS = [
             "required": ["name", "scale"]
         }
     },
+    {
+        "name": "unity_set_transforms",
+        "description": "Set the position, rotation and/or scale of many GameObjects in one call, one main-thread pass and one undo step. Use instead of many unity_set_position/unity_set_rotation/unity_set_scale calls (e.g. moving 200 enemies). Values are flat arrays with 3 numbers per target, in targets order ([x0, y0, z0, x1, y1, z1, ...]), or 3 numbers applied to every target; or one base64 'packed' buffer. All targets must exist or nothing changes, unless skipMissing is set.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "targets": {
+                    "type": "array",
+                    "description": "GameObject names, paths or handles (e.g. 'id:12345')",
+                    "items": {"type": "string"},
+                    "minItems": 1
+                },
+                "positions": {
+                    "type": "array",
+                    "description": "Positions [x0, y0, z0, x1, ...], 3 per target or 3 for all",
+                    "items": {"type": "number"},
+                    "minItems": 3
+                },
+                "rotations": {
+                    "type": "array",
+                    "description": "Euler angles in degrees [x0, y0, z0, x1, ...], 3 per target or 3 for all",
+                    "items": {"type": "number"},
+                    "minItems": 3
+                },
+                "scales": {
+                    "type": "array",
+                    "description": "Local scales [x0, y0, z0, x1, ...], 3 per target or 3 for all",
+                    "items": {"type": "number"},
+                    "minItems": 3
+                },
+                "packed": {
+                    "type": "string",
+                    "description": "Instead of the arrays: base64 of little-endian float32 values holding, per target, 3 floats for each of packedChannels in that order"
+                },
+                "packedChannels": {
+                    "type": "array",
+                    "description": "Channels in the packed buffer, in order",
+                    "items": {"type": "string", "enum": ["position", "rotation", "scale"]},
+                    "minItems": 1,
+                    "maxItems": 3,
+                    "default": ["position"]
+                },
+                "space": {
+                    "type": "string",
+                    "enum": ["world", "local"],
+                    "description": "Whether positions and rotations are world or relative to the parent. Scale is always local.",
+                    "default": "world"
+                },
+                "relative": {
+                    "type": "boolean",
+                    "description": "Apply as offsets: positions are added, rotations are applied on top of the current one, scales multiply",
+                    "default": False
+                },
+                "skipMissing": {
+                    "type": "boolean",
+                    "description": "Update the targets that exist and list the others in notFound, instead of failing the whole call",
+                    "default": False
+                }
+            },
+            "required": ["targets"]
+        }
+    },
     {
         "name": "unity_set_tag",
         "description": "Set the tag of a GameObject. Tags are useful for finding objects and organizing the scene hierarchy.",
@@ -220,7 +477,7 @@ GAMEOBJECT_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the GameObject"
+                    "description": "Name of the GameObject, or its handle (e.g. 'id:12345')"
                 },
                 "tag": {
                     "type": "string",
@@ -0,0 +1,83 @@
+"""Asynchronous Job Tools"""
+
+
+def build_job_tools(tools):
+    """Build the job tool definitions; jobs may run any of `tools`"""
+    return [
+        {
+            "name": "unity_submit_job",
+            "description": "Run a tool as a background job and return a jobId immediately. Use for slow operations (importing heavy assets, saving scenes, compiling) that could hit the 30 second request timeout. Follow up with unity_wait_for_job or unity_get_job_status, then unity_get_job_result.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "tool": {
+                        "type": "string",
+                        "enum": [tool["name"] for tool in tools],
+                        "description": "Name of the tool to run (e.g., 'unity_create_prefab_from_asset')"
+                    },
+                    "args": {
+                        "type": "object",
+                        "description": "Arguments for the tool, same as calling it directly",
+                        "default": {}
+                    }
+                },
+                "required": ["tool"]
+            }
+        },
+        {
+            "name": "unity_get_job_status",
+            "description": "Get a job's status (queued, running, succeeded or failed), progress (0-1) and timing without waiting. Omit jobId to list every retained job. Finished jobs are kept for 10 minutes, at most 100 of them.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "jobId": {
+                        "type": "string",
+                        "description": "Job ID returned by unity_submit_job"
+                    }
+                },
+                "required": []
+            },
+            "annotations": {
+                "readOnlyHint": True
+            }
+        },
+        {
+            "name": "unity_wait_for_job",
+            "description": "Wait until a job finishes or waitSeconds pass. Returns the job status with timedOut, plus the tool's result once finished. Call again if it timed out.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "jobId": {
+                        "type": "string",
+                        "description": "Job ID returned by unity_submit_job"
+                    },
+                    "waitSeconds": {
+                        "type": "number",
+                        "description": "Longest time to wait, in seconds (at most 25)",
+                        "default": 20
+                    }
+                },
+                "required": ["jobId"]
+            },
+            "annotations": {
+                "readOnlyHint": True
+            }
+        },
+        {
+            "name": "unity_get_job_result",
+            "description": "Get the result of a finished job: the tool's own response, as if it had been called directly, plus jobId. Fails while the job is still queued or running.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "jobId": {
+                        "type": "string",
+                        "description": "Job ID returned by unity_submit_job"
+                    }
+                },
+                "required": ["jobId"]
+            },
+            "annotations": {
+                "readOnlyHint": True
+            }
+        }
+    ]
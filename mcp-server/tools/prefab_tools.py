@@ -9,7 +9,7 @@ PREFAB_TOOLS = [
             "properties": {
                 "gameObjectName": {
                     "type": "string",
-                    "description": "Name of the GameObject in the scene to save as prefab"
+                    "description": "Name of the GameObject in the scene to save as prefab, or its handle (e.g. 'id:12345')"
                 },
                 "prefabPath": {
                     "type": "string",
@@ -21,7 +21,7 @@ PREFAB_TOOLS = [
     },
     {
         "name": "unity_update_prefab",
-        "description": "Update an existing prefab file IN-PLACE without deletion. More sustainable than delete-and-recreate. Supports adding/removing components and setting properties. This is the preferred way to modify existing prefabs.",
+        "description": "Update an existing prefab file IN-PLACE without deletion. More sustainable than delete-and-recreate. Pass an ordered list of operations (add/remove components, set properties, on the root or on children by path); they are applied to one loaded copy of the prefab and saved once, so configuring several fields costs one load/save/reimport instead of one per field. If any operation fails, nothing is saved. A single action is still accepted. This is the preferred way to modify existing prefabs.",
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -29,24 +29,54 @@ PREFAB_TOOLS = [
                     "type": "string",
                     "description": "Path to the existing prefab (e.g., 'Assets/Prefabs/Enemy.prefab')"
                 },
+                "operations": {
+                    "type": "array",
+                    "description": "Modifications to apply in order, e.g. [{\"action\": \"add_component\", \"componentType\": \"Rigidbody\"}, {\"action\": \"set_property\", \"componentType\": \"Rigidbody\", \"propertyName\": \"m_Mass\", \"value\": 2}, {\"action\": \"set_property\", \"target\": \"Body/Weapon\", \"componentType\": \"BoxCollider\", \"propertyName\": \"m_IsTrigger\", \"value\": true}]",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "action": {
+                                "type": "string",
+                                "enum": ["add_component", "remove_component", "set_property"]
+                            },
+                            "target": {
+                                "type": "string",
+                                "description": "Child of the prefab root by path (e.g. 'Body/Weapon'); omit for the root"
+                            },
+                            "componentType": {
+                                "type": "string",
+                                "description": "Component type (e.g., 'Rigidbody', 'Enemy', 'UnityEngine.ParticleSystem')"
+                            },
+                            "propertyName": {
+                                "type": "string",
+                                "description": "Serialized property for set_property (e.g., 'bulletPrefab', 'm_Mass')"
+                            },
+                            "value": {
+                                "description": "Value for set_property: number, boolean, string, enum name, [x, y(, z)] vector, [r, g, b(, a)] color, or {\"type\": \"reference\", \"path\": \"Assets/...\"} (path may also be a GUID or a unique asset name)"
+                            }
+                        },
+                        "required": ["action", "componentType"]
+                    }
+                },
                 "action": {
                     "type": "string",
                     "enum": ["add_component", "remove_component", "set_property"],
-                    "description": "What modification to perform on the prefab"
+                    "description": "Single modification to perform, instead of operations"
                 },
                 "componentType": {
                     "type": "string",
-                    "description": "Component type for add/remove/set actions (e.g., 'Rigidbody', 'Enemy', 'UnityEngine.ParticleSystem')"
+                    "description": "With action: component type (e.g., 'Rigidbody', 'Enemy', 'UnityEngine.ParticleSystem')"
                 },
                 "propertyName": {
                     "type": "string",
-                    "description": "Property name for 'set_property' action (e.g., 'bulletPrefab', 'bloodEffect')"
+                    "description": "With action 'set_property': property name (e.g., 'bulletPrefab', 'bloodEffect')"
                 },
                 "value": {
-                    "description": "Value to set for 'set_property' action. Can be primitive or {\"type\": \"reference\", \"path\": \"Assets/...\"} for asset references"
+                    "description": "With action 'set_property': value to set. Can be primitive or {\"type\": \"reference\", \"path\": \"Assets/...\"} for asset references (path may also be a GUID or a unique asset name)"
                 }
             },
-            "required": ["prefabPath", "action"]
+            "required": ["prefabPath"]
         }
     },
     {
@@ -70,6 +100,160 @@ PREFAB_TOOLS = [
             },
             "required": ["assetPath", "prefabPath"]
         }
+    },
+    {
+        "name": "unity_create_prefabs_from_assets",
+        "description": "Create a prefab for each of many assets (FBX, models or prefabs) in one call: pick them by path glob and/or list, save the prefabs into one folder with a naming template, and optionally add components to each. All saves happen in one asset-editing session, so the new prefabs are imported together instead of one refresh per prefab. Returns per-asset timings and failures; one bad asset does not stop the rest.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "assetGlob": {
+                    "type": "string",
+                    "description": "Source assets by path glob: * and ? within a folder, ** across folders (e.g. 'Assets/Characters/FBX/*.fbx')"
+                },
+                "assets": {
+                    "type": "array",
+                    "description": "Source assets by path, GUID or unique asset name; combined with assetGlob if both are given",
+                    "items": {"type": "string"}
+                },
+                "outputFolder": {
+                    "type": "string",
+                    "description": "Folder for the prefabs, created if missing (e.g. 'Assets/Prefabs/Heroes' or 'Prefabs/Heroes')"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Prefab name template: {name} is the source file name without extension, {i} its position in the list (default '{name}')",
+                    "default": "{name}"
+                },
+                "components": {
+                    "type": "array",
+                    "description": "Component types to add to each prefab's root if missing (e.g. ['Rigidbody', 'CapsuleCollider', 'Enemy'])",
+                    "items": {"type": "string"}
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace prefabs that already exist; when false they are reported as failures",
+                    "default": True
+                }
+            },
+            "required": ["outputFolder"]
+        }
+    },
+    {
+        "name": "unity_instantiate_prefabs",
+        "description": "Place many instances of one prefab in one call and one undo step, and return their handles. Give explicit positions (3 numbers per instance) or a pattern: 'grid' (rows along +Z, columns along +X from origin), 'ring' (evenly around origin) or 'scatter' (seeded random inside bounds). Instances keep their prefab link. Optional parent, naming scheme, rotations/scales and property overrides for all or for individual instances.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "prefabPath": {
+                    "type": "string",
+                    "description": "Prefab to instantiate (e.g., 'Assets/Prefabs/Enemy.prefab' or 'Prefabs/Enemy')"
+                },
+                "count": {
+                    "type": "integer",
+                    "description": "Number of instances (at most 10000); implied by positions when those are given",
+                    "minimum": 1
+                },
+                "positions": {
+                    "type": "array",
+                    "description": "Positions [x0, y0, z0, x1, ...], 3 per instance. Local to parent when one is given.",
+                    "items": {"type": "number"},
+                    "minItems": 3
+                },
+                "pattern": {
+                    "type": "object",
+                    "description": "Generated positions instead of explicit ones. Local to parent when one is given.",
+                    "properties": {
+                        "type": {
+                            "type": "string",
+                            "enum": ["grid", "ring", "scatter"]
+                        },
+                        "origin": {
+                            "type": "array",
+                            "description": "Grid: first cell. Ring: center. [x, y, z], default [0, 0, 0]",
+                            "items": {"type": "number"},
+                            "minItems": 3,
+                            "maxItems": 3
+                        },
+                        "columns": {
+                            "type": "integer",
+                            "description": "Grid: cells per row (default: square-ish)",
+                            "minimum": 1
+                        },
+                        "spacing": {
+                            "type": "array",
+                            "description": "Grid: distance between cells [x, z] (default [2, 2])",
+                            "items": {"type": "number"},
+                            "minItems": 2,
+                            "maxItems": 2
+                        },
+                        "radius": {
+                            "type": "number",
+                            "description": "Ring: radius (default 5)"
+                        },
+                        "startAngle": {
+                            "type": "number",
+                            "description": "Ring: angle of the first instance in degrees, clockwise from +Z (default 0)"
+                        },
+                        "boundsMin": {
+                            "type": "array",
+                            "description": "Scatter: lower corner [x, y, z]",
+                            "items": {"type": "number"},
+                            "minItems": 3,
+                            "maxItems": 3
+                        },
+                        "boundsMax": {
+                            "type": "array",
+                            "description": "Scatter: upper corner [x, y, z]",
+                            "items": {"type": "number"},
+                            "minItems": 3,
+                            "maxItems": 3
+                        },
+                        "seed": {
+                            "type": "integer",
+                            "description": "Scatter: random seed; the same seed gives the same layout (default 0)"
+                        }
+                    },
+                    "required": ["type"]
+                },
+                "rotations": {
+                    "type": "array",
+                    "description": "Local Euler angles in degrees, 3 per instance or 3 for all",
+                    "items": {"type": "number"},
+                    "minItems": 3
+                },
+                "scales": {
+                    "type": "array",
+                    "description": "Local scales, 3 per instance or 3 for all",
+                    "items": {"type": "number"},
+                    "minItems": 3
+                },
+                "parent": {
+                    "type": "string",
+                    "description": "Parent GameObject name, path or handle"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Instance names; {prefab} is the prefab's name and {i} the instance number",
+                    "default": "{prefab}_{i}"
+                },
+                "startIndex": {
+                    "type": "integer",
+                    "description": "Number of the first instance in {i}",
+                    "default": 0
+                },
+                "properties": {
+                    "type": "object",
+                    "description": "Overrides for every instance: {\"Component.property\": value} on the prefab's root components, e.g. {\"Rigidbody.m_Mass\": 2}; property is the serialized name. Values: numbers, booleans, strings, enum names, [x, y(, z)] vectors, [r, g, b(, a)] colors, a GameObject name/handle or {\"type\": \"reference\", \"path\": \"Assets/...\"}."
+                },
+                "overrides": {
+                    "type": "array",
+                    "description": "Overrides per instance, same format as properties; entry i applies to instance i (null to skip) and wins over properties",
+                    "items": {"type": ["object", "null"]}
+                }
+            },
+            "required": ["prefabPath"]
+        }
     }
 ]
 
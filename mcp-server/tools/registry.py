@@ -0,0 +1,274 @@
+"""Tool registry: definitions checked once at startup, arguments checked locally on every call"""
+
+import copy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# A compiled check returns None for a valid value, else (where, what is wrong).
+# `where` is relative to the value: "" for the value itself, "position",
+# "calls[2].args.name" and so on.
+Problem = Tuple[str, str]
+Check = Callable[[Any], Optional[Problem]]
+
+# The JSON Schema keywords the tool definitions use. Anything else is
+# reported at startup instead of being silently ignored by the checks.
+SUPPORTED_KEYWORDS = frozenset({
+    "type", "description", "properties", "required", "items", "enum",
+    "minimum", "maximum", "minItems", "maxItems", "default",
+})
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    # JSON has one number type: 5.0 is an integer, true is not a number
+    "integer": lambda value: (
+        isinstance(value, int) and not isinstance(value, bool)
+        or isinstance(value, float) and value.is_integer()
+    ),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+
+class InvalidToolCall(ValueError):
+    """An unknown tool, or arguments that do not match its inputSchema"""
+
+
+def _json_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return "null" if value is None else type(value).__name__
+
+
+def _copier(default: Any) -> Optional[Callable[[Any], Any]]:
+    """How to hand out a default without sharing it between calls"""
+    if not isinstance(default, (list, dict)):
+        return None
+    members = default.values() if isinstance(default, dict) else default
+    if any(isinstance(member, (list, dict)) for member in members):
+        return copy.deepcopy
+    return type(default)
+
+
+def _items(count: int) -> str:
+    return f"{count} item" if count == 1 else f"{count} items"
+
+
+def _nest(key: str, problem: Problem) -> Problem:
+    where, what = problem
+    if not where:
+        return key, what
+    return (key + where if where.startswith("[") else f"{key}.{where}"), what
+
+
+class _Compiler:
+    """Turns inputSchemas into nested closures, collecting definition problems"""
+
+    def __init__(self, checks: Dict[str, Check]):
+        # Filled in by ToolRegistry; {tool, args} objects look their tool up here
+        self.checks = checks
+        self.problems: List[str] = []
+
+    def compile(self, schema: Dict[str, Any], where: str) -> Check:
+        unknown = set(schema) - SUPPORTED_KEYWORDS
+        if unknown:
+            self.problems.append(f"{where}: unsupported keywords {sorted(unknown)}")
+
+        types = schema.get("type")
+        names = [] if types is None else [types] if isinstance(types, str) else list(types)
+        unknown_types = [name for name in names if name not in _TYPE_CHECKS]
+        if unknown_types:
+            self.problems.append(f"{where}: unknown type {unknown_types}")
+        type_checks = [_TYPE_CHECKS[name] for name in names if name in _TYPE_CHECKS]
+        expected = " or ".join(names)
+        if not type_checks:
+            is_type = None
+        elif len(type_checks) == 1:
+            is_type = type_checks[0]
+        else:
+            is_type = lambda value: any(type_check(value) for type_check in type_checks)
+
+        enum = schema.get("enum")
+        if enum is not None:
+            for option in enum:
+                if is_type is not None and not is_type(option):
+                    self.problems.append(f"{where}: enum value {option!r} is not {expected}")
+            listed = (
+                f"one of {', '.join(map(repr, enum))}" if len(enum) <= 8
+                else f"one of the {len(enum)} values listed in the schema"
+            )
+            try:
+                enum = frozenset(enum)
+            except TypeError:
+                enum = tuple(enum)
+
+        if "properties" in schema or types == "object":
+            detail = self._compile_object(schema, where)
+        elif "items" in schema or types == "array":
+            detail = self._compile_array(schema, where)
+        elif types in ("number", "integer"):
+            detail = self._compile_range(schema)
+        else:
+            detail = None
+
+        def check(value: Any) -> Optional[Problem]:
+            if is_type is not None and not is_type(value):
+                return "", f"must be {expected}, got {_json_type(value)}"
+            if enum is not None and value not in enum:
+                return "", f"must be {listed}; got {value!r}"
+            if detail is not None:
+                return detail(value)
+            return None
+
+        return check
+
+    def _compile_object(self, schema: Dict[str, Any], where: str) -> Check:
+        properties = schema.get("properties", {})
+        required = tuple(schema.get("required", ()))
+        for key in required:
+            if key not in properties:
+                self.problems.append(f"{where}: required '{key}' is not in properties")
+
+        property_checks = tuple(
+            (key, self.compile(subschema, f"{where}.{key}"))
+            for key, subschema in properties.items()
+        )
+        defaults = tuple(
+            (key, subschema["default"], _copier(subschema["default"]))
+            for key, subschema in properties.items() if "default" in subschema
+        )
+        by_key = dict(property_checks)
+        for key, default, _ in defaults:
+            problem = by_key[key](copy.deepcopy(default))
+            if problem is not None:
+                self.problems.append(f"{where}.{key}: default {default!r} {problem[1]}")
+
+        # {tool, args}, as in unity_batch entries and unity_submit_job: args
+        # are checked (and filled in) against that tool's own schema
+        calls_tool = "enum" in properties.get("tool", {}) and "args" in properties
+        checks = self.checks
+
+        def check(value: Dict[str, Any]) -> Optional[Problem]:
+            for key in required:
+                if key not in value:
+                    return key, "is required"
+            for key, check_property in property_checks:
+                if key in value:
+                    problem = check_property(value[key])
+                    if problem is not None:
+                        return _nest(key, problem)
+            for key, default, copier in defaults:
+                if key not in value:
+                    value[key] = default if copier is None else copier(default)
+            if calls_tool and value.get("tool") in checks:
+                problem = checks[value["tool"]](value["args"])
+                if problem is not None:
+                    return _nest("args", problem)
+            return None
+
+        return check
+
+    def _compile_array(self, schema: Dict[str, Any], where: str) -> Check:
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+        items = self.compile(schema["items"], f"{where}[]") if "items" in schema else None
+
+        def check(value: List[Any]) -> Optional[Problem]:
+            if min_items is not None and len(value) < min_items:
+                return "", f"needs at least {_items(min_items)}, got {len(value)}"
+            if max_items is not None and len(value) > max_items:
+                return "", f"takes at most {_items(max_items)}, got {len(value)}"
+            if items is not None:
+                for index, item in enumerate(value):
+                    problem = items(item)
+                    if problem is not None:
+                        return _nest(f"[{index}]", problem)
+            return None
+
+        return check
+
+    def _compile_range(self, schema: Dict[str, Any]) -> Optional[Check]:
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+        if minimum is None and maximum is None:
+            return None
+
+        def check(value: float) -> Optional[Problem]:
+            if minimum is not None and value < minimum:
+                return "", f"must be at least {minimum}, got {value}"
+            if maximum is not None and value > maximum:
+                return "", f"must be at most {maximum}, got {value}"
+            return None
+
+        return check
+
+
+class ToolRegistry:
+    """Every tool definition, checked and compiled once.
+
+    Building the registry checks each definition (unique names, an object
+    inputSchema, required properties that exist, defaults and enum values
+    that match their own schema, no keywords the checks do not understand)
+    and raises ValueError listing every problem, so a broken definition
+    stops the server at startup rather than surfacing in a call.
+
+    `prepare()` then checks a call's arguments against the compiled schema
+    and fills in declared defaults, in microseconds and without a Unity
+    round-trip. Nested objects are filled in place; the top-level dict is
+    copied.
+    """
+
+    def __init__(self, tools: Iterable[Dict[str, Any]]):
+        self.definitions: Dict[str, Dict[str, Any]] = {}
+        self._checks: Dict[str, Check] = {}
+        compiler = _Compiler(self._checks)
+        for index, tool in enumerate(tools):
+            name = tool.get("name")
+            if not isinstance(name, str) or not name:
+                compiler.problems.append(f"tool #{index}: missing name")
+                continue
+            if name in self.definitions:
+                compiler.problems.append(f"{name}: defined twice")
+                continue
+            if not isinstance(tool.get("description"), str):
+                compiler.problems.append(f"{name}: missing description")
+            schema = tool.get("inputSchema")
+            if not isinstance(schema, dict) or schema.get("type") != "object":
+                compiler.problems.append(f"{name}: inputSchema must be an object schema")
+                continue
+            self.definitions[name] = tool
+            self._checks[name] = compiler.compile(schema, name)
+        if compiler.problems:
+            raise ValueError("Invalid tool definitions:\n  " + "\n  ".join(compiler.problems))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.definitions
+
+    def __len__(self) -> int:
+        return len(self.definitions)
+
+    def prepare(self, name: str, arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Arguments for `name` with defaults filled in; InvalidToolCall if they do not fit"""
+        check = self._checks.get(name)
+        if check is None:
+            raise InvalidToolCall(f"Unknown tool: {name}")
+        arguments = {} if arguments is None else arguments
+        if isinstance(arguments, dict):
+            arguments = dict(arguments)
+        problem = check(arguments)
+        if problem is not None:
+            where, what = problem
+            subject = f"'{where}'" if where else "arguments"
+            raise InvalidToolCall(f"Invalid arguments for {name}: {subject} {what}")
+        return arguments
@@ -24,6 +24,47 @@ SCRIPT_TOOLS = [
             "required": ["name", "content"]
         }
     },
+    {
+        "name": "unity_create_scripts",
+        "description": "Create several C# scripts at once, then refresh and compile a single time and wait for the result. Returns compiler errors and warnings for just these files (file, line, column, message), so no unity_force_compile / unity_is_compiling polling is needed. If compilation succeeds, Unity reloads scripts right after responding.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "scripts": {
+                    "type": "array",
+                    "description": "Scripts to write",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Script name (without .cs extension)"
+                            },
+                            "content": {
+                                "type": "string",
+                                "description": "Full C# script content"
+                            },
+                            "path": {
+                                "type": "string",
+                                "description": "Save path for the script",
+                                "default": "Assets/Scripts/"
+                            }
+                        },
+                        "required": ["name", "content"]
+                    },
+                    "minItems": 1
+                },
+                "waitSeconds": {
+                    "type": "number",
+                    "minimum": 0,
+                    "maximum": 25,
+                    "description": "How long to wait for compilation to finish (0 = return right after requesting it)",
+                    "default": 20
+                }
+            },
+            "required": ["scripts"]
+        }
+    },
     {
         "name": "unity_add_component",
         "description": "Add a component to a GameObject. The component type must be compiled and available first.",
@@ -32,7 +73,7 @@ SCRIPT_TOOLS = [
             "properties": {
                 "gameObjectName": {
                     "type": "string",
-                    "description": "Name of the GameObject to add component to"
+                    "description": "Name of the GameObject to add component to, or its handle (e.g. 'id:12345')"
                 },
                 "componentType": {
                     "type": "string",
@@ -50,7 +91,7 @@ SCRIPT_TOOLS = [
             "properties": {
                 "gameObjectName": {
                     "type": "string",
-                    "description": "Name of the GameObject to add the component to"
+                    "description": "Name of the GameObject to add the component to, or its handle (e.g. 'id:12345')"
                 },
                 "scriptName": {
                     "type": "string",
@@ -68,7 +109,7 @@ SCRIPT_TOOLS = [
             "properties": {
                 "gameObjectName": {
                     "type": "string",
-                    "description": "Name of the GameObject"
+                    "description": "Name of the GameObject, or its handle (e.g. 'id:12345')"
                 },
                 "componentType": {
                     "type": "string",
@@ -79,7 +120,7 @@ SCRIPT_TOOLS = [
                     "description": "Name of the property/field to set (e.g., 'heroPrefab', 'speed')"
                 },
                 "value": {
-                    "description": "Value to set. For asset references, use {\"type\": \"reference\", \"path\": \"Assets/Prefabs/Hero.prefab\"}. For primitives, use the value directly."
+                    "description": "Value to set. For asset references, use {\"type\": \"reference\", \"path\": \"Assets/Prefabs/Hero.prefab\"} (path may also be the asset's GUID or, if unique, its name). For primitives, use the value directly."
                 }
             },
             "required": ["gameObjectName", "componentType", "propertyName", "value"]
@@ -93,7 +134,7 @@ SCRIPT_TOOLS = [
             "properties": {
                 "buttonName": {
                     "type": "string",
-                    "description": "Name of the Button GameObject"
+                    "description": "Name of the Button GameObject, or its handle (e.g. 'id:12345')"
                 },
                 "action": {
                     "type": "string",
@@ -116,7 +157,7 @@ SCRIPT_TOOLS = [
             "properties": {
                 "gameObjectName": {
                     "type": "string",
-                    "description": "Name of the GameObject"
+                    "description": "Name of the GameObject, or its handle (e.g. 'id:12345')"
                 },
                 "componentType": {
                     "type": "string",
@@ -141,7 +182,7 @@ SCRIPT_TOOLS = [
                     "description": "Name of the property/field to set (e.g., 'heroPrefab', 'maxHealth')"
                 },
                 "value": {
-                    "description": "Value to set. For asset references, use {\"type\": \"reference\", \"path\": \"Assets/Characters/FBX/Elf.fbx\"}. For primitives, use the value directly."
+                    "description": "Value to set. For asset references, use {\"type\": \"reference\", \"path\": \"Assets/Characters/FBX/Elf.fbx\"} (path may also be the asset's GUID or, if unique, its name). For primitives, use the value directly."
                 }
             },
             "required": ["assetPath", "propertyName", "value"]
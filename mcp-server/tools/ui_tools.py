@@ -37,13 +37,11 @@ UI_TOOLS = [
                 "referenceResolution": {
                     "type": "array",
                     "items": {"type": "number"},
-                    "description": "Canvas Scaler reference resolution [width, height] (overrides preset)",
-                    "default": [1920, 1080]
+                    "description": "Canvas Scaler reference resolution [width, height] (overrides preset; without either, 1920x1080)"
                 },
                 "matchValue": {
                     "type": "number",
-                    "description": "Canvas Scaler match value: 0 = width, 1 = height, 0.5 = balance (overrides preset)",
-                    "default": 0.5
+                    "description": "Canvas Scaler match value: 0 = width, 1 = height, 0.5 = balance (overrides preset; without either, 0.5)"
                 }
             },
             "required": []
@@ -72,7 +70,7 @@ UI_TOOLS = [
                 },
                 "parent": {
                     "type": "string",
-                    "description": "Parent object name (usually Canvas)",
+                    "description": "Parent object name (usually Canvas), or its handle (e.g. 'id:12345')",
                     "default": "Canvas"
                 },
                 "text": {
@@ -114,7 +112,7 @@ UI_TOOLS = [
                 },
                 "parent": {
                     "type": "string",
-                    "description": "Parent object name",
+                    "description": "Parent object name, or its handle (e.g. 'id:12345')",
                     "default": "Canvas"
                 },
                 "text": {
@@ -175,7 +173,7 @@ UI_TOOLS = [
                 },
                 "parent": {
                     "type": "string",
-                    "description": "Parent object name",
+                    "description": "Parent object name, or its handle (e.g. 'id:12345')",
                     "default": "Canvas"
                 },
                 "color": {
@@ -212,7 +210,7 @@ UI_TOOLS = [
                 },
                 "parent": {
                     "type": "string",
-                    "description": "Parent object name",
+                    "description": "Parent object name, or its handle (e.g. 'id:12345')",
                     "default": "Canvas"
                 },
                 "color": {
@@ -238,7 +236,7 @@ UI_TOOLS = [
                 },
                 "parent": {
                     "type": "string",
-                    "description": "Parent object name",
+                    "description": "Parent object name, or its handle (e.g. 'id:12345')",
                     "default": "Canvas"
                 },
                 "layoutType": {
@@ -277,7 +275,7 @@ UI_TOOLS = [
             "properties": {
                 "objectPath": {
                     "type": "string",
-                    "description": "Full path to the GameObject (e.g., 'MenuCanvas/BackgroundPanel')"
+                    "description": "Full path to the GameObject (e.g., 'MenuCanvas/BackgroundPanel'), or its handle (e.g. 'id:12345')"
                 },
                 "spritePath": {
                     "type": "string",
@@ -295,7 +293,7 @@ UI_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name of the UI GameObject (must have RectTransform)"
+                    "description": "Name of the UI GameObject (must have RectTransform), or its handle (e.g. 'id:12345')"
                 },
                 "preset": {
                     "type": "string",
@@ -334,7 +332,7 @@ UI_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Full path to the UI GameObject (e.g., 'Canvas/Button')"
+                    "description": "Full path to the UI GameObject (e.g., 'Canvas/Button'), or its handle (e.g. 'id:12345')"
                 },
                 "size": {
                     "type": "array",
@@ -355,7 +353,7 @@ UI_TOOLS = [
             "properties": {
                 "name": {
                     "type": "string",
-                    "description": "Name or path to the UI Image GameObject (e.g., 'Canvas/ProgressBar')"
+                    "description": "Name or path to the UI Image GameObject (e.g., 'Canvas/ProgressBar'), or its handle (e.g. 'id:12345')"
                 },
                 "fillAmount": {
                     "type": "number",
@@ -6,58 +6,249 @@ Provides comprehensive tools to control Unity Editor via MCP
 
 import asyncio
 import httpx
+import inspect
 import json
+import time
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
 # Import organized tools
-from tools import ALL_TOOLS
+from tools import ALL_TOOLS, TOOL_REGISTRY
+from bridge import UnityClient, RequestCoalescer, ResponseCache, ReloadGate, CallMetrics
 
 # Configuration
 UNITY_URL = "http://localhost:8765"
 TIMEOUT = 30.0
+CONNECT_TIMEOUT = 2.0
+MAX_CONNECTIONS = 10
+
+# Per-tool (connect, read) timeouts in seconds. Tools not listed use
+# (CONNECT_TIMEOUT, TIMEOUT). Heavy tools get a little longer than Unity's own
+# 30 second main-thread timeout so its error message reaches the caller.
+TOOL_TIMEOUTS = {
+    "unity_ping": (CONNECT_TIMEOUT, 5.0),
+    "unity_is_compiling": (CONNECT_TIMEOUT, 5.0),
+    "unity_wait_for_compile": (CONNECT_TIMEOUT, 5.0),
+    "unity_get_logs": (CONNECT_TIMEOUT, 35.0),
+    "unity_force_compile": (CONNECT_TIMEOUT, 35.0),
+    "unity_create_scripts": (CONNECT_TIMEOUT, 35.0),
+    "unity_create_prefab_from_asset": (CONNECT_TIMEOUT, 35.0),
+    "unity_instantiate_prefabs": (CONNECT_TIMEOUT, 35.0),
+    "unity_create_prefabs_from_assets": (CONNECT_TIMEOUT, 35.0),
+    "unity_save_scene": (CONNECT_TIMEOUT, 35.0),
+    "unity_load_scene": (CONNECT_TIMEOUT, 35.0),
+    "unity_batch": (CONNECT_TIMEOUT, 35.0),
+    "unity_submit_job": (CONNECT_TIMEOUT, 5.0),
+    "unity_get_job_status": (CONNECT_TIMEOUT, 5.0),
+    "unity_wait_for_job": (CONNECT_TIMEOUT, 35.0),
+    "unity_get_job_result": (CONNECT_TIMEOUT, 5.0),
+    "unity_get_scheduler_stats": (CONNECT_TIMEOUT, 5.0),
+}
+
+# Tools that wait for their waitSeconds argument after the main-thread work,
+# so their read timeout above grows by it, up to the editor's own cap.
+# unity_create_scripts can use its whole 30 second main-thread allowance and
+# then wait up to 25 seconds for the compile (MCPScripts.MaxWaitSeconds).
+TOOL_WAITS = {
+    "unity_create_scripts": 25.0,
+}
+
+# Response text format: "compact" forwards the editor's JSON as sent;
+# "pretty" re-serializes it with indent=2 (about 40% larger for listings).
+RESPONSE_FORMAT = "compact"
+
+# Ask Unity to gzip large responses. Only worth the CPU when the editor is
+# on another machine; loopback is faster uncompressed.
+GZIP_RESPONSES = False
+
+# Persistent, multiplexed connection to the editor (MCPStreamServer.cs). Calls
+# fall back to HTTP while it cannot be opened and it reconnects after assembly
+# reloads. None sends every call as its own HTTP request.
+STREAM_PORT = 8766
+
+# Request coalescing (opt-in). Calls arriving within COALESCE_WINDOW seconds
+# of each other are sent to Unity as one unity_batch of at most
+# COALESCE_MAX_BATCH calls. 0 sends every call on its own.
+COALESCE_WINDOW = 0.0
+COALESCE_MAX_BATCH = 32
+
+# Script reloads. While Unity reloads its assemblies, calls are held (at most
+# RELOAD_MAX_WAITING of them) and replayed in order once unity_ping answers
+# again. Held calls fail after RELOAD_DEADLINE seconds.
+RELOAD_GATE_ENABLED = True
+RELOAD_DEADLINE = 60.0
+RELOAD_MAX_WAITING = 64
+
+# Read cache. Results of these scene reads are reused until a mutating tool
+# runs or the editor's scene version changes (including edits by hand).
+CACHE_ENABLED = True
+CACHED_TOOLS = [
+    "unity_get_scene_info",
+    "unity_list_all_gameobjects",
+    "unity_query_gameobjects",
+    "unity_spatial_query",
+    "unity_find_gameobject",
+]
+CACHE_MAX_ENTRIES = 256
+
+# Latency metrics. Every call is timed by phase (transport, editor queue,
+# execution, serialization, formatting) into per-tool histograms, reported by
+# unity_get_metrics. METRICS_TRACE_PATH also appends each call to a JSONL file.
+METRICS_ENABLED = True
+METRICS_TRACE_PATH = None
+
+# Tools that never change editor state (tagged with readOnlyHint)
+READ_ONLY_TOOLS = {
+    tool["name"] for tool in ALL_TOOLS
+    if tool.get("annotations", {}).get("readOnlyHint")
+}
+
+metrics = CallMetrics(trace_path=METRICS_TRACE_PATH) if METRICS_ENABLED else None
+
+# One pooled, keep-alive client shared by every tool call
+unity = UnityClient(
+    UNITY_URL,
+    max_connections=MAX_CONNECTIONS,
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=TIMEOUT,
+    tool_timeouts=TOOL_TIMEOUTS,
+    tool_waits=TOOL_WAITS,
+    gzip=GZIP_RESPONSES,
+    stream_port=STREAM_PORT,
+    metrics=metrics
+)
+
+# Tool calls go through the coalescer when it is enabled, straight to Unity otherwise
+dispatcher = (
+    RequestCoalescer(unity, window=COALESCE_WINDOW, max_batch=COALESCE_MAX_BATCH)
+    if COALESCE_WINDOW > 0 else unity
+)
+
+reload_gate = None
+if RELOAD_GATE_ENABLED:
+    reload_gate = ReloadGate(
+        dispatcher,
+        ping=unity.ping,
+        read_only_tools=READ_ONLY_TOOLS,
+        max_waiting=RELOAD_MAX_WAITING,
+        deadline=RELOAD_DEADLINE
+    )
+    dispatcher = reload_gate
+
+cache = None
+if CACHE_ENABLED:
+    cache = ResponseCache(
+        dispatcher,
+        version=unity.scene_version,
+        cached_tools=CACHED_TOOLS,
+        read_only_tools=READ_ONLY_TOOLS,
+        max_entries=CACHE_MAX_ENTRIES
+    )
+    dispatcher = cache
+
+def cache_stats(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """unity_cache_stats: read cache counters"""
+    if cache is None:
+        return {"success": True, "enabled": False}
+    stats = cache.stats()
+    if arguments.get("reset"):
+        cache.reset_stats()
+    return {"success": True, "enabled": True, **stats}
+
+def readiness(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """unity_get_readiness: whether calls go through, are held or fail fast"""
+    if reload_gate is None:
+        return {"success": True, "enabled": False, "transport": unity.transport}
+    return {"success": True, "enabled": True, "transport": unity.transport, **reload_gate.readiness()}
+
+def get_metrics(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """unity_get_metrics: per-tool latency by phase"""
+    if metrics is None:
+        return {"success": True, "enabled": False}
+    tool = arguments.get("tool")
+    snapshot = metrics.snapshot([tool] if tool else None, buckets=bool(arguments.get("histogram")))
+    if arguments.get("reset"):
+        metrics.reset()
+    return {"success": True, "enabled": True, **snapshot}
+
+# BRIDGE_TOOLS handlers, answered without a Unity round-trip
+LOCAL_TOOLS = {
+    "unity_cache_stats": cache_stats,
+    "unity_get_readiness": readiness,
+    "unity_get_metrics": get_metrics,
+}
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Text for a successful result, reusing Unity's JSON when possible"""
+    if RESPONSE_FORMAT == "pretty":
+        return json.dumps(result, indent=2)
+    raw = getattr(result, "raw", None)
+    return raw if raw is not None else json.dumps(result, separators=(",", ":"))
+
+@asynccontextmanager
+async def lifespan(server: Server):
+    """Open the Unity connection pool for the lifetime of the MCP server"""
+    async with unity:
+        try:
+            yield {}
+        finally:
+            if reload_gate is not None:
+                await reload_gate.close()
+            if metrics is not None:
+                metrics.close()
 
 # Create MCP server
-app = Server("unity-mcp")
+app = Server("unity-mcp", lifespan=lifespan)
 
-# Use modular tools
-TOOLS = ALL_TOOLS
+# Use modular tools, built once: TOOL_REGISTRY has already checked them
+TOOLS = [Tool(**tool) for tool in ALL_TOOLS]
+
+# Arguments are checked by TOOL_REGISTRY's compiled schemas. mcp >= 1.10
+# would also run jsonschema.validate on every call, which compiles the
+# schema again each time (about a millisecond per call).
+CALL_TOOL_OPTIONS = (
+    {"validate_input": False}
+    if "validate_input" in inspect.signature(Server.call_tool).parameters else {}
+)
 
 @app.list_tools()
 async def list_tools() -> List[Tool]:
     """List available Unity tools"""
-    return [Tool(**tool) for tool in TOOLS]
+    return TOOLS
 
-@app.call_tool()
+@app.call_tool(**CALL_TOOL_OPTIONS)
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Execute a Unity tool"""
+    start = time.perf_counter()
+    received = None
+    success = False
     try:
-        # Send request to Unity
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            response = await client.post(
-                UNITY_URL,
-                json={
-                    "tool": name,
-                    "args": arguments
-                }
-            )
-            
-            result = response.json()
+        # Unknown tools and arguments that do not match the schema fail here,
+        # as InvalidToolCall, without a Unity round-trip; defaults are filled in
+        arguments = TOOL_REGISTRY.prepare(name, arguments)
+        if name in LOCAL_TOOLS:
+            result = LOCAL_TOOLS[name](arguments)
+        else:
+            # Send request to Unity over the pooled connection
+            result = await dispatcher.call(name, arguments)
+        received = time.perf_counter()
+        success = bool(result.get("success"))
+        
+        # Format response
+        if success:
+            return [TextContent(
+                type="text",
+                text=format_result(result)
+            )]
+        else:
+            error_msg = result.get("error", "Unknown error")
+            return [TextContent(
+                type="text",
+                text=f"Error: {error_msg}"
+            )]
             
-            # Format response
-            if result.get("success"):
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
-            else:
-                error_msg = result.get("error", "Unknown error")
-                return [TextContent(
-                    type="text",
-                    text=f"Error: {error_msg}"
-                )]
-                
     except httpx.TimeoutException:
         return [TextContent(
             type="text",
@@ -73,6 +264,11 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             type="text",
             text=f"Error: {str(e)}"
         )]
+    finally:
+        if metrics is not None and name not in LOCAL_TOOLS:
+            end = time.perf_counter()
+            format_ms = (end - received) * 1000 if received is not None else 0.0
+            metrics.record_call(name, (end - start) * 1000, format_ms, success)
 
 async def main():
     """Run the MCP server"""